@@ -5,12 +5,12 @@ import featuretools as ft
 import pandas as pd
 
 import cardea
-from cardea.data_loader import EntitySetLoader
+from cardea.data_loader import EntitySetCache, EntitySetLoader, ShardSplitter
 from cardea.featurization import Featurization
 from cardea.modeling import Modeler
 from cardea.problem_definition import (
     DiagnosisPrediction, LengthOfStay, MissedAppointmentProblemDefinition, MortalityPrediction,
-    ProlongedLengthOfStay, Readmission)
+    MultiLabelDiagnosisPrediction, ProlongedLengthOfStay, Readmission)
 
 
 class Cardea():
@@ -24,11 +24,16 @@ class Cardea():
         chosen_problem: The selected prediction problem or regression.
         es: The loaded entityset.
         target_entity: The target entity for featurization.
+        cache: An optional cache of the entitysets loaded from local folders.
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir=None, cache_size=2 * 1024 ** 3):
 
         self.es_loader = EntitySetLoader()
+        self.cache = None
+        if cache_dir:
+            self.cache = EntitySetCache(cache_dir, max_size=cache_size)
+
         self.featurization = Featurization()
         self.modeler = Modeler()
 
@@ -36,22 +41,25 @@ class Cardea():
         self.chosen_problem = None
         self.target_entity = None
 
-    def load_data_entityset(self, folder_path=None):
+    def load_data_entityset(self, folder_path=None, n_jobs=None):
         """Returns an entityset loaded with .csv files in folder_path.
 
         Load the given dataset within the folder path into an entityset. The dataset
         must be in a FHIR structure format. If no folder_path is not passed, the
-        function will automatically load kaggle's missed appointment dataset.
+        function will automatically load kaggle's missed appointment dataset. When
+        Cardea was created with a cache_dir, unchanged folders are loaded from the cache.
 
         Args:
             folder_path: A directory of all .csv files that should be loaded.
+            n_jobs: The number of files read concurrently, defaults to the number of CPUs.
 
         Returns:
             An entityset with loaded data.
         """
 
         if folder_path:
-            self.es = self.es_loader.load_data_entityset(folder_path)
+            self.es = self.es_loader.load_data_entityset(folder_path, n_jobs=n_jobs,
+                                                         cache=self.cache)
 
         else:
             csv_s3 = "https://s3.amazonaws.com/dai-cardea/"
@@ -66,8 +74,8 @@ class Cardea():
                       'Reference']
 
             fhir = {
-                resource: pd.read_csv(
-                    csv_s3 + resource + ".csv") for resource in kaggle}
+                resource: self.es_loader.read_csv_file(
+                    csv_s3 + resource + ".csv", resource) for resource in kaggle}
             self.es = self.es_loader.load_df_entityset(fhir)
 
     def list_problems(self):
@@ -105,6 +113,9 @@ class Cardea():
         if selection == 'LengthOfStay':
             self.chosen_problem = LengthOfStay()
 
+        elif selection == 'MortalityPrediction' and parameter:
+            self.chosen_problem = MortalityPrediction(parameter)
+
         elif selection == 'MortalityPrediction':
             self.chosen_problem = MortalityPrediction()
 
@@ -129,9 +140,18 @@ class Cardea():
         elif selection == 'DiagnosisPrediction':
             raise ValueError('unspecified diagnosis code')
 
+        elif selection == 'MultiLabelDiagnosisPrediction' and parameter:
+            self.chosen_problem = MultiLabelDiagnosisPrediction(parameter)
+
+        elif selection == 'MultiLabelDiagnosisPrediction':
+            raise ValueError('unspecified diagnosis codes')
+
         else:
             raise ValueError('{} is not a defined problem'.format(selection))
 
+        # apply the merges deferred at load time, if any, before the entityset is read
+        self.es = self.es_loader.materialize_entityset(self.es)
+
         # target label calculation
         self.es, self.target_entity, cutoff = self.chosen_problem.generate_cutoff_times(self.es)
         return cutoff
@@ -144,22 +164,71 @@ class Cardea():
         """
         return ft.list_primitives()
 
-    def generate_features(self, cutoff):
+    def generate_features(self, cutoff, n_jobs=None):
         """Returns a the calculated feature matrix.
 
         Args:
             es: A featuretools entityset that holds data.
             cutoff: A pandas dataframe that indicates cutoff_time for each instance.
+            n_jobs: The number of processes that calculate the feature matrix, by
+                partitions of the instances, -1 for one per CPU.
 
         Returns:
             Encoded feature_matrix, encoded features.
         """
 
+        self.es = self.es_loader.materialize_entityset(self.es)
         fm_encoded, _ = self.featurization.generate_feature_matrix(
-            self.es, self.target_entity, cutoff)
+            self.es, self.target_entity, cutoff, n_jobs=n_jobs)
         fm_encoded = fm_encoded.reset_index(drop=True)
         return fm_encoded
 
+    def generate_sharded_features(self, folder_path, shards_path, selection, parameter=None,
+                                  n_shards=4):
+        """Returns the feature matrix of a dataset that is featurized by shards of patients.
+
+        The .csv files in folder_path are split into at most n_shards folders under
+        shards_path, each holding the data of a non empty subset of the patients. The
+        shards are loaded and featurized one at a time with the features defined on the
+        first shard, so the peak memory is bounded by the size of a shard instead of the
+        whole dataset.
+
+        Args:
+            folder_path: A directory of all .csv files that should be loaded.
+            shards_path: The directory where the shard folders are written.
+            selection: Name of the chosen prediction problem.
+            parameter: A variable to change the default parameters, if any.
+            n_shards: The number of shards.
+
+        Returns:
+            Encoded feature_matrix of the instances of every shard.
+        """
+
+        shard_paths = ShardSplitter(n_shards).split_csv_files(folder_path, shards_path)
+
+        features_defs = None
+        feature_matrices = []
+        for shard_path in shard_paths:
+            self.load_data_entityset(shard_path)
+            cutoff = self.select_problem(selection, parameter)
+            if cutoff.empty:
+                continue
+
+            if features_defs is None:
+                features_defs = self.featurization.generate_feature_defs(
+                    self.es, self.target_entity, cutoff)
+
+            feature_matrices.append(self.featurization.calculate_feature_matrix(
+                features_defs, self.es, cutoff))
+
+        if not feature_matrices:
+            raise ValueError('No instances of {} in {}'.format(selection, folder_path))
+
+        # encode categorical values on the whole matrix, so every shard has the same columns
+        feature_matrix = pd.concat(feature_matrices, sort=False)
+        fm_encoded, _ = ft.encode_features(feature_matrix, features_defs)
+        return fm_encoded.reset_index(drop=True)
+
     def execute_model(self, feature_matrix, target, primitives,
                       optimize=False, hyperparameters=None):
         """Executes and predict all the pipelines.
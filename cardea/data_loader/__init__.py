@@ -1,4 +1,8 @@
 # import logging
 
 from cardea.data_loader.data_loader import DataLoader, Diamond
+from cardea.data_loader.entityset_cache import EntitySetCache
 from cardea.data_loader.entityset_loader import EntitySetLoader
+from cardea.data_loader.key_encoder import KeyEncoder
+from cardea.data_loader.resource_reader import ResourceReader
+from cardea.data_loader.shard_splitter import ShardSplitter
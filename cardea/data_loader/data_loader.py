@@ -1,12 +1,175 @@
-import inspect
-import sys
+import logging
+import weakref
+from collections import namedtuple
 
 import networkx as nx
-import numpy as np
 import pandas as pd
-from numpy import nan
+from pandas.api.types import is_datetime64_any_dtype, is_integer_dtype, is_numeric_dtype
 
-from cardea import fhir as fh
+from cardea.data_loader.key_encoder import KeyEncoder
+from cardea.fhir.fhirbase import assert_enums
+from cardea.fhir.schema import Relationship, get_schema
+
+LOGGER = logging.getLogger(__name__)
+
+MergeStep = namedtuple(
+    'MergeStep', ['source_entity', 'source_column', 'target_entity', 'target_column'])
+
+# column names of each entity, keyed by id and invalidated when its variables change
+_COLUMN_INDEX = {}
+
+# text values treated as missing, besides the null values detected by pandas
+MISSING_VALUES = frozenset(['null', 'nan', 'NAN', 'Nan', 'NaN', 'undefined', 'unknown'])
+
+
+def get_columns(entity):
+    """Returns the set of column names of an entity.
+
+    The set is built once per entity and kept until the entity is garbage collected
+    or its number of variables changes. Entities replaced by entity_from_dataframe
+    are new objects, so they are indexed again.
+
+    Args:
+        entity: A featuretools entity.
+
+    Returns:
+        A frozenset with the names of the variables of the entity.
+    """
+
+    key = id(entity)
+    entry = _COLUMN_INDEX.get(key)
+    if entry is not None:
+        ref, n_variables, columns = entry
+        if ref() is entity and n_variables == len(entity.variables):
+            return columns
+
+    columns = frozenset(variable.name for variable in entity.variables)
+    ref = weakref.ref(entity, lambda _: _COLUMN_INDEX.pop(key, None))
+    _COLUMN_INDEX[key] = (ref, len(entity.variables), columns)
+
+    return columns
+
+
+def size_cost(diamond, step):
+    """Returns the sum of the sizes of the dataframes of a merge step."""
+
+    return diamond.fhir[step.source_entity].size + diamond.fhir[step.target_entity].size
+
+
+def memory_cost(diamond, step):
+    """Returns the estimated memory that a merge step adds to its target dataframe."""
+
+    target_memory = diamond.fhir[step.target_entity].memory_usage(index=False).sum()
+    return diamond.estimate_merge(step)[1] - int(target_memory)
+
+
+MERGE_KEY = '.merge_key'
+
+COST_MODELS = {
+    'size': size_cost,
+    'memory': memory_cost,
+}
+
+
+def merge_dataframes(source_df, target_df, step, columns=None):
+    """Returns the target dataframe of a merge step with the columns of its source.
+
+    Args:
+        source_df: The dataframe of the source entity.
+        target_df: The dataframe of the target entity.
+        step: A MergeStep.
+        columns: An optional list of the source columns to copy, all of them by default.
+
+    Returns:
+        The merged target dataframe, with a row per target row.
+    """
+
+    source_entity, source_column, target_entity, target_column = step
+
+    if columns is not None:
+        source_df = source_df[[source_column] + [column for column in source_df.columns
+                                                 if column in columns and
+                                                 column != source_column]]
+
+    # missing source keys are referenced by no target row
+    source_df = source_df[source_df[source_column].notnull()]
+
+    source_keys = source_df[source_column]
+    target_keys = target_df[target_column]
+
+    # integer keys, like the encoded ones, are joined as they are, the others by the
+    # string representation of KeyEncoder, so 92 and 92.0 match while the key columns
+    # keep their dtype
+    if not (is_integer_dtype(source_keys) and is_integer_dtype(target_keys)):
+        source_keys = KeyEncoder.normalize(source_keys)
+        target_keys = KeyEncoder.normalize(target_keys)
+
+    source_df = source_df.copy()
+    target_df = target_df.copy()
+
+    source_df.columns = [source_entity + "." + str(col) for col in source_df.columns]
+    target_df.columns = [target_entity + "." + str(col) for col in target_df.columns]
+
+    source_merge_col = source_entity + "." + source_column
+
+    source_df[MERGE_KEY] = source_keys.values
+    target_df[MERGE_KEY] = target_keys.values
+
+    target_df = pd.merge(source_df, target_df, how='right', on=MERGE_KEY)
+
+    target_df = target_df.drop([source_merge_col, MERGE_KEY], axis=1)
+
+    target_df.columns = [str(col).split('.')[-1] for col in target_df.columns]
+    return target_df
+
+
+def get_identifier_index(fhir):
+    """Returns the index of the identifiers of the loaded resources.
+
+    Every distinct identifier value is stored once per resource that owns it, with the
+    resource as a categorical ordered like fhir. Reference is not indexed since it
+    only holds the referenced identifiers.
+
+    Args:
+        fhir: A dictionary of fhir resources in pandas dataframe format.
+
+    Returns:
+        A dataframe with the identifier, as normalized by KeyEncoder, and the resource
+        columns.
+    """
+
+    names = [name for name, df in fhir.items()
+             if 'identifier' in df.columns and name != 'Reference']
+
+    identifiers = {name: KeyEncoder.normalize(fhir[name]['identifier']).dropna().unique()
+                   for name in names}
+    index = pd.concat([pd.DataFrame({'identifier': identifiers[name], 'resource': name},
+                                    columns=['identifier', 'resource'])
+                       for name in names] or [pd.DataFrame(columns=['identifier', 'resource'])],
+                      ignore_index=True)
+    index['resource'] = pd.Categorical(index['resource'], categories=names)
+
+    return index
+
+
+def find_missing_values(values):
+    """Returns a boolean mask of the missing values of a column.
+
+    Null values (None, NaN and NaT) are missing, as well as the text values in
+    MISSING_VALUES, which can only appear in text and categorical columns.
+
+    Args:
+        values: A pandas series.
+
+    Returns:
+        A boolean pandas series, True where the value is missing.
+    """
+
+    missing = values.isnull()
+    if not (is_numeric_dtype(values) or is_datetime64_any_dtype(values)):
+        missing |= values.isin(sorted(MISSING_VALUES))
+
+    return missing
 
 
 class DataLoader():
@@ -22,26 +185,23 @@ class DataLoader():
             file_name: A string that determines the resource type of fhir class.
 
         Returns:
-            An object with the corresponding fhir class.
+            An object with the corresponding fhir class, wrapping df without copying it.
 
         Raises:
-            LookupError: An error occurs if df doesn't have an id.
+            LookupError: An error occurs if file_name is not part of the FHIR schema
+                or if df doesn't have an id.
+            ValueError: An error occurs if a column of df does not match its
+                possible enumerations.
         """
 
-        fhir_classes = [c[0] for c in inspect.getmembers(fh)]
-        if file_name not in fhir_classes:
-            raise LookupError('{} file is not part of FHIR schema'.format(file_name))
-
-        object_values = df.to_dict('list')
-        id_enum = ['identifier', 'id', 'object_id']
+        schema = get_schema(file_name)
 
-        id_exist = any(i in df.columns for i in id_enum)
-
-        if not id_exist:
+        if schema.get_id(df.columns) is None:
             raise LookupError('{} is missing an identifier column'.format(file_name))
 
-        object = getattr(sys.modules[fh.__name__], file_name)(object_values)
-        object.assert_type()
+        assert_enums(df, schema.enums, file_name)
+
+        object = schema.resource.from_dataframe(df)
         return object
 
     def get_object_ids(self, objects):
@@ -54,8 +214,16 @@ class DataLoader():
             A list of the corresponding identifiers.
         """
 
-        identifiers = [(object.__class__.__name__, object.get_id()) for object in objects]
-        identifiers = dict(identifiers)
+        identifiers = {}
+        for object in objects:
+            schema = get_schema(object.__name__)
+            id = schema.get_id(attr for attr in schema.identifiers
+                               if getattr(object, attr) is not None)
+
+            if id is None:
+                raise LookupError('{} is missing an identifier'.format(schema.name))
+
+            identifiers[schema.name] = id
 
         return identifiers
 
@@ -64,14 +232,19 @@ class DataLoader():
 
         Args:
             objects: A list of fhir class objects.
+            names: A list of the loaded fhir class names.
 
         Returns:
             A pandas dataframe of the corresponding relationships.
         """
 
-        relationships = [relation for o in objects for relation in o.get_eligible_relationships()
-                         if relation['parent_entity'] in names]
-        relationships = pd.DataFrame(relationships)
+        relationships = []
+        for object in objects:
+            schema = get_schema(object.__name__)
+            loaded = [attr for attr in schema.fields if getattr(object, attr) is not None]
+            relationships.extend(schema.get_relationships(loaded, names))
+
+        relationships = pd.DataFrame(relationships, columns=Relationship._fields)
 
         return relationships
 
@@ -101,59 +274,95 @@ class DataLoader():
         Returns:
             True if the column_name exists, False otherwise.
         """
-        columns_list = []
-        does_exist = True
 
-        for variable in entity_set.__getitem__(target_entity).variables:
-            columns_list.append(variable.name)
+        return column_name in get_columns(entity_set[target_entity])
 
-        does_exist = column_name in columns_list
-        if does_exist:
-            return does_exist
-        else:
-            return False
+    def get_missing_columns(self, entity_set, requirements):
+        """Returns the required columns that do not exist in the entity set.
+
+        Args:
+            entity_set: fhir entityset.
+            requirements: A dictionary of entity names and the list of their required columns.
+
+        Returns:
+            A list of the missing columns, as entity.column strings.
+        """
+
+        missing = []
+        for target_entity, column_names in requirements.items():
+            try:
+                columns = get_columns(entity_set[target_entity])
+            except KeyError:
+                columns = frozenset()
+
+            missing.extend('{}.{}'.format(target_entity, column_name)
+                           for column_name in column_names if column_name not in columns)
+
+        return missing
+
+    def require_columns(self, entity_set, requirements):
+        """Checks that all the required columns exist in the entity set.
+
+        Args:
+            entity_set: fhir entityset.
+            requirements: A dictionary of entity names and the list of their required columns.
+
+        Raises:
+            ValueError: An error occurs if any required column does not exist, listing
+                every missing column.
+        """
+
+        missing = self.get_missing_columns(entity_set, requirements)
+        if missing:
+            raise ValueError('Columns {} do not exist in the entity set'.format(
+                ', '.join(sorted(missing))))
+
+    def count_missing_values(self, entity_set, target_entity, column_names):
+        """Counts the missing values of the given columns.
+
+        Args:
+            entity_set: fhir entityset.
+            target_entity: The entity name which contains the column_names.
+            column_names: A column name or a list of column names to be counted.
+
+        Returns:
+            A pandas series with the number of missing values of each existing column.
+        """
+
+        if isinstance(column_names, str):
+            column_names = [column_names]
+
+        df = entity_set[target_entity].df
+        counts = {column_name: int(find_missing_values(df[column_name]).sum())
+                  for column_name in column_names
+                  if self.check_column_existence(entity_set, target_entity, column_name)}
+
+        return pd.Series(counts, index=[c for c in column_names if c in counts], dtype='int64')
 
     def check_for_missing_values(self, entity_set, target_entity, column_name):
-        """Checks if there is a missing value in the given column.
+        """Checks if there is a missing value in the given columns.
+
+        The columns are checked one at a time and the check stops at the first
+        column that contains a missing value.
 
         Args:
             entity_set: fhir entityset.
-            column_name: The column name to be checked for missing values.
+            column_name: A column name or a list of column names to be checked.
             target_entity: The entity name which contains the column_name.
 
         Returns:
-            False is the column_name does not contain a missing value.
+            False if none of the existing columns contains a missing value.
         """
-        if self.check_column_existence(entity_set, target_entity, column_name):
-
-            nat = np.datetime64('NaT')
-            missings = [
-                nat,
-                nan,
-                'null',
-                'nan',
-                'NAN',
-                'Nan',
-                'NaN',
-                'undefined',
-                None,
-                'unknown']
-            contains_nan = False
-
-            target_label_values = entity_set.__getitem__(target_entity).df[column_name]
-
-            for missing_value in missings:
-                if missing_value in list(target_label_values):
-                    contains_nan = True
-
-            for missing_value in missings:
-                for target_value in (target_label_values):
-                    if pd.isnull(target_value):
-                        contains_nan = True
-
-            return contains_nan
-        else:
-            return False
+
+        column_names = [column_name] if isinstance(column_name, str) else column_name
+
+        df = entity_set[target_entity].df
+        for column_name in column_names:
+            if (self.check_column_existence(entity_set, target_entity, column_name) and
+                    find_missing_values(df[column_name]).any()):
+                return True
+
+        return False
 
 
 class Diamond(DataLoader):
@@ -162,14 +371,39 @@ class Diamond(DataLoader):
     Attributes:
         fhir: A dictionary with the correspondig fhir dataframes.
         relationships: A dataframe of present fhir Relationships.
+        deferred: A boolean to determine whether merges are recorded instead of applied.
+        merge_plan: A list of the recorded merges that are not materialized yet.
+        cost_model: The name of a cost model in COST_MODELS, or a function of the diamond
+            and a MergeStep, used to weight the relationships.
+        merge_report: A list with the estimated and actual rows and memory of each merge.
+        merges: A list of the applied MergeSteps and the source columns they copied.
     """
 
     __name__ = 'Diamond'
 
-    def __init__(self, objects):
+    def __init__(self, objects, deferred=False, cost_model='size'):
+
+        if not callable(cost_model) and cost_model not in COST_MODELS:
+            raise ValueError('Cost model {} does not exist, choose one of: {}'.format(
+                cost_model, ', '.join(sorted(COST_MODELS))))
 
         self.fhir = self.get_dataframes(objects)
         self.relationships = self.get_relationships(objects, list(self.fhir.keys()))
+        self.deferred = deferred
+        self.merge_plan = []
+        self.cost_model = cost_model
+        self.merge_report = []
+        self.merges = []
+        self._identifier_index = None
+
+    @property
+    def identifier_index(self):
+        """The index of the identifiers of the loaded resources, built on first use."""
+
+        if self._identifier_index is None:
+            self._identifier_index = get_identifier_index(self.fhir)
+
+        return self._identifier_index
 
     def get_fhir_dataframes(self):
         """Returns fhir dataframes with their associated names.
@@ -194,20 +428,27 @@ class Diamond(DataLoader):
 
         This method is a pipline to solve diamond graphs by depending on MST to
         resolve the present cycles and maintains information by copying data from
-        the cut ties.
+        the cut ties. The spanning tree keeps the relationships of highest merge
+        cost, so the cut ties are the cheapest ones to merge according to the cost
+        model. The size cost is computed before the references are resolved, as it
+        always was, so relationships to Reference weigh the size of Reference. The
+        other cost models weigh the resolved relationships.
         """
 
-        self.relationships['weight'] = self.merge_cost()
+        if self.cost_model == 'size':
+            self.relationships['weight'] = self.merge_cost()
 
         G = nx.from_pandas_edgelist(
             self.relationships,
             source='parent_entity',
-            target='child_entity',
-            edge_attr=['weight'])
+            target='child_entity')
 
         if len(list(nx.cycle_basis(G))) > 0:
 
             self.resolve_reference()
+            if self.cost_model != 'size':
+                self.relationships['weight'] = self.merge_cost()
+
             G = nx.from_pandas_edgelist(
                 self.relationships,
                 source='parent_entity',
@@ -232,20 +473,21 @@ class Diamond(DataLoader):
             An index of the record of the edge in relationships.
         """
 
-        source_df = self.relationships[self.relationships['parent_entity'] == source]
-        target_df = self.relationships[self.relationships['child_entity'] == target]
-        intersection = source_df[source_df.index.isin(target_df.index)]
+        parents = self.relationships['parent_entity']
+        children = self.relationships['child_entity']
 
+        intersection = self.relationships[(parents == source) & (children == target)]
         if len(intersection) == 0:
-            source_df = self.relationships[self.relationships['child_entity'] == source]
-            target_df = self.relationships[self.relationships['parent_entity'] == target]
-            intersection = source_df[source_df.index.isin(target_df.index)]
+            intersection = self.relationships[(children == source) & (parents == target)]
 
         return intersection
 
     def merge(self, edge, remove=False):
         """Merges dataframes that are in edge then removes it from relationships and updates the fhir.
 
+        In deferred mode the merge is only recorded in merge_plan, to be applied by
+        materialize.
+
         Args:
             edge: A tuple that has the relationship to be broken.
             remove: A boolean to determine whether the edge should be removed from relationships.
@@ -253,74 +495,213 @@ class Diamond(DataLoader):
 
         relation = self.get_relation(edge[0], edge[1])
 
-        source_entity = relation.iloc[0]['parent_entity']
-        source_column = relation.iloc[0]['parent_variable']
-        target_entity = relation.iloc[0]['child_entity']
-        target_column = relation.iloc[0]['child_variable']
+        step = MergeStep(source_entity=relation.iloc[0]['parent_entity'],
+                         source_column=relation.iloc[0]['parent_variable'],
+                         target_entity=relation.iloc[0]['child_entity'],
+                         target_column=relation.iloc[0]['child_variable'])
 
-        source_df = self.fhir[source_entity].copy()
-        target_df = self.fhir[target_entity].copy()
+        if self.deferred:
+            self.merge_plan.append(step)
+        else:
+            self.apply_merge(step)
 
-        source_df[source_column] = source_df[source_column].astype('str')
-        target_df[target_column] = target_df[target_column].astype('str')
+        if remove:
+            self.relationships.drop(relation.index, inplace=True)
 
-        source_df.columns = [source_entity + "." + str(col) for col in source_df.columns]
-        target_df.columns = [target_entity + "." + str(col) for col in target_df.columns]
+    def apply_merge(self, step, columns=None):
+        """Copies the columns of the source of a merge step into its target dataframe.
 
-        source_merge_col = source_entity + "." + source_column
-        target_merge_col = target_entity + "." + target_column
+        Args:
+            step: A MergeStep.
+            columns: An optional list of the source columns to copy, all of them by default.
+        """
 
-        target_df = pd.merge(source_df, target_df, how='right', left_on=[source_merge_col],
-                             right_on=[target_merge_col])
+        estimated_rows, estimated_memory = self.estimate_merge(step, columns)
 
-        target_df = target_df.drop([source_entity + "." + source_column], axis=1)
+        target_df = merge_dataframes(self.fhir[step.source_entity],
+                                     self.fhir[step.target_entity], step, columns)
+        self.fhir[step.target_entity] = target_df
+        self.merges.append((step, columns))
 
-        target_df.columns = [str(col).split('.')[-1] for col in target_df.columns]
-        self.fhir[target_entity] = target_df
+        self.merge_report.append(dict(step._asdict(),
+                                      estimated_rows=estimated_rows,
+                                      estimated_memory=estimated_memory,
+                                      rows=len(target_df),
+                                      memory=int(target_df.memory_usage(index=False).sum())))
 
-        if remove:
-            self.relationships.drop(relation.index, inplace=True)
+    def get_merge_plan(self, columns=None):
+        """Returns the recorded merges with an estimate of their rows and memory cost.
+
+        The rows of a merge follow the fan-out of its source key, as in estimate_merge,
+        applied to the rows that earlier merges leave in its target. The cost of a merge
+        is the memory it adds to its target: the source columns copied into every merged
+        row, following the columns that earlier merges copy into the source, and the
+        target rows duplicated by the fan-out. Object columns are counted by their
+        references, which is what a merge copies.
+
+        Args:
+            columns: An optional dictionary of the columns to copy from each source entity.
+
+        Returns:
+            A dataframe with a row per recorded merge, the number of columns it copies,
+            the estimated rows of its target and its estimated memory in bytes.
+        """
+
+        widths = {}
+        rows = {}
+        for name, df in self.fhir.items():
+            usage = df.memory_usage(index=False)
+            widths[name] = [(column, usage.iloc[i] / max(len(df), 1))
+                            for i, column in enumerate(df.columns)]
+            rows[name] = len(df)
+
+        plan = []
+        for step in self.merge_plan:
+            copied = [(column, width) for column, width in widths[step.source_entity]
+                      if column != step.source_column and
+                      (columns is None or step.source_entity not in columns or
+                       column in columns[step.source_entity])]
+
+            fan_out = self.estimate_merge(step)[0] / max(len(self.fhir[step.target_entity]), 1)
+            target_rows = int(round(rows[step.target_entity] * fan_out))
+            target_width = sum(width for _, width in widths[step.target_entity])
+            copied_width = sum(width for _, width in copied)
+            memory = (target_rows * (target_width + copied_width) -
+                      rows[step.target_entity] * target_width)
+
+            widths[step.target_entity] = widths[step.target_entity] + copied
+            rows[step.target_entity] = target_rows
+            plan.append(dict(step._asdict(), columns=len(copied), rows=target_rows,
+                             memory=int(round(memory))))
+
+        return pd.DataFrame(plan, columns=list(MergeStep._fields) + [
+            'columns', 'rows', 'memory'])
+
+    def get_merge_report(self):
+        """Returns the estimated and actual rows and memory of the applied merges.
+
+        Returns:
+            A dataframe with a row per applied merge.
+        """
+
+        return pd.DataFrame(self.merge_report, columns=list(MergeStep._fields) + [
+            'estimated_rows', 'estimated_memory', 'rows', 'memory'])
+
+    def materialize(self, columns=None):
+        """Applies the recorded merges and clears merge_plan.
+
+        Args:
+            columns: An optional dictionary of the columns to copy from each source entity,
+                all the columns are copied from the entities it does not list.
+
+        Returns:
+            A dictionary with the correspondig fhir dataframes.
+        """
+
+        for step in self.merge_plan:
+            source_columns = None
+            if columns is not None:
+                source_columns = columns.get(step.source_entity)
+
+            self.apply_merge(step, source_columns)
+
+        self.merge_plan = []
+        return self.fhir
 
     def merge_cost(self):
         """ Calculates the merge cost of two dataframes.
 
-        The equation is defined as the sum of the dataframe sizes.
+        With the size cost model, the equation is defined as the sum of the dataframe
+        sizes. With the memory cost model, it is the estimated memory that the merge
+        adds to the target dataframe, for the copied columns and the rows it fans out.
+        Other cost models are called with the diamond and the MergeStep of each
+        relationship.
 
         Returns:
             A list of the cost of merging for each relationship
         """
 
-        cost = [self.fhir[row['parent_entity']].size + self.fhir[row['child_entity']].size
-                for _, row in self.relationships.iterrows()]
+        if self.cost_model == 'size':
+            sizes = {name: df.size for name, df in self.fhir.items()}
+            cost = (self.relationships['parent_entity'].map(sizes) +
+                    self.relationships['child_entity'].map(sizes))
+
+            return cost.tolist()
+
+        cost_model = COST_MODELS.get(self.cost_model, self.cost_model)
+        return [cost_model(self, MergeStep(*relation)) for relation in zip(
+            self.relationships['parent_entity'], self.relationships['parent_variable'],
+            self.relationships['child_entity'], self.relationships['child_variable'])]
+
+    def estimate_merge(self, step, columns=None):
+        """Estimates the rows and memory of the target dataframe of a merge step.
+
+        The rows come from the fan-out of the source key, counting how many source
+        rows match each target key, and the memory from the width of the rows of both
+        dataframes. Object columns are counted by their references.
+
+        Args:
+            step: A MergeStep.
+            columns: An optional list of the source columns to copy, all of them by default.
+
+        Returns:
+            A tuple with the estimated number of rows and memory in bytes.
+        """
+
+        source_df = self.fhir[step.source_entity]
+        target_df = self.fhir[step.target_entity]
 
-        return cost
+        counts = KeyEncoder.normalize(source_df[step.source_column]).value_counts()
+        rows = int(KeyEncoder.normalize(target_df[step.target_column]).map(counts).fillna(1).sum())
+
+        source_usage = source_df.memory_usage(index=False)
+        copied = [i for i, column in enumerate(source_df.columns)
+                  if column != step.source_column and (columns is None or column in columns)]
+        width = (source_usage.iloc[copied].sum() / max(len(source_df), 1) +
+                 target_df.memory_usage(index=False).sum() / max(len(target_df), 1))
+
+        return rows, int(rows * width)
 
     def resolve_reference(self):
         """ Consolidates relationships that have a connection to References.
+
+        Each relationship to Reference is pointed to the resource that owns most of
+        the referenced identifiers, looked up in the identifier index, the first one
+        in the order of fhir on ties. References to several resources are logged. The
+        relationships to Identifier are removed.
         """
 
         if 'Identifier' not in list(self.fhir.keys()):
             raise LookupError('\'Identifier\' file is not loaded.')
 
         identifier_df = self.fhir['Identifier']  # always subset from id
-        identifier_df['object_id'] = identifier_df['object_id'].astype('str')
+        identifier_ids = KeyEncoder.normalize(identifier_df['object_id']).dropna()
+
+        index = self.identifier_index
+        index = index[index['identifier'].isin(identifier_ids)]
 
-        for i, relation in self.relationships.iterrows():
+        relationships = self.relationships
+        references = relationships[relationships['parent_entity'] == 'Reference']
 
-            if relation['parent_entity'] == 'Reference':
+        parents = {}
+        for i, child_entity, child_variable in zip(references.index,
+                                                   references['child_entity'],
+                                                   references['child_variable']):
 
-                df = self.fhir[relation['child_entity']]
-                subset_values = [str(x) for x in df[relation['child_variable']].values]
-                sub_df = identifier_df.loc[identifier_df['object_id'].isin(subset_values)]
+            values = KeyEncoder.normalize(self.fhir[child_entity][child_variable]).dropna()
+            counts = index.loc[index['identifier'].isin(values), 'resource'].value_counts(
+                sort=False)
+            counts = counts[counts > 0]
+            if not len(counts):
+                continue
 
-                for second_name, second_df in self.fhir.items():
-                    if 'identifier' not in second_df.columns or second_name == 'Reference':
-                        continue
+            parents[i] = counts.idxmax()
+            if len(counts) > 1:
+                LOGGER.info('%s.%s references %s, using %s', child_entity, child_variable,
+                            ', '.join(counts.index.astype(str)), parents[i])
 
-                    second_df['identifier'] = second_df['identifier'].astype('str')
-                    if len(set(second_df['identifier']).intersection(sub_df['object_id'])) > 0:
-                        self.relationships.at[i, 'parent_entity'] = second_name
-                        break
+        if parents:
+            relationships.loc[list(parents), 'parent_entity'] = list(parents.values())
 
-            if relation['parent_entity'] == 'Identifier':
-                self.relationships.drop(i, inplace=True)
+        relationships.drop(relationships.index[relationships['parent_entity'] == 'Identifier'],
+                           inplace=True)
@@ -0,0 +1,175 @@
+import hashlib
+import importlib
+import logging
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+
+import featuretools as ft
+import pandas as pd
+
+import cardea
+
+LOGGER = logging.getLogger(__name__)
+
+# the modules that build a loaded entityset, whose source code is part of every key
+LOADER_MODULES = (
+    'cardea.data_loader.data_loader',
+    'cardea.data_loader.entityset_loader',
+    'cardea.data_loader.key_encoder',
+    'cardea.data_loader.resource_reader',
+    'cardea.fhir.schema',
+)
+
+
+@lru_cache(maxsize=None)
+def get_code_fingerprint():
+    """Returns a hash of the code that loaded entitysets depend on.
+
+    The fingerprint covers the versions of cardea, featuretools and pandas and the
+    source of LOADER_MODULES, so editing the loader or the schema during development
+    invalidates the cached entitysets even if the version string is unchanged.
+
+    Returns:
+        A string with the hexadecimal hash of the code.
+    """
+
+    fingerprint = hashlib.sha256()
+    for version in (cardea.__version__, ft.__version__, pd.__version__):
+        fingerprint.update(version.encode())
+
+    for name in LOADER_MODULES:
+        with open(importlib.import_module(name).__file__, 'rb') as source_file:
+            fingerprint.update(source_file.read())
+
+    return fingerprint.hexdigest()
+
+
+class EntitySetCache():
+    """A class that stores loaded entitysets on disk, keyed by their input files.
+
+    The key of an entityset is a hash of the name, size and modification time of its
+    input files, or of their content when digest is set, so changing an input file
+    loads the entityset again. The key also holds the fingerprint of the loading code,
+    but changes to other code, like the fhir classes, require clearing the cache.
+    Each entityset is pickled into its own file, and the least recently used files are
+    evicted once the cache exceeds max_size bytes.
+
+    Attributes:
+        cache_dir: The directory where the entitysets are stored.
+        max_size: The maximum size of the cache in bytes.
+        digest: A boolean to determine whether the content of the input files is hashed.
+    """
+
+    __name__ = 'EntitySetCache'
+
+    def __init__(self, cache_dir=None, max_size=2 * 1024 ** 3, digest=False):
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser('~'), '.cardea', 'cache')
+        self.max_size = max_size
+        self.digest = digest
+
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+    def get_key(self, file_paths):
+        """Returns the key of the entityset loaded from file_paths.
+
+        Args:
+            file_paths: A list of the input files of the entityset.
+
+        Returns:
+            A string with the hexadecimal hash of the input files.
+        """
+
+        key = hashlib.sha256(get_code_fingerprint().encode())
+        for file_path in sorted(file_paths):
+            stat = os.stat(file_path)
+            key.update(os.path.basename(file_path).encode())
+            key.update('{}:{}'.format(stat.st_size, stat.st_mtime_ns).encode())
+
+            if self.digest:
+                with open(file_path, 'rb') as input_file:
+                    for block in iter(lambda: input_file.read(2 ** 20), b''):
+                        key.update(block)
+
+        return key.hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self.cache_dir, key + '.pkl')
+
+    def get(self, key):
+        """Returns the entityset stored under key.
+
+        Args:
+            key: The key of the entityset.
+
+        Returns:
+            The stored entityset, or None if it is not in the cache.
+        """
+
+        path = self._get_path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as cache_file:
+                entity_set = pickle.load(cache_file)
+
+        except (EOFError, pickle.UnpicklingError):
+            LOGGER.warning('Removing corrupted cache file %s', path)
+            os.remove(path)
+            return None
+
+        os.utime(path, None)  # mark as recently used
+        return entity_set
+
+    def set(self, key, entity_set):
+        """Stores an entityset under key, evicting the least recently used ones.
+
+        Args:
+            key: The key of the entityset.
+            entity_set: The entityset to store.
+        """
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as cache_file:
+                pickle.dump(entity_set, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(tmp_path, self._get_path(key))
+
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+        self.evict(keep=key)
+
+    def evict(self, keep=None):
+        """Removes the least recently used entitysets until the cache fits max_size.
+
+        Args:
+            keep: An optional key that is never evicted.
+        """
+
+        entries = []
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith('.pkl'):
+                stat = os.stat(os.path.join(self.cache_dir, file_name))
+                entries.append((stat.st_mtime, stat.st_size, file_name))
+
+        size = sum(entry[1] for entry in entries)
+        for _, file_size, file_name in sorted(entries):
+            if size <= self.max_size:
+                break
+
+            if file_name != '{}.pkl'.format(keep):
+                os.remove(os.path.join(self.cache_dir, file_name))
+                size -= file_size
+
+    def clear(self):
+        """Removes every entityset from the cache."""
+
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith('.pkl'):
+                os.remove(os.path.join(self.cache_dir, file_name))
@@ -1,16 +1,79 @@
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 
 import featuretools as ft
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_string_dtype
 
 from cardea.data_loader import DataLoader, Diamond
+from cardea.data_loader.data_loader import merge_dataframes
+from cardea.data_loader.key_encoder import KeyEncoder
+from cardea.data_loader.resource_reader import ResourceReader
+from cardea.fhir import RESOURCES
+from cardea.fhir.schema import get_schema, is_datetime_field
+
+LOGGER = logging.getLogger(__name__)
+
+PARQUET_MANIFEST = 'manifest.json'
+
+
+def _is_text(series):
+    return series.dtype.name != 'category' and is_string_dtype(series)
+
+
+def _to_numeric(series):
+    try:
+        return pd.to_numeric(series)
+    except (TypeError, ValueError):
+        return series
+
+
+def _to_datetime(series):
+    try:
+        return pd.to_datetime(series)
+    except (TypeError, ValueError, OverflowError):
+        return series
+
+
+def _is_number(series):
+    return is_numeric_dtype(series) and not is_bool_dtype(series)
+
+
+def _import_parquet():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError('pyarrow is required to read and write parquet files, '
+                          'install it with: pip install cardea[parquet]')
+
+    return pyarrow, pyarrow.parquet
 
 
 class EntitySetLoader(DataLoader):
-    """A class that loads fhir class objects to featuretools entityset."""
+    """A class that loads fhir class objects to featuretools entityset.
+
+    The key_encoder, merges and merge_plan of a load are also stored as attributes of
+    its entityset, which are pickled along with it, so that any loader can materialize
+    or append to the entityset.
+
+    Attributes:
+        key_encoder: The KeyEncoder of the last resources loaded with encoded keys.
+        merges: The merges applied to the last resources loaded, with their columns.
+        merge_plan: The merges deferred when the last resources were loaded, with their
+            columns, until materialize_entityset applies them.
+    """
 
     __name__ = 'EntitySetLoader'
 
+    key_encoder = None
+    merges = ()
+    merge_plan = ()
+
     def create_entity(self, fhir, identifiers, entity_set):
         """Creates an entity from fhir dataframes and add it to entityset.
 
@@ -22,7 +85,7 @@ class EntitySetLoader(DataLoader):
         for object_name, df in fhir.items():
 
             id = identifiers[object_name]
-            df = df.apply(pd.to_numeric, errors='ignore')
+            df = self.set_dtypes(df, object_name)
 
             if object_name == 'Period':
                 entity_set.entity_from_dataframe(entity_id=str(object_name),
@@ -34,6 +97,94 @@ class EntitySetLoader(DataLoader):
                                                  dataframe=df,
                                                  index=id)
 
+    def set_dtypes(self, df, name):
+        """Returns the dataframe of a fhir resource with the dtypes of its attributes.
+
+        Only the text columns are converted: enumerations to categories, datetime
+        attributes to datetimes and keys or numbers to numeric. Columns that are not
+        attributes of the fhir class, like the ones merged from other classes, are
+        converted to numeric when possible.
+
+        Args:
+            df: A fhir resource in pandas dataframe format.
+            name: The name of the fhir class of the dataframe.
+
+        Returns:
+            A dataframe with the converted columns, or df if none needs a conversion.
+        """
+
+        types, enums = {}, {}
+        if name in RESOURCES:
+            schema = get_schema(name)
+            types, enums = schema.types, schema.enums
+
+        converted = False
+        columns = []
+        for i, column in enumerate(df.columns):
+            series = df.iloc[:, i]
+            type = types.get(column)
+
+            if not _is_text(series) or type in ('bool', 'list'):
+                new_series = series
+
+            elif type == 'str' and column in enums:
+                new_series = series.astype('category')
+
+            elif type == 'str':
+                new_series = _to_datetime(series) if is_datetime_field(column) else series
+
+            else:
+                new_series = _to_numeric(series)
+
+            converted = converted or new_series is not series
+            columns.append(new_series)
+
+        if not converted:
+            return df
+
+        return pd.concat(columns, axis=1)
+
+    def align_key_dtypes(self, fhir, relationships):
+        """Returns the dataframes in fhir with the same dtype on both sides of a relationship.
+
+        A key column with missing values, like the reference to an optional element,
+        is read as float64 while the keys it references are read as int64. The numeric
+        keys of each relationship are cast to their common dtype, until every
+        relationship agrees.
+
+        Args:
+            fhir: A dictionary of fhir resources in pandas dataframe format.
+            relationships: A dataframe of the relationships in fhir.
+
+        Returns:
+            A dictionary of fhir resources in pandas dataframe format.
+        """
+
+        fhir = dict(fhir)
+        relationships = list(zip(
+            relationships['parent_entity'], relationships['parent_variable'],
+            relationships['child_entity'], relationships['child_variable']))
+
+        changed = True
+        while changed:
+            changed = False
+            for parent_entity, parent_variable, child_entity, child_variable in relationships:
+                parent = fhir[parent_entity][parent_variable]
+                child = fhir[child_entity][child_variable]
+                if parent.dtype == child.dtype or not (_is_number(parent) and _is_number(child)):
+                    continue
+
+                dtype = np.promote_types(parent.dtype, child.dtype)
+                for name, column in ((parent_entity, parent_variable),
+                                     (child_entity, child_variable)):
+                    if fhir[name][column].dtype != dtype:
+                        fhir[name] = fhir[name].assign(
+                            **{column: fhir[name][column].astype(dtype)})
+
+                changed = True
+
+        return fhir
+
     def create_relationships(self, relationships, entity_set):
         """Binds entities in the entityset.
 
@@ -42,82 +193,495 @@ class EntitySetLoader(DataLoader):
             entity_set: The global entityset that the entity will be added to.
         """
 
-        for i, relation in relationships.iterrows():
-            # parent table: 0, field: 1
-            # child table: 2, field: 3
-
-            new_relationship = ft.Relationship(
-                entity_set[relation['parent_entity']][relation['parent_variable']],
-                entity_set[relation['child_entity']][relation['child_variable']])
+        new_relationships = [
+            ft.Relationship(entity_set[parent_entity][parent_variable],
+                            entity_set[child_entity][child_variable])
+            for parent_entity, parent_variable, child_entity, child_variable in zip(
+                relationships['parent_entity'], relationships['parent_variable'],
+                relationships['child_entity'], relationships['child_variable'])]
 
-            entity_set.add_relationship(new_relationship)
+        if new_relationships:
+            entity_set.add_relationships(new_relationships)
 
-    def load_data_entityset(self, folder_path):
+    def load_data_entityset(self, folder_path, n_jobs=None, cache=None):
         """Returns an entityset loaded with .csv files in folder_path.
 
         Loads .csv files into pandas dataframes then loads them into featuretools' entityset.
+        When a cache is given, the entityset is loaded from it if the .csv files did not
+        change since it was stored, and stored in it otherwise.
 
         Args:
             folder_path: A directory of all .csv files that should be loaded.
+            n_jobs: The number of files read concurrently, defaults to the number of CPUs.
+            cache: An optional EntitySetCache.
 
         Returns:
             An entityset with loaded data.
         """
 
-        fhir = self.read_csv_files(folder_path=folder_path)
-        return self.load_df_entityset(fhir=fhir)
+        if cache is not None:
+            key = cache.get_key(glob(folder_path + "/*.csv"))
+            entity_set = cache.get(key)
+            if entity_set is not None:
+                return entity_set
+
+        fhir = self.read_csv_files(folder_path=folder_path, n_jobs=n_jobs)
+        entity_set = self.load_df_entityset(fhir=fhir)
+
+        if cache is not None:
+            cache.set(key, entity_set)
 
-    def read_csv_files(self, folder_path):
+        return entity_set
+
+    def read_csv_file(self, file_path, file_name):
+        """Returns a dataframe with a loaded .csv file of a fhir resource.
+
+        The columns are read with the dtypes derived from the attribute types of
+        the fhir class named file_name, when it is part of the FHIR schema: enumerations
+        as categories, text as strings and datetime attributes as datetimes.
+
+        Args:
+            file_path: The path or url of the .csv file.
+            file_name: The name of the fhir class of the file.
+
+        Returns:
+            A fhir resource in pandas dataframe format.
+        """
+
+        if file_name not in RESOURCES:
+            return pd.read_csv(file_path)
+
+        schema = get_schema(file_name)
+        df = pd.read_csv(file_path, dtype=schema.get_dtypes())
+        for column in schema.get_parse_dates(df.columns):
+            df[column] = _to_datetime(df[column])
+
+        return df
+
+    def read_csv_files(self, folder_path, n_jobs=None):
         """Returns a dictionary with loaded .csv files in folder_path.
 
-        Loads .csv files into pandas dataframes.
+        Loads .csv files into pandas dataframes, reading n_jobs files concurrently.
 
         Args:
-            folder_path: A dictionary of fhir resources in pandas dataframe format.
+            folder_path: A directory of all .csv files that should be loaded.
+            n_jobs: The number of files read concurrently, defaults to the number of CPUs.
 
         Returns:
             A dictionary of fhir resources in pandas dataframe format.
         """
 
-        fhir = {}
-
         csv_files = glob(folder_path + "/*.csv")
-        for file_path in csv_files:
-            df = pd.read_csv(file_path)
-            file_name = file_path.split("/")[-1].split(".")[0]
+        file_names = [file_path.split("/")[-1].split(".")[0] for file_path in csv_files]
 
-            fhir[file_name] = df
+        n_jobs = n_jobs or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=max(min(n_jobs, len(csv_files)), 1)) as executor:
+            dfs = executor.map(self.read_csv_file, csv_files, file_names)
+            fhir = dict(zip(file_names, dfs))
 
         return fhir
 
-    def load_df_entityset(self, fhir):
-        """Returns an entityset loaded with received dataframes in fhir.
+    def load_json_entityset(self, folder_path, chunksize=10000):
+        """Returns an entityset loaded with .ndjson and Bundle .json files in folder_path.
 
-        Loads the received dictionary of fhir resources into featuretools' entityset, where
-        the key is the resource name and the value is a pandas dataframe.
+        Flattens the FHIR resources into per-resource dataframes then loads them into
+        featuretools' entityset.
 
         Args:
-            fhir: A dictionary of fhir resources in pandas dataframe format.
+            folder_path: A directory of all .ndjson and .json files that should be loaded.
+            chunksize: The number of resources flattened at a time.
 
         Returns:
             An entityset with loaded data.
         """
 
-        all_objects = []
-        entity_set = ft.EntitySet(id="fhir")
+        fhir = self.read_json_files(folder_path=folder_path, chunksize=chunksize)
+        return self.load_df_entityset(fhir=fhir)
 
+    def read_json_files(self, folder_path, chunksize=10000):
+        """Returns a dictionary with the flattened resources of the files in folder_path.
+
+        Reads FHIR Bulk Data .ndjson files and Bundle .json files, flattening chunksize
+        resources at a time into per-resource pandas dataframes. The chunking only
+        bounds the flattened rows held as Python objects: the dataframes of every chunk
+        are kept and concatenated, so the returned tables grow with the input, and each
+        Bundle file is parsed whole.
+
+        Args:
+            folder_path: A directory of .ndjson and .json files.
+            chunksize: The number of resources flattened at a time.
+
+        Returns:
+            A dictionary of fhir resources in pandas dataframe format.
+        """
+
+        chunks = {}
+
+        reader = ResourceReader(chunksize=chunksize)
+        for tables in reader.iter_chunks(folder_path):
+            for name, df in tables.items():
+                chunks.setdefault(name, []).append(df)
+
+        fhir = {}
+        for name in list(chunks):
+            fhir[name] = pd.concat(chunks.pop(name), ignore_index=True, sort=False)
+
+        return fhir
+
+    def resolve_df_entityset(self, fhir, columns=None, encode_keys=False):
+        """Returns the resources in fhir with their relationships resolved.
+
+        Loads the received dataframes into fhir class objects and resolves the
+        diamond relationships between them. When columns is given, the merges of the
+        cut relationships are not applied but recorded in merge_plan, to only copy the
+        listed columns once materialize_entityset is called. When encode_keys is set,
+        the join columns are first encoded as int64 surrogate keys, which key_encoder
+        can decode.
+
+        Args:
+            fhir: A dictionary of fhir resources in pandas dataframe format.
+            columns: An optional dictionary of the columns to copy from each merged entity.
+            encode_keys: A boolean to determine whether the join columns are encoded.
+
+        Returns:
+            A tuple of the resolved dictionary of dataframes, the dataframe of their
+            relationships and the dictionary of their identifiers.
+        """
+
+        self.key_encoder = None
+        if encode_keys:
+            self.key_encoder = KeyEncoder()
+            fhir = self.key_encoder.fit_transform(fhir)
+
+        all_objects = []
         for name, df in fhir.items():
 
             object = self.create_object(df, name)
             all_objects.append(object)
 
-        diamond = Diamond(all_objects)
+        diamond = Diamond(all_objects, deferred=columns is not None)
         diamond.resolve_diamond()
+
         fhir = diamond.get_fhir_dataframes()
         relationships = diamond.get_fhir_relationships()
         identifiers = diamond.get_object_ids(all_objects)
+        self.merges = tuple(diamond.merges)
+        self.merge_plan = ()
+        if columns is not None:
+            self.merge_plan = tuple((step, columns.get(step.source_entity))
+                                    for step in diamond.merge_plan)
+
+        return fhir, relationships, identifiers
+
+    def create_entityset(self, fhir, relationships, identifiers):
+        """Returns an entityset of resolved fhir dataframes.
+
+        Args:
+            fhir: A dictionary of fhir resources in pandas dataframe format.
+            relationships: A dataframe of the relationships in fhir.
+            identifiers: A dictionary of the identifier of each resource.
+
+        Returns:
+            An entityset with loaded data.
+        """
+
+        entity_set = ft.EntitySet(id="fhir")
+
+        fhir = {name: self.set_dtypes(df, name) for name, df in fhir.items()}
+        fhir = self.align_key_dtypes(fhir, relationships)
 
         self.create_entity(fhir, identifiers, entity_set=entity_set)
         self.create_relationships(relationships, entity_set=entity_set)
 
         return entity_set
+
+    def store_merges(self, entity_set):
+        """Stores the key_encoder, merges and merge_plan of the last load in entity_set.
+
+        Args:
+            entity_set: The entityset of the last load.
+
+        Returns:
+            The entityset.
+        """
+
+        entity_set.key_encoder = self.key_encoder
+        entity_set.merges = self.merges
+        entity_set.merge_plan = self.merge_plan
+
+        return entity_set
+
+    def load_df_entityset(self, fhir, columns=None, encode_keys=False):
+        """Returns an entityset loaded with received dataframes in fhir.
+
+        Loads the received dictionary of fhir resources into featuretools' entityset, where
+        the key is the resource name and the value is a pandas dataframe.
+
+        When columns is given, the merges of the cut relationships are deferred: the
+        entityset is loaded without the merged columns, which materialize_entityset
+        adds once they are needed.
+
+        Args:
+            fhir: A dictionary of fhir resources in pandas dataframe format.
+            columns: An optional dictionary of the columns to copy from each merged entity.
+            encode_keys: A boolean to determine whether the join columns are encoded as
+                int64 surrogate keys.
+
+        Returns:
+            An entityset with loaded data.
+        """
+
+        fhir, relationships, identifiers = self.resolve_df_entityset(fhir, columns, encode_keys)
+        entity_set = self.create_entityset(fhir, relationships, identifiers)
+
+        return self.store_merges(entity_set)
+
+    def materialize_entityset(self, entity_set):
+        """Returns an entityset with the merges deferred by its load applied.
+
+        The source columns of each deferred merge are copied into its target entity,
+        and the entityset is created again from the merged dataframes. The applied
+        merges are moved to the merges of the new entityset, so later appends apply
+        them too.
+
+        Args:
+            entity_set: An entityset loaded with load_df_entityset.
+
+        Returns:
+            A new entityset with the merged columns, or entity_set if no merge is
+            deferred.
+        """
+
+        merge_plan = getattr(entity_set, 'merge_plan', ())
+        if not merge_plan:
+            return entity_set
+
+        fhir = {entity.id: entity.df.reset_index(drop=True) for entity in entity_set.entities}
+        for step, columns in merge_plan:
+            fhir[step.target_entity] = merge_dataframes(
+                fhir[step.source_entity], fhir[step.target_entity], step, columns)
+
+        relationships = pd.DataFrame(
+            [(relationship.parent_entity.id, relationship.parent_variable.id,
+              relationship.child_entity.id, relationship.child_variable.id)
+             for relationship in entity_set.relationships],
+            columns=['parent_entity', 'parent_variable', 'child_entity', 'child_variable'])
+        identifiers = {entity.id: entity.index for entity in entity_set.entities}
+
+        self.key_encoder = entity_set.key_encoder
+        self.merges = entity_set.merges + merge_plan
+        self.merge_plan = ()
+
+        entity_set = self.create_entityset(fhir, relationships, identifiers)
+        return self.store_merges(entity_set)
+
+    def append_df_entityset(self, entity_set, fhir_delta):
+        """Appends new rows of fhir resources to an entityset loaded by load_df_entityset.
+
+        The new rows are validated against the fhir classes and the entities, their keys
+        are encoded with the key_encoder stored in the entityset, if any, and the merges
+        stored in it are applied to them only, taking the source columns from the
+        entityset and the other new rows. References that do not match a row of their
+        parent entity are logged. The appended columns keep the dtypes of the entities,
+        except for integer columns that get missing values.
+
+        Args:
+            entity_set: An entityset loaded with load_df_entityset.
+            fhir_delta: A dictionary of the new rows of fhir resources in pandas dataframe
+                format.
+
+        Returns:
+            The updated entityset.
+
+        Raises:
+            ValueError: An error occurs if the entityset does not store its merges, if a
+                resource is not an entity of the entityset, if its columns differ from
+                the entity or if its rows are repeated or already loaded.
+        """
+
+        if not hasattr(entity_set, 'merges'):
+            raise ValueError('The merges of the entityset are unknown, '
+                             'load it with load_df_entityset to append to it')
+
+        for name, df in fhir_delta.items():
+            if name not in entity_set.entity_dict:
+                raise ValueError('{} is not an entity of the entityset'.format(name))
+
+            self.create_object(df, name)
+
+        key_encoder = entity_set.key_encoder
+        if key_encoder is not None:
+            fhir_delta = key_encoder.fit(fhir_delta).transform(fhir_delta)
+
+        fhir_delta = dict(fhir_delta)
+        for step, columns in entity_set.merges:
+            if step.target_entity not in fhir_delta:
+                continue
+
+            source_df = entity_set[step.source_entity].df
+            if step.source_entity in fhir_delta:
+                source_df = pd.concat([source_df, fhir_delta[step.source_entity]],
+                                      ignore_index=True, sort=False)
+
+            fhir_delta[step.target_entity] = merge_dataframes(
+                source_df, fhir_delta[step.target_entity], step, columns)
+
+        for name, df in fhir_delta.items():
+            entity = entity_set[name]
+            df = self.set_dtypes(df, name)
+
+            unknown = [str(column) for column in df.columns if column not in entity.df.columns]
+            if unknown:
+                raise ValueError('Columns {} of {} do not exist in the entityset'.format(
+                    ', '.join(unknown), name))
+
+            repeated = df[entity.index].duplicated()
+            if repeated.any():
+                raise ValueError('{} rows {} are repeated in the new rows'.format(
+                    name, ', '.join(str(key) for key in df.loc[repeated, entity.index].unique())))
+
+            duplicated = df[entity.index].isin(entity.df[entity.index])
+            if duplicated.any():
+                raise ValueError('{} rows {} are already loaded'.format(
+                    name, ', '.join(str(key) for key in df.loc[duplicated, entity.index])))
+
+            fhir_delta[name] = df.reindex(columns=entity.df.columns)
+
+        for relationship in entity_set.relationships:
+            child = relationship.child_entity.id
+            if child not in fhir_delta:
+                continue
+
+            parent = relationship.parent_entity.id
+            parent_ids = entity_set[parent].df[relationship.parent_variable.id]
+            values = fhir_delta[child][relationship.child_variable.id].dropna()
+            dangling = ~values.isin(parent_ids)
+            if parent in fhir_delta:
+                dangling &= ~values.isin(fhir_delta[parent][relationship.parent_variable.id])
+
+            if dangling.any():
+                LOGGER.warning('%s rows of %s.%s do not match %s.%s', dangling.sum(), child,
+                               relationship.child_variable.id, parent,
+                               relationship.parent_variable.id)
+
+        for name, df in fhir_delta.items():
+            entity = entity_set[name]
+            updated = pd.concat([entity.df, df], ignore_index=True, sort=False)
+            for column in entity.df.columns:
+                if entity.df[column].dtype.name == 'category':
+                    updated[column] = updated[column].astype('category')
+                elif (is_numeric_dtype(entity.df[column]) and
+                      not is_numeric_dtype(updated[column])):
+                    updated[column] = pd.to_numeric(updated[column], errors='ignore')
+
+            entity.update_data(updated)
+
+        return entity_set
+
+    def write_parquet_files(self, fhir, folder_path):
+        """Writes the received dataframes in fhir as parquet files in folder_path.
+
+        The relationships between the resources are resolved first, so that the
+        stored tables are the ones loaded into the entityset. Each table is written
+        with its dtypes to a .parquet file, and the identifiers and relationships
+        are written to a manifest.json file.
+
+        Args:
+            fhir: A dictionary of fhir resources in pandas dataframe format.
+            folder_path: The directory where the files are written.
+
+        Raises:
+            ImportError: An error occurs if pyarrow is not installed.
+        """
+
+        pyarrow, parquet = _import_parquet()
+
+        fhir, relationships, identifiers = self.resolve_df_entityset(fhir)
+
+        if not os.path.exists(folder_path):
+            os.makedirs(folder_path)
+
+        entities = {}
+        for name, df in fhir.items():
+            df = self.set_dtypes(df, name)
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            parquet.write_table(table, os.path.join(folder_path, name + '.parquet'))
+
+            entities[name] = {'path': name + '.parquet',
+                              'index': identifiers[name],
+                              'columns': [str(column) for column in df.columns]}
+
+        manifest = {'entities': entities,
+                    'relationships': relationships.to_dict('records')}
+
+        with open(os.path.join(folder_path, PARQUET_MANIFEST), 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=4)
+
+    def read_parquet_files(self, folder_path, columns=None):
+        """Returns the resolved resources written as parquet files in folder_path.
+
+        The files are memory-mapped and, when columns lists the attributes needed
+        from a resource, only those are read along with its identifier and the
+        attributes of its relationships.
+
+        Args:
+            folder_path: A directory written by write_parquet_files.
+            columns: An optional dictionary of the columns to read from each resource.
+
+        Returns:
+            A tuple of the dictionary of dataframes, the dataframe of their
+            relationships and the dictionary of their identifiers.
+
+        Raises:
+            ImportError: An error occurs if pyarrow is not installed.
+        """
+
+        _, parquet = _import_parquet()
+
+        with open(os.path.join(folder_path, PARQUET_MANIFEST)) as manifest_file:
+            manifest = json.load(manifest_file)
+
+        relationships = pd.DataFrame(manifest['relationships'], columns=[
+            'parent_entity', 'parent_variable', 'child_entity', 'child_variable'])
+
+        fhir = {}
+        identifiers = {}
+        for name, entity in manifest['entities'].items():
+            identifiers[name] = entity['index']
+
+            read_columns = None
+            if columns is not None and name in columns:
+                required = {entity['index']}
+                required.update(relationships.loc[
+                    relationships['parent_entity'] == name, 'parent_variable'])
+                required.update(relationships.loc[
+                    relationships['child_entity'] == name, 'child_variable'])
+                if name == 'Period':
+                    required.add('start')
+
+                read_columns = [column for column in entity['columns']
+                                if column in required or column in columns[name]]
+
+            table = parquet.read_table(os.path.join(folder_path, entity['path']),
+                                       columns=read_columns, memory_map=True,
+                                       use_pandas_metadata=True)
+            fhir[name] = table.to_pandas()
+
+        return fhir, relationships, identifiers
+
+    def load_parquet_entityset(self, folder_path, columns=None):
+        """Returns an entityset loaded with the parquet files in folder_path.
+
+        The tables are already resolved, so they are loaded into featuretools'
+        entityset without being parsed or merged again.
+
+        Args:
+            folder_path: A directory written by write_parquet_files.
+            columns: An optional dictionary of the columns to read from each resource.
+
+        Returns:
+            An entityset with loaded data.
+        """
+
+        fhir, relationships, identifiers = self.read_parquet_files(folder_path, columns)
+        return self.create_entityset(fhir, relationships, identifiers)
@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_float_dtype
+
+from cardea.fhir import RESOURCES
+from cardea.fhir.schema import get_schema
+
+
+class KeyEncoder():
+    """A class that encodes the join columns of fhir resources as integer surrogate keys.
+
+    Identifiers, object ids and the columns that reference them are mixed ints and
+    strings, which are joined by their string representation. The encoder maps every
+    distinct string representation, across all the resources, to an int64 code, so
+    equal keys get equal codes in every resource. Integral float keys, the ints read as
+    floats because of missing values, are represented as ints, while other float keys
+    keep their decimals, so 1.5 gets its own code. Missing keys stay missing, so a
+    column with missing keys, like ints with missing values, gets float64 codes.
+
+    Attributes:
+        keys: An index of the encoded keys, where the position of a key is its code.
+    """
+
+    __name__ = 'KeyEncoder'
+
+    def __init__(self):
+        self.keys = pd.Index([], dtype=object)
+
+    @staticmethod
+    def get_key_columns(name, columns):
+        """Returns the join columns of a fhir resource among the given columns.
+
+        Args:
+            name: The name of the fhir class.
+            columns: An iterable of the loaded column names.
+
+        Returns:
+            A list with the names of the identifier and reference columns.
+        """
+
+        if name not in RESOURCES:
+            return []
+
+        types = get_schema(name).types
+        return [column for column in columns if types.get(column) == 'reference']
+
+    @staticmethod
+    def _to_str(values):
+        values = values[values.notnull()]
+        keys = values.astype('str')
+        if is_float_dtype(values):
+            # ints read as floats because of missing values
+            integral = (values == values.round()).values
+            keys[integral] = values[integral].astype('int64').astype('str')
+
+        return keys
+
+    @classmethod
+    def normalize(cls, values):
+        """Returns the string representation that a column of keys is joined by.
+
+        Args:
+            values: A pandas series of keys.
+
+        Returns:
+            A pandas series of string keys, None for missing keys.
+        """
+
+        known = values.notnull().values
+        keys = np.full(len(values), None, dtype=object)
+        keys[known] = cls._to_str(values).values
+
+        return pd.Series(keys, index=values.index, name=values.name, dtype=object)
+
+    def fit(self, fhir):
+        """Learns the keys of the join columns of the resources in fhir.
+
+        Args:
+            fhir: A dictionary of fhir resources in pandas dataframe format.
+
+        Returns:
+            The fitted encoder.
+        """
+
+        values = [self.keys.values]
+        for name, df in fhir.items():
+            for column in self.get_key_columns(name, df.columns):
+                values.append(self._to_str(df[column]).unique())
+
+        self.keys = pd.Index(pd.unique(np.concatenate(values)))
+        return self
+
+    def encode(self, values):
+        """Returns the codes of a column of keys.
+
+        Args:
+            values: A pandas series of keys.
+
+        Returns:
+            A pandas series of int64 codes, or of float64 codes if some keys are
+            missing or unknown, which are NaN.
+        """
+
+        known = values.notnull().values
+        codes = np.full(len(values), -1, dtype='int64')
+        codes[known] = self.keys.get_indexer(self._to_str(values).values)
+
+        codes = pd.Series(codes, index=values.index, name=values.name)
+        return codes.where(codes >= 0) if (codes < 0).any() else codes
+
+    def decode(self, codes):
+        """Returns the keys of a column of codes.
+
+        Args:
+            codes: A pandas series of int64 or float64 codes.
+
+        Returns:
+            A pandas series of string keys, None for missing keys.
+        """
+
+        known = codes.notnull().values
+        keys = np.full(len(codes), None, dtype=object)
+        keys[known] = self.keys.values[codes.values[known].astype('int64')]
+
+        return pd.Series(keys, index=codes.index, name=codes.name, dtype=object)
+
+    def transform(self, fhir):
+        """Returns the resources in fhir with their join columns encoded.
+
+        Args:
+            fhir: A dictionary of fhir resources in pandas dataframe format.
+
+        Returns:
+            A dictionary of fhir resources in pandas dataframe format.
+        """
+
+        encoded = {}
+        for name, df in fhir.items():
+            key_columns = self.get_key_columns(name, df.columns)
+            if key_columns:
+                df = df.assign(**{column: self.encode(df[column]) for column in key_columns})
+
+            encoded[name] = df
+
+        return encoded
+
+    def fit_transform(self, fhir):
+        """Learns the keys of the resources in fhir and returns them encoded.
+
+        Args:
+            fhir: A dictionary of fhir resources in pandas dataframe format.
+
+        Returns:
+            A dictionary of fhir resources in pandas dataframe format.
+        """
+
+        return self.fit(fhir).transform(fhir)
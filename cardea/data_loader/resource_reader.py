@@ -0,0 +1,264 @@
+import json
+import logging
+from collections import Counter, defaultdict
+from glob import glob
+from itertools import count
+
+import pandas as pd
+
+from cardea.fhir import RESOURCES
+from cardea.fhir.schema import get_schema
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ResourceReader():
+    """A class that flattens FHIR JSON resources into per-resource tables.
+
+    Nested elements are moved to the table of the class they reference, following the
+    relationships of each fhir class, and replaced by the key of the created row.
+    Resources are keyed by their type and logical id, as in "Patient/p1", so resources
+    of different types may share a logical id, while nested elements get generated keys
+    starting with "_", which no logical id does. References are kept as the key of the
+    referenced resource and gathered in the Reference table, while the business
+    identifier of each resource is gathered in the Identifier table under the resource
+    key.
+
+    Each table row holds a single value per column, so only the first element of
+    repeated elements is kept. The other elements are counted in dropped and logged
+    once all the files are read.
+
+    Attributes:
+        chunksize: The number of resources flattened before a chunk of tables is emitted.
+        dropped: A Counter of the elements dropped from each repeated (class, field).
+    """
+
+    __name__ = 'ResourceReader'
+
+    def __init__(self, chunksize=10000):
+        self.chunksize = chunksize
+        self._keys = count()
+        self._rows = defaultdict(list)
+        self._references = set()
+        self._identifiers = set()
+        self._urls = {}
+        self.dropped = Counter()
+
+    @staticmethod
+    def get_reference_id(reference):
+        """Returns the logical id of the resource pointed by a reference.
+
+        Args:
+            reference: A string with a relative, absolute or urn reference.
+
+        Returns:
+            The logical id of the referenced resource.
+        """
+
+        if '/_history/' in reference:
+            reference = reference.split('/_history/')[0]
+
+        return reference.rsplit('/', 1)[-1].rsplit(':', 1)[-1]
+
+    @staticmethod
+    def get_reference_key(reference):
+        """Returns the key of the resource pointed by a reference.
+
+        Args:
+            reference: A string with a relative, absolute or urn reference.
+
+        Returns:
+            The type and logical id of the referenced resource, as in "Patient/p1", or
+            the reference itself for urn references, which do not name the type.
+        """
+
+        if '/_history/' in reference:
+            reference = reference.split('/_history/')[0]
+
+        if reference.startswith('urn:'):
+            return reference
+
+        return '/'.join(reference.rsplit('/', 2)[-2:])
+
+    def flatten(self, resource, name=None, key=None):
+        """Flattens a JSON resource into rows of the per-resource tables.
+
+        Args:
+            resource: A dictionary with the JSON representation of the resource.
+            name: The fhir class of the resource, taken from resourceType by default.
+            key: The key of the resource row, its type and id or generated by default.
+
+        Returns:
+            The key of the resource row.
+        """
+
+        name = name or resource.get('resourceType')
+        if name not in RESOURCES:
+            LOGGER.debug('Skipping %s, it is not part of FHIR schema', name)
+            return None
+
+        schema = get_schema(name)
+        relationships = {relation.child_variable: relation for relation in schema.relationships}
+        id_column = schema.identifiers[0]
+
+        if key is None:
+            key = resource.get('id')
+            key = self._next_key() if key is None else '{}/{}'.format(name, key)
+
+        row = {id_column: key}
+        for field, value in resource.items():
+            if field not in schema.fields and '_' + field in schema.fields:
+                field = '_' + field  # attributes named after python keywords
+
+            if field not in schema.fields or field in ('resourceType', id_column):
+                continue
+
+            if isinstance(value, list):
+                if not value:
+                    continue
+
+                if len(value) > 1:
+                    self.dropped[(name, field)] += len(value) - 1
+
+                value = value[0]
+
+            relation = relationships.get(field)
+            if relation is None:
+                if not isinstance(value, dict):
+                    row[field] = value
+
+            elif isinstance(value, dict):
+                row[field] = self._flatten_element(relation.parent_entity, value)
+
+        identifier = resource.get('identifier')
+        if id_column == 'identifier' and identifier:
+            if isinstance(identifier, list):
+                if len(identifier) > 1:
+                    self.dropped[(name, 'identifier')] += len(identifier) - 1
+
+                identifier = identifier[0]
+
+            if isinstance(identifier, dict):
+                self._add_identifier(identifier, key)
+
+        self._rows[name].append(row)
+        return key
+
+    def _flatten_element(self, name, element):
+        if name == 'Reference':
+            return self._add_reference(element)
+
+        return self.flatten(element, name=name, key=self._next_key())
+
+    def _next_key(self):
+        # "_" is not a character of logical ids, so generated keys never match a resource
+        return '_{}'.format(next(self._keys))
+
+    def _add_reference(self, element):
+        if 'reference' not in element:
+            return None
+
+        reference = element['reference']
+        key = self._urls.get(reference) or self.get_reference_key(reference)
+        if key not in self._references:
+            self._references.add(key)
+            self._rows['Reference'].append({'identifier': key,
+                                            'reference': element['reference'],
+                                            'display': element.get('display')})
+
+        return key
+
+    def _add_identifier(self, element, key):
+        if key not in self._identifiers:
+            self._identifiers.add(key)
+            self.flatten(element, name='Identifier', key=key)
+
+    def get_tables(self):
+        """Returns the flattened rows as dataframes and clears them.
+
+        Returns:
+            A dictionary of fhir resources in pandas dataframe format.
+        """
+
+        tables = {name: pd.DataFrame(rows) for name, rows in self._rows.items() if rows}
+        self._rows = defaultdict(list)
+        return tables
+
+    def iter_resources(self, file_path):
+        """Yields the resources stored in a NDJSON or a Bundle JSON file.
+
+        NDJSON files are read one line at a time. Bundles are parsed whole with
+        json.load, so a Bundle file must fit in memory, and their entries are yielded
+        one at a time, while references to the fullUrl of an entry are resolved to the
+        key of its resource.
+
+        Args:
+            file_path: The path of a .ndjson or .json file.
+
+        Yields:
+            A dictionary with the JSON representation of each resource.
+        """
+
+        with open(file_path) as json_file:
+            if file_path.endswith('.ndjson'):
+                for line in json_file:
+                    if line.strip():
+                        yield json.loads(line)
+
+            else:
+                bundle = json.load(json_file)
+                if bundle.get('resourceType') != 'Bundle':
+                    yield bundle
+                    return
+
+                # references to the fullUrl of an entry point to its resource
+                resources = []
+                self._urls = {}
+                for entry in bundle.get('entry', []):
+                    resource = entry.get('resource')
+                    if resource is not None and 'id' not in resource and 'fullUrl' in entry:
+                        resource = dict(resource, id=self.get_reference_id(entry['fullUrl']))
+
+                    if resource is not None:
+                        resources.append(resource)
+                        if 'fullUrl' in entry:
+                            self._urls[entry['fullUrl']] = '{}/{}'.format(
+                                resource.get('resourceType'), resource['id'])
+
+                for resource in resources:
+                    yield resource
+
+                self._urls = {}
+
+    def iter_chunks(self, folder_path):
+        """Yields the resources of the NDJSON and Bundle files in folder_path by chunks.
+
+        The flattened rows of at most chunksize resources are held at a time, besides
+        the set of references and identifiers already emitted and the Bundle being
+        read. The elements dropped from repeated elements are logged at the end.
+
+        Args:
+            folder_path: A directory of .ndjson and .json files.
+
+        Yields:
+            A dictionary of fhir resources in pandas dataframe format for each chunk.
+        """
+
+        file_paths = sorted(glob(folder_path + "/*.ndjson") + glob(folder_path + "/*.json"))
+
+        flattened = 0
+        for file_path in file_paths:
+            for resource in self.iter_resources(file_path):
+                self.flatten(resource)
+                flattened += 1
+
+                if flattened % self.chunksize == 0:
+                    yield self.get_tables()
+
+        tables = self.get_tables()
+        if tables:
+            yield tables
+
+        for (name, field), dropped in sorted(self.dropped.items()):
+            LOGGER.warning('%s elements of %s.%s were dropped, only the first element of '
+                           'repeated elements is kept', dropped, name, field)
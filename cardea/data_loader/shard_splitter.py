@@ -0,0 +1,255 @@
+import logging
+import os
+from glob import glob
+
+import numpy as np
+import pandas as pd
+
+from cardea.data_loader.data_loader import get_identifier_index
+from cardea.data_loader.key_encoder import KeyEncoder
+from cardea.fhir import RESOURCES
+from cardea.fhir.schema import Relationship, get_schema
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ShardSplitter():
+    """A class that partitions fhir .csv files into shards of patients.
+
+    Patients are assigned to a shard by the hash of their identifier, as are the rows
+    of the resources that reference a patient through one of patient_columns. Like
+    the loader, a reference column is taken to point to the resource that owns most
+    of its values, so a subject that holds encounters, as in Condition, follows the
+    shards of its encounters instead. The shards then spread along the relationships
+    of the fhir classes: a row belongs to the shards of the rows that reference it,
+    and the resources that are not reachable that way belong to the shards of the
+    rows they reference. Rows of the resources that are not connected to a patient
+    are copied to every shard, while the rows of connected resources that no patient
+    reaches, like the ones without subject, are written to the first shard.
+
+    Keys are compared by the string representation KeyEncoder joins them by, so an
+    identifier read as an int in one file and as a float in another lands in the same
+    shard.
+
+    Only the join columns are held in memory while assigning the shards, and the
+    files are then copied to the shards by chunks.
+
+    Attributes:
+        n_shards: The number of shards.
+        chunksize: The number of rows copied at a time.
+        patient_columns: The columns that reference the patient of a resource.
+    """
+
+    __name__ = 'ShardSplitter'
+
+    def __init__(self, n_shards=4, chunksize=100000, patient_columns=('subject', 'patient')):
+        self.n_shards = n_shards
+        self.chunksize = chunksize
+        self.patient_columns = patient_columns
+
+    def _hash(self, values):
+        codes = pd.util.hash_pandas_object(values.fillna(''), index=False).values
+        shards = np.zeros((len(values), self.n_shards), dtype=bool)
+        shards[np.arange(len(values)), codes % self.n_shards] = True
+        shards[values.isnull().values] = False
+
+        return shards
+
+    @staticmethod
+    def _assign_unreached(name, shards):
+        unreached = ~shards.any(axis=1)
+        if unreached.any():
+            LOGGER.info('%s rows of %s are not reached by any patient, writing them to the '
+                        'first shard', unreached.sum(), name)
+            shards[unreached, 0] = True
+
+    def _spread(self, source, source_shards, target):
+        values = source.dropna()
+        source_shards = source_shards[source.notnull().values]
+
+        return np.column_stack([target.isin(values[source_shards[:, shard]]).values
+                                for shard in range(self.n_shards)])
+
+    @staticmethod
+    def resolve_references(keys):
+        """Returns the relationships of the reference columns to the resources they point to.
+
+        Each reference column points to the resource that owns most of its values, the
+        first one in the order of keys on ties, as resolved by the loader.
+
+        Args:
+            keys: A dictionary of the join columns of fhir resources in pandas dataframe
+                format, as strings.
+
+        Returns:
+            A list of relationships from the reference columns to the identifier of the
+            resource they point to.
+        """
+
+        index = get_identifier_index(keys)
+
+        relationships = []
+        for name, df in keys.items():
+            if name not in RESOURCES:
+                continue
+
+            for relation in get_schema(name).get_relationships(df.columns, ['Reference']):
+                values = df[relation.child_variable].dropna()
+                counts = index.loc[index['identifier'].isin(values), 'resource'].value_counts(
+                    sort=False)
+                counts = counts[counts > 0]
+                if len(counts):
+                    relationships.append(Relationship(counts.idxmax(), 'identifier', name,
+                                                      relation.child_variable))
+
+        return relationships
+
+    def get_shards(self, keys):
+        """Returns the shards of the rows of each resource.
+
+        Args:
+            keys: A dictionary of the join columns of fhir resources in pandas dataframe
+                format, as strings.
+
+        Returns:
+            A dictionary of boolean arrays with a row per resource row and a column per
+            shard, True where the row belongs to the shard.
+        """
+
+        return self._assign_shards(keys)[0]
+
+    def _assign_shards(self, keys):
+        references = self.resolve_references(keys)
+        targets = {(relation.child_entity, relation.child_variable): relation.parent_entity
+                   for relation in references}
+
+        shards = {}
+        if 'Patient' in keys and 'identifier' in keys['Patient'].columns:
+            shards['Patient'] = self._hash(keys['Patient']['identifier'])
+
+        # columns whose values no resource owns are taken as patients
+        for name, df in keys.items():
+            patient_columns = [column for column in self.patient_columns
+                               if column in df.columns and
+                               targets.get((name, column), 'Patient') == 'Patient']
+            if name != 'Patient' and patient_columns:
+                shards[name] = self._hash(df[patient_columns[0]])
+
+        seeds = set(shards)
+        for name in seeds:
+            self._assign_unreached(name, shards[name])
+
+        # the resolved references come first, so the rows of unreached resources take the
+        # shards of the resources they point to rather than of Reference
+        relationships = [relation for name, df in keys.items() if name in RESOURCES
+                         for relation in get_schema(name).get_relationships(df.columns, keys)]
+        relationships = [relation for relation in references + relationships
+                         if relation.parent_entity != relation.child_entity and
+                         relation.parent_variable in keys[relation.parent_entity].columns]
+
+        changed = True
+        while changed:
+            changed = False
+
+            # the rows referenced by a shard belong to it
+            for relation in relationships:
+                parent, child = relation.parent_entity, relation.child_entity
+                if child not in shards or parent in seeds:
+                    continue
+
+                spread = self._spread(keys[child][relation.child_variable], shards[child],
+                                      keys[parent][relation.parent_variable])
+                if parent in shards:
+                    spread |= shards[parent]
+
+                if parent not in shards or (spread != shards[parent]).any():
+                    shards[parent] = spread
+                    changed = True
+
+            if changed:
+                continue
+
+            # the rows of unreached resources belong to the shards they reference
+            for relation in relationships:
+                parent, child = relation.parent_entity, relation.child_entity
+                if parent in shards and child not in shards:
+                    shards[child] = self._spread(
+                        keys[parent][relation.parent_variable], shards[parent],
+                        keys[child][relation.child_variable])
+                    changed = True
+
+        connected = set(shards)
+        for name, df in keys.items():
+            if name not in shards:
+                shards[name] = np.ones((len(df), self.n_shards), dtype=bool)
+            else:
+                self._assign_unreached(name, shards[name])
+
+        return shards, connected
+
+    def read_keys(self, csv_files):
+        """Returns the join columns of the given .csv files.
+
+        Args:
+            csv_files: A dictionary of resource names and the paths of their .csv files.
+
+        Returns:
+            A dictionary of the join columns of fhir resources in pandas dataframe format,
+            as the strings KeyEncoder joins them by.
+        """
+
+        keys = {}
+        for name, file_path in csv_files.items():
+            columns = pd.read_csv(file_path, nrows=0).columns
+            key_columns = KeyEncoder.get_key_columns(name, columns)
+            key_columns += [column for column in self.patient_columns
+                            if column in columns and column not in key_columns]
+
+            # a column is still read for resources without keys, to count their rows
+            df = pd.read_csv(file_path, usecols=key_columns or columns[:1])
+            keys[name] = df.apply(KeyEncoder.normalize)
+
+        return keys
+
+    def split_csv_files(self, folder_path, shards_path):
+        """Copies the .csv files in folder_path into a folder per shard.
+
+        Args:
+            folder_path: A directory of all .csv files that should be split.
+            shards_path: The directory where the shard folders are written.
+
+        Returns:
+            A list with the directories of the shards, leaving out the shards that no
+            row connected to a patient belongs to, which are not written.
+        """
+
+        csv_files = {file_path.split("/")[-1].split(".")[0]: file_path
+                     for file_path in glob(folder_path + "/*.csv")}
+
+        shards, connected = self._assign_shards(self.read_keys(csv_files))
+
+        used = np.zeros(self.n_shards, dtype=bool)
+        for name in connected:
+            used |= shards[name].any(axis=0)
+
+        if connected and not used.all():
+            LOGGER.info('%s of %s shards hold no patient, they are not written',
+                        (~used).sum(), self.n_shards)
+
+        shard_paths = {shard: os.path.join(shards_path, 'shard_{}'.format(shard))
+                       for shard in range(self.n_shards) if used[shard] or not connected}
+        for shard_path in shard_paths.values():
+            if not os.path.exists(shard_path):
+                os.makedirs(shard_path)
+
+        for name, file_path in csv_files.items():
+            chunks = pd.read_csv(file_path, dtype=str, keep_default_na=False,
+                                 chunksize=self.chunksize)
+            for i, chunk in enumerate(chunks):
+                rows = shards[name][chunk.index.values]
+                for shard, shard_path in shard_paths.items():
+                    chunk[rows[:, shard]].to_csv(os.path.join(shard_path, name + '.csv'),
+                                                 mode='w' if i == 0 else 'a',
+                                                 header=i == 0, index=False)
+
+        return list(shard_paths.values())
@@ -1,11 +1,47 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 import featuretools as ft
+import numpy as np
+import pandas as pd
+
+# passed through the feature matrix to put the partitions back in the cutoff order
+POSITION = '_cutoff_position'
+
+
+def _get_n_jobs(n_jobs):
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+
+    return n_jobs
+
+
+def _calculate_partition(features_defs, es, cutoff):
+    return ft.calculate_feature_matrix(features_defs,
+                                       entityset=es,
+                                       cutoff_time=cutoff,
+                                       n_jobs=1,
+                                       verbose=False)
 
 
 class Featurization():
-    """A class that generates a feature matrix from its attributes."""
+    """A class that generates a feature matrix from its attributes.
+
+    With n_jobs other than 1, the feature definitions are computed once and the
+    cutoff times are split by instance into a partition per worker, whose feature
+    matrices are calculated in a process pool and put back in the cutoff order.
+
+    Attributes:
+        workers: The number of processes used to calculate a feature matrix, -1 for
+            one per CPU.
+    """
 
     __name__ = 'Featurization'
 
+    def __init__(self, n_jobs=1):
+        self.workers = n_jobs
+
     @staticmethod
     def agg_prim():
         return ["sum", "std", "max", "skew", "min", "mean", "count", "percent_true"]
@@ -14,36 +50,121 @@ class Featurization():
     def trans_prim():
         return ["day", "month", "year", "weekday", "is_weekend"]
 
-    @staticmethod
-    def n_jobs():
-        return 1
+    def n_jobs(self):
+        return _get_n_jobs(self.workers)
 
     @staticmethod
     def max_depth():
         return 2
 
-    def generate_feature_matrix(self, es, target, cutoff, verbose=True):
+    def generate_feature_matrix(self, es, target, cutoff, verbose=True, n_jobs=None):
         """Calculates a feature matrix and features given in Featurization object.
             Args:
             es: A featuretools entityset that holds injested data.
             target: A string of the target entity name.
             cutoff: A pandas dataframe that indicates cutoff_time for each instance.
             verbose: A boolean indicator of verbose option.
+            n_jobs: The number of processes, defaults to the Featurization ones.
             Returns:
             A pandas dataframe of the calculated matrix.
             """
 
-        feature_matrix, features_defs = ft.dfs(entityset=es,
-                                               target_entity=target,
-                                               agg_primitives=self.agg_prim(),
-                                               trans_primitives=self.trans_prim(),
-                                               cutoff_time=cutoff,
-                                               n_jobs=self.n_jobs(),
-                                               max_depth=self.max_depth(),
-                                               verbose=verbose)
+        n_jobs = self.n_jobs() if n_jobs is None else _get_n_jobs(n_jobs)
+        if n_jobs == 1:
+            feature_matrix, features_defs = ft.dfs(entityset=es,
+                                                   target_entity=target,
+                                                   agg_primitives=self.agg_prim(),
+                                                   trans_primitives=self.trans_prim(),
+                                                   cutoff_time=cutoff,
+                                                   n_jobs=1,
+                                                   max_depth=self.max_depth(),
+                                                   verbose=verbose)
+
+        else:
+            features_defs = self.generate_feature_defs(es, target, cutoff)
+            feature_matrix = self.calculate_feature_matrix(features_defs, es, cutoff,
+                                                           verbose=verbose, n_jobs=n_jobs)
 
         # encode categorical values
         fm_encoded, features_encoded = ft.encode_features(feature_matrix,
                                                           features_defs)
 
         return fm_encoded, features_encoded
+
+    def generate_feature_defs(self, es, target, cutoff):
+        """Generates the feature definitions given in Featurization object.
+
+        Args:
+            es: A featuretools entityset that holds injested data.
+            target: A string of the target entity name.
+            cutoff: A pandas dataframe that indicates cutoff_time for each instance.
+
+        Returns:
+            A list of featuretools feature definitions.
+        """
+
+        return ft.dfs(entityset=es,
+                      target_entity=target,
+                      agg_primitives=self.agg_prim(),
+                      trans_primitives=self.trans_prim(),
+                      cutoff_time=cutoff,
+                      max_depth=self.max_depth(),
+                      features_only=True)
+
+    @staticmethod
+    def partition_cutoff(cutoff, n_partitions):
+        """Splits the cutoff times by instance into partitions.
+
+        Every cutoff time of an instance falls in the same partition. Each partition
+        keeps the position of its rows in cutoff in the POSITION column.
+
+        Args:
+            cutoff: A pandas dataframe that indicates cutoff_time for each instance, with
+                the instances in its instance_id column, or in its first column if it
+                has none, as featuretools reads it.
+            n_partitions: The maximum number of partitions.
+
+        Returns:
+            A list of the non-empty partitions of cutoff.
+        """
+
+        instances = cutoff['instance_id'] if 'instance_id' in cutoff.columns else cutoff.iloc[:, 0]
+        cutoff = cutoff.assign(**{POSITION: np.arange(len(cutoff))})
+        partitions = pd.factorize(instances)[0] % n_partitions
+
+        return [cutoff[partitions == partition] for partition in range(n_partitions)
+                if (partitions == partition).any()]
+
+    def calculate_feature_matrix(self, features_defs, es, cutoff, verbose=False, n_jobs=None):
+        """Calculates a feature matrix of the given feature definitions.
+
+        The definitions can come from another entityset with the same entities, such as
+        another shard of the data.
+
+        Args:
+            features_defs: A list of featuretools feature definitions.
+            es: A featuretools entityset that holds injested data.
+            cutoff: A pandas dataframe that indicates cutoff_time for each instance.
+            verbose: A boolean indicator of verbose option.
+            n_jobs: The number of processes, defaults to the Featurization ones.
+
+        Returns:
+            A pandas dataframe of the calculated matrix, not encoded.
+        """
+
+        n_jobs = self.n_jobs() if n_jobs is None else _get_n_jobs(n_jobs)
+        partitions = self.partition_cutoff(cutoff, n_jobs)
+        if len(partitions) < 2:
+            return ft.calculate_feature_matrix(features_defs,
+                                               entityset=es,
+                                               cutoff_time=cutoff,
+                                               n_jobs=1,
+                                               verbose=verbose)
+
+        with ProcessPoolExecutor(max_workers=len(partitions)) as executor:
+            feature_matrices = list(executor.map(
+                _calculate_partition, repeat(features_defs), repeat(es), partitions))
+
+        feature_matrix = pd.concat(feature_matrices, sort=False)
+        order = np.argsort(feature_matrix[POSITION].values, kind='mergesort')
+        return feature_matrix.iloc[order].drop(columns=POSITION)
@@ -35,6 +35,32 @@ class Account(fhirbase):
 
     __name__ = 'Account'
 
+    _enums = {
+        'status': ['active', 'inactive', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'type': 'reference',
+        'name': 'str',
+        'subject': 'reference',
+        'period': 'reference',
+        'active': 'reference',
+        'balance': 'reference',
+        'coverage': 'reference',
+        'owner': 'reference',
+        'description': 'str',
+        'guarantor': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'type', 'name', 'subject', 'period', 'active', 'balance',
+        'coverage', 'owner', 'description', 'guarantor', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Account'
         # type: str
@@ -84,15 +110,6 @@ class Account(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'inactive', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, inactive, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -160,6 +177,15 @@ class Account_Coverage(fhirbase):
 
     __name__ = 'Account_Coverage'
 
+    _types = {
+        'coverage': 'reference',
+        'priority': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = ('coverage', 'priority', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.coverage = None
         # reference to Reference: identifier
@@ -199,6 +225,16 @@ class Account_Guarantor(fhirbase):
 
     __name__ = 'Account_Guarantor'
 
+    _types = {
+        'party': 'reference',
+        'onHold': 'bool',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('party', 'onHold', 'period', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.party = None
         # reference to Reference: identifier
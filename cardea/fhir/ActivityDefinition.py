@@ -123,6 +123,63 @@ class ActivityDefinition(fhirbase):
 
     __name__ = 'ActivityDefinition'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'usage': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'effectivePeriod': 'reference',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'topic': 'reference',
+        'contributor': 'reference',
+        'contact': 'reference',
+        'copyright': 'str',
+        'relatedArtifact': 'reference',
+        'library': 'reference',
+        'kind': 'str',
+        'code': 'reference',
+        'timingTiming': 'reference',
+        'timingDateTime': 'str',
+        'timingPeriod': 'reference',
+        'timingRange': 'reference',
+        'location': 'reference',
+        'participant': 'reference',
+        'productReference': 'reference',
+        'productCodeableConcept': 'reference',
+        'quantity': 'reference',
+        'dosage': 'reference',
+        'bodySite': 'reference',
+        'transform': 'reference',
+        'dynamicValue': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'description', 'purpose', 'usage', 'approvalDate', 'lastReviewDate',
+        'effectivePeriod', 'useContext', 'jurisdiction', 'topic', 'contributor', 'contact',
+        'copyright', 'relatedArtifact', 'library', 'kind', 'code', 'timingTiming',
+        'timingDateTime', 'timingPeriod', 'timingRange', 'location', 'participant',
+        'productReference', 'productCodeableConcept', 'quantity', 'dosage', 'bodySite',
+        'transform', 'dynamicValue', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ActivityDefinition'
         # type: str
@@ -259,15 +316,6 @@ class ActivityDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -397,6 +445,15 @@ class ActivityDefinition_Participant(fhirbase):
 
     __name__ = 'ActivityDefinition_Participant'
 
+    _types = {
+        'type': 'str',
+        'role': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'role', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -439,6 +496,17 @@ class ActivityDefinition_DynamicValue(fhirbase):
 
     __name__ = 'ActivityDefinition_DynamicValue'
 
+    _types = {
+        'description': 'str',
+        'path': 'str',
+        'language': 'str',
+        'expression': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('description', 'path', 'language', 'expression', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.description = None
         # type: str
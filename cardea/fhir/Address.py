@@ -33,6 +33,31 @@ class Address(fhirbase):
 
     __name__ = 'Address'
 
+    _enums = {
+        'use': ['home', 'work', 'temp', 'old'],
+        'type': ['postal', 'physical', 'both'],
+    }
+
+    _types = {
+        'use': 'str',
+        'type': 'str',
+        'text': 'str',
+        'line': 'list',
+        'city': 'str',
+        'district': 'str',
+        'state': 'str',
+        'postalCode': 'str',
+        'country': 'str',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'use', 'type', 'text', 'line', 'city', 'district', 'state', 'postalCode', 'country',
+        'period', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.use = None
         # type: str
@@ -73,22 +98,6 @@ class Address(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'home', 'work', 'temp', 'old']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'home, work, temp, old'))
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'postal', 'physical', 'both']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'postal, physical, both'))
-
     def get_relationships(self):
 
         return [
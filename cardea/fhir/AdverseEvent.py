@@ -46,6 +46,37 @@ class AdverseEvent(fhirbase):
 
     __name__ = 'AdverseEvent'
 
+    _enums = {
+        'category': ['ae', 'pae'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'category': 'str',
+        'type': 'reference',
+        'subject': 'reference',
+        'date': 'str',
+        'reaction': 'reference',
+        'location': 'reference',
+        'seriousness': 'reference',
+        'outcome': 'reference',
+        'recorder': 'reference',
+        'eventParticipant': 'reference',
+        'description': 'str',
+        'suspectEntity': 'reference',
+        'subjectMedicalHistory': 'reference',
+        'referenceDocument': 'reference',
+        'study': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'category', 'type', 'subject', 'date', 'reaction', 'location',
+        'seriousness', 'outcome', 'recorder', 'eventParticipant', 'description', 'suspectEntity',
+        'subjectMedicalHistory', 'referenceDocument', 'study', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'AdverseEvent'
         # type: str
@@ -109,15 +140,6 @@ class AdverseEvent(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.category is not None:
-            for value in self.category:
-                if value is not None and value.lower() not in [
-                        'ae', 'pae']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'AE, PAE'))
-
     def get_relationships(self):
 
         return [
@@ -210,6 +232,27 @@ class AdverseEvent_SuspectEntity(fhirbase):
 
     __name__ = 'AdverseEvent_SuspectEntity'
 
+    _enums = {
+        'causality': ['causality1', 'causality2'],
+    }
+
+    _types = {
+        'instance': 'reference',
+        'causality': 'str',
+        'causalityAssessment': 'reference',
+        'causalityProductRelatedness': 'str',
+        'causalityMethod': 'reference',
+        'causalityAuthor': 'reference',
+        'causalityResult': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'instance', 'causality', 'causalityAssessment', 'causalityProductRelatedness',
+        'causalityMethod', 'causalityAuthor', 'causalityResult', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.instance = None
         # reference to Reference: identifier
@@ -240,15 +283,6 @@ class AdverseEvent_SuspectEntity(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.causality is not None:
-            for value in self.causality:
-                if value is not None and value.lower() not in [
-                        'causality1', 'causality2']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'causality1, causality2'))
-
     def get_relationships(self):
 
         return [
@@ -10,6 +10,13 @@ class Age(fhirbase):
 
     __name__ = 'Age'
 
+    _types = {
+        'object_id': 'reference',
+    }
+
+    _fields = ('object_id',)
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.object_id = None
         # unique identifier for object class
@@ -57,6 +57,44 @@ class AllergyIntolerance(fhirbase):
 
     __name__ = 'AllergyIntolerance'
 
+    _enums = {
+        'clinicalStatus': ['active', 'inactive', 'resolved'],
+        'verificationStatus': ['unconfirmed', 'confirmed', 'refuted', 'entered-in-error'],
+        'type': ['allergy', 'intolerance'],
+        'category': ['food', 'medication', 'environment', 'biologic'],
+        'criticality': ['low', 'high', 'unable-to-assess'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'clinicalStatus': 'str',
+        'verificationStatus': 'str',
+        'type': 'str',
+        'category': 'list',
+        'criticality': 'str',
+        'code': 'reference',
+        'patient': 'reference',
+        'onsetDateTime': 'str',
+        'onsetAge': 'reference',
+        'onsetPeriod': 'reference',
+        'onsetRange': 'reference',
+        'onsetString': 'str',
+        'assertedDate': 'str',
+        'recorder': 'reference',
+        'asserter': 'reference',
+        'lastOccurrence': 'str',
+        'note': 'reference',
+        'reaction': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'clinicalStatus', 'verificationStatus', 'type', 'category', 'criticality',
+        'code', 'patient', 'onsetDateTime', 'onsetAge', 'onsetPeriod', 'onsetRange', 'onsetString',
+        'assertedDate', 'recorder', 'asserter', 'lastOccurrence', 'note', 'reaction', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'AllergyIntolerance'
         # type: str
@@ -132,43 +170,6 @@ class AllergyIntolerance(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.clinicalStatus is not None:
-            for value in self.clinicalStatus:
-                if value is not None and value.lower() not in [
-                        'active', 'inactive', 'resolved']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, inactive, resolved'))
-
-        if self.verificationStatus is not None:
-            for value in self.verificationStatus:
-                if value is not None and value.lower() not in [
-                        'unconfirmed', 'confirmed', 'refuted', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'unconfirmed, confirmed, refuted, entered-in-error'))
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'allergy', 'intolerance']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'allergy, intolerance'))
-
-        if self.category is not None:
-            for value in self.category:
-                if value is not None and value.lower() not in [
-                        'food', 'medication', 'environment', 'biologic']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'food, medication, environment, biologic'))
-
-        if self.criticality is not None:
-            for value in self.criticality:
-                if value is not None and value.lower() not in [
-                        'low', 'high', 'unable-to-assess']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'low, high, unable-to-assess'))
-
     def get_relationships(self):
 
         return [
@@ -253,6 +254,27 @@ class AllergyIntolerance_Reaction(fhirbase):
 
     __name__ = 'AllergyIntolerance_Reaction'
 
+    _enums = {
+        'severity': ['mild', 'moderate', 'severe'],
+    }
+
+    _types = {
+        'substance': 'reference',
+        'manifestation': 'reference',
+        'description': 'str',
+        'onset': 'str',
+        'severity': 'str',
+        'exposureRoute': 'reference',
+        'note': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'substance', 'manifestation', 'description', 'onset', 'severity', 'exposureRoute', 'note',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.substance = None
         # reference to CodeableConcept
@@ -285,15 +307,6 @@ class AllergyIntolerance_Reaction(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.severity is not None:
-            for value in self.severity:
-                if value is not None and value.lower() not in [
-                        'mild', 'moderate', 'severe']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'mild, moderate, severe'))
-
     def get_relationships(self):
 
         return [
@@ -15,6 +15,17 @@ class Annotation(fhirbase):
 
     __name__ = 'Annotation'
 
+    _types = {
+        'authorReference': 'reference',
+        'authorString': 'str',
+        'time': 'str',
+        'text': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('authorReference', 'authorString', 'time', 'text', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.authorReference = None
         # reference to Reference: identifier
@@ -68,6 +68,45 @@ class Appointment(fhirbase):
 
     __name__ = 'Appointment'
 
+    _enums = {
+        'status': [
+            'proposed', 'pending', 'booked', 'arrived', 'fulfilled', 'cancelled', 'noshow',
+            'entered-in-error'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'serviceCategory': 'reference',
+        'serviceType': 'reference',
+        'specialty': 'reference',
+        'appointmentType': 'reference',
+        'reason': 'reference',
+        'indication': 'reference',
+        'priority': 'int',
+        'description': 'str',
+        'supportingInformation': 'reference',
+        'start': 'str',
+        'end': 'str',
+        'minutesDuration': 'int',
+        'slot': 'reference',
+        'created': 'str',
+        'comment': 'str',
+        'incomingReferral': 'reference',
+        'participant': 'reference',
+        'requestedPeriod': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'serviceCategory', 'serviceType', 'specialty', 'appointmentType',
+        'reason', 'indication', 'priority', 'description', 'supportingInformation', 'start', 'end',
+        'minutesDuration', 'slot', 'created', 'comment', 'incomingReferral', 'participant',
+        'requestedPeriod', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Appointment'
         # type: str
@@ -149,17 +188,6 @@ class Appointment(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'proposed', 'pending', 'booked', 'arrived', 'fulfilled', 'cancelled',
-                        'noshow', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposed, pending, booked, arrived, fulfilled, cancelled, noshow,'
-                        'entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -244,6 +272,22 @@ class Appointment_Participant(fhirbase):
 
     __name__ = 'Appointment_Participant'
 
+    _enums = {
+        'required': ['required', 'optional', 'information-only'],
+        'status': ['accepted', 'declined', 'tentative', 'needs-action'],
+    }
+
+    _types = {
+        'type': 'reference',
+        'actor': 'reference',
+        'required': 'str',
+        'status': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'actor', 'required', 'status', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: list
@@ -267,22 +311,6 @@ class Appointment_Participant(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.required is not None:
-            for value in self.required:
-                if value is not None and value.lower() not in [
-                        'required', 'optional', 'information-only']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'required, optional, information-only'))
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'accepted', 'declined', 'tentative', 'needs-action']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'accepted, declined, tentative, needs-action'))
-
     def get_relationships(self):
 
         return [
@@ -32,6 +32,24 @@ class AppointmentResponse(fhirbase):
 
     __name__ = 'AppointmentResponse'
 
+    _types = {
+        'resourceType': 'str',
+        'appointment': 'reference',
+        'start': 'str',
+        'end': 'str',
+        'participantType': 'reference',
+        'actor': 'reference',
+        'participantStatus': 'str',
+        'comment': 'str',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'appointment', 'start', 'end', 'participantType', 'actor',
+        'participantStatus', 'comment', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'AppointmentResponse'
         # type: str
@@ -24,6 +24,23 @@ class Attachment(fhirbase):
 
     __name__ = 'Attachment'
 
+    _types = {
+        'contentType': 'str',
+        'language': 'str',
+        'data': 'str',
+        'url': 'str',
+        'size': 'int',
+        'hash': 'str',
+        'title': 'str',
+        'creation': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'contentType', 'language', 'data', 'url', 'size', 'hash', 'title', 'creation', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.contentType = None
         # type: str
@@ -28,6 +28,32 @@ class AuditEvent(fhirbase):
 
     __name__ = 'AuditEvent'
 
+    _enums = {
+        'action': ['c', 'r', 'u', 'd', 'e'],
+        'outcome': ['0', '4', '8', '12'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'type': 'reference',
+        'subtype': 'reference',
+        'action': 'str',
+        'recorded': 'str',
+        'outcome': 'str',
+        'outcomeDesc': 'str',
+        'purposeOfEvent': 'reference',
+        'agent': 'reference',
+        'source': 'reference',
+        'entity': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'type', 'subtype', 'action', 'recorded', 'outcome', 'outcomeDesc',
+        'purposeOfEvent', 'agent', 'source', 'entity', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'AuditEvent'
         # type: str
@@ -76,22 +102,6 @@ class AuditEvent(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.action is not None:
-            for value in self.action:
-                if value is not None and value.lower() not in [
-                        'c', 'r', 'u', 'd', 'e']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'C, R, U, D, E'))
-
-        if self.outcome is not None:
-            for value in self.outcome:
-                if value is not None and value.lower() not in [
-                        '0', '4', '8', '12']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, '0, 4, 8, 12'))
-
     def get_relationships(self):
 
         return [
@@ -162,6 +172,27 @@ class AuditEvent_Agent(fhirbase):
 
     __name__ = 'AuditEvent_Agent'
 
+    _types = {
+        'role': 'reference',
+        'reference': 'reference',
+        'userId': 'reference',
+        'altId': 'str',
+        'name': 'str',
+        'requestor': 'bool',
+        'location': 'reference',
+        'policy': 'list',
+        'media': 'reference',
+        'network': 'reference',
+        'purposeOfUse': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'role', 'reference', 'userId', 'altId', 'name', 'requestor', 'location', 'policy', 'media',
+        'network', 'purposeOfUse', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.role = None
         # type: list
@@ -259,6 +290,19 @@ class AuditEvent_Network(fhirbase):
 
     __name__ = 'AuditEvent_Network'
 
+    _enums = {
+        'type': ['1', '2', '3', '4', '5'],
+    }
+
+    _types = {
+        'address': 'str',
+        'type': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('address', 'type', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.address = None
         # type: str
@@ -274,15 +318,6 @@ class AuditEvent_Network(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        '1', '2', '3', '4', '5']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, '1, 2, 3, 4, 5'))
-
 
 class AuditEvent_Source(fhirbase):
     """
@@ -300,6 +335,15 @@ class AuditEvent_Source(fhirbase):
 
     __name__ = 'AuditEvent_Source'
 
+    _types = {
+        'site': 'str',
+        'type': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('site', 'type', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.site = None
         # type: str
@@ -354,6 +398,25 @@ class AuditEvent_Entity(fhirbase):
 
     __name__ = 'AuditEvent_Entity'
 
+    _types = {
+        'reference': 'reference',
+        'type': 'reference',
+        'role': 'reference',
+        'lifecycle': 'reference',
+        'securityLabel': 'reference',
+        'name': 'str',
+        'description': 'str',
+        'query': 'str',
+        'detail': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'reference', 'type', 'role', 'lifecycle', 'securityLabel', 'name', 'description', 'query',
+        'detail', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.reference = None
         # reference to Reference: identifier
@@ -443,6 +506,15 @@ class AuditEvent_Detail(fhirbase):
 
     __name__ = 'AuditEvent_Detail'
 
+    _types = {
+        'type': 'str',
+        'value': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
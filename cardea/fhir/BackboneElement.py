@@ -21,6 +21,14 @@ class BackboneElement(fhirbase):
 
     __name__ = 'BackboneElement'
 
+    _types = {
+        'modifierExtension': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('modifierExtension', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.modifierExtension = None
         # type: list
@@ -23,6 +23,18 @@ class Basic(fhirbase):
 
     __name__ = 'Basic'
 
+    _types = {
+        'resourceType': 'str',
+        'code': 'reference',
+        'subject': 'reference',
+        'created': 'str',
+        'author': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('resourceType', 'code', 'subject', 'created', 'author', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Basic'
         # type: str
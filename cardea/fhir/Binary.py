@@ -17,6 +17,17 @@ class Binary(fhirbase):
 
     __name__ = 'Binary'
 
+    _types = {
+        'resourceType': 'str',
+        'contentType': 'str',
+        'securityContext': 'reference',
+        'content': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('resourceType', 'contentType', 'securityContext', 'content', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Binary'
         # type: str
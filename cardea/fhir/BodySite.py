@@ -23,6 +23,23 @@ class BodySite(fhirbase):
 
     __name__ = 'BodySite'
 
+    _types = {
+        'resourceType': 'str',
+        'active': 'bool',
+        'code': 'reference',
+        'qualifier': 'reference',
+        'description': 'str',
+        'image': 'reference',
+        'patient': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'active', 'code', 'qualifier', 'description', 'image', 'patient',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'BodySite'
         # type: str
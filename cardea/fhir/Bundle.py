@@ -21,6 +21,26 @@ class Bundle(fhirbase):
 
     __name__ = 'Bundle'
 
+    _enums = {
+        'type': [
+            'document', 'message', 'transaction', 'transaction-response', 'batch',
+            'batch-response', 'history', 'searchset', 'collection'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'type': 'str',
+        'total': 'int',
+        'link': 'reference',
+        'entry': 'reference',
+        'signature': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('resourceType', 'type', 'total', 'link', 'entry', 'signature', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Bundle'
         # type: str
@@ -53,17 +73,6 @@ class Bundle(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'document', 'message', 'transaction', 'transaction-response', 'batch',
-                        'batch-response', 'history', 'searchset', 'collection']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'document, message, transaction, transaction-response, batch,'
-                        'batch-response, history, searchset, collection'))
-
     def get_relationships(self):
 
         return [
@@ -101,6 +110,15 @@ class Bundle_Link(fhirbase):
 
     __name__ = 'Bundle_Link'
 
+    _types = {
+        'relation': 'str',
+        'url': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('relation', 'url', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.relation = None
         # type: str
@@ -139,6 +157,19 @@ class Bundle_Entry(fhirbase):
 
     __name__ = 'Bundle_Entry'
 
+    _types = {
+        'link': 'reference',
+        'fullUrl': 'str',
+        'resource': 'reference',
+        'search': 'reference',
+        'request': 'reference',
+        'response': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('link', 'fullUrl', 'resource', 'search', 'request', 'response', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.link = None
         # type: list
@@ -208,6 +239,19 @@ class Bundle_Search(fhirbase):
 
     __name__ = 'Bundle_Search'
 
+    _enums = {
+        'mode': ['match', 'include', 'outcome'],
+    }
+
+    _types = {
+        'mode': 'str',
+        'score': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = ('mode', 'score', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.mode = None
         # type: str
@@ -223,15 +267,6 @@ class Bundle_Search(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'match', 'include', 'outcome']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'match, include, outcome'))
-
 
 class Bundle_Request(fhirbase):
     """
@@ -260,6 +295,25 @@ class Bundle_Request(fhirbase):
 
     __name__ = 'Bundle_Request'
 
+    _enums = {
+        'method': ['get', 'post', 'put', 'delete'],
+    }
+
+    _types = {
+        'method': 'str',
+        'url': 'str',
+        'ifNoneMatch': 'str',
+        'ifModifiedSince': 'str',
+        'ifMatch': 'str',
+        'ifNoneExist': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'method', 'url', 'ifNoneMatch', 'ifModifiedSince', 'ifMatch', 'ifNoneExist', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.method = None
         # type: str
@@ -287,15 +341,6 @@ class Bundle_Request(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.method is not None:
-            for value in self.method:
-                if value is not None and value.lower() not in [
-                        'get', 'post', 'put', 'delete']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'GET, POST, PUT, DELETE'))
-
 
 class Bundle_Response(fhirbase):
     """
@@ -318,6 +363,18 @@ class Bundle_Response(fhirbase):
 
     __name__ = 'Bundle_Response'
 
+    _types = {
+        'status': 'str',
+        'location': 'str',
+        'etag': 'str',
+        'lastModified': 'str',
+        'outcome': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('status', 'location', 'etag', 'lastModified', 'outcome', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.status = None
         # type: str
@@ -102,6 +102,53 @@ class CapabilityStatement(fhirbase):
 
     __name__ = 'CapabilityStatement'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+        'kind': ['instance', 'capability', 'requirements'],
+        'acceptUnknown': ['no', 'extensions', 'elements', 'both'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'purpose': 'str',
+        'copyright': 'str',
+        'kind': 'str',
+        'instantiates': 'list',
+        'software': 'reference',
+        'implementation': 'reference',
+        'fhirVersion': 'str',
+        'acceptUnknown': 'str',
+        'format': 'list',
+        'patchFormat': 'list',
+        'implementationGuide': 'list',
+        'profile': 'reference',
+        'rest': 'reference',
+        'messaging': 'reference',
+        'document': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'contact', 'description', 'useContext', 'jurisdiction', 'purpose',
+        'copyright', 'kind', 'instantiates', 'software', 'implementation', 'fhirVersion',
+        'acceptUnknown', 'format', 'patchFormat', 'implementationGuide', 'profile', 'rest',
+        'messaging', 'document', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'CapabilityStatement'
         # type: str
@@ -205,29 +252,6 @@ class CapabilityStatement(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                        'instance', 'capability', 'requirements']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'instance, capability, requirements'))
-
-        if self.acceptUnknown is not None:
-            for value in self.acceptUnknown:
-                if value is not None and value.lower() not in [
-                        'no', 'extensions', 'elements', 'both']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'no, extensions, elements, both'))
-
     def get_relationships(self):
 
         return [
@@ -294,6 +318,16 @@ class CapabilityStatement_Software(fhirbase):
 
     __name__ = 'CapabilityStatement_Software'
 
+    _types = {
+        'name': 'str',
+        'version': 'str',
+        'releaseDate': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'version', 'releaseDate', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -327,6 +361,15 @@ class CapabilityStatement_Implementation(fhirbase):
 
     __name__ = 'CapabilityStatement_Implementation'
 
+    _types = {
+        'description': 'str',
+        'url': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('description', 'url', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.description = None
         # type: str
@@ -372,6 +415,28 @@ class CapabilityStatement_Rest(fhirbase):
 
     __name__ = 'CapabilityStatement_Rest'
 
+    _enums = {
+        'mode': ['client', 'server'],
+    }
+
+    _types = {
+        'mode': 'str',
+        'documentation': 'str',
+        'security': 'reference',
+        'resource': 'reference',
+        'interaction': 'reference',
+        'searchParam': 'reference',
+        'operation': 'reference',
+        'compartment': 'list',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'mode', 'documentation', 'security', 'resource', 'interaction', 'searchParam', 'operation',
+        'compartment', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.mode = None
         # type: str
@@ -409,15 +474,6 @@ class CapabilityStatement_Rest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'client', 'server']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'client, server'))
-
     def get_relationships(self):
 
         return [
@@ -466,6 +522,17 @@ class CapabilityStatement_Security(fhirbase):
 
     __name__ = 'CapabilityStatement_Security'
 
+    _types = {
+        'cors': 'bool',
+        'service': 'reference',
+        'description': 'str',
+        'certificate': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('cors', 'service', 'description', 'certificate', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.cors = None
         # type: bool
@@ -516,6 +583,15 @@ class CapabilityStatement_Certificate(fhirbase):
 
     __name__ = 'CapabilityStatement_Certificate'
 
+    _types = {
+        'type': 'str',
+        'blob': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'blob', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -580,6 +656,40 @@ class CapabilityStatement_Resource(fhirbase):
 
     __name__ = 'CapabilityStatement_Resource'
 
+    _enums = {
+        'versioning': ['no-version', 'versioned', 'versioned-update'],
+        'conditionalRead': ['not-supported', 'modified-since', 'not-match', 'full-support'],
+        'conditionalDelete': ['not-supported', 'single', 'multiple'],
+        'referencePolicy': ['literal', 'logical', 'resolves', 'enforced', 'local'],
+    }
+
+    _types = {
+        'type': 'str',
+        'profile': 'reference',
+        'documentation': 'str',
+        'interaction': 'reference',
+        'versioning': 'str',
+        'readHistory': 'bool',
+        'updateCreate': 'bool',
+        'conditionalCreate': 'bool',
+        'conditionalRead': 'str',
+        'conditionalUpdate': 'bool',
+        'conditionalDelete': 'str',
+        'referencePolicy': 'list',
+        'searchInclude': 'list',
+        'searchRevInclude': 'list',
+        'searchParam': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'type', 'profile', 'documentation', 'interaction', 'versioning', 'readHistory',
+        'updateCreate', 'conditionalCreate', 'conditionalRead', 'conditionalUpdate',
+        'conditionalDelete', 'referencePolicy', 'searchInclude', 'searchRevInclude', 'searchParam',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -640,36 +750,6 @@ class CapabilityStatement_Resource(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.versioning is not None:
-            for value in self.versioning:
-                if value is not None and value.lower() not in [
-                        'no-version', 'versioned', 'versioned-update']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'no-version, versioned, versioned-update'))
-
-        if self.conditionalRead is not None:
-            for value in self.conditionalRead:
-                if value is not None and value.lower() not in [
-                        'not-supported', 'modified-since', 'not-match', 'full-support']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'not-supported, modified-since, not-match, full-support'))
-
-        if self.conditionalDelete is not None:
-            for value in self.conditionalDelete:
-                if value is not None and value.lower() not in [
-                        'not-supported', 'single', 'multiple']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'not-supported, single, multiple'))
-
-        if self.referencePolicy is not None:
-            for value in self.referencePolicy:
-                if value is not None and value.lower() not in [
-                        'literal', 'logical', 'resolves', 'enforced', 'local']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'literal, logical, resolves, enforced, local'))
-
     def get_relationships(self):
 
         return [
@@ -708,6 +788,22 @@ class CapabilityStatement_Interaction(fhirbase):
 
     __name__ = 'CapabilityStatement_Interaction'
 
+    _enums = {
+        'code': [
+            'read', 'vread', 'update', 'patch', 'delete', 'history-instance', 'history-type',
+            'create', 'search-type'
+        ],
+    }
+
+    _types = {
+        'code': 'str',
+        'documentation': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'documentation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -724,17 +820,6 @@ class CapabilityStatement_Interaction(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                    'read', 'vread', 'update', 'patch', 'delete', 'history-instance',
-                        'history-type', 'create', 'search-type']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'read, vread, update, patch, delete, history-instance, '
-                        'history-type, create, search-type'))
-
 
 class CapabilityStatement_SearchParam(fhirbase):
     """
@@ -758,6 +843,21 @@ class CapabilityStatement_SearchParam(fhirbase):
 
     __name__ = 'CapabilityStatement_SearchParam'
 
+    _enums = {
+        'type': ['number', 'date', 'string', 'token', 'reference', 'composite', 'quantity', 'uri'],
+    }
+
+    _types = {
+        'name': 'str',
+        'definition': 'str',
+        'type': 'str',
+        'documentation': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'definition', 'type', 'documentation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -780,16 +880,6 @@ class CapabilityStatement_SearchParam(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'number', 'date', 'string', 'token', 'reference', 'composite',
-                        'quantity', 'uri']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'number, date, string, token, reference, composite, quantity, uri'))
-
 
 class CapabilityStatement_Interaction1(fhirbase):
     """
@@ -807,6 +897,19 @@ class CapabilityStatement_Interaction1(fhirbase):
 
     __name__ = 'CapabilityStatement_Interaction1'
 
+    _enums = {
+        'code': ['transaction', 'batch', 'search-system', 'history-system'],
+    }
+
+    _types = {
+        'code': 'str',
+        'documentation': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'documentation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -823,15 +926,6 @@ class CapabilityStatement_Interaction1(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                        'transaction', 'batch', 'search-system', 'history-system']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'transaction, batch, search-system, history-system'))
-
 
 class CapabilityStatement_Operation(fhirbase):
     """
@@ -849,6 +943,15 @@ class CapabilityStatement_Operation(fhirbase):
 
     __name__ = 'CapabilityStatement_Operation'
 
+    _types = {
+        'name': 'str',
+        'definition': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'definition', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -897,6 +1000,20 @@ class CapabilityStatement_Messaging(fhirbase):
 
     __name__ = 'CapabilityStatement_Messaging'
 
+    _types = {
+        'endpoint': 'reference',
+        'reliableCache': 'int',
+        'documentation': 'str',
+        'supportedMessage': 'reference',
+        'event': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'endpoint', 'reliableCache', 'documentation', 'supportedMessage', 'event', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.endpoint = None
         # type: list
@@ -958,6 +1075,15 @@ class CapabilityStatement_Endpoint(fhirbase):
 
     __name__ = 'CapabilityStatement_Endpoint'
 
+    _types = {
+        'protocol': 'reference',
+        'address': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('protocol', 'address', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.protocol = None
         # reference to Coding
@@ -997,6 +1123,19 @@ class CapabilityStatement_SupportedMessage(fhirbase):
 
     __name__ = 'CapabilityStatement_SupportedMessage'
 
+    _enums = {
+        'mode': ['sender', 'receiver'],
+    }
+
+    _types = {
+        'mode': 'str',
+        'definition': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('mode', 'definition', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.mode = None
         # type: str
@@ -1012,15 +1151,6 @@ class CapabilityStatement_SupportedMessage(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'sender', 'receiver']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'sender, receiver'))
-
     def get_relationships(self):
 
         return [
@@ -1053,6 +1183,27 @@ class CapabilityStatement_Event(fhirbase):
 
     __name__ = 'CapabilityStatement_Event'
 
+    _enums = {
+        'category': ['consequence', 'currency', 'notification'],
+        'mode': ['sender', 'receiver'],
+    }
+
+    _types = {
+        'code': 'reference',
+        'category': 'str',
+        'mode': 'str',
+        'focus': 'str',
+        'request': 'reference',
+        'response': 'reference',
+        'documentation': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'code', 'category', 'mode', 'focus', 'request', 'response', 'documentation', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to Coding
@@ -1084,22 +1235,6 @@ class CapabilityStatement_Event(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.category is not None:
-            for value in self.category:
-                if value is not None and value.lower() not in [
-                        'consequence', 'currency', 'notification']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'Consequence, Currency, Notification'))
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'sender', 'receiver']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'sender, receiver'))
-
     def get_relationships(self):
 
         return [
@@ -1138,6 +1273,20 @@ class CapabilityStatement_Document(fhirbase):
 
     __name__ = 'CapabilityStatement_Document'
 
+    _enums = {
+        'mode': ['producer', 'consumer'],
+    }
+
+    _types = {
+        'mode': 'str',
+        'documentation': 'str',
+        'profile': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('mode', 'documentation', 'profile', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.mode = None
         # type: str
@@ -1156,15 +1305,6 @@ class CapabilityStatement_Document(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'producer', 'consumer']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'producer, consumer'))
-
     def get_relationships(self):
 
         return [
@@ -59,6 +59,44 @@ class CarePlan(fhirbase):
 
     __name__ = 'CarePlan'
 
+    _enums = {
+        'status': [
+            'draft', 'active', 'suspended', 'completed', 'entered-in-error', 'cancelled', 'unknown'
+        ],
+        'intent': ['proposal', 'plan', 'order', 'option'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'definition': 'reference',
+        'basedOn': 'reference',
+        'replaces': 'reference',
+        'partOf': 'reference',
+        'status': 'str',
+        'intent': 'str',
+        'category': 'reference',
+        'title': 'str',
+        'description': 'str',
+        'subject': 'reference',
+        'context': 'reference',
+        'period': 'reference',
+        'author': 'reference',
+        'careTeam': 'reference',
+        'addresses': 'reference',
+        'supportingInfo': 'reference',
+        'goal': 'reference',
+        'activity': 'reference',
+        'note': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definition', 'basedOn', 'replaces', 'partOf', 'status', 'intent',
+        'category', 'title', 'description', 'subject', 'context', 'period', 'author', 'careTeam',
+        'addresses', 'supportingInfo', 'goal', 'activity', 'note', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'CarePlan'
         # type: str
@@ -144,24 +182,6 @@ class CarePlan(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'draft', 'active', 'suspended', 'completed', 'entered-in-error',
-                        'cancelled', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, suspended, completed, entered-in-error, cancelled,'
-                        'unknown'))
-
-        if self.intent is not None:
-            for value in self.intent:
-                if value is not None and value.lower() not in [
-                        'proposal', 'plan', 'order', 'option']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposal, plan, order, option'))
-
     def get_relationships(self):
 
         return [
@@ -274,6 +294,21 @@ class CarePlan_Activity(fhirbase):
 
     __name__ = 'CarePlan_Activity'
 
+    _types = {
+        'outcomeCodeableConcept': 'reference',
+        'outcomeReference': 'reference',
+        'progress': 'reference',
+        'reference': 'reference',
+        'detail': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'outcomeCodeableConcept', 'outcomeReference', 'progress', 'reference', 'detail',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.outcomeCodeableConcept = None
         # type: list
@@ -385,6 +420,44 @@ class CarePlan_Detail(fhirbase):
 
     __name__ = 'CarePlan_Detail'
 
+    _enums = {
+        'status': [
+            'not-started', 'scheduled', 'in-progress', 'on-hold', 'completed', 'cancelled',
+            'unknown'
+        ],
+    }
+
+    _types = {
+        'category': 'reference',
+        'definition': 'reference',
+        'code': 'reference',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'goal': 'reference',
+        'status': 'str',
+        'statusReason': 'str',
+        'prohibited': 'bool',
+        'scheduledTiming': 'reference',
+        'scheduledPeriod': 'reference',
+        'scheduledString': 'str',
+        'location': 'reference',
+        'performer': 'reference',
+        'productCodeableConcept': 'reference',
+        'productReference': 'reference',
+        'dailyAmount': 'reference',
+        'quantity': 'reference',
+        'description': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'category', 'definition', 'code', 'reasonCode', 'reasonReference', 'goal', 'status',
+        'statusReason', 'prohibited', 'scheduledTiming', 'scheduledPeriod', 'scheduledString',
+        'location', 'performer', 'productCodeableConcept', 'productReference', 'dailyAmount',
+        'quantity', 'description', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.category = None
         # reference to CodeableConcept
@@ -456,17 +529,6 @@ class CarePlan_Detail(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'not-started', 'scheduled', 'in-progress', 'on-hold', 'completed',
-                        'cancelled', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'not-started, scheduled, in-progress, on-hold, completed, '
-                        'cancelled, unknown'))
-
     def get_relationships(self):
 
         return [
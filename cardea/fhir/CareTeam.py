@@ -33,6 +33,33 @@ class CareTeam(fhirbase):
 
     __name__ = 'CareTeam'
 
+    _enums = {
+        'status': ['proposed', 'active', 'suspended', 'inactive', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'category': 'reference',
+        'name': 'str',
+        'subject': 'reference',
+        'context': 'reference',
+        'period': 'reference',
+        'participant': 'reference',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'managingOrganization': 'reference',
+        'note': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'category', 'name', 'subject', 'context', 'period',
+        'participant', 'reasonCode', 'reasonReference', 'managingOrganization', 'note',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'CareTeam'
         # type: str
@@ -87,15 +114,6 @@ class CareTeam(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'proposed', 'active', 'suspended', 'inactive', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposed, active, suspended, inactive, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -169,6 +187,17 @@ class CareTeam_Participant(fhirbase):
 
     __name__ = 'CareTeam_Participant'
 
+    _types = {
+        'role': 'reference',
+        'member': 'reference',
+        'onBehalfOf': 'reference',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('role', 'member', 'onBehalfOf', 'period', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.role = None
         # reference to CodeableConcept
@@ -56,6 +56,51 @@ class ChargeItem(fhirbase):
 
     __name__ = 'ChargeItem'
 
+    _enums = {
+        'status': [
+            'planned', 'billable', 'not-billable', 'aborted', 'billed', 'entered-in-error',
+            'unknown'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'definition': 'list',
+        'status': 'str',
+        'partOf': 'reference',
+        'code': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'occurrenceDateTime': 'str',
+        'occurrencePeriod': 'reference',
+        'occurrenceTiming': 'reference',
+        'participant': 'reference',
+        'performingOrganization': 'reference',
+        'requestingOrganization': 'reference',
+        'quantity': 'reference',
+        'bodysite': 'reference',
+        'factorOverride': 'int',
+        'priceOverride': 'reference',
+        'overrideReason': 'str',
+        'enterer': 'reference',
+        'enteredDate': 'str',
+        'reason': 'reference',
+        'service': 'reference',
+        'account': 'reference',
+        'note': 'reference',
+        'supportingInformation': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definition', 'status', 'partOf', 'code', 'subject', 'context',
+        'occurrenceDateTime', 'occurrencePeriod', 'occurrenceTiming', 'participant',
+        'performingOrganization', 'requestingOrganization', 'quantity', 'bodysite',
+        'factorOverride', 'priceOverride', 'overrideReason', 'enterer', 'enteredDate', 'reason',
+        'service', 'account', 'note', 'supportingInformation', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ChargeItem'
         # type: str
@@ -150,17 +195,6 @@ class ChargeItem(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'planned', 'billable', 'not-billable', 'aborted', 'billed',
-                        'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, billable, not-billable, aborted, billed, '
-                        'entered-in-error, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -279,6 +313,15 @@ class ChargeItem_Participant(fhirbase):
 
     __name__ = 'ChargeItem_Participant'
 
+    _types = {
+        'role': 'reference',
+        'actor': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('role', 'actor', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.role = None
         # reference to CodeableConcept
@@ -76,6 +76,53 @@ class Claim(fhirbase):
 
     __name__ = 'Claim'
 
+    _enums = {
+        'use': ['complete', 'proposed', 'exploratory', 'other'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'type': 'reference',
+        'subType': 'reference',
+        'use': 'str',
+        'patient': 'reference',
+        'billablePeriod': 'reference',
+        'created': 'str',
+        'enterer': 'reference',
+        'insurer': 'reference',
+        'provider': 'reference',
+        'organization': 'reference',
+        'priority': 'reference',
+        'fundsReserve': 'reference',
+        'related': 'reference',
+        'prescription': 'reference',
+        'originalPrescription': 'reference',
+        'payee': 'reference',
+        'referral': 'reference',
+        'facility': 'reference',
+        'careTeam': 'reference',
+        'information': 'reference',
+        'diagnosis': 'reference',
+        'procedure': 'reference',
+        'insurance': 'reference',
+        'accident': 'reference',
+        'employmentImpacted': 'reference',
+        'hospitalization': 'reference',
+        'item': 'reference',
+        'total': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'type', 'subType', 'use', 'patient', 'billablePeriod', 'created',
+        'enterer', 'insurer', 'provider', 'organization', 'priority', 'fundsReserve', 'related',
+        'prescription', 'originalPrescription', 'payee', 'referral', 'facility', 'careTeam',
+        'information', 'diagnosis', 'procedure', 'insurance', 'accident', 'employmentImpacted',
+        'hospitalization', 'item', 'total', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Claim'
         # type: str
@@ -185,15 +232,6 @@ class Claim(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'complete', 'proposed', 'exploratory', 'other']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'complete, proposed, exploratory, other'))
-
     def get_relationships(self):
 
         return [
@@ -351,6 +389,16 @@ class Claim_Related(fhirbase):
 
     __name__ = 'Claim_Related'
 
+    _types = {
+        'claim': 'reference',
+        'relationship': 'reference',
+        'reference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('claim', 'relationship', 'reference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.claim = None
         # reference to Reference: identifier
@@ -401,6 +449,16 @@ class Claim_Payee(fhirbase):
 
     __name__ = 'Claim_Payee'
 
+    _types = {
+        'type': 'reference',
+        'resourceType': 'reference',
+        'party': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'resourceType', 'party', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
@@ -456,6 +514,18 @@ class Claim_CareTeam(fhirbase):
 
     __name__ = 'Claim_CareTeam'
 
+    _types = {
+        'sequence': 'int',
+        'provider': 'reference',
+        'responsible': 'bool',
+        'role': 'reference',
+        'qualification': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('sequence', 'provider', 'responsible', 'role', 'qualification', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -534,6 +604,26 @@ class Claim_Information(fhirbase):
 
     __name__ = 'Claim_Information'
 
+    _types = {
+        'sequence': 'int',
+        'category': 'reference',
+        'code': 'reference',
+        'timingDate': 'str',
+        'timingPeriod': 'reference',
+        'valueString': 'str',
+        'valueQuantity': 'reference',
+        'valueAttachment': 'reference',
+        'valueReference': 'reference',
+        'reason': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'category', 'code', 'timingDate', 'timingPeriod', 'valueString',
+        'valueQuantity', 'valueAttachment', 'valueReference', 'reason', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -629,6 +719,21 @@ class Claim_Diagnosis(fhirbase):
 
     __name__ = 'Claim_Diagnosis'
 
+    _types = {
+        'sequence': 'int',
+        'diagnosisCodeableConcept': 'reference',
+        'diagnosisReference': 'reference',
+        'type': 'reference',
+        'packageCode': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'diagnosisCodeableConcept', 'diagnosisReference', 'type', 'packageCode',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -693,6 +798,17 @@ class Claim_Procedure(fhirbase):
 
     __name__ = 'Claim_Procedure'
 
+    _types = {
+        'sequence': 'int',
+        'date': 'str',
+        'procedureCodeableConcept': 'reference',
+        'procedureReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('sequence', 'date', 'procedureCodeableConcept', 'procedureReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -750,6 +866,22 @@ class Claim_Insurance(fhirbase):
 
     __name__ = 'Claim_Insurance'
 
+    _types = {
+        'sequence': 'int',
+        'focal': 'bool',
+        'coverage': 'reference',
+        'businessArrangement': 'str',
+        'preAuthRef': 'list',
+        'claimResponse': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'focal', 'coverage', 'businessArrangement', 'preAuthRef', 'claimResponse',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -805,6 +937,17 @@ class Claim_Accident(fhirbase):
 
     __name__ = 'Claim_Accident'
 
+    _types = {
+        'date': 'str',
+        'type': 'reference',
+        'locationAddress': 'reference',
+        'locationReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('date', 'type', 'locationAddress', 'locationReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.date = None
         # type: str
@@ -903,6 +1046,43 @@ class Claim_Item(fhirbase):
 
     __name__ = 'Claim_Item'
 
+    _types = {
+        'sequence': 'int',
+        'careTeamLinkId': 'list',
+        'diagnosisLinkId': 'list',
+        'procedureLinkId': 'list',
+        'informationLinkId': 'list',
+        'revenue': 'reference',
+        'category': 'reference',
+        'service': 'reference',
+        'modifier': 'reference',
+        'programCode': 'reference',
+        'servicedDate': 'str',
+        'servicedPeriod': 'reference',
+        'locationCodeableConcept': 'reference',
+        'locationAddress': 'reference',
+        'locationReference': 'reference',
+        'quantity': 'reference',
+        'unitPrice': 'reference',
+        'factor': 'int',
+        'net': 'reference',
+        'udi': 'reference',
+        'bodySite': 'reference',
+        'subSite': 'reference',
+        'encounter': 'reference',
+        'detail': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'careTeamLinkId', 'diagnosisLinkId', 'procedureLinkId', 'informationLinkId',
+        'revenue', 'category', 'service', 'modifier', 'programCode', 'servicedDate',
+        'servicedPeriod', 'locationCodeableConcept', 'locationAddress', 'locationReference',
+        'quantity', 'unitPrice', 'factor', 'net', 'udi', 'bodySite', 'subSite', 'encounter',
+        'detail', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -1118,6 +1298,28 @@ class Claim_Detail(fhirbase):
 
     __name__ = 'Claim_Detail'
 
+    _types = {
+        'sequence': 'int',
+        'revenue': 'reference',
+        'category': 'reference',
+        'service': 'reference',
+        'modifier': 'reference',
+        'programCode': 'reference',
+        'quantity': 'reference',
+        'unitPrice': 'reference',
+        'factor': 'int',
+        'net': 'reference',
+        'udi': 'reference',
+        'subDetail': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'revenue', 'category', 'service', 'modifier', 'programCode', 'quantity',
+        'unitPrice', 'factor', 'net', 'udi', 'subDetail', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -1254,6 +1456,27 @@ class Claim_SubDetail(fhirbase):
 
     __name__ = 'Claim_SubDetail'
 
+    _types = {
+        'sequence': 'int',
+        'revenue': 'reference',
+        'category': 'reference',
+        'service': 'reference',
+        'modifier': 'reference',
+        'programCode': 'reference',
+        'quantity': 'reference',
+        'unitPrice': 'reference',
+        'factor': 'int',
+        'net': 'reference',
+        'udi': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'revenue', 'category', 'service', 'modifier', 'programCode', 'quantity',
+        'unitPrice', 'factor', 'net', 'udi', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
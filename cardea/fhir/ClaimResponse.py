@@ -45,6 +45,41 @@ class ClaimResponse(fhirbase):
 
     __name__ = 'ClaimResponse'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'patient': 'reference',
+        'created': 'str',
+        'insurer': 'reference',
+        'requestProvider': 'reference',
+        'requestOrganization': 'reference',
+        'request': 'reference',
+        'outcome': 'reference',
+        'disposition': 'str',
+        'payeeType': 'reference',
+        'item': 'reference',
+        'addItem': 'reference',
+        'error': 'reference',
+        'totalCost': 'reference',
+        'unallocDeductable': 'reference',
+        'totalBenefit': 'reference',
+        'payment': 'reference',
+        'reserved': 'reference',
+        'form': 'reference',
+        'processNote': 'reference',
+        'communicationRequest': 'reference',
+        'insurance': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'patient', 'created', 'insurer', 'requestProvider',
+        'requestOrganization', 'request', 'outcome', 'disposition', 'payeeType', 'item', 'addItem',
+        'error', 'totalCost', 'unallocDeductable', 'totalBenefit', 'payment', 'reserved', 'form',
+        'processNote', 'communicationRequest', 'insurance', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ClaimResponse'
         # type: str
@@ -249,6 +284,17 @@ class ClaimResponse_Item(fhirbase):
 
     __name__ = 'ClaimResponse_Item'
 
+    _types = {
+        'sequenceLinkId': 'int',
+        'noteNumber': 'list',
+        'adjudication': 'reference',
+        'detail': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('sequenceLinkId', 'noteNumber', 'adjudication', 'detail', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequenceLinkId = None
         # type: int
@@ -301,6 +347,17 @@ class ClaimResponse_Adjudication(fhirbase):
 
     __name__ = 'ClaimResponse_Adjudication'
 
+    _types = {
+        'category': 'reference',
+        'reason': 'reference',
+        'amount': 'reference',
+        'value': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = ('category', 'reason', 'amount', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.category = None
         # reference to CodeableConcept
@@ -355,6 +412,17 @@ class ClaimResponse_Detail(fhirbase):
 
     __name__ = 'ClaimResponse_Detail'
 
+    _types = {
+        'sequenceLinkId': 'int',
+        'noteNumber': 'list',
+        'adjudication': 'reference',
+        'subDetail': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('sequenceLinkId', 'noteNumber', 'adjudication', 'subDetail', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequenceLinkId = None
         # type: int
@@ -404,6 +472,16 @@ class ClaimResponse_SubDetail(fhirbase):
 
     __name__ = 'ClaimResponse_SubDetail'
 
+    _types = {
+        'sequenceLinkId': 'int',
+        'noteNumber': 'list',
+        'adjudication': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('sequenceLinkId', 'noteNumber', 'adjudication', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequenceLinkId = None
         # type: int
@@ -457,6 +535,25 @@ class ClaimResponse_AddItem(fhirbase):
 
     __name__ = 'ClaimResponse_AddItem'
 
+    _types = {
+        'sequenceLinkId': 'list',
+        'revenue': 'reference',
+        'category': 'reference',
+        'service': 'reference',
+        'modifier': 'reference',
+        'fee': 'reference',
+        'noteNumber': 'list',
+        'adjudication': 'reference',
+        'detail': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequenceLinkId', 'revenue', 'category', 'service', 'modifier', 'fee', 'noteNumber',
+        'adjudication', 'detail', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequenceLinkId = None
         # type: list
@@ -556,6 +653,23 @@ class ClaimResponse_Detail1(fhirbase):
 
     __name__ = 'ClaimResponse_Detail1'
 
+    _types = {
+        'revenue': 'reference',
+        'category': 'reference',
+        'service': 'reference',
+        'modifier': 'reference',
+        'fee': 'reference',
+        'noteNumber': 'list',
+        'adjudication': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'revenue', 'category', 'service', 'modifier', 'fee', 'noteNumber', 'adjudication',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.revenue = None
         # reference to CodeableConcept
@@ -641,6 +755,19 @@ class ClaimResponse_Error(fhirbase):
 
     __name__ = 'ClaimResponse_Error'
 
+    _types = {
+        'sequenceLinkId': 'int',
+        'detailSequenceLinkId': 'int',
+        'subdetailSequenceLinkId': 'int',
+        'code': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequenceLinkId', 'detailSequenceLinkId', 'subdetailSequenceLinkId', 'code', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequenceLinkId = None
         # type: int
@@ -688,6 +815,18 @@ class ClaimResponse_Payment(fhirbase):
 
     __name__ = 'ClaimResponse_Payment'
 
+    _types = {
+        'type': 'reference',
+        'adjustment': 'reference',
+        'adjustmentReason': 'reference',
+        'date': 'str',
+        'amount': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('type', 'adjustment', 'adjustmentReason', 'date', 'amount', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
@@ -758,6 +897,17 @@ class ClaimResponse_ProcessNote(fhirbase):
 
     __name__ = 'ClaimResponse_ProcessNote'
 
+    _types = {
+        'number': 'int',
+        'type': 'reference',
+        'text': 'str',
+        'language': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('number', 'type', 'text', 'language', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.number = None
         # type: int
@@ -813,6 +963,22 @@ class ClaimResponse_Insurance(fhirbase):
 
     __name__ = 'ClaimResponse_Insurance'
 
+    _types = {
+        'sequence': 'int',
+        'focal': 'bool',
+        'coverage': 'reference',
+        'businessArrangement': 'str',
+        'preAuthRef': 'list',
+        'claimResponse': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'focal', 'coverage', 'businessArrangement', 'preAuthRef', 'claimResponse',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
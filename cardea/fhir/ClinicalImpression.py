@@ -59,6 +59,42 @@ class ClinicalImpression(fhirbase):
 
     __name__ = 'ClinicalImpression'
 
+    _enums = {
+        'status': ['draft', 'completed', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'code': 'reference',
+        'description': 'str',
+        'subject': 'reference',
+        'context': 'reference',
+        'effectiveDateTime': 'str',
+        'effectivePeriod': 'reference',
+        'date': 'str',
+        'assessor': 'reference',
+        'previous': 'reference',
+        'problem': 'reference',
+        'investigation': 'reference',
+        'protocol': 'list',
+        'summary': 'str',
+        'finding': 'reference',
+        'prognosisCodeableConcept': 'reference',
+        'prognosisReference': 'reference',
+        'action': 'reference',
+        'note': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'code', 'description', 'subject', 'context', 'effectiveDateTime',
+        'effectivePeriod', 'date', 'assessor', 'previous', 'problem', 'investigation', 'protocol',
+        'summary', 'finding', 'prognosisCodeableConcept', 'prognosisReference', 'action', 'note',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ClinicalImpression'
         # type: str
@@ -137,15 +173,6 @@ class ClinicalImpression(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'completed', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, completed, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -242,6 +269,15 @@ class ClinicalImpression_Investigation(fhirbase):
 
     __name__ = 'ClinicalImpression_Investigation'
 
+    _types = {
+        'code': 'reference',
+        'item': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'item', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to CodeableConcept
@@ -292,6 +328,16 @@ class ClinicalImpression_Finding(fhirbase):
 
     __name__ = 'ClinicalImpression_Finding'
 
+    _types = {
+        'itemCodeableConcept': 'reference',
+        'itemReference': 'reference',
+        'basis': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('itemCodeableConcept', 'itemReference', 'basis', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.itemCodeableConcept = None
         # reference to CodeableConcept
@@ -81,6 +81,49 @@ class CodeSystem(fhirbase):
 
     __name__ = 'CodeSystem'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+        'hierarchyMeaning': ['grouped-by', 'is-a', 'part-of', 'classified-with'],
+        'content': ['not-present', 'example', 'fragment', 'complete'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'purpose': 'str',
+        'copyright': 'str',
+        'caseSensitive': 'bool',
+        'valueSet': 'str',
+        'hierarchyMeaning': 'str',
+        'compositional': 'bool',
+        'versionNeeded': 'bool',
+        'content': 'str',
+        'count': 'int',
+        'filter': 'reference',
+        'property': 'reference',
+        'concept': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'contact', 'description', 'useContext', 'jurisdiction', 'purpose',
+        'copyright', 'caseSensitive', 'valueSet', 'hierarchyMeaning', 'compositional',
+        'versionNeeded', 'content', 'count', 'filter', 'property', 'concept', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'CodeSystem'
         # type: str
@@ -174,29 +217,6 @@ class CodeSystem(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.hierarchyMeaning is not None:
-            for value in self.hierarchyMeaning:
-                if value is not None and value.lower() not in [
-                        'grouped-by', 'is-a', 'part-of', 'classified-with']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'grouped-by, is-a, part-of, classified-with'))
-
-        if self.content is not None:
-            for value in self.content:
-                if value is not None and value.lower() not in [
-                        'not-present', 'example', 'fragment', 'complete']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'not-present, example, fragment, complete'))
-
     def get_relationships(self):
 
         return [
@@ -252,6 +272,17 @@ class CodeSystem_Filter(fhirbase):
 
     __name__ = 'CodeSystem_Filter'
 
+    _types = {
+        'code': 'str',
+        'description': 'str',
+        'operator': 'list',
+        'value': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'description', 'operator', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -293,6 +324,21 @@ class CodeSystem_Property(fhirbase):
 
     __name__ = 'CodeSystem_Property'
 
+    _enums = {
+        'type': ['code', 'coding', 'string', 'integer', 'boolean', 'datetime'],
+    }
+
+    _types = {
+        'code': 'str',
+        'uri': 'str',
+        'description': 'str',
+        'type': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'uri', 'description', 'type', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -315,15 +361,6 @@ class CodeSystem_Property(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'code', 'coding', 'string', 'integer', 'boolean', 'datetime']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'code, Coding, string, integer, boolean, dateTime'))
-
 
 class CodeSystem_Concept(fhirbase):
     """
@@ -350,6 +387,19 @@ class CodeSystem_Concept(fhirbase):
 
     __name__ = 'CodeSystem_Concept'
 
+    _types = {
+        'code': 'str',
+        'display': 'str',
+        'definition': 'str',
+        'designation': 'reference',
+        'property': 'reference',
+        'concept': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'display', 'definition', 'designation', 'property', 'concept', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -411,6 +461,16 @@ class CodeSystem_Designation(fhirbase):
 
     __name__ = 'CodeSystem_Designation'
 
+    _types = {
+        'language': 'str',
+        'use': 'reference',
+        'value': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('language', 'use', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.language = None
         # type: str
@@ -454,6 +514,23 @@ class CodeSystem_Property1(fhirbase):
 
     __name__ = 'CodeSystem_Property1'
 
+    _types = {
+        'code': 'str',
+        'valueCode': 'str',
+        'valueCoding': 'reference',
+        'valueString': 'str',
+        'valueInteger': 'int',
+        'valueBoolean': 'bool',
+        'valueDateTime': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'code', 'valueCode', 'valueCoding', 'valueString', 'valueInteger', 'valueBoolean',
+        'valueDateTime', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -15,6 +15,15 @@ class CodeableConcept(fhirbase):
 
     __name__ = 'CodeableConcept'
 
+    _types = {
+        'coding': 'reference',
+        'text': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('coding', 'text', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.coding = None
         # type: list
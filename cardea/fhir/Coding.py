@@ -25,6 +25,18 @@ class Coding(fhirbase):
 
     __name__ = 'Coding'
 
+    _types = {
+        'system': 'str',
+        'version': 'str',
+        'code': 'str',
+        'display': 'str',
+        'userSelected': 'bool',
+        'object_id': 'reference',
+    }
+
+    _fields = ('system', 'version', 'code', 'display', 'userSelected', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.system = None
         # type: str
@@ -54,6 +54,37 @@ class Communication(fhirbase):
 
     __name__ = 'Communication'
 
+    _types = {
+        'resourceType': 'str',
+        'definition': 'reference',
+        'basedOn': 'reference',
+        'partOf': 'reference',
+        'status': 'str',
+        'notDone': 'bool',
+        'notDoneReason': 'reference',
+        'category': 'reference',
+        'medium': 'reference',
+        'subject': 'reference',
+        'recipient': 'reference',
+        'topic': 'reference',
+        'context': 'reference',
+        'sent': 'str',
+        'received': 'str',
+        'sender': 'reference',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'payload': 'reference',
+        'note': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definition', 'basedOn', 'partOf', 'status', 'notDone', 'notDoneReason',
+        'category', 'medium', 'subject', 'recipient', 'topic', 'context', 'sent', 'received',
+        'sender', 'reasonCode', 'reasonReference', 'payload', 'note', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Communication'
         # type: str
@@ -237,6 +268,16 @@ class Communication_Payload(fhirbase):
 
     __name__ = 'Communication_Payload'
 
+    _types = {
+        'contentString': 'str',
+        'contentAttachment': 'reference',
+        'contentReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('contentString', 'contentAttachment', 'contentReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.contentString = None
         # type: str
@@ -58,6 +58,39 @@ class CommunicationRequest(fhirbase):
 
     __name__ = 'CommunicationRequest'
 
+    _types = {
+        'resourceType': 'str',
+        'basedOn': 'reference',
+        'replaces': 'reference',
+        'groupIdentifier': 'reference',
+        'status': 'str',
+        'category': 'reference',
+        'priority': 'str',
+        'medium': 'reference',
+        'subject': 'reference',
+        'recipient': 'reference',
+        'topic': 'reference',
+        'context': 'reference',
+        'payload': 'reference',
+        'occurrenceDateTime': 'str',
+        'occurrencePeriod': 'reference',
+        'authoredOn': 'str',
+        'sender': 'reference',
+        'requester': 'reference',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'note': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'basedOn', 'replaces', 'groupIdentifier', 'status', 'category', 'priority',
+        'medium', 'subject', 'recipient', 'topic', 'context', 'payload', 'occurrenceDateTime',
+        'occurrencePeriod', 'authoredOn', 'sender', 'requester', 'reasonCode', 'reasonReference',
+        'note', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'CommunicationRequest'
         # type: str
@@ -248,6 +281,16 @@ class CommunicationRequest_Payload(fhirbase):
 
     __name__ = 'CommunicationRequest_Payload'
 
+    _types = {
+        'contentString': 'str',
+        'contentAttachment': 'reference',
+        'contentReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('contentString', 'contentAttachment', 'contentReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.contentString = None
         # type: str
@@ -293,6 +336,15 @@ class CommunicationRequest_Requester(fhirbase):
 
     __name__ = 'CommunicationRequest_Requester'
 
+    _types = {
+        'agent': 'reference',
+        'onBehalfOf': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('agent', 'onBehalfOf', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.agent = None
         # reference to Reference: identifier
@@ -53,6 +53,38 @@ class CompartmentDefinition(fhirbase):
 
     __name__ = 'CompartmentDefinition'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+        'code': ['patient', 'encounter', 'relatedperson', 'practitioner', 'device'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'purpose': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'code': 'str',
+        'search': 'bool',
+        'resource': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'name', 'title', 'status', 'experimental', 'date', 'publisher',
+        'contact', 'description', 'purpose', 'useContext', 'jurisdiction', 'code', 'search',
+        'resource', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'CompartmentDefinition'
         # type: str
@@ -117,22 +149,6 @@ class CompartmentDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                        'patient', 'encounter', 'relatedperson', 'practitioner', 'device']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'Patient, Encounter, RelatedPerson, Practitioner, Device'))
-
     def get_relationships(self):
 
         return [
@@ -174,6 +190,16 @@ class CompartmentDefinition_Resource(fhirbase):
 
     __name__ = 'CompartmentDefinition_Resource'
 
+    _types = {
+        'code': 'str',
+        'param': 'list',
+        'documentation': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'param', 'documentation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -51,6 +51,36 @@ class Composition(fhirbase):
 
     __name__ = 'Composition'
 
+    _enums = {
+        'status': ['preliminary', 'final', 'amended', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'type': 'reference',
+        '_class': 'reference',
+        'subject': 'reference',
+        'encounter': 'reference',
+        'date': 'str',
+        'author': 'reference',
+        'title': 'str',
+        'confidentiality': 'str',
+        'attester': 'reference',
+        'custodian': 'reference',
+        'relatesTo': 'reference',
+        'event': 'reference',
+        'section': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'type', '_class', 'subject', 'encounter', 'date', 'author',
+        'title', 'confidentiality', 'attester', 'custodian', 'relatesTo', 'event', 'section',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Composition'
         # type: str
@@ -112,15 +142,6 @@ class Composition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'preliminary', 'final', 'amended', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'preliminary, final, amended, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -199,6 +220,20 @@ class Composition_Attester(fhirbase):
 
     __name__ = 'Composition_Attester'
 
+    _enums = {
+        'mode': ['personal', 'professional', 'legal', 'official'],
+    }
+
+    _types = {
+        'mode': 'list',
+        'time': 'str',
+        'party': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('mode', 'time', 'party', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.mode = None
         # type: list
@@ -217,15 +252,6 @@ class Composition_Attester(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'personal', 'professional', 'legal', 'official']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'personal, professional, legal, official'))
-
     def get_relationships(self):
 
         return [
@@ -256,6 +282,16 @@ class Composition_RelatesTo(fhirbase):
 
     __name__ = 'Composition_RelatesTo'
 
+    _types = {
+        'code': 'str',
+        'targetIdentifier': 'reference',
+        'targetReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'targetIdentifier', 'targetReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -313,6 +349,16 @@ class Composition_Event(fhirbase):
 
     __name__ = 'Composition_Event'
 
+    _types = {
+        'code': 'reference',
+        'period': 'reference',
+        'detail': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'period', 'detail', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: list
@@ -388,6 +434,24 @@ class Composition_Section(fhirbase):
 
     __name__ = 'Composition_Section'
 
+    _types = {
+        'title': 'str',
+        'code': 'reference',
+        'text': 'reference',
+        'mode': 'str',
+        'orderedBy': 'reference',
+        'entry': 'reference',
+        'emptyReason': 'reference',
+        'section': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'title', 'code', 'text', 'mode', 'orderedBy', 'entry', 'emptyReason', 'section',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.title = None
         # type: str
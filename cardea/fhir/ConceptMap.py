@@ -73,6 +73,42 @@ class ConceptMap(fhirbase):
 
     __name__ = 'ConceptMap'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'purpose': 'str',
+        'copyright': 'str',
+        'sourceUri': 'str',
+        'sourceReference': 'reference',
+        'targetUri': 'str',
+        'targetReference': 'reference',
+        'group': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'contact', 'description', 'useContext', 'jurisdiction', 'purpose',
+        'copyright', 'sourceUri', 'sourceReference', 'targetUri', 'targetReference', 'group',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ConceptMap'
         # type: str
@@ -147,15 +183,6 @@ class ConceptMap(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -219,6 +246,21 @@ class ConceptMap_Group(fhirbase):
 
     __name__ = 'ConceptMap_Group'
 
+    _types = {
+        'source': 'str',
+        'sourceVersion': 'str',
+        'target': 'str',
+        'targetVersion': 'str',
+        'element': 'reference',
+        'unmapped': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'source', 'sourceVersion', 'target', 'targetVersion', 'element', 'unmapped', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.source = None
         # type: str
@@ -275,6 +317,16 @@ class ConceptMap_Element(fhirbase):
 
     __name__ = 'ConceptMap_Element'
 
+    _types = {
+        'code': 'str',
+        'display': 'str',
+        'target': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'display', 'target', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -330,6 +382,26 @@ class ConceptMap_Target(fhirbase):
 
     __name__ = 'ConceptMap_Target'
 
+    _enums = {
+        'equivalence': [
+            'relatedto', 'equivalent', 'equal', 'wider', 'subsumes', 'narrower', 'specializes',
+            'inexact', 'unmatched', 'disjoint'
+        ],
+    }
+
+    _types = {
+        'code': 'str',
+        'display': 'str',
+        'equivalence': 'str',
+        'comment': 'str',
+        'dependsOn': 'reference',
+        'product': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'display', 'equivalence', 'comment', 'dependsOn', 'product', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -360,17 +432,6 @@ class ConceptMap_Target(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.equivalence is not None:
-            for value in self.equivalence:
-                if value is not None and value.lower() not in [
-                    'relatedto', 'equivalent', 'equal', 'wider', 'subsumes', 'narrower',
-                        'specializes', 'inexact', 'unmatched', 'disjoint']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'relatedto, equivalent, equal, wider, subsumes, narrower, '
-                        'specializes, inexact, unmatched, disjoint'))
-
     def get_relationships(self):
 
         return [
@@ -408,6 +469,17 @@ class ConceptMap_DependsOn(fhirbase):
 
     __name__ = 'ConceptMap_DependsOn'
 
+    _types = {
+        'property': 'str',
+        'system': 'str',
+        'code': 'str',
+        'display': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('property', 'system', 'code', 'display', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.property = None
         # type: str
@@ -451,6 +523,21 @@ class ConceptMap_Unmapped(fhirbase):
 
     __name__ = 'ConceptMap_Unmapped'
 
+    _enums = {
+        'mode': ['provided', 'fixed', 'other-map'],
+    }
+
+    _types = {
+        'mode': 'str',
+        'code': 'str',
+        'display': 'str',
+        'url': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('mode', 'code', 'display', 'url', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.mode = None
         # type: str
@@ -471,12 +558,3 @@ class ConceptMap_Unmapped(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'provided', 'fixed', 'other-map']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'provided, fixed, other-map'))
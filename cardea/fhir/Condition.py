@@ -76,6 +76,50 @@ class Condition(fhirbase):
 
     __name__ = 'Condition'
 
+    _enums = {
+        'verificationStatus': [
+            'provisional', 'differential', 'confirmed', 'refuted', 'entered-in-error', 'unknown'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'clinicalStatus': 'str',
+        'verificationStatus': 'str',
+        'category': 'reference',
+        'severity': 'reference',
+        'code': 'reference',
+        'bodySite': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'onsetDateTime': 'str',
+        'onsetAge': 'reference',
+        'onsetPeriod': 'reference',
+        'onsetRange': 'reference',
+        'onsetString': 'str',
+        'abatementDateTime': 'str',
+        'abatementAge': 'reference',
+        'abatementBoolean': 'bool',
+        'abatementPeriod': 'reference',
+        'abatementRange': 'reference',
+        'abatementString': 'str',
+        'assertedDate': 'str',
+        'asserter': 'reference',
+        'stage': 'reference',
+        'evidence': 'reference',
+        'note': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'clinicalStatus', 'verificationStatus', 'category', 'severity', 'code',
+        'bodySite', 'subject', 'context', 'onsetDateTime', 'onsetAge', 'onsetPeriod', 'onsetRange',
+        'onsetString', 'abatementDateTime', 'abatementAge', 'abatementBoolean', 'abatementPeriod',
+        'abatementRange', 'abatementString', 'assertedDate', 'asserter', 'stage', 'evidence',
+        'note', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Condition'
         # type: str
@@ -167,17 +211,6 @@ class Condition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.verificationStatus is not None:
-            for value in self.verificationStatus:
-                if value is not None and value.lower() not in [
-                    'provisional', 'differential', 'confirmed', 'refuted',
-                        'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'provisional, differential, confirmed, refuted, entered-in-error,'
-                        'unknown'))
-
     def get_relationships(self):
 
         return [
@@ -282,6 +315,15 @@ class Condition_Stage(fhirbase):
 
     __name__ = 'Condition_Stage'
 
+    _types = {
+        'summary': 'reference',
+        'assessment': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('summary', 'assessment', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.summary = None
         # reference to CodeableConcept
@@ -325,6 +367,15 @@ class Condition_Evidence(fhirbase):
 
     __name__ = 'Condition_Evidence'
 
+    _types = {
+        'code': 'reference',
+        'detail': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'detail', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: list
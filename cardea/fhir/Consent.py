@@ -60,6 +60,42 @@ class Consent(fhirbase):
 
     __name__ = 'Consent'
 
+    _enums = {
+        'status': ['draft', 'proposed', 'active', 'rejected', 'inactive', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'category': 'reference',
+        'patient': 'reference',
+        'period': 'reference',
+        'dateTime': 'str',
+        'consentingParty': 'reference',
+        'actor': 'reference',
+        'action': 'reference',
+        'organization': 'reference',
+        'sourceAttachment': 'reference',
+        'sourceIdentifier': 'reference',
+        'sourceReference': 'reference',
+        'policy': 'reference',
+        'policyRule': 'str',
+        'securityLabel': 'reference',
+        'purpose': 'reference',
+        'dataPeriod': 'reference',
+        'data': 'reference',
+        '_except': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'category', 'patient', 'period', 'dateTime', 'consentingParty',
+        'actor', 'action', 'organization', 'sourceAttachment', 'sourceIdentifier',
+        'sourceReference', 'policy', 'policyRule', 'securityLabel', 'purpose', 'dataPeriod',
+        'data', '_except', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Consent'
         # type: str
@@ -141,16 +177,6 @@ class Consent(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'draft', 'proposed', 'active', 'rejected', 'inactive',
-                        'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, proposed, active, rejected, inactive, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -258,6 +284,15 @@ class Consent_Actor(fhirbase):
 
     __name__ = 'Consent_Actor'
 
+    _types = {
+        'role': 'reference',
+        'reference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('role', 'reference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.role = None
         # reference to CodeableConcept
@@ -304,6 +339,15 @@ class Consent_Policy(fhirbase):
 
     __name__ = 'Consent_Policy'
 
+    _types = {
+        'authority': 'str',
+        'uri': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('authority', 'uri', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.authority = None
         # type: str
@@ -334,6 +378,19 @@ class Consent_Data(fhirbase):
 
     __name__ = 'Consent_Data'
 
+    _enums = {
+        'meaning': ['instance', 'related', 'dependents', 'authoredby'],
+    }
+
+    _types = {
+        'meaning': 'str',
+        'reference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('meaning', 'reference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.meaning = None
         # type: str
@@ -349,15 +406,6 @@ class Consent_Data(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.meaning is not None:
-            for value in self.meaning:
-                if value is not None and value.lower() not in [
-                        'instance', 'related', 'dependents', 'authoredby']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'instance, related, dependents, authoredby'))
-
     def get_relationships(self):
 
         return [
@@ -402,6 +450,30 @@ class Consent_Except(fhirbase):
 
     __name__ = 'Consent_Except'
 
+    _enums = {
+        'type': ['deny', 'permit'],
+    }
+
+    _types = {
+        'type': 'str',
+        'period': 'reference',
+        'actor': 'reference',
+        'action': 'reference',
+        'securityLabel': 'reference',
+        'purpose': 'reference',
+        '_class': 'reference',
+        'code': 'reference',
+        'dataPeriod': 'reference',
+        'data': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'type', 'period', 'actor', 'action', 'securityLabel', 'purpose', '_class', 'code',
+        'dataPeriod', 'data', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -448,15 +520,6 @@ class Consent_Except(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'deny', 'permit']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'deny, permit'))
-
     def get_relationships(self):
 
         return [
@@ -524,6 +587,15 @@ class Consent_Actor1(fhirbase):
 
     __name__ = 'Consent_Actor1'
 
+    _types = {
+        'role': 'reference',
+        'reference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('role', 'reference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.role = None
         # reference to CodeableConcept
@@ -568,6 +640,19 @@ class Consent_Data1(fhirbase):
 
     __name__ = 'Consent_Data1'
 
+    _enums = {
+        'meaning': ['instance', 'related', 'dependents', 'authoredby'],
+    }
+
+    _types = {
+        'meaning': 'str',
+        'reference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('meaning', 'reference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.meaning = None
         # type: str
@@ -583,15 +668,6 @@ class Consent_Data1(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.meaning is not None:
-            for value in self.meaning:
-                if value is not None and value.lower() not in [
-                        'instance', 'related', 'dependents', 'authoredby']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'instance, related, dependents, authoredby'))
-
     def get_relationships(self):
 
         return [
@@ -13,6 +13,15 @@ class ContactDetail(fhirbase):
 
     __name__ = 'ContactDetail'
 
+    _types = {
+        'name': 'str',
+        'telecom': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'telecom', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -20,6 +20,23 @@ class ContactPoint(fhirbase):
 
     __name__ = 'ContactPoint'
 
+    _enums = {
+        'system': ['phone', 'fax', 'email', 'pager', 'url', 'sms', 'other'],
+        'use': ['home', 'work', 'temp', 'old', 'mobile'],
+    }
+
+    _types = {
+        'system': 'str',
+        'value': 'str',
+        'use': 'str',
+        'rank': 'int',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('system', 'value', 'use', 'rank', 'period', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.system = None
         # type: str
@@ -45,22 +62,6 @@ class ContactPoint(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.system is not None:
-            for value in self.system:
-                if value is not None and value.lower() not in [
-                        'phone', 'fax', 'email', 'pager', 'url', 'sms', 'other']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'phone, fax, email, pager, url, sms, other'))
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'home', 'work', 'temp', 'old', 'mobile']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'home, work, temp, old, mobile'))
-
     def get_relationships(self):
 
         return [
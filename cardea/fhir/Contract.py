@@ -72,6 +72,42 @@ class Contract(fhirbase):
 
     __name__ = 'Contract'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'issued': 'str',
+        'applies': 'reference',
+        'subject': 'reference',
+        'topic': 'reference',
+        'authority': 'reference',
+        'domain': 'reference',
+        'type': 'reference',
+        'subType': 'reference',
+        'action': 'reference',
+        'actionReason': 'reference',
+        'decisionType': 'reference',
+        'contentDerivative': 'reference',
+        'securityLabel': 'reference',
+        'agent': 'reference',
+        'signer': 'reference',
+        'valuedItem': 'reference',
+        'term': 'reference',
+        'bindingAttachment': 'reference',
+        'bindingReference': 'reference',
+        'friendly': 'reference',
+        'legal': 'reference',
+        'rule': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'issued', 'applies', 'subject', 'topic', 'authority', 'domain',
+        'type', 'subType', 'action', 'actionReason', 'decisionType', 'contentDerivative',
+        'securityLabel', 'agent', 'signer', 'valuedItem', 'term', 'bindingAttachment',
+        'bindingReference', 'friendly', 'legal', 'rule', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Contract'
         # type: str
@@ -295,6 +331,15 @@ class Contract_Agent(fhirbase):
 
     __name__ = 'Contract_Agent'
 
+    _types = {
+        'actor': 'reference',
+        'role': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('actor', 'role', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.actor = None
         # reference to Reference: identifier
@@ -337,6 +382,16 @@ class Contract_Signer(fhirbase):
 
     __name__ = 'Contract_Signer'
 
+    _types = {
+        'type': 'reference',
+        'party': 'reference',
+        'signature': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'party', 'signature', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to Coding
@@ -408,6 +463,24 @@ class Contract_ValuedItem(fhirbase):
 
     __name__ = 'Contract_ValuedItem'
 
+    _types = {
+        'entityCodeableConcept': 'reference',
+        'entityReference': 'reference',
+        'effectiveTime': 'str',
+        'quantity': 'reference',
+        'unitPrice': 'reference',
+        'factor': 'int',
+        'points': 'int',
+        'net': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'entityCodeableConcept', 'entityReference', 'effectiveTime', 'quantity', 'unitPrice',
+        'factor', 'points', 'net', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.entityCodeableConcept = None
         # reference to CodeableConcept
@@ -506,6 +579,28 @@ class Contract_Term(fhirbase):
 
     __name__ = 'Contract_Term'
 
+    _types = {
+        'issued': 'str',
+        'applies': 'reference',
+        'type': 'reference',
+        'subType': 'reference',
+        'topic': 'reference',
+        'action': 'reference',
+        'actionReason': 'reference',
+        'securityLabel': 'reference',
+        'agent': 'reference',
+        'text': 'str',
+        'valuedItem': 'reference',
+        'group': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'issued', 'applies', 'type', 'subType', 'topic', 'action', 'actionReason', 'securityLabel',
+        'agent', 'text', 'valuedItem', 'group', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.issued = None
         # type: str
@@ -629,6 +724,15 @@ class Contract_Agent1(fhirbase):
 
     __name__ = 'Contract_Agent1'
 
+    _types = {
+        'actor': 'reference',
+        'role': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('actor', 'role', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.actor = None
         # reference to Reference: identifier
@@ -693,6 +797,24 @@ class Contract_ValuedItem1(fhirbase):
 
     __name__ = 'Contract_ValuedItem1'
 
+    _types = {
+        'entityCodeableConcept': 'reference',
+        'entityReference': 'reference',
+        'effectiveTime': 'str',
+        'quantity': 'reference',
+        'unitPrice': 'reference',
+        'factor': 'int',
+        'points': 'int',
+        'net': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'entityCodeableConcept', 'entityReference', 'effectiveTime', 'quantity', 'unitPrice',
+        'factor', 'points', 'net', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.entityCodeableConcept = None
         # reference to CodeableConcept
@@ -775,6 +897,15 @@ class Contract_Friendly(fhirbase):
 
     __name__ = 'Contract_Friendly'
 
+    _types = {
+        'contentAttachment': 'reference',
+        'contentReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('contentAttachment', 'contentReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.contentAttachment = None
         # reference to Attachment
@@ -815,6 +946,15 @@ class Contract_Legal(fhirbase):
 
     __name__ = 'Contract_Legal'
 
+    _types = {
+        'contentAttachment': 'reference',
+        'contentReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('contentAttachment', 'contentReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.contentAttachment = None
         # reference to Attachment
@@ -857,6 +997,15 @@ class Contract_Rule(fhirbase):
 
     __name__ = 'Contract_Rule'
 
+    _types = {
+        'contentAttachment': 'reference',
+        'contentReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('contentAttachment', 'contentReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.contentAttachment = None
         # reference to Attachment
@@ -16,6 +16,20 @@ class Contributor(fhirbase):
 
     __name__ = 'Contributor'
 
+    _enums = {
+        'type': ['author', 'editor', 'reviewer', 'endorser'],
+    }
+
+    _types = {
+        'type': 'str',
+        'name': 'str',
+        'contact': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'name', 'contact', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -35,15 +49,6 @@ class Contributor(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'author', 'editor', 'reviewer', 'endorser']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'author, editor, reviewer, endorser'))
-
     def get_relationships(self):
 
         return [
@@ -52,6 +52,33 @@ class Coverage(fhirbase):
 
     __name__ = 'Coverage'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'type': 'reference',
+        'policyHolder': 'reference',
+        'subscriber': 'reference',
+        'subscriberId': 'str',
+        'beneficiary': 'reference',
+        'relationship': 'reference',
+        'period': 'reference',
+        'payor': 'reference',
+        'grouping': 'reference',
+        'dependent': 'str',
+        'sequence': 'str',
+        'order': 'int',
+        'network': 'str',
+        'contract': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'type', 'policyHolder', 'subscriber', 'subscriberId',
+        'beneficiary', 'relationship', 'period', 'payor', 'grouping', 'dependent', 'sequence',
+        'order', 'network', 'contract', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Coverage'
         # type: str
@@ -202,6 +229,28 @@ class Coverage_Grouping(fhirbase):
 
     __name__ = 'Coverage_Grouping'
 
+    _types = {
+        'group': 'str',
+        'groupDisplay': 'str',
+        'subGroup': 'str',
+        'subGroupDisplay': 'str',
+        'plan': 'str',
+        'planDisplay': 'str',
+        'subPlan': 'str',
+        'subPlanDisplay': 'str',
+        '_class': 'str',
+        'classDisplay': 'str',
+        'subClass': 'str',
+        'subClassDisplay': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'group', 'groupDisplay', 'subGroup', 'subGroupDisplay', 'plan', 'planDisplay', 'subPlan',
+        'subPlanDisplay', '_class', 'classDisplay', 'subClass', 'subClassDisplay', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.group = None
         # type: str
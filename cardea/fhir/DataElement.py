@@ -63,6 +63,40 @@ class DataElement(fhirbase):
 
     __name__ = 'DataElement'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+        'stringency': [
+            'comparable', 'fully-specified', 'equivalent', 'convertable', 'scaleable', 'flexible'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'name': 'str',
+        'title': 'str',
+        'contact': 'reference',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'copyright': 'str',
+        'stringency': 'str',
+        'mapping': 'reference',
+        'element': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'status', 'experimental', 'date', 'publisher', 'name',
+        'title', 'contact', 'useContext', 'jurisdiction', 'copyright', 'stringency', 'mapping',
+        'element', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'DataElement'
         # type: str
@@ -129,24 +163,6 @@ class DataElement(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.stringency is not None:
-            for value in self.stringency:
-                if value is not None and value.lower() not in [
-                    'comparable', 'fully-specified', 'equivalent', 'convertable',
-                        'scaleable', 'flexible']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'comparable, fully-specified, equivalent, convertable, scaleable,'
-                        'flexible'))
-
     def get_relationships(self):
 
         return [
@@ -199,6 +215,17 @@ class DataElement_Mapping(fhirbase):
 
     __name__ = 'DataElement_Mapping'
 
+    _types = {
+        'identity': 'str',
+        'uri': 'str',
+        'name': 'str',
+        'comment': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('identity', 'uri', 'name', 'comment', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.identity = None
         # type: str
@@ -29,6 +29,18 @@ class DataRequirement(fhirbase):
 
     __name__ = 'DataRequirement'
 
+    _types = {
+        'type': 'str',
+        'profile': 'list',
+        'mustSupport': 'list',
+        'codeFilter': 'reference',
+        'dateFilter': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'profile', 'mustSupport', 'codeFilter', 'dateFilter', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -109,6 +121,22 @@ class DataRequirement_CodeFilter(fhirbase):
 
     __name__ = 'DataRequirement_CodeFilter'
 
+    _types = {
+        'path': 'str',
+        'valueSetString': 'str',
+        'valueSetReference': 'reference',
+        'valueCode': 'list',
+        'valueCoding': 'reference',
+        'valueCodeableConcept': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'path', 'valueSetString', 'valueSetReference', 'valueCode', 'valueCoding',
+        'valueCodeableConcept', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.path = None
         # type: str
@@ -193,6 +221,17 @@ class DataRequirement_DateFilter(fhirbase):
 
     __name__ = 'DataRequirement_DateFilter'
 
+    _types = {
+        'path': 'str',
+        'valueDateTime': 'str',
+        'valuePeriod': 'reference',
+        'valueDuration': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('path', 'valueDateTime', 'valuePeriod', 'valueDuration', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.path = None
         # type: str
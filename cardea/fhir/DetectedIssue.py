@@ -37,6 +37,31 @@ class DetectedIssue(fhirbase):
 
     __name__ = 'DetectedIssue'
 
+    _enums = {
+        'severity': ['high', 'moderate', 'low'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'category': 'reference',
+        'severity': 'str',
+        'patient': 'reference',
+        'date': 'str',
+        'author': 'reference',
+        'implicated': 'reference',
+        'detail': 'str',
+        'reference': 'str',
+        'mitigation': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'category', 'severity', 'patient', 'date', 'author',
+        'implicated', 'detail', 'reference', 'mitigation', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'DetectedIssue'
         # type: str
@@ -82,15 +107,6 @@ class DetectedIssue(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.severity is not None:
-            for value in self.severity:
-                if value is not None and value.lower() not in [
-                        'high', 'moderate', 'low']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'high, moderate, low'))
-
     def get_relationships(self):
 
         return [
@@ -144,6 +160,16 @@ class DetectedIssue_Mitigation(fhirbase):
 
     __name__ = 'DetectedIssue_Mitigation'
 
+    _types = {
+        'action': 'reference',
+        'date': 'str',
+        'author': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('action', 'date', 'author', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.action = None
         # reference to CodeableConcept
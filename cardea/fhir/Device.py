@@ -46,6 +46,38 @@ class Device(fhirbase):
 
     __name__ = 'Device'
 
+    _enums = {
+        'status': ['active', 'inactive', 'entered-in-error', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'udi': 'reference',
+        'status': 'str',
+        'type': 'reference',
+        'lotNumber': 'str',
+        'manufacturer': 'str',
+        'manufactureDate': 'str',
+        'expirationDate': 'str',
+        'model': 'str',
+        'version': 'str',
+        'patient': 'reference',
+        'owner': 'reference',
+        'contact': 'reference',
+        'location': 'reference',
+        'url': 'str',
+        'note': 'reference',
+        'safety': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'udi', 'status', 'type', 'lotNumber', 'manufacturer', 'manufactureDate',
+        'expirationDate', 'model', 'version', 'patient', 'owner', 'contact', 'location', 'url',
+        'note', 'safety', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Device'
         # type: str
@@ -111,15 +143,6 @@ class Device(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'inactive', 'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, inactive, entered-in-error, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -212,6 +235,27 @@ class Device_Udi(fhirbase):
 
     __name__ = 'Device_Udi'
 
+    _enums = {
+        'entryType': ['barcode', 'rfid', 'manual', 'card', 'self-reported', 'unknown'],
+    }
+
+    _types = {
+        'deviceIdentifier': 'str',
+        'name': 'str',
+        'jurisdiction': 'str',
+        'carrierHRF': 'str',
+        'carrierAIDC': 'str',
+        'issuer': 'str',
+        'entryType': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'deviceIdentifier', 'name', 'jurisdiction', 'carrierHRF', 'carrierAIDC', 'issuer',
+        'entryType', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.deviceIdentifier = None
         # type: str
@@ -242,12 +286,3 @@ class Device_Udi(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.entryType is not None:
-            for value in self.entryType:
-                if value is not None and value.lower() not in [
-                        'barcode', 'rfid', 'manual', 'card', 'self-reported', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'barcode, rfid, manual, card, self-reported, unknown'))
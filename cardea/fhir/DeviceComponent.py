@@ -33,6 +33,34 @@ class DeviceComponent(fhirbase):
 
     __name__ = 'DeviceComponent'
 
+    _enums = {
+        'measurementPrinciple': [
+            'other', 'chemical', 'electrical', 'impedance', 'nuclear', 'optical', 'thermal',
+            'biological', 'mechanical', 'acoustical', 'manual'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'type': 'reference',
+        'lastSystemChange': 'str',
+        'source': 'reference',
+        'parent': 'reference',
+        'operationalStatus': 'reference',
+        'parameterGroup': 'reference',
+        'measurementPrinciple': 'str',
+        'productionSpecification': 'reference',
+        'languageCode': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'type', 'lastSystemChange', 'source', 'parent', 'operationalStatus',
+        'parameterGroup', 'measurementPrinciple', 'productionSpecification', 'languageCode',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'DeviceComponent'
         # type: str
@@ -76,17 +104,6 @@ class DeviceComponent(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.measurementPrinciple is not None:
-            for value in self.measurementPrinciple:
-                if value is not None and value.lower() not in [
-                    'other', 'chemical', 'electrical', 'impedance', 'nuclear', 'optical',
-                        'thermal', 'biological', 'mechanical', 'acoustical', 'manual']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'other, chemical, electrical, impedance, nuclear, optical, thermal,'
-                        'biological, mechanical, acoustical, manual'))
-
     def get_relationships(self):
 
         return [
@@ -149,6 +166,16 @@ class DeviceComponent_ProductionSpecification(fhirbase):
 
     __name__ = 'DeviceComponent_ProductionSpecification'
 
+    _types = {
+        'specType': 'reference',
+        'componentId': 'reference',
+        'productionSpec': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('specType', 'componentId', 'productionSpec', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.specType = None
         # reference to CodeableConcept
@@ -53,6 +53,32 @@ class DeviceMetric(fhirbase):
 
     __name__ = 'DeviceMetric'
 
+    _enums = {
+        'operationalStatus': ['on', 'off', 'standby', 'entered-in-error'],
+        'color': ['black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white'],
+        'category': ['measurement', 'setting', 'calculation', 'unspecified'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'type': 'reference',
+        'unit': 'reference',
+        'source': 'reference',
+        'parent': 'reference',
+        'operationalStatus': 'str',
+        'color': 'str',
+        'category': 'str',
+        'measurementPeriod': 'reference',
+        'calibration': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'type', 'unit', 'source', 'parent', 'operationalStatus', 'color',
+        'category', 'measurementPeriod', 'calibration', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'DeviceMetric'
         # type: str
@@ -98,29 +124,6 @@ class DeviceMetric(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.operationalStatus is not None:
-            for value in self.operationalStatus:
-                if value is not None and value.lower() not in [
-                        'on', 'off', 'standby', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'on, off, standby, entered-in-error'))
-
-        if self.color is not None:
-            for value in self.color:
-                if value is not None and value.lower() not in [
-                        'black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'black, red, green, yellow, blue, magenta, cyan, white'))
-
-        if self.category is not None:
-            for value in self.category:
-                if value is not None and value.lower() not in [
-                        'measurement', 'setting', 'calculation', 'unspecified']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'measurement, setting, calculation, unspecified'))
-
     def get_relationships(self):
 
         return [
@@ -174,6 +177,21 @@ class DeviceMetric_Calibration(fhirbase):
 
     __name__ = 'DeviceMetric_Calibration'
 
+    _enums = {
+        'type': ['unspecified', 'offset', 'gain', 'two-point'],
+        'state': ['not-calibrated', 'calibration-required', 'calibrated', 'unspecified'],
+    }
+
+    _types = {
+        'type': 'str',
+        'state': 'str',
+        'time': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'state', 'time', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -193,19 +211,3 @@ class DeviceMetric_Calibration(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'unspecified', 'offset', 'gain', 'two-point']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'unspecified, offset, gain, two-point'))
-
-        if self.state is not None:
-            for value in self.state:
-                if value is not None and value.lower() not in [
-                        'not-calibrated', 'calibration-required', 'calibrated', 'unspecified']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'not-calibrated, calibration-required, calibrated, unspecified'))
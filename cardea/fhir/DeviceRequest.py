@@ -64,6 +64,43 @@ class DeviceRequest(fhirbase):
 
     __name__ = 'DeviceRequest'
 
+    _types = {
+        'resourceType': 'str',
+        'definition': 'reference',
+        'basedOn': 'reference',
+        'priorRequest': 'reference',
+        'groupIdentifier': 'reference',
+        'status': 'str',
+        'intent': 'reference',
+        'priority': 'str',
+        'codeReference': 'reference',
+        'codeCodeableConcept': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'occurrenceDateTime': 'str',
+        'occurrencePeriod': 'reference',
+        'occurrenceTiming': 'reference',
+        'authoredOn': 'str',
+        'requester': 'reference',
+        'performerType': 'reference',
+        'performer': 'reference',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'supportingInfo': 'reference',
+        'note': 'reference',
+        'relevantHistory': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definition', 'basedOn', 'priorRequest', 'groupIdentifier', 'status',
+        'intent', 'priority', 'codeReference', 'codeCodeableConcept', 'subject', 'context',
+        'occurrenceDateTime', 'occurrencePeriod', 'occurrenceTiming', 'authoredOn', 'requester',
+        'performerType', 'performer', 'reasonCode', 'reasonReference', 'supportingInfo', 'note',
+        'relevantHistory', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'DeviceRequest'
         # type: str
@@ -273,6 +310,15 @@ class DeviceRequest_Requester(fhirbase):
 
     __name__ = 'DeviceRequest_Requester'
 
+    _types = {
+        'agent': 'reference',
+        'onBehalfOf': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('agent', 'onBehalfOf', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.agent = None
         # reference to Reference: identifier
@@ -31,6 +31,34 @@ class DeviceUseStatement(fhirbase):
 
     __name__ = 'DeviceUseStatement'
 
+    _enums = {
+        'status': ['active', 'completed', 'entered-in-error', 'intended', 'stopped', 'on-hold'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'subject': 'reference',
+        'whenUsed': 'reference',
+        'timingTiming': 'reference',
+        'timingPeriod': 'reference',
+        'timingDateTime': 'str',
+        'recordedOn': 'str',
+        'source': 'reference',
+        'device': 'reference',
+        'indication': 'reference',
+        'bodySite': 'reference',
+        'note': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'subject', 'whenUsed', 'timingTiming', 'timingPeriod',
+        'timingDateTime', 'recordedOn', 'source', 'device', 'indication', 'bodySite', 'note',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'DeviceUseStatement'
         # type: str
@@ -84,16 +112,6 @@ class DeviceUseStatement(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'active', 'completed', 'entered-in-error', 'intended', 'stopped',
-                        'on-hold']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, completed, entered-in-error, intended, stopped, on-hold'))
-
     def get_relationships(self):
 
         return [
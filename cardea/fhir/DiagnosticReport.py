@@ -64,6 +64,42 @@ class DiagnosticReport(fhirbase):
 
     __name__ = 'DiagnosticReport'
 
+    _enums = {
+        'status': [
+            'registered', 'partial', 'preliminary', 'final', 'amended', 'corrected', 'appended',
+            'cancelled', 'entered-in-error', 'unknown'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'basedOn': 'reference',
+        'status': 'str',
+        'category': 'reference',
+        'code': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'effectiveDateTime': 'str',
+        'effectivePeriod': 'reference',
+        'issued': 'str',
+        'performer': 'reference',
+        'specimen': 'reference',
+        'result': 'reference',
+        'imagingStudy': 'reference',
+        'image': 'reference',
+        'conclusion': 'str',
+        'codedDiagnosis': 'reference',
+        'presentedForm': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'basedOn', 'status', 'category', 'code', 'subject', 'context',
+        'effectiveDateTime', 'effectivePeriod', 'issued', 'performer', 'specimen', 'result',
+        'imagingStudy', 'image', 'conclusion', 'codedDiagnosis', 'presentedForm', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'DiagnosticReport'
         # type: str
@@ -138,17 +174,6 @@ class DiagnosticReport(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'registered', 'partial', 'preliminary', 'final', 'amended',
-                        'corrected', 'appended', 'cancelled', 'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'registered, partial, preliminary, final, amended, corrected, '
-                        'appended, cancelled, entered-in-error, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -243,6 +268,15 @@ class DiagnosticReport_Performer(fhirbase):
 
     __name__ = 'DiagnosticReport_Performer'
 
+    _types = {
+        'role': 'reference',
+        'actor': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('role', 'actor', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.role = None
         # reference to CodeableConcept
@@ -289,6 +323,15 @@ class DiagnosticReport_Image(fhirbase):
 
     __name__ = 'DiagnosticReport_Image'
 
+    _types = {
+        'comment': 'str',
+        'link': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('comment', 'link', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.comment = None
         # type: str
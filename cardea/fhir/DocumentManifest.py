@@ -42,6 +42,32 @@ class DocumentManifest(fhirbase):
 
     __name__ = 'DocumentManifest'
 
+    _enums = {
+        'status': ['current', 'superseded', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'masterIdentifier': 'reference',
+        'status': 'str',
+        'type': 'reference',
+        'subject': 'reference',
+        'created': 'str',
+        'author': 'reference',
+        'recipient': 'reference',
+        'source': 'str',
+        'description': 'str',
+        'content': 'reference',
+        'related': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'masterIdentifier', 'status', 'type', 'subject', 'created', 'author',
+        'recipient', 'source', 'description', 'content', 'related', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'DocumentManifest'
         # type: str
@@ -93,15 +119,6 @@ class DocumentManifest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'current', 'superseded', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'current, superseded, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -165,6 +182,15 @@ class DocumentManifest_Content(fhirbase):
 
     __name__ = 'DocumentManifest_Content'
 
+    _types = {
+        'pAttachment': 'reference',
+        'pReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('pAttachment', 'pReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.pAttachment = None
         # reference to Attachment
@@ -207,6 +233,14 @@ class DocumentManifest_Related(fhirbase):
 
     __name__ = 'DocumentManifest_Related'
 
+    _types = {
+        'ref': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('ref', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.ref = None
         # reference to Reference: identifier
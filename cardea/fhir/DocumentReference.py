@@ -50,6 +50,38 @@ class DocumentReference(fhirbase):
 
     __name__ = 'DocumentReference'
 
+    _enums = {
+        'status': ['current', 'superseded', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'masterIdentifier': 'reference',
+        'status': 'str',
+        'docStatus': 'str',
+        'type': 'reference',
+        '_class': 'reference',
+        'subject': 'reference',
+        'created': 'str',
+        'indexed': 'str',
+        'author': 'reference',
+        'authenticator': 'reference',
+        'custodian': 'reference',
+        'relatesTo': 'reference',
+        'description': 'str',
+        'securityLabel': 'reference',
+        'content': 'reference',
+        'context': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'masterIdentifier', 'status', 'docStatus', 'type', '_class', 'subject',
+        'created', 'indexed', 'author', 'authenticator', 'custodian', 'relatesTo', 'description',
+        'securityLabel', 'content', 'context', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'DocumentReference'
         # type: str
@@ -116,15 +148,6 @@ class DocumentReference(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'current', 'superseded', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'current, superseded, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -202,6 +225,19 @@ class DocumentReference_RelatesTo(fhirbase):
 
     __name__ = 'DocumentReference_RelatesTo'
 
+    _enums = {
+        'code': ['replaces', 'transforms', 'signs', 'appends'],
+    }
+
+    _types = {
+        'code': 'str',
+        'target': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'target', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -217,15 +253,6 @@ class DocumentReference_RelatesTo(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                        'replaces', 'transforms', 'signs', 'appends']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'replaces, transforms, signs, appends'))
-
     def get_relationships(self):
 
         return [
@@ -250,6 +277,15 @@ class DocumentReference_Content(fhirbase):
 
     __name__ = 'DocumentReference_Content'
 
+    _types = {
+        'attachment': 'reference',
+        'format': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('attachment', 'format', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.attachment = None
         # reference to Attachment
@@ -304,6 +340,23 @@ class DocumentReference_Context(fhirbase):
 
     __name__ = 'DocumentReference_Context'
 
+    _types = {
+        'encounter': 'reference',
+        'event': 'reference',
+        'period': 'reference',
+        'facilityType': 'reference',
+        'practiceSetting': 'reference',
+        'sourcePatientInfo': 'reference',
+        'related': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'encounter', 'event', 'period', 'facilityType', 'practiceSetting', 'sourcePatientInfo',
+        'related', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.encounter = None
         # reference to Reference: identifier
@@ -387,6 +440,14 @@ class DocumentReference_Related(fhirbase):
 
     __name__ = 'DocumentReference_Related'
 
+    _types = {
+        'ref': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('ref', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.ref = None
         # reference to Reference: identifier
@@ -39,6 +39,17 @@ class DomainResource(fhirbase):
 
     __name__ = 'DomainResource'
 
+    _types = {
+        'text': 'reference',
+        'contained': 'reference',
+        'extension': 'reference',
+        'modifierExtension': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('text', 'contained', 'extension', 'modifierExtension', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.text = None
         # reference to Narrative
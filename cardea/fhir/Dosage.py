@@ -39,6 +39,36 @@ class Dosage(fhirbase):
 
     __name__ = 'Dosage'
 
+    _types = {
+        'sequence': 'int',
+        'text': 'str',
+        'additionalInstruction': 'reference',
+        'patientInstruction': 'str',
+        'timing': 'reference',
+        'asNeededBoolean': 'bool',
+        'asNeededCodeableConcept': 'reference',
+        'site': 'reference',
+        'route': 'reference',
+        'method': 'reference',
+        'doseRange': 'reference',
+        'doseSimpleQuantity': 'reference',
+        'maxDosePerPeriod': 'reference',
+        'maxDosePerAdministration': 'reference',
+        'maxDosePerLifetime': 'reference',
+        'rateRatio': 'reference',
+        'rateRange': 'reference',
+        'rateSimpleQuantity': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'text', 'additionalInstruction', 'patientInstruction', 'timing',
+        'asNeededBoolean', 'asNeededCodeableConcept', 'site', 'route', 'method', 'doseRange',
+        'doseSimpleQuantity', 'maxDosePerPeriod', 'maxDosePerAdministration', 'maxDosePerLifetime',
+        'rateRatio', 'rateRange', 'rateSimpleQuantity', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -20,6 +20,14 @@ class Element(fhirbase):
 
     __name__ = 'Element'
 
+    _types = {
+        'extension': 'reference',
+        'id': 'str',
+    }
+
+    _fields = ('extension', 'id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.extension = None
         # type: list
@@ -884,6 +884,271 @@ class ElementDefinition(fhirbase):
 
     __name__ = 'ElementDefinition'
 
+    _enums = {
+        'representation': ['xmlattr', 'xmltext', 'typeattr', 'cdatext', 'xhtml'],
+    }
+
+    _types = {
+        'path': 'str',
+        'representation': 'list',
+        'sliceName': 'str',
+        'label': 'str',
+        'code': 'reference',
+        'slicing': 'reference',
+        'short': 'str',
+        'definition': 'str',
+        'comment': 'str',
+        'requirements': 'str',
+        'alias': 'list',
+        'min': 'int',
+        'max': 'str',
+        'base': 'reference',
+        'contentReference': 'str',
+        'type': 'reference',
+        'defaultValueBoolean': 'bool',
+        'defaultValueInteger': 'int',
+        'defaultValueDecimal': 'int',
+        'defaultValueBase64Binary': 'str',
+        'defaultValueInstant': 'str',
+        'defaultValueString': 'str',
+        'defaultValueUri': 'str',
+        'defaultValueDate': 'str',
+        'defaultValueDateTime': 'str',
+        'defaultValueTime': 'str',
+        'defaultValueCode': 'str',
+        'defaultValueOid': 'str',
+        'defaultValueUuid': 'str',
+        'defaultValueId': 'str',
+        'defaultValueUnsignedInt': 'int',
+        'defaultValuePositiveInt': 'int',
+        'defaultValueMarkdown': 'str',
+        'defaultValueElement': 'reference',
+        'defaultValueExtension': 'reference',
+        'defaultValueBackboneElement': 'reference',
+        'defaultValueNarrative': 'reference',
+        'defaultValueAnnotation': 'reference',
+        'defaultValueAttachment': 'reference',
+        'defaultValueIdentifier': 'reference',
+        'defaultValueCodeableConcept': 'reference',
+        'defaultValueCoding': 'reference',
+        'defaultValueQuantity': 'reference',
+        'defaultValueDuration': 'reference',
+        'defaultValueSimpleQuantity': 'reference',
+        'defaultValueDistance': 'reference',
+        'defaultValueCount': 'reference',
+        'defaultValueMoney': 'reference',
+        'defaultValueAge': 'reference',
+        'defaultValueRange': 'reference',
+        'defaultValuePeriod': 'reference',
+        'defaultValueRatio': 'reference',
+        'defaultValueReference': 'reference',
+        'defaultValueSampledData': 'reference',
+        'defaultValueSignature': 'reference',
+        'defaultValueHumanName': 'reference',
+        'defaultValueAddress': 'reference',
+        'defaultValueContactPoint': 'reference',
+        'defaultValueTiming': 'reference',
+        'defaultValueMeta': 'reference',
+        'defaultValueElementDefinition': 'reference',
+        'defaultValueContactDetail': 'reference',
+        'defaultValueContributor': 'reference',
+        'defaultValueDosage': 'reference',
+        'defaultValueRelatedArtifact': 'reference',
+        'defaultValueUsageContext': 'reference',
+        'defaultValueDataRequirement': 'reference',
+        'defaultValueParameterDefinition': 'reference',
+        'defaultValueTriggerDefinition': 'reference',
+        'meaningWhenMissing': 'str',
+        'orderMeaning': 'str',
+        'fixedBoolean': 'bool',
+        'fixedInteger': 'int',
+        'fixedDecimal': 'int',
+        'fixedBase64Binary': 'str',
+        'fixedInstant': 'str',
+        'fixedString': 'str',
+        'fixedUri': 'str',
+        'fixedDate': 'str',
+        'fixedDateTime': 'str',
+        'fixedTime': 'str',
+        'fixedCode': 'str',
+        'fixedOid': 'str',
+        'fixedUuid': 'str',
+        'fixedId': 'str',
+        'fixedUnsignedInt': 'int',
+        'fixedPositiveInt': 'int',
+        'fixedMarkdown': 'str',
+        'fixedElement': 'reference',
+        'fixedExtension': 'reference',
+        'fixedBackboneElement': 'reference',
+        'fixedNarrative': 'reference',
+        'fixedAnnotation': 'reference',
+        'fixedAttachment': 'reference',
+        'fixedIdentifier': 'reference',
+        'fixedCodeableConcept': 'reference',
+        'fixedCoding': 'reference',
+        'fixedQuantity': 'reference',
+        'fixedDuration': 'reference',
+        'fixedSimpleQuantity': 'reference',
+        'fixedDistance': 'reference',
+        'fixedCount': 'reference',
+        'fixedMoney': 'reference',
+        'fixedAge': 'reference',
+        'fixedRange': 'reference',
+        'fixedPeriod': 'reference',
+        'fixedRatio': 'reference',
+        'fixedReference': 'reference',
+        'fixedSampledData': 'reference',
+        'fixedSignature': 'reference',
+        'fixedHumanName': 'reference',
+        'fixedAddress': 'reference',
+        'fixedContactPoint': 'reference',
+        'fixedTiming': 'reference',
+        'fixedMeta': 'reference',
+        'fixedElementDefinition': 'reference',
+        'fixedContactDetail': 'reference',
+        'fixedContributor': 'reference',
+        'fixedDosage': 'reference',
+        'fixedRelatedArtifact': 'reference',
+        'fixedUsageContext': 'reference',
+        'fixedDataRequirement': 'reference',
+        'fixedParameterDefinition': 'reference',
+        'fixedTriggerDefinition': 'reference',
+        'patternBoolean': 'bool',
+        'patternInteger': 'int',
+        'patternDecimal': 'int',
+        'patternBase64Binary': 'str',
+        'patternInstant': 'str',
+        'patternString': 'str',
+        'patternUri': 'str',
+        'patternDate': 'str',
+        'patternDateTime': 'str',
+        'patternTime': 'str',
+        'patternCode': 'str',
+        'patternOid': 'str',
+        'patternUuid': 'str',
+        'patternId': 'str',
+        'patternUnsignedInt': 'int',
+        'patternPositiveInt': 'int',
+        'patternMarkdown': 'str',
+        'patternElement': 'reference',
+        'patternExtension': 'reference',
+        'patternBackboneElement': 'reference',
+        'patternNarrative': 'reference',
+        'patternAnnotation': 'reference',
+        'patternAttachment': 'reference',
+        'patternIdentifier': 'reference',
+        'patternCodeableConcept': 'reference',
+        'patternCoding': 'reference',
+        'patternQuantity': 'reference',
+        'patternDuration': 'reference',
+        'patternSimpleQuantity': 'reference',
+        'patternDistance': 'reference',
+        'patternCount': 'reference',
+        'patternMoney': 'reference',
+        'patternAge': 'reference',
+        'patternRange': 'reference',
+        'patternPeriod': 'reference',
+        'patternRatio': 'reference',
+        'patternReference': 'reference',
+        'patternSampledData': 'reference',
+        'patternSignature': 'reference',
+        'patternHumanName': 'reference',
+        'patternAddress': 'reference',
+        'patternContactPoint': 'reference',
+        'patternTiming': 'reference',
+        'patternMeta': 'reference',
+        'patternElementDefinition': 'reference',
+        'patternContactDetail': 'reference',
+        'patternContributor': 'reference',
+        'patternDosage': 'reference',
+        'patternRelatedArtifact': 'reference',
+        'patternUsageContext': 'reference',
+        'patternDataRequirement': 'reference',
+        'patternParameterDefinition': 'reference',
+        'patternTriggerDefinition': 'reference',
+        'example': 'reference',
+        'minValueDate': 'str',
+        'minValueDateTime': 'str',
+        'minValueInstant': 'str',
+        'minValueTime': 'str',
+        'minValueDecimal': 'int',
+        'minValueInteger': 'int',
+        'minValuePositiveInt': 'int',
+        'minValueUnsignedInt': 'int',
+        'minValueQuantity': 'reference',
+        'maxValueDate': 'str',
+        'maxValueDateTime': 'str',
+        'maxValueInstant': 'str',
+        'maxValueTime': 'str',
+        'maxValueDecimal': 'int',
+        'maxValueInteger': 'int',
+        'maxValuePositiveInt': 'int',
+        'maxValueUnsignedInt': 'int',
+        'maxValueQuantity': 'reference',
+        'maxLength': 'int',
+        'condition': 'list',
+        'constraint': 'reference',
+        'mustSupport': 'bool',
+        'isModifier': 'bool',
+        'isSummary': 'bool',
+        'binding': 'reference',
+        'mapping': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'path', 'representation', 'sliceName', 'label', 'code', 'slicing', 'short', 'definition',
+        'comment', 'requirements', 'alias', 'min', 'max', 'base', 'contentReference', 'type',
+        'defaultValueBoolean', 'defaultValueInteger', 'defaultValueDecimal',
+        'defaultValueBase64Binary', 'defaultValueInstant', 'defaultValueString', 'defaultValueUri',
+        'defaultValueDate', 'defaultValueDateTime', 'defaultValueTime', 'defaultValueCode',
+        'defaultValueOid', 'defaultValueUuid', 'defaultValueId', 'defaultValueUnsignedInt',
+        'defaultValuePositiveInt', 'defaultValueMarkdown', 'defaultValueElement',
+        'defaultValueExtension', 'defaultValueBackboneElement', 'defaultValueNarrative',
+        'defaultValueAnnotation', 'defaultValueAttachment', 'defaultValueIdentifier',
+        'defaultValueCodeableConcept', 'defaultValueCoding', 'defaultValueQuantity',
+        'defaultValueDuration', 'defaultValueSimpleQuantity', 'defaultValueDistance',
+        'defaultValueCount', 'defaultValueMoney', 'defaultValueAge', 'defaultValueRange',
+        'defaultValuePeriod', 'defaultValueRatio', 'defaultValueReference',
+        'defaultValueSampledData', 'defaultValueSignature', 'defaultValueHumanName',
+        'defaultValueAddress', 'defaultValueContactPoint', 'defaultValueTiming',
+        'defaultValueMeta', 'defaultValueElementDefinition', 'defaultValueContactDetail',
+        'defaultValueContributor', 'defaultValueDosage', 'defaultValueRelatedArtifact',
+        'defaultValueUsageContext', 'defaultValueDataRequirement',
+        'defaultValueParameterDefinition', 'defaultValueTriggerDefinition', 'meaningWhenMissing',
+        'orderMeaning', 'fixedBoolean', 'fixedInteger', 'fixedDecimal', 'fixedBase64Binary',
+        'fixedInstant', 'fixedString', 'fixedUri', 'fixedDate', 'fixedDateTime', 'fixedTime',
+        'fixedCode', 'fixedOid', 'fixedUuid', 'fixedId', 'fixedUnsignedInt', 'fixedPositiveInt',
+        'fixedMarkdown', 'fixedElement', 'fixedExtension', 'fixedBackboneElement',
+        'fixedNarrative', 'fixedAnnotation', 'fixedAttachment', 'fixedIdentifier',
+        'fixedCodeableConcept', 'fixedCoding', 'fixedQuantity', 'fixedDuration',
+        'fixedSimpleQuantity', 'fixedDistance', 'fixedCount', 'fixedMoney', 'fixedAge',
+        'fixedRange', 'fixedPeriod', 'fixedRatio', 'fixedReference', 'fixedSampledData',
+        'fixedSignature', 'fixedHumanName', 'fixedAddress', 'fixedContactPoint', 'fixedTiming',
+        'fixedMeta', 'fixedElementDefinition', 'fixedContactDetail', 'fixedContributor',
+        'fixedDosage', 'fixedRelatedArtifact', 'fixedUsageContext', 'fixedDataRequirement',
+        'fixedParameterDefinition', 'fixedTriggerDefinition', 'patternBoolean', 'patternInteger',
+        'patternDecimal', 'patternBase64Binary', 'patternInstant', 'patternString', 'patternUri',
+        'patternDate', 'patternDateTime', 'patternTime', 'patternCode', 'patternOid',
+        'patternUuid', 'patternId', 'patternUnsignedInt', 'patternPositiveInt', 'patternMarkdown',
+        'patternElement', 'patternExtension', 'patternBackboneElement', 'patternNarrative',
+        'patternAnnotation', 'patternAttachment', 'patternIdentifier', 'patternCodeableConcept',
+        'patternCoding', 'patternQuantity', 'patternDuration', 'patternSimpleQuantity',
+        'patternDistance', 'patternCount', 'patternMoney', 'patternAge', 'patternRange',
+        'patternPeriod', 'patternRatio', 'patternReference', 'patternSampledData',
+        'patternSignature', 'patternHumanName', 'patternAddress', 'patternContactPoint',
+        'patternTiming', 'patternMeta', 'patternElementDefinition', 'patternContactDetail',
+        'patternContributor', 'patternDosage', 'patternRelatedArtifact', 'patternUsageContext',
+        'patternDataRequirement', 'patternParameterDefinition', 'patternTriggerDefinition',
+        'example', 'minValueDate', 'minValueDateTime', 'minValueInstant', 'minValueTime',
+        'minValueDecimal', 'minValueInteger', 'minValuePositiveInt', 'minValueUnsignedInt',
+        'minValueQuantity', 'maxValueDate', 'maxValueDateTime', 'maxValueInstant', 'maxValueTime',
+        'maxValueDecimal', 'maxValueInteger', 'maxValuePositiveInt', 'maxValueUnsignedInt',
+        'maxValueQuantity', 'maxLength', 'condition', 'constraint', 'mustSupport', 'isModifier',
+        'isSummary', 'binding', 'mapping', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.path = None
         # type: str
@@ -1510,15 +1775,6 @@ class ElementDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.representation is not None:
-            for value in self.representation:
-                if value is not None and value.lower() not in [
-                        'xmlattr', 'xmltext', 'typeattr', 'cdatext', 'xhtml']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xmlAttr, xmlText, typeAttr, cdaText, xhtml'))
-
     def get_relationships(self):
 
         return [
@@ -2139,6 +2395,21 @@ class ElementDefinition_Slicing(fhirbase):
 
     __name__ = 'ElementDefinition_Slicing'
 
+    _enums = {
+        'rules': ['closed', 'open', 'openatend'],
+    }
+
+    _types = {
+        'discriminator': 'reference',
+        'description': 'str',
+        'ordered': 'bool',
+        'rules': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('discriminator', 'description', 'ordered', 'rules', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.discriminator = None
         # type: list
@@ -2161,15 +2432,6 @@ class ElementDefinition_Slicing(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.rules is not None:
-            for value in self.rules:
-                if value is not None and value.lower() not in [
-                        'closed', 'open', 'openatend']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'closed, open, openAtEnd'))
-
     def get_relationships(self):
 
         return [
@@ -2194,6 +2456,19 @@ class ElementDefinition_Discriminator(fhirbase):
 
     __name__ = 'ElementDefinition_Discriminator'
 
+    _enums = {
+        'type': ['value', 'exists', 'pattern', 'type', 'profile'],
+    }
+
+    _types = {
+        'type': 'str',
+        'path': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'path', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -2209,15 +2484,6 @@ class ElementDefinition_Discriminator(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'value', 'exists', 'pattern', 'type', 'profile']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'value, exists, pattern, type, profile'))
-
 
 class ElementDefinition_Base(fhirbase):
     """
@@ -2235,6 +2501,16 @@ class ElementDefinition_Base(fhirbase):
 
     __name__ = 'ElementDefinition_Base'
 
+    _types = {
+        'path': 'str',
+        'min': 'int',
+        'max': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('path', 'min', 'max', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.path = None
         # type: str
@@ -2286,6 +2562,23 @@ class ElementDefinition_Type(fhirbase):
 
     __name__ = 'ElementDefinition_Type'
 
+    _enums = {
+        'aggregation': ['contained', 'referenced', 'bundled'],
+        'versioning': ['either', 'independent', 'specific'],
+    }
+
+    _types = {
+        'code': 'str',
+        'profile': 'str',
+        'targetProfile': 'str',
+        'aggregation': 'list',
+        'versioning': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'profile', 'targetProfile', 'aggregation', 'versioning', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -2311,22 +2604,6 @@ class ElementDefinition_Type(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.aggregation is not None:
-            for value in self.aggregation:
-                if value is not None and value.lower() not in [
-                        'contained', 'referenced', 'bundled']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'contained, referenced, bundled'))
-
-        if self.versioning is not None:
-            for value in self.versioning:
-                if value is not None and value.lower() not in [
-                        'either', 'independent', 'specific']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'either, independent, specific'))
-
 
 class ElementDefinition_Example(fhirbase):
     """
@@ -2446,6 +2723,80 @@ class ElementDefinition_Example(fhirbase):
 
     __name__ = 'ElementDefinition_Example'
 
+    _types = {
+        'label': 'str',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueBase64Binary': 'str',
+        'valueInstant': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueCode': 'str',
+        'valueOid': 'str',
+        'valueUuid': 'str',
+        'valueId': 'str',
+        'valueUnsignedInt': 'int',
+        'valuePositiveInt': 'int',
+        'valueMarkdown': 'str',
+        'valueElement': 'reference',
+        'valueExtension': 'reference',
+        'valueBackboneElement': 'reference',
+        'valueNarrative': 'reference',
+        'valueAnnotation': 'reference',
+        'valueAttachment': 'reference',
+        'valueIdentifier': 'reference',
+        'valueCodeableConcept': 'reference',
+        'valueCoding': 'reference',
+        'valueQuantity': 'reference',
+        'valueDuration': 'reference',
+        'valueSimpleQuantity': 'reference',
+        'valueDistance': 'reference',
+        'valueCount': 'reference',
+        'valueMoney': 'reference',
+        'valueAge': 'reference',
+        'valueRange': 'reference',
+        'valuePeriod': 'reference',
+        'valueRatio': 'reference',
+        'valueReference': 'reference',
+        'valueSampledData': 'reference',
+        'valueSignature': 'reference',
+        'valueHumanName': 'reference',
+        'valueAddress': 'reference',
+        'valueContactPoint': 'reference',
+        'valueTiming': 'reference',
+        'valueMeta': 'reference',
+        'valueElementDefinition': 'str',
+        'valueContactDetail': 'reference',
+        'valueContributor': 'reference',
+        'valueDosage': 'reference',
+        'valueRelatedArtifact': 'reference',
+        'valueUsageContext': 'reference',
+        'valueDataRequirement': 'reference',
+        'valueParameterDefinition': 'reference',
+        'valueTriggerDefinition': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'label', 'valueBoolean', 'valueInteger', 'valueDecimal', 'valueBase64Binary',
+        'valueInstant', 'valueString', 'valueUri', 'valueDate', 'valueDateTime', 'valueTime',
+        'valueCode', 'valueOid', 'valueUuid', 'valueId', 'valueUnsignedInt', 'valuePositiveInt',
+        'valueMarkdown', 'valueElement', 'valueExtension', 'valueBackboneElement',
+        'valueNarrative', 'valueAnnotation', 'valueAttachment', 'valueIdentifier',
+        'valueCodeableConcept', 'valueCoding', 'valueQuantity', 'valueDuration',
+        'valueSimpleQuantity', 'valueDistance', 'valueCount', 'valueMoney', 'valueAge',
+        'valueRange', 'valuePeriod', 'valueRatio', 'valueReference', 'valueSampledData',
+        'valueSignature', 'valueHumanName', 'valueAddress', 'valueContactPoint', 'valueTiming',
+        'valueMeta', 'valueElementDefinition', 'valueContactDetail', 'valueContributor',
+        'valueDosage', 'valueRelatedArtifact', 'valueUsageContext', 'valueDataRequirement',
+        'valueParameterDefinition', 'valueTriggerDefinition', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.label = None
         # type: str
@@ -2819,6 +3170,26 @@ class ElementDefinition_Constraint(fhirbase):
 
     __name__ = 'ElementDefinition_Constraint'
 
+    _enums = {
+        'severity': ['error', 'warning'],
+    }
+
+    _types = {
+        'key': 'str',
+        'requirements': 'str',
+        'severity': 'str',
+        'human': 'str',
+        'expression': 'str',
+        'xpath': 'str',
+        'source': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'key', 'requirements', 'severity', 'human', 'expression', 'xpath', 'source', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.key = None
         # type: str
@@ -2849,15 +3220,6 @@ class ElementDefinition_Constraint(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.severity is not None:
-            for value in self.severity:
-                if value is not None and value.lower() not in [
-                        'error', 'warning']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'error, warning'))
-
 
 class ElementDefinition_Binding(fhirbase):
     """
@@ -2888,6 +3250,21 @@ class ElementDefinition_Binding(fhirbase):
 
     __name__ = 'ElementDefinition_Binding'
 
+    _enums = {
+        'strength': ['required', 'extensible', 'preferred', 'example'],
+    }
+
+    _types = {
+        'strength': 'str',
+        'description': 'str',
+        'valueSetUri': 'str',
+        'valueSetReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('strength', 'description', 'valueSetUri', 'valueSetReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.strength = None
         # type: str
@@ -2909,15 +3286,6 @@ class ElementDefinition_Binding(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.strength is not None:
-            for value in self.strength:
-                if value is not None and value.lower() not in [
-                        'required', 'extensible', 'preferred', 'example']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'required, extensible, preferred, example'))
-
     def get_relationships(self):
 
         return [
@@ -2945,6 +3313,17 @@ class ElementDefinition_Mapping(fhirbase):
 
     __name__ = 'ElementDefinition_Mapping'
 
+    _types = {
+        'identity': 'str',
+        'language': 'str',
+        'map': 'str',
+        'comment': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('identity', 'language', 'map', 'comment', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.identity = None
         # type: str
@@ -39,6 +39,33 @@ class EligibilityRequest(fhirbase):
 
     __name__ = 'EligibilityRequest'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'priority': 'reference',
+        'patient': 'reference',
+        'servicedDate': 'str',
+        'servicedPeriod': 'reference',
+        'created': 'str',
+        'enterer': 'reference',
+        'provider': 'reference',
+        'organization': 'reference',
+        'insurer': 'reference',
+        'facility': 'reference',
+        'coverage': 'reference',
+        'businessArrangement': 'str',
+        'benefitCategory': 'reference',
+        'benefitSubCategory': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'priority', 'patient', 'servicedDate', 'servicedPeriod',
+        'created', 'enterer', 'provider', 'organization', 'insurer', 'facility', 'coverage',
+        'businessArrangement', 'benefitCategory', 'benefitSubCategory', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'EligibilityRequest'
         # type: str
@@ -32,6 +32,29 @@ class EligibilityResponse(fhirbase):
 
     __name__ = 'EligibilityResponse'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'created': 'str',
+        'requestProvider': 'reference',
+        'requestOrganization': 'reference',
+        'request': 'reference',
+        'outcome': 'reference',
+        'disposition': 'str',
+        'insurer': 'reference',
+        'inforce': 'bool',
+        'insurance': 'reference',
+        'form': 'reference',
+        'error': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'created', 'requestProvider', 'requestOrganization', 'request',
+        'outcome', 'disposition', 'insurer', 'inforce', 'insurance', 'form', 'error', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'EligibilityResponse'
         # type: str
@@ -147,6 +170,16 @@ class EligibilityResponse_Insurance(fhirbase):
 
     __name__ = 'EligibilityResponse_Insurance'
 
+    _types = {
+        'coverage': 'reference',
+        'contract': 'reference',
+        'benefitBalance': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('coverage', 'contract', 'benefitBalance', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.coverage = None
         # reference to Reference: identifier
@@ -210,6 +243,25 @@ class EligibilityResponse_BenefitBalance(fhirbase):
 
     __name__ = 'EligibilityResponse_BenefitBalance'
 
+    _types = {
+        'category': 'reference',
+        'subCategory': 'reference',
+        'excluded': 'bool',
+        'name': 'str',
+        'description': 'str',
+        'network': 'reference',
+        'unit': 'reference',
+        'term': 'reference',
+        'financial': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'category', 'subCategory', 'excluded', 'name', 'description', 'network', 'unit', 'term',
+        'financial', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.category = None
         # reference to CodeableConcept
@@ -296,6 +348,22 @@ class EligibilityResponse_Financial(fhirbase):
 
     __name__ = 'EligibilityResponse_Financial'
 
+    _types = {
+        'type': 'reference',
+        'allowedUnsignedInt': 'int',
+        'allowedString': 'str',
+        'allowedMoney': 'reference',
+        'usedUnsignedInt': 'int',
+        'usedMoney': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'type', 'allowedUnsignedInt', 'allowedString', 'allowedMoney', 'usedUnsignedInt',
+        'usedMoney', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
@@ -353,6 +421,14 @@ class EligibilityResponse_Error(fhirbase):
 
     __name__ = 'EligibilityResponse_Error'
 
+    _types = {
+        'code': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to CodeableConcept
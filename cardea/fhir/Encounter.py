@@ -63,6 +63,46 @@ class Encounter(fhirbase):
 
     __name__ = 'Encounter'
 
+    _enums = {
+        'status': [
+            'planned', 'arrived', 'triaged', 'in-progress', 'onleave', 'finished', 'cancelled',
+            'entered-in-error', 'unknown'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'statusHistory': 'reference',
+        '_class': 'reference',
+        'classHistory': 'reference',
+        'type': 'reference',
+        'priority': 'reference',
+        'subject': 'reference',
+        'episodeOfCare': 'reference',
+        'incomingReferral': 'reference',
+        'participant': 'reference',
+        'appointment': 'reference',
+        'period': 'reference',
+        'length': 'reference',
+        'reason': 'reference',
+        'diagnosis': 'reference',
+        'account': 'reference',
+        'hospitalization': 'reference',
+        'location': 'reference',
+        'serviceProvider': 'reference',
+        'partOf': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'statusHistory', '_class', 'classHistory', 'type', 'priority',
+        'subject', 'episodeOfCare', 'incomingReferral', 'participant', 'appointment', 'period',
+        'length', 'reason', 'diagnosis', 'account', 'hospitalization', 'location',
+        'serviceProvider', 'partOf', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Encounter'
         # type: str
@@ -148,17 +188,6 @@ class Encounter(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'planned', 'arrived', 'triaged', 'in-progress', 'onleave', 'finished',
-                        'cancelled', 'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, arrived, triaged, in-progress, onleave, finished, '
-                        'cancelled, entered-in-error, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -278,6 +307,22 @@ class Encounter_StatusHistory(fhirbase):
 
     __name__ = 'Encounter_StatusHistory'
 
+    _enums = {
+        'status': [
+            'planned', 'arrived', 'triaged', 'in-progress', 'onleave', 'finished', 'cancelled',
+            'entered-in-error', 'unknown'
+        ],
+    }
+
+    _types = {
+        'status': 'str',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('status', 'period', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.status = None
         # type: str
@@ -294,17 +339,6 @@ class Encounter_StatusHistory(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'planned', 'arrived', 'triaged', 'in-progress', 'onleave', 'finished',
-                        'cancelled', 'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, arrived, triaged, in-progress, onleave, finished, '
-                        'cancelled, entered-in-error, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -328,6 +362,15 @@ class Encounter_ClassHistory(fhirbase):
 
     __name__ = 'Encounter_ClassHistory'
 
+    _types = {
+        '_class': 'reference',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('_class', 'period', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self._class = None
         # reference to Coding
@@ -372,6 +415,16 @@ class Encounter_Participant(fhirbase):
 
     __name__ = 'Encounter_Participant'
 
+    _types = {
+        'type': 'reference',
+        'period': 'reference',
+        'individual': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'period', 'individual', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: list
@@ -428,6 +481,16 @@ class Encounter_Diagnosis(fhirbase):
 
     __name__ = 'Encounter_Diagnosis'
 
+    _types = {
+        'condition': 'reference',
+        'role': 'reference',
+        'rank': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = ('condition', 'role', 'rank', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.condition = None
         # reference to Reference: identifier
@@ -483,6 +546,25 @@ class Encounter_Hospitalization(fhirbase):
 
     __name__ = 'Encounter_Hospitalization'
 
+    _types = {
+        'preAdmissionIdentifier': 'reference',
+        'origin': 'reference',
+        'admitSource': 'reference',
+        'reAdmission': 'reference',
+        'dietPreference': 'reference',
+        'specialCourtesy': 'reference',
+        'specialArrangement': 'reference',
+        'destination': 'reference',
+        'dischargeDisposition': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'preAdmissionIdentifier', 'origin', 'admitSource', 'reAdmission', 'dietPreference',
+        'specialCourtesy', 'specialArrangement', 'destination', 'dischargeDisposition', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.preAdmissionIdentifier = None
         # reference to Identifier
@@ -587,6 +669,20 @@ class Encounter_Location(fhirbase):
 
     __name__ = 'Encounter_Location'
 
+    _enums = {
+        'status': ['planned', 'active', 'reserved', 'completed'],
+    }
+
+    _types = {
+        'location': 'reference',
+        'status': 'str',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('location', 'status', 'period', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.location = None
         # reference to Reference: identifier
@@ -605,15 +701,6 @@ class Encounter_Location(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'planned', 'active', 'reserved', 'completed']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, active, reserved, completed'))
-
     def get_relationships(self):
 
         return [
@@ -38,6 +38,31 @@ class Endpoint(fhirbase):
 
     __name__ = 'Endpoint'
 
+    _enums = {
+        'status': ['active', 'suspended', 'error', 'off', 'entered-in-error', 'test'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'connectionType': 'reference',
+        'name': 'str',
+        'managingOrganization': 'reference',
+        'contact': 'reference',
+        'period': 'reference',
+        'payloadType': 'reference',
+        'payloadMimeType': 'list',
+        'address': 'str',
+        'header': 'list',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'connectionType', 'name', 'managingOrganization', 'contact',
+        'period', 'payloadType', 'payloadMimeType', 'address', 'header', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Endpoint'
         # type: str
@@ -85,15 +110,6 @@ class Endpoint(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'suspended', 'error', 'off', 'entered-in-error', 'test']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, suspended, error, off, entered-in-error, test'))
-
     def get_relationships(self):
 
         return [
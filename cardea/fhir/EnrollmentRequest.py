@@ -23,6 +23,24 @@ class EnrollmentRequest(fhirbase):
 
     __name__ = 'EnrollmentRequest'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'created': 'str',
+        'insurer': 'reference',
+        'provider': 'reference',
+        'organization': 'reference',
+        'subject': 'reference',
+        'coverage': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'created', 'insurer', 'provider', 'organization', 'subject',
+        'coverage', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'EnrollmentRequest'
         # type: str
@@ -24,6 +24,25 @@ class EnrollmentResponse(fhirbase):
 
     __name__ = 'EnrollmentResponse'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'request': 'reference',
+        'outcome': 'reference',
+        'disposition': 'str',
+        'created': 'str',
+        'organization': 'reference',
+        'requestProvider': 'reference',
+        'requestOrganization': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'request', 'outcome', 'disposition', 'created', 'organization',
+        'requestProvider', 'requestOrganization', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'EnrollmentResponse'
         # type: str
@@ -36,6 +36,35 @@ class EpisodeOfCare(fhirbase):
 
     __name__ = 'EpisodeOfCare'
 
+    _enums = {
+        'status': [
+            'planned', 'waitlist', 'active', 'onhold', 'finished', 'cancelled', 'entered-in-error'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'statusHistory': 'reference',
+        'type': 'reference',
+        'diagnosis': 'reference',
+        'patient': 'reference',
+        'managingOrganization': 'reference',
+        'period': 'reference',
+        'referralRequest': 'reference',
+        'careManager': 'reference',
+        'team': 'reference',
+        'account': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'statusHistory', 'type', 'diagnosis', 'patient',
+        'managingOrganization', 'period', 'referralRequest', 'careManager', 'team', 'account',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'EpisodeOfCare'
         # type: str
@@ -90,17 +119,6 @@ class EpisodeOfCare(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'planned', 'waitlist', 'active', 'onhold', 'finished', 'cancelled',
-                        'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, waitlist, active, onhold, finished, cancelled,'
-                        'entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -176,6 +194,21 @@ class EpisodeOfCare_StatusHistory(fhirbase):
 
     __name__ = 'EpisodeOfCare_StatusHistory'
 
+    _enums = {
+        'status': [
+            'planned', 'waitlist', 'active', 'onhold', 'finished', 'cancelled', 'entered-in-error'
+        ],
+    }
+
+    _types = {
+        'status': 'str',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('status', 'period', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.status = None
         # type: str
@@ -192,17 +225,6 @@ class EpisodeOfCare_StatusHistory(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'planned', 'waitlist', 'active', 'onhold', 'finished', 'cancelled',
-                        'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'planned, waitlist, active, onhold, finished, cancelled,'
-                        'entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -230,6 +252,16 @@ class EpisodeOfCare_Diagnosis(fhirbase):
 
     __name__ = 'EpisodeOfCare_Diagnosis'
 
+    _types = {
+        'condition': 'reference',
+        'role': 'reference',
+        'rank': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = ('condition', 'role', 'rank', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.condition = None
         # reference to Reference: identifier
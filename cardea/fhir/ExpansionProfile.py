@@ -79,6 +79,46 @@ class ExpansionProfile(fhirbase):
 
     __name__ = 'ExpansionProfile'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'fixedVersion': 'reference',
+        'excludedSystem': 'reference',
+        'includeDesignations': 'bool',
+        'designation': 'reference',
+        'includeDefinition': 'bool',
+        'activeOnly': 'bool',
+        'excludeNested': 'bool',
+        'excludeNotForUI': 'bool',
+        'excludePostCoordinated': 'bool',
+        'displayLanguage': 'str',
+        'limitedExpansion': 'bool',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'status', 'experimental', 'date', 'publisher',
+        'contact', 'description', 'useContext', 'jurisdiction', 'fixedVersion', 'excludedSystem',
+        'includeDesignations', 'designation', 'includeDefinition', 'activeOnly', 'excludeNested',
+        'excludeNotForUI', 'excludePostCoordinated', 'displayLanguage', 'limitedExpansion',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ExpansionProfile'
         # type: str
@@ -162,15 +202,6 @@ class ExpansionProfile(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -226,6 +257,20 @@ class ExpansionProfile_FixedVersion(fhirbase):
 
     __name__ = 'ExpansionProfile_FixedVersion'
 
+    _enums = {
+        'mode': ['default', 'check', 'override'],
+    }
+
+    _types = {
+        'system': 'str',
+        'version': 'str',
+        'mode': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('system', 'version', 'mode', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.system = None
         # type: str
@@ -244,15 +289,6 @@ class ExpansionProfile_FixedVersion(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'default', 'check', 'override']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'default, check, override'))
-
 
 class ExpansionProfile_ExcludedSystem(fhirbase):
     """
@@ -266,6 +302,15 @@ class ExpansionProfile_ExcludedSystem(fhirbase):
 
     __name__ = 'ExpansionProfile_ExcludedSystem'
 
+    _types = {
+        'system': 'str',
+        'version': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('system', 'version', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.system = None
         # type: str
@@ -291,6 +336,15 @@ class ExpansionProfile_Designation(fhirbase):
 
     __name__ = 'ExpansionProfile_Designation'
 
+    _types = {
+        'include': 'reference',
+        'exclude': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('include', 'exclude', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.include = None
         # reference to ExpansionProfile_Include
@@ -329,6 +383,14 @@ class ExpansionProfile_Include(fhirbase):
 
     __name__ = 'ExpansionProfile_Include'
 
+    _types = {
+        'designation': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('designation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.designation = None
         # type: list
@@ -361,6 +423,15 @@ class ExpansionProfile_Designation1(fhirbase):
 
     __name__ = 'ExpansionProfile_Designation1'
 
+    _types = {
+        'language': 'str',
+        'use': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('language', 'use', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.language = None
         # type: str
@@ -394,6 +465,14 @@ class ExpansionProfile_Exclude(fhirbase):
 
     __name__ = 'ExpansionProfile_Exclude'
 
+    _types = {
+        'designation': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('designation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.designation = None
         # type: list
@@ -426,6 +505,15 @@ class ExpansionProfile_Designation2(fhirbase):
 
     __name__ = 'ExpansionProfile_Designation2'
 
+    _types = {
+        'language': 'str',
+        'use': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('language', 'use', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.language = None
         # type: str
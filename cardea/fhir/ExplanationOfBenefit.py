@@ -82,6 +82,64 @@ class ExplanationOfBenefit(fhirbase):
 
     __name__ = 'ExplanationOfBenefit'
 
+    _enums = {
+        'status': ['active', 'cancelled', 'draft', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'type': 'reference',
+        'subType': 'reference',
+        'patient': 'reference',
+        'billablePeriod': 'reference',
+        'created': 'str',
+        'enterer': 'reference',
+        'insurer': 'reference',
+        'provider': 'reference',
+        'organization': 'reference',
+        'referral': 'reference',
+        'facility': 'reference',
+        'claim': 'reference',
+        'claimResponse': 'reference',
+        'outcome': 'reference',
+        'disposition': 'str',
+        'related': 'reference',
+        'prescription': 'reference',
+        'originalPrescription': 'reference',
+        'payee': 'reference',
+        'information': 'reference',
+        'careTeam': 'reference',
+        'diagnosis': 'reference',
+        'procedure': 'reference',
+        'precedence': 'int',
+        'insurance': 'reference',
+        'accident': 'reference',
+        'employmentImpacted': 'reference',
+        'hospitalization': 'reference',
+        'item': 'reference',
+        'addItem': 'reference',
+        'totalCost': 'reference',
+        'unallocDeductable': 'reference',
+        'totalBenefit': 'reference',
+        'payment': 'reference',
+        'form': 'reference',
+        'processNote': 'reference',
+        'benefitBalance': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'type', 'subType', 'patient', 'billablePeriod', 'created',
+        'enterer', 'insurer', 'provider', 'organization', 'referral', 'facility', 'claim',
+        'claimResponse', 'outcome', 'disposition', 'related', 'prescription',
+        'originalPrescription', 'payee', 'information', 'careTeam', 'diagnosis', 'procedure',
+        'precedence', 'insurance', 'accident', 'employmentImpacted', 'hospitalization', 'item',
+        'addItem', 'totalCost', 'unallocDeductable', 'totalBenefit', 'payment', 'form',
+        'processNote', 'benefitBalance', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ExplanationOfBenefit'
         # type: str
@@ -220,15 +278,6 @@ class ExplanationOfBenefit(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'cancelled', 'draft', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, cancelled, draft, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -426,6 +475,16 @@ class ExplanationOfBenefit_Related(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Related'
 
+    _types = {
+        'claim': 'reference',
+        'relationship': 'reference',
+        'reference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('claim', 'relationship', 'reference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.claim = None
         # reference to Reference: identifier
@@ -476,6 +535,16 @@ class ExplanationOfBenefit_Payee(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Payee'
 
+    _types = {
+        'type': 'reference',
+        'resourceType': 'reference',
+        'party': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'resourceType', 'party', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
@@ -548,6 +617,26 @@ class ExplanationOfBenefit_Information(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Information'
 
+    _types = {
+        'sequence': 'int',
+        'category': 'reference',
+        'code': 'reference',
+        'timingDate': 'str',
+        'timingPeriod': 'reference',
+        'valueString': 'str',
+        'valueQuantity': 'reference',
+        'valueAttachment': 'reference',
+        'valueReference': 'reference',
+        'reason': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'category', 'code', 'timingDate', 'timingPeriod', 'valueString',
+        'valueQuantity', 'valueAttachment', 'valueReference', 'reason', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -644,6 +733,18 @@ class ExplanationOfBenefit_CareTeam(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_CareTeam'
 
+    _types = {
+        'sequence': 'int',
+        'provider': 'reference',
+        'responsible': 'bool',
+        'role': 'reference',
+        'qualification': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('sequence', 'provider', 'responsible', 'role', 'qualification', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -704,6 +805,21 @@ class ExplanationOfBenefit_Diagnosis(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Diagnosis'
 
+    _types = {
+        'sequence': 'int',
+        'diagnosisCodeableConcept': 'reference',
+        'diagnosisReference': 'reference',
+        'type': 'reference',
+        'packageCode': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'diagnosisCodeableConcept', 'diagnosisReference', 'type', 'packageCode',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -768,6 +884,17 @@ class ExplanationOfBenefit_Procedure(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Procedure'
 
+    _types = {
+        'sequence': 'int',
+        'date': 'str',
+        'procedureCodeableConcept': 'reference',
+        'procedureReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('sequence', 'date', 'procedureCodeableConcept', 'procedureReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -817,6 +944,15 @@ class ExplanationOfBenefit_Insurance(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Insurance'
 
+    _types = {
+        'coverage': 'reference',
+        'preAuthRef': 'list',
+        'object_id': 'reference',
+    }
+
+    _fields = ('coverage', 'preAuthRef', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.coverage = None
         # reference to Reference: identifier
@@ -855,6 +991,17 @@ class ExplanationOfBenefit_Accident(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Accident'
 
+    _types = {
+        'date': 'str',
+        'type': 'reference',
+        'locationAddress': 'reference',
+        'locationReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('date', 'type', 'locationAddress', 'locationReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.date = None
         # type: str
@@ -955,6 +1102,45 @@ class ExplanationOfBenefit_Item(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Item'
 
+    _types = {
+        'sequence': 'int',
+        'careTeamLinkId': 'list',
+        'diagnosisLinkId': 'list',
+        'procedureLinkId': 'list',
+        'informationLinkId': 'list',
+        'revenue': 'reference',
+        'category': 'reference',
+        'service': 'reference',
+        'modifier': 'reference',
+        'programCode': 'reference',
+        'servicedDate': 'str',
+        'servicedPeriod': 'reference',
+        'locationCodeableConcept': 'reference',
+        'locationAddress': 'reference',
+        'locationReference': 'reference',
+        'quantity': 'reference',
+        'unitPrice': 'reference',
+        'factor': 'int',
+        'net': 'reference',
+        'udi': 'reference',
+        'bodySite': 'reference',
+        'subSite': 'reference',
+        'encounter': 'reference',
+        'noteNumber': 'list',
+        'adjudication': 'reference',
+        'detail': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'careTeamLinkId', 'diagnosisLinkId', 'procedureLinkId', 'informationLinkId',
+        'revenue', 'category', 'service', 'modifier', 'programCode', 'servicedDate',
+        'servicedPeriod', 'locationCodeableConcept', 'locationAddress', 'locationReference',
+        'quantity', 'unitPrice', 'factor', 'net', 'udi', 'bodySite', 'subSite', 'encounter',
+        'noteNumber', 'adjudication', 'detail', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -1159,6 +1345,17 @@ class ExplanationOfBenefit_Adjudication(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Adjudication'
 
+    _types = {
+        'category': 'reference',
+        'reason': 'reference',
+        'amount': 'reference',
+        'value': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = ('category', 'reason', 'amount', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.category = None
         # reference to CodeableConcept
@@ -1241,6 +1438,32 @@ class ExplanationOfBenefit_Detail(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Detail'
 
+    _types = {
+        'sequence': 'int',
+        'type': 'reference',
+        'revenue': 'reference',
+        'category': 'reference',
+        'service': 'reference',
+        'modifier': 'reference',
+        'programCode': 'reference',
+        'quantity': 'reference',
+        'unitPrice': 'reference',
+        'factor': 'int',
+        'net': 'reference',
+        'udi': 'reference',
+        'noteNumber': 'list',
+        'adjudication': 'reference',
+        'subDetail': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'type', 'revenue', 'category', 'service', 'modifier', 'programCode',
+        'quantity', 'unitPrice', 'factor', 'net', 'udi', 'noteNumber', 'adjudication', 'subDetail',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -1400,6 +1623,30 @@ class ExplanationOfBenefit_SubDetail(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_SubDetail'
 
+    _types = {
+        'sequence': 'int',
+        'type': 'reference',
+        'revenue': 'reference',
+        'category': 'reference',
+        'service': 'reference',
+        'modifier': 'reference',
+        'programCode': 'reference',
+        'quantity': 'reference',
+        'unitPrice': 'reference',
+        'factor': 'int',
+        'net': 'reference',
+        'udi': 'reference',
+        'noteNumber': 'list',
+        'adjudication': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequence', 'type', 'revenue', 'category', 'service', 'modifier', 'programCode',
+        'quantity', 'unitPrice', 'factor', 'net', 'udi', 'noteNumber', 'adjudication', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequence = None
         # type: int
@@ -1543,6 +1790,25 @@ class ExplanationOfBenefit_AddItem(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_AddItem'
 
+    _types = {
+        'sequenceLinkId': 'list',
+        'revenue': 'reference',
+        'category': 'reference',
+        'service': 'reference',
+        'modifier': 'reference',
+        'fee': 'reference',
+        'noteNumber': 'list',
+        'adjudication': 'reference',
+        'detail': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'sequenceLinkId', 'revenue', 'category', 'service', 'modifier', 'fee', 'noteNumber',
+        'adjudication', 'detail', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequenceLinkId = None
         # type: list
@@ -1643,6 +1909,23 @@ class ExplanationOfBenefit_Detail1(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Detail1'
 
+    _types = {
+        'revenue': 'reference',
+        'category': 'reference',
+        'service': 'reference',
+        'modifier': 'reference',
+        'fee': 'reference',
+        'noteNumber': 'list',
+        'adjudication': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'revenue', 'category', 'service', 'modifier', 'fee', 'noteNumber', 'adjudication',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.revenue = None
         # reference to CodeableConcept
@@ -1727,6 +2010,18 @@ class ExplanationOfBenefit_Payment(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Payment'
 
+    _types = {
+        'type': 'reference',
+        'adjustment': 'reference',
+        'adjustmentReason': 'reference',
+        'date': 'str',
+        'amount': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('type', 'adjustment', 'adjustmentReason', 'date', 'amount', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
@@ -1798,6 +2093,17 @@ class ExplanationOfBenefit_ProcessNote(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_ProcessNote'
 
+    _types = {
+        'number': 'int',
+        'type': 'reference',
+        'text': 'str',
+        'language': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('number', 'type', 'text', 'language', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.number = None
         # type: int
@@ -1859,6 +2165,25 @@ class ExplanationOfBenefit_BenefitBalance(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_BenefitBalance'
 
+    _types = {
+        'category': 'reference',
+        'subCategory': 'reference',
+        'excluded': 'bool',
+        'name': 'str',
+        'description': 'str',
+        'network': 'reference',
+        'unit': 'reference',
+        'term': 'reference',
+        'financial': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'category', 'subCategory', 'excluded', 'name', 'description', 'network', 'unit', 'term',
+        'financial', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.category = None
         # reference to CodeableConcept
@@ -1946,6 +2271,22 @@ class ExplanationOfBenefit_Financial(fhirbase):
 
     __name__ = 'ExplanationOfBenefit_Financial'
 
+    _types = {
+        'type': 'reference',
+        'allowedUnsignedInt': 'int',
+        'allowedString': 'str',
+        'allowedMoney': 'reference',
+        'usedUnsignedInt': 'int',
+        'usedMoney': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'type', 'allowedUnsignedInt', 'allowedString', 'allowedMoney', 'usedUnsignedInt',
+        'usedMoney', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
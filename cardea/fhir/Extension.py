@@ -171,6 +171,80 @@ class Extension(fhirbase):
 
     __name__ = 'Extension'
 
+    _types = {
+        'url': 'str',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueBase64Binary': 'str',
+        'valueInstant': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueCode': 'str',
+        'valueOid': 'str',
+        'valueUuid': 'str',
+        'valueId': 'str',
+        'valueUnsignedInt': 'int',
+        'valuePositiveInt': 'int',
+        'valueMarkdown': 'str',
+        'valueElement': 'str',
+        'valueExtension': 'reference',
+        'valueBackboneElement': 'str',
+        'valueNarrative': 'reference',
+        'valueAnnotation': 'reference',
+        'valueAttachment': 'reference',
+        'valueIdentifier': 'reference',
+        'valueCodeableConcept': 'reference',
+        'valueCoding': 'reference',
+        'valueQuantity': 'reference',
+        'valueDuration': 'reference',
+        'valueSimpleQuantity': 'reference',
+        'valueDistance': 'reference',
+        'valueCount': 'reference',
+        'valueMoney': 'reference',
+        'valueAge': 'reference',
+        'valueRange': 'reference',
+        'valuePeriod': 'reference',
+        'valueRatio': 'reference',
+        'valueReference': 'reference',
+        'valueSampledData': 'reference',
+        'valueSignature': 'reference',
+        'valueHumanName': 'reference',
+        'valueAddress': 'reference',
+        'valueContactPoint': 'reference',
+        'valueTiming': 'reference',
+        'valueMeta': 'reference',
+        'valueElementDefinition': 'str',
+        'valueContactDetail': 'reference',
+        'valueContributor': 'reference',
+        'valueDosage': 'reference',
+        'valueRelatedArtifact': 'reference',
+        'valueUsageContext': 'reference',
+        'valueDataRequirement': 'reference',
+        'valueParameterDefinition': 'reference',
+        'valueTriggerDefinition': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'url', 'valueBoolean', 'valueInteger', 'valueDecimal', 'valueBase64Binary', 'valueInstant',
+        'valueString', 'valueUri', 'valueDate', 'valueDateTime', 'valueTime', 'valueCode',
+        'valueOid', 'valueUuid', 'valueId', 'valueUnsignedInt', 'valuePositiveInt',
+        'valueMarkdown', 'valueElement', 'valueExtension', 'valueBackboneElement',
+        'valueNarrative', 'valueAnnotation', 'valueAttachment', 'valueIdentifier',
+        'valueCodeableConcept', 'valueCoding', 'valueQuantity', 'valueDuration',
+        'valueSimpleQuantity', 'valueDistance', 'valueCount', 'valueMoney', 'valueAge',
+        'valueRange', 'valuePeriod', 'valueRatio', 'valueReference', 'valueSampledData',
+        'valueSignature', 'valueHumanName', 'valueAddress', 'valueContactPoint', 'valueTiming',
+        'valueMeta', 'valueElementDefinition', 'valueContactDetail', 'valueContributor',
+        'valueDosage', 'valueRelatedArtifact', 'valueUsageContext', 'valueDataRequirement',
+        'valueParameterDefinition', 'valueTriggerDefinition', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.url = None
         # type: str
@@ -68,6 +68,50 @@ class FamilyMemberHistory(fhirbase):
 
     __name__ = 'FamilyMemberHistory'
 
+    _enums = {
+        'status': ['partial', 'completed', 'entered-in-error', 'health-unknown'],
+        'gender': ['male', 'female', 'other', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'definition': 'reference',
+        'status': 'str',
+        'notDone': 'bool',
+        'notDoneReason': 'reference',
+        'patient': 'reference',
+        'date': 'str',
+        'name': 'str',
+        'relationship': 'reference',
+        'gender': 'str',
+        'bornPeriod': 'reference',
+        'bornDate': 'str',
+        'bornString': 'str',
+        'ageAge': 'reference',
+        'ageRange': 'reference',
+        'ageString': 'str',
+        'estimatedAge': 'bool',
+        'deceasedBoolean': 'bool',
+        'deceasedAge': 'reference',
+        'deceasedRange': 'reference',
+        'deceasedDate': 'str',
+        'deceasedString': 'str',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'note': 'reference',
+        'condition': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definition', 'status', 'notDone', 'notDoneReason', 'patient', 'date',
+        'name', 'relationship', 'gender', 'bornPeriod', 'bornDate', 'bornString', 'ageAge',
+        'ageRange', 'ageString', 'estimatedAge', 'deceasedBoolean', 'deceasedAge', 'deceasedRange',
+        'deceasedDate', 'deceasedString', 'reasonCode', 'reasonReference', 'note', 'condition',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'FamilyMemberHistory'
         # type: str
@@ -164,22 +208,6 @@ class FamilyMemberHistory(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'partial', 'completed', 'entered-in-error', 'health-unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'partial, completed, entered-in-error, health-unknown'))
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -286,6 +314,23 @@ class FamilyMemberHistory_Condition(fhirbase):
 
     __name__ = 'FamilyMemberHistory_Condition'
 
+    _types = {
+        'code': 'reference',
+        'outcome': 'reference',
+        'onsetAge': 'reference',
+        'onsetRange': 'reference',
+        'onsetPeriod': 'reference',
+        'onsetString': 'str',
+        'note': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'code', 'outcome', 'onsetAge', 'onsetRange', 'onsetPeriod', 'onsetString', 'note',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to CodeableConcept
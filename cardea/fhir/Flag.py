@@ -28,6 +28,28 @@ class Flag(fhirbase):
 
     __name__ = 'Flag'
 
+    _enums = {
+        'status': ['active', 'inactive', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'category': 'reference',
+        'code': 'reference',
+        'subject': 'reference',
+        'period': 'reference',
+        'encounter': 'reference',
+        'author': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'category', 'code', 'subject', 'period', 'encounter', 'author',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Flag'
         # type: str
@@ -63,15 +85,6 @@ class Flag(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'inactive', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, inactive, entered-in-error'))
-
     def get_relationships(self):
 
         return [
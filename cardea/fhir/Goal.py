@@ -44,6 +44,41 @@ class Goal(fhirbase):
 
     __name__ = 'Goal'
 
+    _enums = {
+        'status': [
+            'proposed', 'accepted', 'planned', 'in-progress', 'on-target', 'ahead-of-target',
+            'behind-target', 'sustaining', 'achieved', 'on-hold', 'cancelled', 'entered-in-error',
+            'rejected'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'category': 'reference',
+        'priority': 'reference',
+        'description': 'reference',
+        'subject': 'reference',
+        'startDate': 'str',
+        'startCodeableConcept': 'reference',
+        'target': 'reference',
+        'statusDate': 'str',
+        'statusReason': 'str',
+        'expressedBy': 'reference',
+        'addresses': 'reference',
+        'note': 'reference',
+        'outcomeCode': 'reference',
+        'outcomeReference': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'category', 'priority', 'description', 'subject', 'startDate',
+        'startCodeableConcept', 'target', 'statusDate', 'statusReason', 'expressedBy', 'addresses',
+        'note', 'outcomeCode', 'outcomeReference', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Goal'
         # type: str
@@ -110,19 +145,6 @@ class Goal(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'proposed', 'accepted', 'planned', 'in-progress', 'on-target',
-                    'ahead-of-target', 'behind-target', 'sustaining', 'achieved',
-                        'on-hold', 'cancelled', 'entered-in-error', 'rejected']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposed, accepted, planned, in-progress, on-target, '
-                        'ahead-of-target, behind-target, sustaining, achieved, on-hold, '
-                        'cancelled, entered-in-error, rejected'))
-
     def get_relationships(self):
 
         return [
@@ -227,6 +249,22 @@ class Goal_Target(fhirbase):
 
     __name__ = 'Goal_Target'
 
+    _types = {
+        'measure': 'reference',
+        'detailQuantity': 'reference',
+        'detailRange': 'reference',
+        'detailCodeableConcept': 'reference',
+        'dueDate': 'str',
+        'dueDuration': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'measure', 'detailQuantity', 'detailRange', 'detailCodeableConcept', 'dueDate',
+        'dueDuration', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.measure = None
         # reference to CodeableConcept
@@ -59,6 +59,37 @@ class GraphDefinition(fhirbase):
 
     __name__ = 'GraphDefinition'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'purpose': 'str',
+        'start': 'str',
+        'profile': 'str',
+        'link': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'status', 'experimental', 'date', 'publisher',
+        'contact', 'description', 'useContext', 'jurisdiction', 'purpose', 'start', 'profile',
+        'link', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'GraphDefinition'
         # type: str
@@ -121,15 +152,6 @@ class GraphDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -174,6 +196,19 @@ class GraphDefinition_Link(fhirbase):
 
     __name__ = 'GraphDefinition_Link'
 
+    _types = {
+        'path': 'str',
+        'sliceName': 'str',
+        'min': 'int',
+        'max': 'str',
+        'description': 'str',
+        'target': 'list',
+        'object_id': 'reference',
+    }
+
+    _fields = ('path', 'sliceName', 'min', 'max', 'description', 'target', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.path = None
         # type: str
@@ -216,6 +251,17 @@ class GraphDefinition_Target(fhirbase):
 
     __name__ = 'GraphDefinition_Target'
 
+    _types = {
+        'type': 'str',
+        'profile': 'str',
+        'compartment': 'reference',
+        'link': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'profile', 'compartment', 'link', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -268,6 +314,21 @@ class GraphDefinition_Compartment(fhirbase):
 
     __name__ = 'GraphDefinition_Compartment'
 
+    _enums = {
+        'rule': ['identical', 'matching', 'different', 'custom'],
+    }
+
+    _types = {
+        'code': 'str',
+        'rule': 'str',
+        'expression': 'str',
+        'description': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'rule', 'expression', 'description', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -288,12 +349,3 @@ class GraphDefinition_Compartment(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.rule is not None:
-            for value in self.rule:
-                if value is not None and value.lower() not in [
-                        'identical', 'matching', 'different', 'custom']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'identical, matching, different, custom'))
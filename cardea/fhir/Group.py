@@ -31,6 +31,29 @@ class Group(fhirbase):
 
     __name__ = 'Group'
 
+    _enums = {
+        'type': ['person', 'animal', 'practitioner', 'device', 'medication', 'substance'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'active': 'bool',
+        'type': 'str',
+        'actual': 'bool',
+        'code': 'reference',
+        'name': 'str',
+        'quantity': 'int',
+        'characteristic': 'reference',
+        'member': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'active', 'type', 'actual', 'code', 'name', 'quantity', 'characteristic',
+        'member', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Group'
         # type: str
@@ -72,16 +95,6 @@ class Group(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'person', 'animal', 'practitioner', 'device', 'medication',
-                        'substance']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'person, animal, practitioner, device, medication, substance'))
-
     def get_relationships(self):
 
         return [
@@ -132,6 +145,23 @@ class Group_Characteristic(fhirbase):
 
     __name__ = 'Group_Characteristic'
 
+    _types = {
+        'code': 'reference',
+        'valueCodeableConcept': 'reference',
+        'valueBoolean': 'bool',
+        'valueQuantity': 'reference',
+        'valueRange': 'reference',
+        'exclude': 'bool',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'code', 'valueCodeableConcept', 'valueBoolean', 'valueQuantity', 'valueRange', 'exclude',
+        'period', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to CodeableConcept
@@ -207,6 +237,16 @@ class Group_Member(fhirbase):
 
     __name__ = 'Group_Member'
 
+    _types = {
+        'entity': 'reference',
+        'period': 'reference',
+        'inactive': 'bool',
+        'object_id': 'reference',
+    }
+
+    _fields = ('entity', 'period', 'inactive', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.entity = None
         # reference to Reference: identifier
@@ -65,6 +65,39 @@ class GuidanceResponse(fhirbase):
 
     __name__ = 'GuidanceResponse'
 
+    _enums = {
+        'status': [
+            'success', 'data-requested', 'data-required', 'in-progress', 'failure',
+            'entered-in-error'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'requestId': 'str',
+        'module': 'reference',
+        'status': 'str',
+        'subject': 'reference',
+        'context': 'reference',
+        'occurrenceDateTime': 'str',
+        'performer': 'reference',
+        'reasonCodeableConcept': 'reference',
+        'reasonReference': 'reference',
+        'note': 'reference',
+        'evaluationMessage': 'reference',
+        'outputParameters': 'reference',
+        'result': 'reference',
+        'dataRequirement': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'requestId', 'module', 'status', 'subject', 'context',
+        'occurrenceDateTime', 'performer', 'reasonCodeableConcept', 'reasonReference', 'note',
+        'evaluationMessage', 'outputParameters', 'result', 'dataRequirement', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'GuidanceResponse'
         # type: str
@@ -124,17 +157,6 @@ class GuidanceResponse(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'success', 'data-requested', 'data-required', 'in-progress',
-                        'failure', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'success, data-requested, data-required, in-progress, failure,'
-                        'entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -57,6 +57,43 @@ class HealthcareService(fhirbase):
 
     __name__ = 'HealthcareService'
 
+    _types = {
+        'resourceType': 'str',
+        'active': 'bool',
+        'providedBy': 'reference',
+        'category': 'reference',
+        'type': 'reference',
+        'specialty': 'reference',
+        'location': 'reference',
+        'name': 'str',
+        'comment': 'str',
+        'extraDetails': 'str',
+        'photo': 'reference',
+        'telecom': 'reference',
+        'coverageArea': 'reference',
+        'serviceProvisionCode': 'reference',
+        'eligibility': 'reference',
+        'eligibilityNote': 'str',
+        'programName': 'list',
+        'characteristic': 'reference',
+        'referralMethod': 'reference',
+        'appointmentRequired': 'bool',
+        'availableTime': 'reference',
+        'notAvailable': 'reference',
+        'availabilityExceptions': 'str',
+        'endpoint': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'active', 'providedBy', 'category', 'type', 'specialty', 'location',
+        'name', 'comment', 'extraDetails', 'photo', 'telecom', 'coverageArea',
+        'serviceProvisionCode', 'eligibility', 'eligibilityNote', 'programName', 'characteristic',
+        'referralMethod', 'appointmentRequired', 'availableTime', 'notAvailable',
+        'availabilityExceptions', 'endpoint', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'HealthcareService'
         # type: str
@@ -252,6 +289,21 @@ class HealthcareService_AvailableTime(fhirbase):
 
     __name__ = 'HealthcareService_AvailableTime'
 
+    _enums = {
+        'daysOfWeek': ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'],
+    }
+
+    _types = {
+        'daysOfWeek': 'list',
+        'allDay': 'bool',
+        'availableStartTime': 'str',
+        'availableEndTime': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('daysOfWeek', 'allDay', 'availableStartTime', 'availableEndTime', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.daysOfWeek = None
         # type: list
@@ -273,15 +325,6 @@ class HealthcareService_AvailableTime(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.daysOfWeek is not None:
-            for value in self.daysOfWeek:
-                if value is not None and value.lower() not in [
-                        'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'mon, tue, wed, thu, fri, sat, sun'))
-
 
 class HealthcareService_NotAvailable(fhirbase):
     """
@@ -296,6 +339,15 @@ class HealthcareService_NotAvailable(fhirbase):
 
     __name__ = 'HealthcareService_NotAvailable'
 
+    _types = {
+        'description': 'str',
+        'during': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('description', 'during', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.description = None
         # type: str
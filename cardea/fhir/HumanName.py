@@ -24,6 +24,24 @@ class HumanName(fhirbase):
 
     __name__ = 'HumanName'
 
+    _enums = {
+        'use': ['usual', 'official', 'temp', 'nickname', 'anonymous', 'old', 'maiden'],
+    }
+
+    _types = {
+        'use': 'str',
+        'text': 'str',
+        'family': 'str',
+        'given': 'list',
+        'prefix': 'list',
+        'suffix': 'list',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('use', 'text', 'family', 'given', 'prefix', 'suffix', 'period', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.use = None
         # type: str
@@ -55,15 +73,6 @@ class HumanName(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'usual', 'official', 'temp', 'nickname', 'anonymous', 'old', 'maiden']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'usual, official, temp, nickname, anonymous, old, maiden'))
-
     def get_relationships(self):
 
         return [
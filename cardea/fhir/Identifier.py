@@ -20,6 +20,23 @@ class Identifier(fhirbase):
 
     __name__ = 'Identifier'
 
+    _enums = {
+        'use': ['usual', 'official', 'temp', 'secondary'],
+    }
+
+    _types = {
+        'use': 'str',
+        'type': 'reference',
+        'system': 'str',
+        'value': 'str',
+        'period': 'reference',
+        'assigner': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('use', 'type', 'system', 'value', 'period', 'assigner', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.use = None
         # type: str
@@ -46,15 +63,6 @@ class Identifier(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'usual', 'official', 'temp', 'secondary']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'usual, official, temp, secondary'))
-
     def get_relationships(self):
 
         return [
@@ -36,6 +36,21 @@ class ImagingManifest(fhirbase):
 
     __name__ = 'ImagingManifest'
 
+    _types = {
+        'resourceType': 'str',
+        'patient': 'reference',
+        'authoringTime': 'str',
+        'author': 'reference',
+        'description': 'str',
+        'study': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'patient', 'authoringTime', 'author', 'description', 'study', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ImagingManifest'
         # type: str
@@ -108,6 +123,17 @@ class ImagingManifest_Study(fhirbase):
 
     __name__ = 'ImagingManifest_Study'
 
+    _types = {
+        'uid': 'str',
+        'imagingStudy': 'reference',
+        'endpoint': 'reference',
+        'series': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('uid', 'imagingStudy', 'endpoint', 'series', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.uid = None
         # type: str
@@ -166,6 +192,16 @@ class ImagingManifest_Series(fhirbase):
 
     __name__ = 'ImagingManifest_Series'
 
+    _types = {
+        'uid': 'str',
+        'endpoint': 'reference',
+        'instance': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('uid', 'endpoint', 'instance', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.uid = None
         # type: str
@@ -211,6 +247,15 @@ class ImagingManifest_Instance(fhirbase):
 
     __name__ = 'ImagingManifest_Instance'
 
+    _types = {
+        'sopClass': 'str',
+        'uid': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('sopClass', 'uid', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sopClass = None
         # type: str
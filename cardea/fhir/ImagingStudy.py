@@ -55,6 +55,41 @@ class ImagingStudy(fhirbase):
 
     __name__ = 'ImagingStudy'
 
+    _enums = {
+        'availability': ['online', 'offline', 'nearline', 'unavailable'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'uid': 'str',
+        'accession': 'reference',
+        'availability': 'str',
+        'modalityList': 'reference',
+        'patient': 'reference',
+        'context': 'reference',
+        'started': 'str',
+        'basedOn': 'reference',
+        'referrer': 'reference',
+        'interpreter': 'reference',
+        'endpoint': 'reference',
+        'numberOfSeries': 'int',
+        'numberOfInstances': 'int',
+        'procedureReference': 'reference',
+        'procedureCode': 'reference',
+        'reason': 'reference',
+        'description': 'str',
+        'series': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'uid', 'accession', 'availability', 'modalityList', 'patient', 'context',
+        'started', 'basedOn', 'referrer', 'interpreter', 'endpoint', 'numberOfSeries',
+        'numberOfInstances', 'procedureReference', 'procedureCode', 'reason', 'description',
+        'series', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ImagingStudy'
         # type: str
@@ -130,15 +165,6 @@ class ImagingStudy(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.availability is not None:
-            for value in self.availability:
-                if value is not None and value.lower() not in [
-                        'online', 'offline', 'nearline', 'unavailable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'ONLINE, OFFLINE, NEARLINE, UNAVAILABLE'))
-
     def get_relationships(self):
 
         return [
@@ -253,6 +279,32 @@ class ImagingStudy_Series(fhirbase):
 
     __name__ = 'ImagingStudy_Series'
 
+    _enums = {
+        'availability': ['online', 'offline', 'nearline', 'unavailable'],
+    }
+
+    _types = {
+        'uid': 'str',
+        'number': 'int',
+        'modality': 'reference',
+        'description': 'str',
+        'numberOfInstances': 'int',
+        'availability': 'str',
+        'endpoint': 'reference',
+        'bodySite': 'reference',
+        'laterality': 'reference',
+        'started': 'str',
+        'performer': 'reference',
+        'instance': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'uid', 'number', 'modality', 'description', 'numberOfInstances', 'availability',
+        'endpoint', 'bodySite', 'laterality', 'started', 'performer', 'instance', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.uid = None
         # type: str
@@ -301,15 +353,6 @@ class ImagingStudy_Series(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.availability is not None:
-            for value in self.availability:
-                if value is not None and value.lower() not in [
-                        'online', 'offline', 'nearline', 'unavailable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'ONLINE, OFFLINE, NEARLINE, UNAVAILABLE'))
-
     def get_relationships(self):
 
         return [
@@ -363,6 +406,17 @@ class ImagingStudy_Instance(fhirbase):
 
     __name__ = 'ImagingStudy_Instance'
 
+    _types = {
+        'uid': 'str',
+        'number': 'int',
+        'sopClass': 'str',
+        'title': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('uid', 'number', 'sopClass', 'title', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.uid = None
         # type: str
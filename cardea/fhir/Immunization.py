@@ -45,6 +45,39 @@ class Immunization(fhirbase):
 
     __name__ = 'Immunization'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'notGiven': 'bool',
+        'vaccineCode': 'reference',
+        'patient': 'reference',
+        'encounter': 'reference',
+        'date': 'str',
+        'primarySource': 'bool',
+        'reportOrigin': 'reference',
+        'location': 'reference',
+        'manufacturer': 'reference',
+        'lotNumber': 'str',
+        'expirationDate': 'str',
+        'site': 'reference',
+        'route': 'reference',
+        'doseQuantity': 'reference',
+        'practitioner': 'reference',
+        'note': 'reference',
+        'explanation': 'reference',
+        'reaction': 'reference',
+        'vaccinationProtocol': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'notGiven', 'vaccineCode', 'patient', 'encounter', 'date',
+        'primarySource', 'reportOrigin', 'location', 'manufacturer', 'lotNumber', 'expirationDate',
+        'site', 'route', 'doseQuantity', 'practitioner', 'note', 'explanation', 'reaction',
+        'vaccinationProtocol', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Immunization'
         # type: str
@@ -217,6 +250,15 @@ class Immunization_Practitioner(fhirbase):
 
     __name__ = 'Immunization_Practitioner'
 
+    _types = {
+        'role': 'reference',
+        'actor': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('role', 'actor', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.role = None
         # reference to CodeableConcept
@@ -259,6 +301,15 @@ class Immunization_Explanation(fhirbase):
 
     __name__ = 'Immunization_Explanation'
 
+    _types = {
+        'reason': 'reference',
+        'reasonNotGiven': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('reason', 'reasonNotGiven', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.reason = None
         # type: list
@@ -304,6 +355,16 @@ class Immunization_Reaction(fhirbase):
 
     __name__ = 'Immunization_Reaction'
 
+    _types = {
+        'date': 'str',
+        'detail': 'reference',
+        'reported': 'bool',
+        'object_id': 'reference',
+    }
+
+    _fields = ('date', 'detail', 'reported', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.date = None
         # type: str
@@ -355,6 +416,24 @@ class Immunization_VaccinationProtocol(fhirbase):
 
     __name__ = 'Immunization_VaccinationProtocol'
 
+    _types = {
+        'doseSequence': 'int',
+        'description': 'str',
+        'authority': 'reference',
+        'series': 'str',
+        'seriesDoses': 'int',
+        'targetDisease': 'reference',
+        'doseStatus': 'reference',
+        'doseStatusReason': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'doseSequence', 'description', 'authority', 'series', 'seriesDoses', 'targetDisease',
+        'doseStatus', 'doseStatusReason', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.doseSequence = None
         # type: int
@@ -17,6 +17,16 @@ class ImmunizationRecommendation(fhirbase):
 
     __name__ = 'ImmunizationRecommendation'
 
+    _types = {
+        'resourceType': 'str',
+        'patient': 'reference',
+        'recommendation': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('resourceType', 'patient', 'recommendation', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ImmunizationRecommendation'
         # type: str
@@ -83,6 +93,25 @@ class ImmunizationRecommendation_Recommendation(fhirbase):
 
     __name__ = 'ImmunizationRecommendation_Recommendation'
 
+    _types = {
+        'date': 'str',
+        'vaccineCode': 'reference',
+        'targetDisease': 'reference',
+        'doseNumber': 'int',
+        'forecastStatus': 'reference',
+        'dateCriterion': 'reference',
+        'protocol': 'reference',
+        'supportingImmunization': 'reference',
+        'supportingPatientInformation': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'date', 'vaccineCode', 'targetDisease', 'doseNumber', 'forecastStatus', 'dateCriterion',
+        'protocol', 'supportingImmunization', 'supportingPatientInformation', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.date = None
         # type: str
@@ -174,6 +203,15 @@ class ImmunizationRecommendation_DateCriterion(fhirbase):
 
     __name__ = 'ImmunizationRecommendation_DateCriterion'
 
+    _types = {
+        'code': 'reference',
+        'value': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to CodeableConcept
@@ -217,6 +255,17 @@ class ImmunizationRecommendation_Protocol(fhirbase):
 
     __name__ = 'ImmunizationRecommendation_Protocol'
 
+    _types = {
+        'doseSequence': 'int',
+        'description': 'str',
+        'authority': 'reference',
+        'series': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('doseSequence', 'description', 'authority', 'series', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.doseSequence = None
         # type: int
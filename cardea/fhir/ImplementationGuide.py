@@ -72,6 +72,40 @@ class ImplementationGuide(fhirbase):
 
     __name__ = 'ImplementationGuide'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'copyright': 'str',
+        'fhirVersion': 'str',
+        'dependency': 'reference',
+        'package': 'reference',
+        '_global': 'reference',
+        'binary': 'list',
+        'page': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'status', 'experimental', 'date', 'publisher',
+        'contact', 'description', 'useContext', 'jurisdiction', 'copyright', 'fhirVersion',
+        'dependency', 'package', '_global', 'binary', 'page', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ImplementationGuide'
         # type: str
@@ -145,15 +179,6 @@ class ImplementationGuide(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -208,6 +233,19 @@ class ImplementationGuide_Dependency(fhirbase):
 
     __name__ = 'ImplementationGuide_Dependency'
 
+    _enums = {
+        'type': ['reference', 'inclusion'],
+    }
+
+    _types = {
+        'type': 'str',
+        'uri': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'uri', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -223,15 +261,6 @@ class ImplementationGuide_Dependency(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'reference', 'inclusion']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'reference, inclusion'))
-
 
 class ImplementationGuide_Package(fhirbase):
     """
@@ -251,6 +280,16 @@ class ImplementationGuide_Package(fhirbase):
 
     __name__ = 'ImplementationGuide_Package'
 
+    _types = {
+        'name': 'str',
+        'description': 'str',
+        'resource': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'description', 'resource', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -306,6 +345,23 @@ class ImplementationGuide_Resource(fhirbase):
 
     __name__ = 'ImplementationGuide_Resource'
 
+    _types = {
+        'example': 'bool',
+        'name': 'str',
+        'description': 'str',
+        'acronym': 'str',
+        'sourceUri': 'str',
+        'sourceReference': 'reference',
+        'exampleFor': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'example', 'name', 'description', 'acronym', 'sourceUri', 'sourceReference', 'exampleFor',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.example = None
         # type: bool
@@ -364,6 +420,15 @@ class ImplementationGuide_Global(fhirbase):
 
     __name__ = 'ImplementationGuide_Global'
 
+    _types = {
+        'type': 'str',
+        'profile': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'profile', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -411,6 +476,26 @@ class ImplementationGuide_Page(fhirbase):
 
     __name__ = 'ImplementationGuide_Page'
 
+    _enums = {
+        'kind': [
+            'page', 'example', 'list', 'include', 'directory', 'dictionary', 'toc', 'resource'
+        ],
+    }
+
+    _types = {
+        'source': 'str',
+        'title': 'str',
+        'kind': 'str',
+        'type': 'list',
+        'package': 'list',
+        'format': 'str',
+        'page': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('source', 'title', 'kind', 'type', 'package', 'format', 'page', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.source = None
         # type: str
@@ -443,17 +528,6 @@ class ImplementationGuide_Page(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                    'page', 'example', 'list', 'include', 'directory', 'dictionary',
-                        'toc', 'resource']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'page, example, list, include, directory, dictionary, toc, '
-                        'resource'))
-
     def get_relationships(self):
 
         return [
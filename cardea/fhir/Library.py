@@ -93,6 +93,48 @@ class Library(fhirbase):
 
     __name__ = 'Library'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'type': 'reference',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'usage': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'effectivePeriod': 'reference',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'topic': 'reference',
+        'contributor': 'reference',
+        'contact': 'reference',
+        'copyright': 'str',
+        'relatedArtifact': 'reference',
+        'parameter': 'reference',
+        'dataRequirement': 'reference',
+        'content': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'type',
+        'date', 'publisher', 'description', 'purpose', 'usage', 'approvalDate', 'lastReviewDate',
+        'effectivePeriod', 'useContext', 'jurisdiction', 'topic', 'contributor', 'contact',
+        'copyright', 'relatedArtifact', 'parameter', 'dataRequirement', 'content', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Library'
         # type: str
@@ -191,15 +233,6 @@ class Library(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
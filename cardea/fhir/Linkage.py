@@ -20,6 +20,17 @@ class Linkage(fhirbase):
 
     __name__ = 'Linkage'
 
+    _types = {
+        'resourceType': 'str',
+        'active': 'bool',
+        'author': 'reference',
+        'item': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('resourceType', 'active', 'author', 'item', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Linkage'
         # type: str
@@ -70,6 +81,19 @@ class Linkage_Item(fhirbase):
 
     __name__ = 'Linkage_Item'
 
+    _enums = {
+        'type': ['source', 'alternate', 'historical'],
+    }
+
+    _types = {
+        'type': 'str',
+        'resource': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'resource', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -85,15 +109,6 @@ class Linkage_Item(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'source', 'alternate', 'historical']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'source, alternate, historical'))
-
     def get_relationships(self):
 
         return [
@@ -33,6 +33,34 @@ class List(fhirbase):
 
     __name__ = 'List'
 
+    _enums = {
+        'status': ['current', 'retired', 'entered-in-error'],
+        'mode': ['working', 'snapshot', 'changes'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'mode': 'str',
+        'title': 'str',
+        'code': 'reference',
+        'subject': 'reference',
+        'encounter': 'reference',
+        'date': 'str',
+        'source': 'reference',
+        'orderedBy': 'reference',
+        'note': 'reference',
+        'entry': 'reference',
+        'emptyReason': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'mode', 'title', 'code', 'subject', 'encounter', 'date',
+        'source', 'orderedBy', 'note', 'entry', 'emptyReason', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'List'
         # type: str
@@ -86,22 +114,6 @@ class List(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'current', 'retired', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'current, retired, entered-in-error'))
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'working', 'snapshot', 'changes']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'working, snapshot, changes'))
-
     def get_relationships(self):
 
         return [
@@ -166,6 +178,17 @@ class List_Entry(fhirbase):
 
     __name__ = 'List_Entry'
 
+    _types = {
+        'flag': 'reference',
+        'deleted': 'bool',
+        'date': 'str',
+        'item': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('flag', 'deleted', 'date', 'item', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.flag = None
         # reference to CodeableConcept
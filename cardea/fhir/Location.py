@@ -46,6 +46,37 @@ class Location(fhirbase):
 
     __name__ = 'Location'
 
+    _enums = {
+        'status': ['active', 'suspended', 'inactive'],
+        'mode': ['instance', 'kind'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'operationalStatus': 'reference',
+        'name': 'str',
+        'alias': 'list',
+        'description': 'str',
+        'mode': 'str',
+        'type': 'reference',
+        'telecom': 'reference',
+        'address': 'reference',
+        'physicalType': 'reference',
+        'position': 'reference',
+        'managingOrganization': 'reference',
+        'partOf': 'reference',
+        'endpoint': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'operationalStatus', 'name', 'alias', 'description', 'mode',
+        'type', 'telecom', 'address', 'physicalType', 'position', 'managingOrganization', 'partOf',
+        'endpoint', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Location'
         # type: str
@@ -105,22 +136,6 @@ class Location(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'suspended', 'inactive']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, suspended, inactive'))
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'instance', 'kind']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'instance, kind'))
-
     def get_relationships(self):
 
         return [
@@ -194,6 +209,16 @@ class Location_Position(fhirbase):
 
     __name__ = 'Location_Position'
 
+    _types = {
+        'longitude': 'int',
+        'latitude': 'int',
+        'altitude': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = ('longitude', 'latitude', 'altitude', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.longitude = None
         # type: int
@@ -117,6 +117,62 @@ class Measure(fhirbase):
 
     __name__ = 'Measure'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'usage': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'effectivePeriod': 'reference',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'topic': 'reference',
+        'contributor': 'reference',
+        'contact': 'reference',
+        'copyright': 'str',
+        'relatedArtifact': 'reference',
+        'library': 'reference',
+        'disclaimer': 'str',
+        'scoring': 'reference',
+        'compositeScoring': 'reference',
+        'type': 'reference',
+        'riskAdjustment': 'str',
+        'rateAggregation': 'str',
+        'rationale': 'str',
+        'clinicalRecommendationStatement': 'str',
+        'improvementNotation': 'str',
+        'definition': 'list',
+        'guidance': 'str',
+        'set': 'str',
+        'group': 'reference',
+        'supplementalData': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'description', 'purpose', 'usage', 'approvalDate', 'lastReviewDate',
+        'effectivePeriod', 'useContext', 'jurisdiction', 'topic', 'contributor', 'contact',
+        'copyright', 'relatedArtifact', 'library', 'disclaimer', 'scoring', 'compositeScoring',
+        'type', 'riskAdjustment', 'rateAggregation', 'rationale',
+        'clinicalRecommendationStatement', 'improvementNotation', 'definition', 'guidance', 'set',
+        'group', 'supplementalData', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Measure'
         # type: str
@@ -249,15 +305,6 @@ class Measure(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -350,6 +397,17 @@ class Measure_Group(fhirbase):
 
     __name__ = 'Measure_Group'
 
+    _types = {
+        'name': 'str',
+        'description': 'str',
+        'population': 'reference',
+        'stratifier': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('name', 'description', 'population', 'stratifier', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -409,6 +467,17 @@ class Measure_Population(fhirbase):
 
     __name__ = 'Measure_Population'
 
+    _types = {
+        'code': 'reference',
+        'name': 'str',
+        'description': 'str',
+        'criteria': 'str',
+        'identifier': 'reference',
+    }
+
+    _fields = ('code', 'name', 'description', 'criteria', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to CodeableConcept
@@ -458,6 +527,15 @@ class Measure_Stratifier(fhirbase):
 
     __name__ = 'Measure_Stratifier'
 
+    _types = {
+        'criteria': 'str',
+        'path': 'str',
+        'identifier': 'reference',
+    }
+
+    _fields = ('criteria', 'path', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.criteria = None
         # type: str
@@ -502,6 +580,16 @@ class Measure_SupplementalData(fhirbase):
 
     __name__ = 'Measure_SupplementalData'
 
+    _types = {
+        'usage': 'reference',
+        'criteria': 'str',
+        'path': 'str',
+        'identifier': 'reference',
+    }
+
+    _fields = ('usage', 'criteria', 'path', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.usage = None
         # type: list
@@ -33,6 +33,31 @@ class MeasureReport(fhirbase):
 
     __name__ = 'MeasureReport'
 
+    _enums = {
+        'status': ['complete', 'pending', 'error'],
+        'type': ['individual', 'patient-list', 'summary'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'type': 'str',
+        'measure': 'reference',
+        'patient': 'reference',
+        'date': 'str',
+        'reportingOrganization': 'reference',
+        'period': 'reference',
+        'group': 'reference',
+        'evaluatedResources': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'type', 'measure', 'patient', 'date', 'reportingOrganization',
+        'period', 'group', 'evaluatedResources', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'MeasureReport'
         # type: str
@@ -75,22 +100,6 @@ class MeasureReport(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'complete', 'pending', 'error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'complete, pending, error'))
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'individual', 'patient-list', 'summary']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'individual, patient-list, summary'))
-
     def get_relationships(self):
 
         return [
@@ -150,6 +159,16 @@ class MeasureReport_Group(fhirbase):
 
     __name__ = 'MeasureReport_Group'
 
+    _types = {
+        'population': 'reference',
+        'measureScore': 'int',
+        'stratifier': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('population', 'measureScore', 'stratifier', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.population = None
         # type: list
@@ -204,6 +223,16 @@ class MeasureReport_Population(fhirbase):
 
     __name__ = 'MeasureReport_Population'
 
+    _types = {
+        'code': 'reference',
+        'count': 'int',
+        'patients': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('code', 'count', 'patients', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to CodeableConcept
@@ -255,6 +284,14 @@ class MeasureReport_Stratifier(fhirbase):
 
     __name__ = 'MeasureReport_Stratifier'
 
+    _types = {
+        'stratum': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('stratum', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.stratum = None
         # type: list
@@ -299,6 +336,16 @@ class MeasureReport_Stratum(fhirbase):
 
     __name__ = 'MeasureReport_Stratum'
 
+    _types = {
+        'value': 'str',
+        'population': 'reference',
+        'measureScore': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = ('value', 'population', 'measureScore', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.value = None
         # type: str
@@ -342,6 +389,16 @@ class MeasureReport_Population1(fhirbase):
 
     __name__ = 'MeasureReport_Population1'
 
+    _types = {
+        'code': 'reference',
+        'count': 'int',
+        'patients': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('code', 'count', 'patients', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to CodeableConcept
@@ -50,6 +50,40 @@ class Media(fhirbase):
 
     __name__ = 'Media'
 
+    _enums = {
+        'type': ['photo', 'video', 'audio'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'basedOn': 'reference',
+        'type': 'str',
+        'subtype': 'reference',
+        'view': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'occurrenceDateTime': 'str',
+        'occurrencePeriod': 'reference',
+        'operator': 'reference',
+        'reasonCode': 'reference',
+        'bodySite': 'reference',
+        'device': 'reference',
+        'height': 'int',
+        'width': 'int',
+        'frames': 'int',
+        'duration': 'int',
+        'content': 'reference',
+        'note': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'basedOn', 'type', 'subtype', 'view', 'subject', 'context',
+        'occurrenceDateTime', 'occurrencePeriod', 'operator', 'reasonCode', 'bodySite', 'device',
+        'height', 'width', 'frames', 'duration', 'content', 'note', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Media'
         # type: str
@@ -121,15 +155,6 @@ class Media(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'photo', 'video', 'audio']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'photo, video, audio'))
-
     def get_relationships(self):
 
         return [
@@ -31,6 +31,30 @@ class Medication(fhirbase):
 
     __name__ = 'Medication'
 
+    _enums = {
+        'status': ['active', 'inactive', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'code': 'reference',
+        'status': 'str',
+        'isBrand': 'bool',
+        'isOverTheCounter': 'bool',
+        'manufacturer': 'reference',
+        'form': 'reference',
+        'ingredient': 'reference',
+        'package': 'reference',
+        'image': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'code', 'status', 'isBrand', 'isOverTheCounter', 'manufacturer', 'form',
+        'ingredient', 'package', 'image', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Medication'
         # type: str
@@ -73,15 +97,6 @@ class Medication(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'inactive', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, inactive, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -138,6 +153,17 @@ class Medication_Ingredient(fhirbase):
 
     __name__ = 'Medication_Ingredient'
 
+    _types = {
+        'itemCodeableConcept': 'reference',
+        'itemReference': 'reference',
+        'isActive': 'bool',
+        'amount': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('itemCodeableConcept', 'itemReference', 'isActive', 'amount', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.itemCodeableConcept = None
         # reference to CodeableConcept
@@ -192,6 +218,16 @@ class Medication_Package(fhirbase):
 
     __name__ = 'Medication_Package'
 
+    _types = {
+        'container': 'reference',
+        'content': 'reference',
+        'batch': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('container', 'content', 'batch', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.container = None
         # reference to CodeableConcept
@@ -244,6 +280,16 @@ class Medication_Content(fhirbase):
 
     __name__ = 'Medication_Content'
 
+    _types = {
+        'itemCodeableConcept': 'reference',
+        'itemReference': 'reference',
+        'amount': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('itemCodeableConcept', 'itemReference', 'amount', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.itemCodeableConcept = None
         # reference to CodeableConcept
@@ -294,6 +340,15 @@ class Medication_Batch(fhirbase):
 
     __name__ = 'Medication_Batch'
 
+    _types = {
+        'lotNumber': 'str',
+        'expirationDate': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('lotNumber', 'expirationDate', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.lotNumber = None
         # type: str
@@ -74,6 +74,46 @@ class MedicationAdministration(fhirbase):
 
     __name__ = 'MedicationAdministration'
 
+    _enums = {
+        'status': [
+            'in-progress', 'on-hold', 'completed', 'entered-in-error', 'stopped', 'unknown'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'definition': 'reference',
+        'partOf': 'reference',
+        'status': 'str',
+        'category': 'reference',
+        'medicationCodeableConcept': 'reference',
+        'medicationReference': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'supportingInformation': 'reference',
+        'effectiveDateTime': 'str',
+        'effectivePeriod': 'reference',
+        'performer': 'reference',
+        'notGiven': 'bool',
+        'reasonNotGiven': 'reference',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'prescription': 'reference',
+        'device': 'reference',
+        'note': 'reference',
+        'dosage': 'reference',
+        'eventHistory': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definition', 'partOf', 'status', 'category', 'medicationCodeableConcept',
+        'medicationReference', 'subject', 'context', 'supportingInformation', 'effectiveDateTime',
+        'effectivePeriod', 'performer', 'notGiven', 'reasonNotGiven', 'reasonCode',
+        'reasonReference', 'prescription', 'device', 'note', 'dosage', 'eventHistory', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'MedicationAdministration'
         # type: str
@@ -162,17 +202,6 @@ class MedicationAdministration(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'in-progress', 'on-hold', 'completed', 'entered-in-error', 'stopped',
-                        'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'in-progress, on-hold, completed, entered-in-error, stopped, '
-                        'unknown'))
-
     def get_relationships(self):
 
         return [
@@ -289,6 +318,15 @@ class MedicationAdministration_Performer(fhirbase):
 
     __name__ = 'MedicationAdministration_Performer'
 
+    _types = {
+        'actor': 'reference',
+        'onBehalfOf': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('actor', 'onBehalfOf', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.actor = None
         # reference to Reference: identifier
@@ -357,6 +395,22 @@ class MedicationAdministration_Dosage(fhirbase):
 
     __name__ = 'MedicationAdministration_Dosage'
 
+    _types = {
+        'text': 'str',
+        'site': 'reference',
+        'route': 'reference',
+        'method': 'reference',
+        'dose': 'reference',
+        'rateRatio': 'reference',
+        'rateSimpleQuantity': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'text', 'site', 'route', 'method', 'dose', 'rateRatio', 'rateSimpleQuantity', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.text = None
         # type: str
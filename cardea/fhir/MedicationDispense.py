@@ -73,6 +73,52 @@ class MedicationDispense(fhirbase):
 
     __name__ = 'MedicationDispense'
 
+    _enums = {
+        'status': [
+            'preparation', 'in-progress', 'on-hold', 'completed', 'entered-in-error', 'stopped'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'partOf': 'reference',
+        'status': 'str',
+        'category': 'reference',
+        'medicationCodeableConcept': 'reference',
+        'medicationReference': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'supportingInformation': 'reference',
+        'performer': 'reference',
+        'authorizingPrescription': 'reference',
+        'type': 'reference',
+        'quantity': 'reference',
+        'daysSupply': 'reference',
+        'whenPrepared': 'str',
+        'whenHandedOver': 'str',
+        'destination': 'reference',
+        'receiver': 'reference',
+        'note': 'reference',
+        'dosageInstruction': 'reference',
+        'substitution': 'reference',
+        'detectedIssue': 'reference',
+        'notDone': 'bool',
+        'notDoneReasonCodeableConcept': 'reference',
+        'notDoneReasonReference': 'reference',
+        'eventHistory': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'partOf', 'status', 'category', 'medicationCodeableConcept',
+        'medicationReference', 'subject', 'context', 'supportingInformation', 'performer',
+        'authorizingPrescription', 'type', 'quantity', 'daysSupply', 'whenPrepared',
+        'whenHandedOver', 'destination', 'receiver', 'note', 'dosageInstruction', 'substitution',
+        'detectedIssue', 'notDone', 'notDoneReasonCodeableConcept', 'notDoneReasonReference',
+        'eventHistory', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'MedicationDispense'
         # type: str
@@ -172,17 +218,6 @@ class MedicationDispense(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'preparation', 'in-progress', 'on-hold', 'completed',
-                        'entered-in-error', 'stopped']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'preparation, in-progress, on-hold, completed, entered-in-error,'
-                        'stopped'))
-
     def get_relationships(self):
 
         return [
@@ -315,6 +350,15 @@ class MedicationDispense_Performer(fhirbase):
 
     __name__ = 'MedicationDispense_Performer'
 
+    _types = {
+        'actor': 'reference',
+        'onBehalfOf': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('actor', 'onBehalfOf', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.actor = None
         # reference to Reference: identifier
@@ -364,6 +408,17 @@ class MedicationDispense_Substitution(fhirbase):
 
     __name__ = 'MedicationDispense_Substitution'
 
+    _types = {
+        'wasSubstituted': 'bool',
+        'type': 'reference',
+        'reason': 'reference',
+        'responsibleParty': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('wasSubstituted', 'type', 'reason', 'responsibleParty', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.wasSubstituted = None
         # type: bool
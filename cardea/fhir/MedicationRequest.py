@@ -84,6 +84,53 @@ class MedicationRequest(fhirbase):
 
     __name__ = 'MedicationRequest'
 
+    _enums = {
+        'status': [
+            'active', 'on-hold', 'cancelled', 'completed', 'entered-in-error', 'stopped', 'draft',
+            'unknown'
+        ],
+        'intent': ['proposal', 'plan', 'order', 'instance-order'],
+        'priority': ['routine', 'urgent', 'stat', 'asap'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'definition': 'reference',
+        'basedOn': 'reference',
+        'groupIdentifier': 'reference',
+        'status': 'str',
+        'intent': 'str',
+        'category': 'reference',
+        'priority': 'str',
+        'medicationCodeableConcept': 'reference',
+        'medicationReference': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'supportingInformation': 'reference',
+        'authoredOn': 'str',
+        'requester': 'reference',
+        'recorder': 'reference',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'note': 'reference',
+        'dosageInstruction': 'reference',
+        'dispenseRequest': 'reference',
+        'substitution': 'reference',
+        'priorPrescription': 'reference',
+        'detectedIssue': 'reference',
+        'eventHistory': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definition', 'basedOn', 'groupIdentifier', 'status', 'intent', 'category',
+        'priority', 'medicationCodeableConcept', 'medicationReference', 'subject', 'context',
+        'supportingInformation', 'authoredOn', 'requester', 'recorder', 'reasonCode',
+        'reasonReference', 'note', 'dosageInstruction', 'dispenseRequest', 'substitution',
+        'priorPrescription', 'detectedIssue', 'eventHistory', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'MedicationRequest'
         # type: str
@@ -182,31 +229,6 @@ class MedicationRequest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'active', 'on-hold', 'cancelled', 'completed', 'entered-in-error',
-                        'stopped', 'draft', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, on-hold, cancelled, completed, entered-in-error, stopped,'
-                        'draft, unknown'))
-
-        if self.intent is not None:
-            for value in self.intent:
-                if value is not None and value.lower() not in [
-                        'proposal', 'plan', 'order', 'instance-order']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposal, plan, order, instance-order'))
-
-        if self.priority is not None:
-            for value in self.priority:
-                if value is not None and value.lower() not in [
-                        'routine', 'urgent', 'stat', 'asap']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'routine, urgent, stat, asap'))
-
     def get_relationships(self):
 
         return [
@@ -335,6 +357,15 @@ class MedicationRequest_Requester(fhirbase):
 
     __name__ = 'MedicationRequest_Requester'
 
+    _types = {
+        'agent': 'reference',
+        'onBehalfOf': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('agent', 'onBehalfOf', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.agent = None
         # reference to Reference: identifier
@@ -392,6 +423,21 @@ class MedicationRequest_DispenseRequest(fhirbase):
 
     __name__ = 'MedicationRequest_DispenseRequest'
 
+    _types = {
+        'validityPeriod': 'reference',
+        'numberOfRepeatsAllowed': 'int',
+        'quantity': 'reference',
+        'expectedSupplyDuration': 'reference',
+        'performer': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'validityPeriod', 'numberOfRepeatsAllowed', 'quantity', 'expectedSupplyDuration',
+        'performer', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.validityPeriod = None
         # reference to Period
@@ -457,6 +503,15 @@ class MedicationRequest_Substitution(fhirbase):
 
     __name__ = 'MedicationRequest_Substitution'
 
+    _types = {
+        'allowed': 'bool',
+        'reason': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('allowed', 'reason', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.allowed = None
         # type: bool
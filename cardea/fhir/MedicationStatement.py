@@ -87,6 +87,43 @@ class MedicationStatement(fhirbase):
 
     __name__ = 'MedicationStatement'
 
+    _enums = {
+        'status': ['active', 'completed', 'entered-in-error', 'intended', 'stopped', 'on-hold'],
+        'taken': ['y', 'n', 'unk', 'na'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'basedOn': 'reference',
+        'partOf': 'reference',
+        'context': 'reference',
+        'status': 'str',
+        'category': 'reference',
+        'medicationCodeableConcept': 'reference',
+        'medicationReference': 'reference',
+        'effectiveDateTime': 'str',
+        'effectivePeriod': 'reference',
+        'dateAsserted': 'str',
+        'informationSource': 'reference',
+        'subject': 'reference',
+        'derivedFrom': 'reference',
+        'taken': 'str',
+        'reasonNotTaken': 'reference',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'note': 'reference',
+        'dosage': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'basedOn', 'partOf', 'context', 'status', 'category',
+        'medicationCodeableConcept', 'medicationReference', 'effectiveDateTime', 'effectivePeriod',
+        'dateAsserted', 'informationSource', 'subject', 'derivedFrom', 'taken', 'reasonNotTaken',
+        'reasonCode', 'reasonReference', 'note', 'dosage', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'MedicationStatement'
         # type: str
@@ -168,23 +205,6 @@ class MedicationStatement(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'active', 'completed', 'entered-in-error', 'intended', 'stopped',
-                        'on-hold']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, completed, entered-in-error, intended, stopped, on-hold'))
-
-        if self.taken is not None:
-            for value in self.taken:
-                if value is not None and value.lower() not in [
-                        'y', 'n', 'unk', 'na']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'y, n, unk, na'))
-
     def get_relationships(self):
 
         return [
@@ -76,6 +76,45 @@ class MessageDefinition(fhirbase):
 
     __name__ = 'MessageDefinition'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'purpose': 'str',
+        'copyright': 'str',
+        'base': 'reference',
+        'parent': 'reference',
+        'replaces': 'reference',
+        'event': 'reference',
+        'category': 'str',
+        'focus': 'reference',
+        'responseRequired': 'bool',
+        'allowedResponse': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'contact', 'description', 'useContext', 'jurisdiction', 'purpose',
+        'copyright', 'base', 'parent', 'replaces', 'event', 'category', 'focus',
+        'responseRequired', 'allowedResponse', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'MessageDefinition'
         # type: str
@@ -162,15 +201,6 @@ class MessageDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -246,6 +276,17 @@ class MessageDefinition_Focus(fhirbase):
 
     __name__ = 'MessageDefinition_Focus'
 
+    _types = {
+        'code': 'str',
+        'profile': 'reference',
+        'min': 'int',
+        'max': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'profile', 'min', 'max', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -291,6 +332,15 @@ class MessageDefinition_AllowedResponse(fhirbase):
 
     __name__ = 'MessageDefinition_AllowedResponse'
 
+    _types = {
+        'message': 'reference',
+        'situation': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('message', 'situation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.message = None
         # reference to Reference: identifier
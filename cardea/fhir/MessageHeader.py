@@ -46,6 +46,29 @@ class MessageHeader(fhirbase):
 
     __name__ = 'MessageHeader'
 
+    _types = {
+        'resourceType': 'str',
+        'event': 'reference',
+        'destination': 'reference',
+        'receiver': 'reference',
+        'sender': 'reference',
+        'timestamp': 'str',
+        'enterer': 'reference',
+        'author': 'reference',
+        'source': 'reference',
+        'responsible': 'reference',
+        'reason': 'reference',
+        'response': 'reference',
+        'focus': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'event', 'destination', 'receiver', 'sender', 'timestamp', 'enterer',
+        'author', 'source', 'responsible', 'reason', 'response', 'focus', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'MessageHeader'
         # type: str
@@ -173,6 +196,16 @@ class MessageHeader_Destination(fhirbase):
 
     __name__ = 'MessageHeader_Destination'
 
+    _types = {
+        'name': 'str',
+        'target': 'reference',
+        'endpoint': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'target', 'endpoint', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -220,6 +253,18 @@ class MessageHeader_Source(fhirbase):
 
     __name__ = 'MessageHeader_Source'
 
+    _types = {
+        'name': 'str',
+        'software': 'str',
+        'version': 'str',
+        'contact': 'reference',
+        'endpoint': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'software', 'version', 'contact', 'endpoint', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -271,6 +316,19 @@ class MessageHeader_Response(fhirbase):
 
     __name__ = 'MessageHeader_Response'
 
+    _enums = {
+        'code': ['ok', 'transient-error', 'fatal-error'],
+    }
+
+    _types = {
+        'code': 'str',
+        'details': 'reference',
+        'identifier': 'str',
+    }
+
+    _fields = ('code', 'details', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -286,15 +344,6 @@ class MessageHeader_Response(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                        'ok', 'transient-error', 'fatal-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'ok, transient-error, fatal-error'))
-
     def get_relationships(self):
 
         return [
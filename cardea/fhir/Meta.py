@@ -26,6 +26,18 @@ class Meta(fhirbase):
 
     __name__ = 'Meta'
 
+    _types = {
+        'versionId': 'str',
+        'lastUpdated': 'str',
+        'profile': 'list',
+        'security': 'reference',
+        'tag': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('versionId', 'lastUpdated', 'profile', 'security', 'tag', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.versionId = None
         # type: str
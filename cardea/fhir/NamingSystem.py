@@ -49,6 +49,37 @@ class NamingSystem(fhirbase):
 
     __name__ = 'NamingSystem'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+        'kind': ['codesystem', 'identifier', 'root'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'name': 'str',
+        'status': 'str',
+        'kind': 'str',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'responsible': 'str',
+        'type': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'usage': 'str',
+        'uniqueId': 'reference',
+        'replacedBy': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'name', 'status', 'kind', 'date', 'publisher', 'contact', 'responsible',
+        'type', 'description', 'useContext', 'jurisdiction', 'usage', 'uniqueId', 'replacedBy',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'NamingSystem'
         # type: str
@@ -109,22 +140,6 @@ class NamingSystem(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                        'codesystem', 'identifier', 'root']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'codesystem, identifier, root'))
-
     def get_relationships(self):
 
         return [
@@ -181,6 +196,22 @@ class NamingSystem_UniqueId(fhirbase):
 
     __name__ = 'NamingSystem_UniqueId'
 
+    _enums = {
+        'type': ['oid', 'uuid', 'uri', 'other'],
+    }
+
+    _types = {
+        'type': 'str',
+        'value': 'str',
+        'preferred': 'bool',
+        'comment': 'str',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'value', 'preferred', 'comment', 'period', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -205,15 +236,6 @@ class NamingSystem_UniqueId(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'oid', 'uuid', 'uri', 'other']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'oid, uuid, uri, other'))
-
     def get_relationships(self):
 
         return [
@@ -14,6 +14,19 @@ class Narrative(fhirbase):
 
     __name__ = 'Narrative'
 
+    _enums = {
+        'status': ['generated', 'extensions', 'additional', 'empty'],
+    }
+
+    _types = {
+        'status': 'str',
+        'div': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('status', 'div', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.status = None
         # type: str
@@ -28,12 +41,3 @@ class Narrative(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'generated', 'extensions', 'additional', 'empty']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'generated, extensions, additional, empty'))
@@ -47,6 +47,36 @@ class NutritionOrder(fhirbase):
 
     __name__ = 'NutritionOrder'
 
+    _enums = {
+        'status': [
+            'proposed', 'draft', 'planned', 'requested', 'active', 'on-hold', 'completed',
+            'cancelled', 'entered-in-error'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'patient': 'reference',
+        'encounter': 'reference',
+        'dateTime': 'str',
+        'orderer': 'reference',
+        'allergyIntolerance': 'reference',
+        'foodPreferenceModifier': 'reference',
+        'excludeFoodModifier': 'reference',
+        'oralDiet': 'reference',
+        'supplement': 'reference',
+        'enteralFormula': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'patient', 'encounter', 'dateTime', 'orderer',
+        'allergyIntolerance', 'foodPreferenceModifier', 'excludeFoodModifier', 'oralDiet',
+        'supplement', 'enteralFormula', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'NutritionOrder'
         # type: str
@@ -99,17 +129,6 @@ class NutritionOrder(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'proposed', 'draft', 'planned', 'requested', 'active', 'on-hold',
-                        'completed', 'cancelled', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'proposed, draft, planned, requested, active, on-hold, completed,'
-                        'cancelled, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -190,6 +209,22 @@ class NutritionOrder_OralDiet(fhirbase):
 
     __name__ = 'NutritionOrder_OralDiet'
 
+    _types = {
+        'type': 'reference',
+        'schedule': 'reference',
+        'nutrient': 'reference',
+        'texture': 'reference',
+        'fluidConsistencyType': 'reference',
+        'instruction': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'type', 'schedule', 'nutrient', 'texture', 'fluidConsistencyType', 'instruction',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: list
@@ -263,6 +298,15 @@ class NutritionOrder_Nutrient(fhirbase):
 
     __name__ = 'NutritionOrder_Nutrient'
 
+    _types = {
+        'modifier': 'reference',
+        'amount': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('modifier', 'amount', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.modifier = None
         # reference to CodeableConcept
@@ -305,6 +349,15 @@ class NutritionOrder_Texture(fhirbase):
 
     __name__ = 'NutritionOrder_Texture'
 
+    _types = {
+        'modifier': 'reference',
+        'foodType': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('modifier', 'foodType', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.modifier = None
         # reference to CodeableConcept
@@ -353,6 +406,18 @@ class NutritionOrder_Supplement(fhirbase):
 
     __name__ = 'NutritionOrder_Supplement'
 
+    _types = {
+        'type': 'reference',
+        'productName': 'str',
+        'schedule': 'reference',
+        'quantity': 'reference',
+        'instruction': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'productName', 'schedule', 'quantity', 'instruction', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
@@ -433,6 +498,26 @@ class NutritionOrder_EnteralFormula(fhirbase):
 
     __name__ = 'NutritionOrder_EnteralFormula'
 
+    _types = {
+        'baseFormulaType': 'reference',
+        'baseFormulaProductName': 'str',
+        'additiveType': 'reference',
+        'additiveProductName': 'str',
+        'caloricDensity': 'reference',
+        'routeofAdministration': 'reference',
+        'administration': 'reference',
+        'maxVolumeToDeliver': 'reference',
+        'administrationInstruction': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'baseFormulaType', 'baseFormulaProductName', 'additiveType', 'additiveProductName',
+        'caloricDensity', 'routeofAdministration', 'administration', 'maxVolumeToDeliver',
+        'administrationInstruction', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.baseFormulaType = None
         # reference to CodeableConcept
@@ -522,6 +607,17 @@ class NutritionOrder_Administration(fhirbase):
 
     __name__ = 'NutritionOrder_Administration'
 
+    _types = {
+        'schedule': 'reference',
+        'quantity': 'reference',
+        'rateSimpleQuantity': 'reference',
+        'rateRatio': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('schedule', 'quantity', 'rateSimpleQuantity', 'rateRatio', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.schedule = None
         # reference to Timing
@@ -92,6 +92,59 @@ class Observation(fhirbase):
 
     __name__ = 'Observation'
 
+    _enums = {
+        'status': [
+            'registered', 'preliminary', 'final', 'amended', 'corrected', 'cancelled',
+            'entered-in-error', 'unknown'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'basedOn': 'reference',
+        'status': 'str',
+        'category': 'reference',
+        'code': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'effectiveDateTime': 'str',
+        'effectivePeriod': 'reference',
+        'issued': 'str',
+        'performer': 'reference',
+        'valueQuantity': 'reference',
+        'valueCodeableConcept': 'reference',
+        'valueString': 'str',
+        'valueBoolean': 'bool',
+        'valueRange': 'reference',
+        'valueRatio': 'reference',
+        'valueSampledData': 'reference',
+        'valueAttachment': 'reference',
+        'valueTime': 'str',
+        'valueDateTime': 'str',
+        'valuePeriod': 'reference',
+        'dataAbsentReason': 'reference',
+        'interpretation': 'reference',
+        'comment': 'str',
+        'bodySite': 'reference',
+        'method': 'reference',
+        'specimen': 'reference',
+        'device': 'reference',
+        'referenceRange': 'reference',
+        'related': 'reference',
+        'component': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'basedOn', 'status', 'category', 'code', 'subject', 'context',
+        'effectiveDateTime', 'effectivePeriod', 'issued', 'performer', 'valueQuantity',
+        'valueCodeableConcept', 'valueString', 'valueBoolean', 'valueRange', 'valueRatio',
+        'valueSampledData', 'valueAttachment', 'valueTime', 'valueDateTime', 'valuePeriod',
+        'dataAbsentReason', 'interpretation', 'comment', 'bodySite', 'method', 'specimen',
+        'device', 'referenceRange', 'related', 'component', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Observation'
         # type: str
@@ -206,17 +259,6 @@ class Observation(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'registered', 'preliminary', 'final', 'amended', 'corrected',
-                        'cancelled', 'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'registered, preliminary, final, amended, corrected, cancelled,'
-                        'entered-in-error, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -372,6 +414,19 @@ class Observation_ReferenceRange(fhirbase):
 
     __name__ = 'Observation_ReferenceRange'
 
+    _types = {
+        'low': 'reference',
+        'high': 'reference',
+        'type': 'reference',
+        'appliesTo': 'reference',
+        'age': 'reference',
+        'text': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('low', 'high', 'type', 'appliesTo', 'age', 'text', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.low = None
         # reference to Quantity
@@ -442,6 +497,21 @@ class Observation_Related(fhirbase):
 
     __name__ = 'Observation_Related'
 
+    _enums = {
+        'type': [
+            'has-member', 'derived-from', 'sequel-to', 'replaces', 'qualified-by', 'interfered-by'
+        ],
+    }
+
+    _types = {
+        'type': 'str',
+        'target': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'target', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -458,17 +528,6 @@ class Observation_Related(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'has-member', 'derived-from', 'sequel-to', 'replaces', 'qualified-by',
-                        'interfered-by']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'has-member, derived-from, sequel-to, replaces, qualified-by,'
-                        'interfered-by'))
-
     def get_relationships(self):
 
         return [
@@ -520,6 +579,31 @@ class Observation_Component(fhirbase):
 
     __name__ = 'Observation_Component'
 
+    _types = {
+        'code': 'reference',
+        'valueQuantity': 'reference',
+        'valueCodeableConcept': 'reference',
+        'valueString': 'str',
+        'valueRange': 'reference',
+        'valueRatio': 'reference',
+        'valueSampledData': 'reference',
+        'valueAttachment': 'reference',
+        'valueTime': 'str',
+        'valueDateTime': 'str',
+        'valuePeriod': 'reference',
+        'dataAbsentReason': 'reference',
+        'interpretation': 'reference',
+        'referenceRange': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'code', 'valueQuantity', 'valueCodeableConcept', 'valueString', 'valueRange', 'valueRatio',
+        'valueSampledData', 'valueAttachment', 'valueTime', 'valueDateTime', 'valuePeriod',
+        'dataAbsentReason', 'interpretation', 'referenceRange', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to CodeableConcept
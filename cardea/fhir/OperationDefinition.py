@@ -77,6 +77,47 @@ class OperationDefinition(fhirbase):
 
     __name__ = 'OperationDefinition'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+        'kind': ['operation', 'query'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'status': 'str',
+        'kind': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'purpose': 'str',
+        'idempotent': 'bool',
+        'code': 'str',
+        'comment': 'str',
+        'base': 'reference',
+        'resource': 'list',
+        'system': 'bool',
+        'type': 'bool',
+        'instance': 'bool',
+        'parameter': 'reference',
+        'overload': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'status', 'kind', 'experimental', 'date',
+        'publisher', 'contact', 'description', 'useContext', 'jurisdiction', 'purpose',
+        'idempotent', 'code', 'comment', 'base', 'resource', 'system', 'type', 'instance',
+        'parameter', 'overload', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'OperationDefinition'
         # type: str
@@ -165,22 +206,6 @@ class OperationDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                        'operation', 'query']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'operation, query'))
-
     def get_relationships(self):
 
         return [
@@ -241,6 +266,33 @@ class OperationDefinition_Parameter(fhirbase):
 
     __name__ = 'OperationDefinition_Parameter'
 
+    _enums = {
+        'use': ['in', 'out'],
+        'searchType': [
+            'number', 'date', 'string', 'token', 'reference', 'composite', 'quantity', 'uri'
+        ],
+    }
+
+    _types = {
+        'name': 'str',
+        'use': 'str',
+        'min': 'int',
+        'max': 'str',
+        'documentation': 'str',
+        'type': 'str',
+        'searchType': 'str',
+        'profile': 'reference',
+        'binding': 'reference',
+        'part': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'name', 'use', 'min', 'max', 'documentation', 'type', 'searchType', 'profile', 'binding',
+        'part', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -283,38 +335,6 @@ class OperationDefinition_Parameter(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'in', 'out']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'in, out'))
-
-        if self.searchType is not None:
-            for value in self.searchType:
-                if value is not None and value.lower() not in [
-                    'number', 'date', 'string', 'token', 'reference', 'composite',
-                        'quantity', 'uri']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'number, date, string, token, reference, composite, quantity, uri'))
-
-        if self.use is not None:
-            for value in self.use:
-                if value is not None and value.lower() not in [
-                        'in', 'out']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'in, out'))
-
-        if self.searchType is not None:
-            for value in self.searchType:
-                if value is not None and value.lower() not in [
-                    'number', 'date', 'string', 'token', 'reference', 'composite',
-                        'quantity', 'uri']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'number, date, string, token, reference, composite, quantity, uri'))
-
     def get_relationships(self):
 
         return [
@@ -352,6 +372,20 @@ class OperationDefinition_Binding(fhirbase):
 
     __name__ = 'OperationDefinition_Binding'
 
+    _enums = {
+        'strength': ['required', 'extensible', 'preferred', 'example'],
+    }
+
+    _types = {
+        'strength': 'str',
+        'valueSetUri': 'str',
+        'valueSetReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('strength', 'valueSetUri', 'valueSetReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.strength = None
         # type: str
@@ -370,15 +404,6 @@ class OperationDefinition_Binding(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.strength is not None:
-            for value in self.strength:
-                if value is not None and value.lower() not in [
-                        'required', 'extensible', 'preferred', 'example']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'required, extensible, preferred, example'))
-
     def get_relationships(self):
 
         return [
@@ -401,6 +426,15 @@ class OperationDefinition_Overload(fhirbase):
 
     __name__ = 'OperationDefinition_Overload'
 
+    _types = {
+        'parameterName': 'list',
+        'comment': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('parameterName', 'comment', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.parameterName = None
         # type: list
@@ -14,6 +14,15 @@ class OperationOutcome(fhirbase):
 
     __name__ = 'OperationOutcome'
 
+    _types = {
+        'resourceType': 'str',
+        'issue': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('resourceType', 'issue', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'OperationOutcome'
         # type: str
@@ -68,6 +77,30 @@ class OperationOutcome_Issue(fhirbase):
 
     __name__ = 'OperationOutcome_Issue'
 
+    _enums = {
+        'severity': ['fatal', 'error', 'warning', 'information'],
+        'code': [
+            'invalid', 'structure', 'required', 'value', 'invariant', 'security', 'login',
+            'unknown', 'expired', 'forbidden', 'suppressed', 'processing', 'not-supported',
+            'duplicate', 'not-found', 'too-long', 'code-invalid', 'extension', 'too-costly',
+            'business-rule', 'conflict', 'incomplete', 'transient', 'lock-error', 'no-store',
+            'exception', 'timeout', 'throttled', 'informational'
+        ],
+    }
+
+    _types = {
+        'severity': 'str',
+        'code': 'str',
+        'details': 'reference',
+        'diagnostics': 'str',
+        'location': 'list',
+        'expression': 'list',
+        'object_id': 'reference',
+    }
+
+    _fields = ('severity', 'code', 'details', 'diagnostics', 'location', 'expression', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.severity = None
         # type: str
@@ -101,31 +134,6 @@ class OperationOutcome_Issue(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.severity is not None:
-            for value in self.severity:
-                if value is not None and value.lower() not in [
-                        'fatal', 'error', 'warning', 'information']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'fatal, error, warning, information'))
-
-        if self.code is not None:
-            for value in self.code:
-                if value is not None and value.lower() not in [
-                    'invalid', 'structure', 'required', 'value', 'invariant', 'security',
-                    'login', 'unknown', 'expired', 'forbidden', 'suppressed',
-                    'processing', 'not-supported', 'duplicate', 'not-found', 'too-long',
-                    'code-invalid', 'extension', 'too-costly', 'business-rule',
-                    'conflict', 'incomplete', 'transient', 'lock-error', 'no-store',
-                        'exception', 'timeout', 'throttled', 'informational']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'invalid, structure, required, value, invariant, security, login,'
-                        'unknown, expired, forbidden, suppressed, processing, not-supported,'
-                        'duplicate, not-found, too-long, code-invalid, extension, too-costly,'
-                        'business-rule, conflict, incomplete, transient, lock-error, no-store,'
-                        'exception, timeout, throttled, informational'))
-
     def get_relationships(self):
 
         return [
@@ -27,6 +27,26 @@ class Organization(fhirbase):
 
     __name__ = 'Organization'
 
+    _types = {
+        'resourceType': 'str',
+        'active': 'bool',
+        'type': 'reference',
+        'name': 'str',
+        'alias': 'list',
+        'telecom': 'reference',
+        'address': 'reference',
+        'partOf': 'reference',
+        'contact': 'reference',
+        'endpoint': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'active', 'type', 'name', 'alias', 'telecom', 'address', 'partOf',
+        'contact', 'endpoint', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Organization'
         # type: str
@@ -129,6 +149,17 @@ class Organization_Contact(fhirbase):
 
     __name__ = 'Organization_Contact'
 
+    _types = {
+        'purpose': 'reference',
+        'name': 'reference',
+        'telecom': 'reference',
+        'address': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('purpose', 'name', 'telecom', 'address', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.purpose = None
         # reference to CodeableConcept
@@ -25,6 +25,20 @@ class ParameterDefinition(fhirbase):
 
     __name__ = 'ParameterDefinition'
 
+    _types = {
+        'name': 'str',
+        'use': 'str',
+        'min': 'int',
+        'max': 'str',
+        'documentation': 'str',
+        'type': 'str',
+        'profile': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'use', 'min', 'max', 'documentation', 'type', 'profile', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
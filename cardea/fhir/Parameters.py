@@ -13,6 +13,14 @@ class Parameters(fhirbase):
 
     __name__ = 'Parameters'
 
+    _types = {
+        'parameter': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('parameter', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.parameter = None
         # type: list
@@ -102,6 +110,82 @@ class Parameters_Parameter(fhirbase):
 
     __name__ = 'Parameters_Parameter'
 
+    _types = {
+        'name': 'str',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueBase64Binary': 'str',
+        'valueInstant': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueCode': 'str',
+        'valueOid': 'str',
+        'valueUuid': 'str',
+        'valueId': 'str',
+        'valueUnsignedInt': 'int',
+        'valuePositiveInt': 'int',
+        'valueMarkdown': 'str',
+        'valueElement': 'reference',
+        'valueExtension': 'reference',
+        'valueBackboneElement': 'reference',
+        'valueNarrative': 'reference',
+        'valueAnnotation': 'reference',
+        'valueAttachment': 'reference',
+        'valueIdentifier': 'reference',
+        'valueCodeableConcept': 'reference',
+        'valueCoding': 'reference',
+        'valueQuantity': 'reference',
+        'valueDuration': 'reference',
+        'valueSimpleQuantity': 'reference',
+        'valueDistance': 'reference',
+        'valueCount': 'reference',
+        'valueMoney': 'reference',
+        'valueAge': 'reference',
+        'valueRange': 'reference',
+        'valuePeriod': 'reference',
+        'valueRatio': 'reference',
+        'valueReference': 'reference',
+        'valueSampledData': 'reference',
+        'valueSignature': 'reference',
+        'valueHumanName': 'reference',
+        'valueAddress': 'reference',
+        'valueContactPoint': 'reference',
+        'valueTiming': 'reference',
+        'valueMeta': 'reference',
+        'valueElementDefinition': 'reference',
+        'valueContactDetail': 'reference',
+        'valueContributor': 'reference',
+        'valueDosage': 'reference',
+        'valueRelatedArtifact': 'reference',
+        'valueUsageContext': 'reference',
+        'valueDataRequirement': 'reference',
+        'valueParameterDefinition': 'reference',
+        'valueTriggerDefinition': 'reference',
+        'resource': 'reference',
+        'part': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'name', 'valueBoolean', 'valueInteger', 'valueDecimal', 'valueBase64Binary',
+        'valueInstant', 'valueString', 'valueUri', 'valueDate', 'valueDateTime', 'valueTime',
+        'valueCode', 'valueOid', 'valueUuid', 'valueId', 'valueUnsignedInt', 'valuePositiveInt',
+        'valueMarkdown', 'valueElement', 'valueExtension', 'valueBackboneElement',
+        'valueNarrative', 'valueAnnotation', 'valueAttachment', 'valueIdentifier',
+        'valueCodeableConcept', 'valueCoding', 'valueQuantity', 'valueDuration',
+        'valueSimpleQuantity', 'valueDistance', 'valueCount', 'valueMoney', 'valueAge',
+        'valueRange', 'valuePeriod', 'valueRatio', 'valueReference', 'valueSampledData',
+        'valueSignature', 'valueHumanName', 'valueAddress', 'valueContactPoint', 'valueTiming',
+        'valueMeta', 'valueElementDefinition', 'valueContactDetail', 'valueContributor',
+        'valueDosage', 'valueRelatedArtifact', 'valueUsageContext', 'valueDataRequirement',
+        'valueParameterDefinition', 'valueTriggerDefinition', 'resource', 'part', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
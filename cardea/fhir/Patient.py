@@ -40,6 +40,41 @@ class Patient(fhirbase):
 
     __name__ = 'Patient'
 
+    _enums = {
+        'gender': ['male', 'female', 'other', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'active': 'bool',
+        'name': 'reference',
+        'telecom': 'reference',
+        'gender': 'str',
+        'birthDate': 'str',
+        'deceasedBoolean': 'bool',
+        'deceasedDateTime': 'str',
+        'address': 'reference',
+        'maritalStatus': 'reference',
+        'multipleBirthBoolean': 'bool',
+        'multipleBirthInteger': 'int',
+        'photo': 'reference',
+        'contact': 'reference',
+        'animal': 'reference',
+        'communication': 'reference',
+        'generalPractitioner': 'reference',
+        'managingOrganization': 'reference',
+        'link': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'active', 'name', 'telecom', 'gender', 'birthDate', 'deceasedBoolean',
+        'deceasedDateTime', 'address', 'maritalStatus', 'multipleBirthBoolean',
+        'multipleBirthInteger', 'photo', 'contact', 'animal', 'communication',
+        'generalPractitioner', 'managingOrganization', 'link', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Patient'
         # type: str
@@ -116,15 +151,6 @@ class Patient(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -212,6 +238,27 @@ class Patient_Contact(fhirbase):
 
     __name__ = 'Patient_Contact'
 
+    _enums = {
+        'gender': ['male', 'female', 'other', 'unknown'],
+    }
+
+    _types = {
+        'relationship': 'reference',
+        'name': 'reference',
+        'telecom': 'reference',
+        'address': 'reference',
+        'gender': 'str',
+        'organization': 'reference',
+        'period': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'relationship', 'name', 'telecom', 'address', 'gender', 'organization', 'period',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.relationship = None
         # type: list
@@ -244,15 +291,6 @@ class Patient_Contact(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -303,6 +341,16 @@ class Patient_Animal(fhirbase):
 
     __name__ = 'Patient_Animal'
 
+    _types = {
+        'species': 'reference',
+        'breed': 'reference',
+        'genderStatus': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('species', 'breed', 'genderStatus', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.species = None
         # reference to CodeableConcept
@@ -355,6 +403,15 @@ class Patient_Communication(fhirbase):
 
     __name__ = 'Patient_Communication'
 
+    _types = {
+        'language': 'reference',
+        'preferred': 'bool',
+        'object_id': 'reference',
+    }
+
+    _fields = ('language', 'preferred', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.language = None
         # reference to CodeableConcept
@@ -391,6 +448,19 @@ class Patient_Link(fhirbase):
 
     __name__ = 'Patient_Link'
 
+    _enums = {
+        'type': ['replaced-by', 'replaces', 'refer', 'seealso'],
+    }
+
+    _types = {
+        'other': 'reference',
+        'type': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('other', 'type', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.other = None
         # reference to Reference: identifier
@@ -406,15 +476,6 @@ class Patient_Link(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'replaced-by', 'replaces', 'refer', 'seealso']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'replaced-by, replaces, refer, seealso'))
-
     def get_relationships(self):
 
         return [
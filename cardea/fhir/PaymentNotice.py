@@ -26,6 +26,26 @@ class PaymentNotice(fhirbase):
 
     __name__ = 'PaymentNotice'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'request': 'reference',
+        'response': 'reference',
+        'statusDate': 'str',
+        'created': 'str',
+        'target': 'reference',
+        'provider': 'reference',
+        'organization': 'reference',
+        'paymentStatus': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'request', 'response', 'statusDate', 'created', 'target',
+        'provider', 'organization', 'paymentStatus', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'PaymentNotice'
         # type: str
@@ -31,6 +31,31 @@ class PaymentReconciliation(fhirbase):
 
     __name__ = 'PaymentReconciliation'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'period': 'reference',
+        'created': 'str',
+        'organization': 'reference',
+        'request': 'reference',
+        'outcome': 'reference',
+        'disposition': 'str',
+        'requestProvider': 'reference',
+        'requestOrganization': 'reference',
+        'detail': 'reference',
+        'form': 'reference',
+        'total': 'reference',
+        'processNote': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'period', 'created', 'organization', 'request', 'outcome',
+        'disposition', 'requestProvider', 'requestOrganization', 'detail', 'form', 'total',
+        'processNote', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'PaymentReconciliation'
         # type: str
@@ -164,6 +189,20 @@ class PaymentReconciliation_Detail(fhirbase):
 
     __name__ = 'PaymentReconciliation_Detail'
 
+    _types = {
+        'type': 'reference',
+        'request': 'reference',
+        'response': 'reference',
+        'submitter': 'reference',
+        'payee': 'reference',
+        'date': 'str',
+        'amount': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'request', 'response', 'submitter', 'payee', 'date', 'amount', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
@@ -239,6 +278,15 @@ class PaymentReconciliation_ProcessNote(fhirbase):
 
     __name__ = 'PaymentReconciliation_ProcessNote'
 
+    _types = {
+        'type': 'reference',
+        'text': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'text', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
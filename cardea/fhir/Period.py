@@ -15,6 +15,15 @@ class Period(fhirbase):
 
     __name__ = 'Period'
 
+    _types = {
+        'start': 'str',
+        'end': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('start', 'end', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.start = None
         # type: str
@@ -25,6 +25,30 @@ class Person(fhirbase):
 
     __name__ = 'Person'
 
+    _enums = {
+        'gender': ['male', 'female', 'other', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'name': 'reference',
+        'telecom': 'reference',
+        'gender': 'str',
+        'birthDate': 'str',
+        'address': 'reference',
+        'photo': 'reference',
+        'managingOrganization': 'reference',
+        'active': 'bool',
+        'link': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'name', 'telecom', 'gender', 'birthDate', 'address', 'photo',
+        'managingOrganization', 'active', 'link', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Person'
         # type: str
@@ -70,15 +94,6 @@ class Person(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -132,6 +147,19 @@ class Person_Link(fhirbase):
 
     __name__ = 'Person_Link'
 
+    _enums = {
+        'assurance': ['level1', 'level2', 'level3', 'level4'],
+    }
+
+    _types = {
+        'target': 'reference',
+        'assurance': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('target', 'assurance', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.target = None
         # reference to Reference: identifier
@@ -147,15 +175,6 @@ class Person_Link(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.assurance is not None:
-            for value in self.assurance:
-                if value is not None and value.lower() not in [
-                        'level1', 'level2', 'level3', 'level4']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'level1, level2, level3, level4'))
-
     def get_relationships(self):
 
         return [
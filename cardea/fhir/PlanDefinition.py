@@ -94,6 +94,48 @@ class PlanDefinition(fhirbase):
 
     __name__ = 'PlanDefinition'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'type': 'reference',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'usage': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'effectivePeriod': 'reference',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'topic': 'reference',
+        'contributor': 'reference',
+        'contact': 'reference',
+        'copyright': 'str',
+        'relatedArtifact': 'reference',
+        'library': 'reference',
+        'goal': 'reference',
+        'action': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'type', 'status', 'experimental',
+        'date', 'publisher', 'description', 'purpose', 'usage', 'approvalDate', 'lastReviewDate',
+        'effectivePeriod', 'useContext', 'jurisdiction', 'topic', 'contributor', 'contact',
+        'copyright', 'relatedArtifact', 'library', 'goal', 'action', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'PlanDefinition'
         # type: str
@@ -192,15 +234,6 @@ class PlanDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -293,6 +326,23 @@ class PlanDefinition_Goal(fhirbase):
 
     __name__ = 'PlanDefinition_Goal'
 
+    _types = {
+        'category': 'reference',
+        'description': 'reference',
+        'priority': 'reference',
+        'start': 'reference',
+        'addresses': 'reference',
+        'documentation': 'reference',
+        'target': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'category', 'description', 'priority', 'start', 'addresses', 'documentation', 'target',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.category = None
         # reference to CodeableConcept
@@ -402,6 +452,20 @@ class PlanDefinition_Target(fhirbase):
 
     __name__ = 'PlanDefinition_Target'
 
+    _types = {
+        'measure': 'reference',
+        'detailQuantity': 'reference',
+        'detailRange': 'reference',
+        'detailCodeableConcept': 'reference',
+        'due': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'measure', 'detailQuantity', 'detailRange', 'detailCodeableConcept', 'due', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.measure = None
         # reference to CodeableConcept
@@ -531,6 +595,59 @@ class PlanDefinition_Action(fhirbase):
 
     __name__ = 'PlanDefinition_Action'
 
+    _enums = {
+        'groupingBehavior': ['visual-group', 'logical-group', 'sentence-group'],
+        'selectionBehavior': [
+            'any', 'all', 'all-or-none', 'exactly-one', 'at-most-one', 'one-or-more'
+        ],
+        'requiredBehavior': ['must', 'could', 'must-unless-documented'],
+        'precheckBehavior': ['yes', 'no'],
+        'cardinalityBehavior': ['single', 'multiple'],
+    }
+
+    _types = {
+        'label': 'str',
+        'title': 'str',
+        'description': 'str',
+        'textEquivalent': 'str',
+        'code': 'reference',
+        'reason': 'reference',
+        'documentation': 'reference',
+        'goalId': 'list',
+        'triggerDefinition': 'reference',
+        'condition': 'reference',
+        'input': 'reference',
+        'output': 'reference',
+        'relatedAction': 'reference',
+        'timingDateTime': 'str',
+        'timingPeriod': 'reference',
+        'timingDuration': 'reference',
+        'timingRange': 'reference',
+        'timingTiming': 'reference',
+        'participant': 'reference',
+        'type': 'reference',
+        'groupingBehavior': 'str',
+        'selectionBehavior': 'str',
+        'requiredBehavior': 'str',
+        'precheckBehavior': 'str',
+        'cardinalityBehavior': 'str',
+        'definition': 'reference',
+        'transform': 'reference',
+        'dynamicValue': 'reference',
+        'action': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'label', 'title', 'description', 'textEquivalent', 'code', 'reason', 'documentation',
+        'goalId', 'triggerDefinition', 'condition', 'input', 'output', 'relatedAction',
+        'timingDateTime', 'timingPeriod', 'timingDuration', 'timingRange', 'timingTiming',
+        'participant', 'type', 'groupingBehavior', 'selectionBehavior', 'requiredBehavior',
+        'precheckBehavior', 'cardinalityBehavior', 'definition', 'transform', 'dynamicValue',
+        'action', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.label = None
         # type: str
@@ -643,80 +760,6 @@ class PlanDefinition_Action(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.groupingBehavior is not None:
-            for value in self.groupingBehavior:
-                if value is not None and value.lower() not in [
-                        'visual-group', 'logical-group', 'sentence-group']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'visual-group, logical-group, sentence-group'))
-
-        if self.selectionBehavior is not None:
-            for value in self.selectionBehavior:
-                if value is not None and value.lower() not in [
-                    'any', 'all', 'all-or-none', 'exactly-one', 'at-most-one',
-                        'one-or-more']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'any, all, all-or-none, exactly-one, at-most-one, one-or-more'))
-
-        if self.requiredBehavior is not None:
-            for value in self.requiredBehavior:
-                if value is not None and value.lower() not in [
-                        'must', 'could', 'must-unless-documented']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'must, could, must-unless-documented'))
-
-        if self.precheckBehavior is not None:
-            for value in self.precheckBehavior:
-                if value is not None and value.lower() not in [
-                        'yes', 'no']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'yes, no'))
-
-        if self.cardinalityBehavior is not None:
-            for value in self.cardinalityBehavior:
-                if value is not None and value.lower() not in [
-                        'single', 'multiple']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'single, multiple'))
-
-        if self.groupingBehavior is not None:
-            for value in self.groupingBehavior:
-                if value is not None and value.lower() not in [
-                        'visual-group', 'logical-group', 'sentence-group']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'visual-group, logical-group, sentence-group'))
-
-        if self.selectionBehavior is not None:
-            for value in self.selectionBehavior:
-                if value is not None and value.lower() not in [
-                    'any', 'all', 'all-or-none', 'exactly-one', 'at-most-one',
-                        'one-or-more']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'any, all, all-or-none, exactly-one, at-most-one, one-or-more'))
-
-        if self.requiredBehavior is not None:
-            for value in self.requiredBehavior:
-                if value is not None and value.lower() not in [
-                        'must', 'could', 'must-unless-documented']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'must, could, must-unless-documented'))
-
-        if self.precheckBehavior is not None:
-            for value in self.precheckBehavior:
-                if value is not None and value.lower() not in [
-                        'yes', 'no']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'yes, no'))
-
-        if self.cardinalityBehavior is not None:
-            for value in self.cardinalityBehavior:
-                if value is not None and value.lower() not in [
-                        'single', 'multiple']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'single, multiple'))
-
     def get_relationships(self):
 
         return [
@@ -831,6 +874,21 @@ class PlanDefinition_Condition(fhirbase):
 
     __name__ = 'PlanDefinition_Condition'
 
+    _enums = {
+        'kind': ['applicability', 'start', 'stop'],
+    }
+
+    _types = {
+        'kind': 'str',
+        'description': 'str',
+        'language': 'str',
+        'expression': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('kind', 'description', 'language', 'expression', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.kind = None
         # type: str
@@ -852,15 +910,6 @@ class PlanDefinition_Condition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                        'applicability', 'start', 'stop']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'applicability, start, stop'))
-
 
 class PlanDefinition_RelatedAction(fhirbase):
     """
@@ -881,6 +930,24 @@ class PlanDefinition_RelatedAction(fhirbase):
 
     __name__ = 'PlanDefinition_RelatedAction'
 
+    _enums = {
+        'relationship': [
+            'before-start', 'before', 'before-end', 'concurrent-with-start', 'concurrent',
+            'concurrent-with-end', 'after-start', 'after', 'after-end'
+        ],
+    }
+
+    _types = {
+        'actionId': 'str',
+        'relationship': 'str',
+        'offsetDuration': 'reference',
+        'offsetRange': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('actionId', 'relationship', 'offsetDuration', 'offsetRange', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.actionId = None
         # type: str
@@ -904,18 +971,6 @@ class PlanDefinition_RelatedAction(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.relationship is not None:
-            for value in self.relationship:
-                if value is not None and value.lower() not in [
-                    'before-start', 'before', 'before-end', 'concurrent-with-start',
-                    'concurrent', 'concurrent-with-end', 'after-start', 'after',
-                        'after-end']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'before-start, before, before-end, concurrent-with-start, '
-                        'concurrent, concurrent-with-end, after-start, after, after-end'))
-
     def get_relationships(self):
 
         return [
@@ -947,6 +1002,19 @@ class PlanDefinition_Participant(fhirbase):
 
     __name__ = 'PlanDefinition_Participant'
 
+    _enums = {
+        'type': ['patient', 'practitioner', 'related-person'],
+    }
+
+    _types = {
+        'type': 'str',
+        'role': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'role', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -962,15 +1030,6 @@ class PlanDefinition_Participant(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'patient', 'practitioner', 'related-person']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'patient, practitioner, related-person'))
-
     def get_relationships(self):
 
         return [
@@ -1002,6 +1061,17 @@ class PlanDefinition_DynamicValue(fhirbase):
 
     __name__ = 'PlanDefinition_DynamicValue'
 
+    _types = {
+        'description': 'str',
+        'path': 'str',
+        'language': 'str',
+        'expression': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('description', 'path', 'language', 'expression', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.description = None
         # type: str
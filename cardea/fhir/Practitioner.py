@@ -27,6 +27,30 @@ class Practitioner(fhirbase):
 
     __name__ = 'Practitioner'
 
+    _enums = {
+        'gender': ['male', 'female', 'other', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'active': 'bool',
+        'name': 'reference',
+        'telecom': 'reference',
+        'address': 'reference',
+        'gender': 'str',
+        'birthDate': 'str',
+        'photo': 'reference',
+        'qualification': 'reference',
+        'communication': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'active', 'name', 'telecom', 'address', 'gender', 'birthDate', 'photo',
+        'qualification', 'communication', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Practitioner'
         # type: str
@@ -74,15 +98,6 @@ class Practitioner(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -138,6 +153,16 @@ class Practitioner_Qualification(fhirbase):
 
     __name__ = 'Practitioner_Qualification'
 
+    _types = {
+        'code': 'reference',
+        'period': 'reference',
+        'issuer': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('code', 'period', 'issuer', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to CodeableConcept
@@ -38,6 +38,31 @@ class PractitionerRole(fhirbase):
 
     __name__ = 'PractitionerRole'
 
+    _types = {
+        'resourceType': 'str',
+        'active': 'bool',
+        'period': 'reference',
+        'practitioner': 'reference',
+        'organization': 'reference',
+        'code': 'reference',
+        'specialty': 'reference',
+        'location': 'reference',
+        'healthcareService': 'reference',
+        'telecom': 'reference',
+        'availableTime': 'reference',
+        'notAvailable': 'reference',
+        'availabilityExceptions': 'str',
+        'endpoint': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'active', 'period', 'practitioner', 'organization', 'code', 'specialty',
+        'location', 'healthcareService', 'telecom', 'availableTime', 'notAvailable',
+        'availabilityExceptions', 'endpoint', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'PractitionerRole'
         # type: str
@@ -181,6 +206,17 @@ class PractitionerRole_AvailableTime(fhirbase):
 
     __name__ = 'PractitionerRole_AvailableTime'
 
+    _types = {
+        'daysOfWeek': 'list',
+        'allDay': 'bool',
+        'availableStartTime': 'str',
+        'availableEndTime': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('daysOfWeek', 'allDay', 'availableStartTime', 'availableEndTime', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.daysOfWeek = None
         # type: list
@@ -215,6 +251,15 @@ class PractitionerRole_NotAvailable(fhirbase):
 
     __name__ = 'PractitionerRole_NotAvailable'
 
+    _types = {
+        'description': 'str',
+        'during': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('description', 'during', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.description = None
         # type: str
@@ -76,6 +76,46 @@ class Procedure(fhirbase):
 
     __name__ = 'Procedure'
 
+    _types = {
+        'resourceType': 'str',
+        'definition': 'reference',
+        'basedOn': 'reference',
+        'partOf': 'reference',
+        'status': 'str',
+        'notDone': 'bool',
+        'notDoneReason': 'reference',
+        'category': 'reference',
+        'code': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'performedDateTime': 'str',
+        'performedPeriod': 'reference',
+        'performer': 'reference',
+        'location': 'reference',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'bodySite': 'reference',
+        'outcome': 'reference',
+        'report': 'reference',
+        'complication': 'reference',
+        'complicationDetail': 'reference',
+        'followUp': 'reference',
+        'note': 'reference',
+        'focalDevice': 'reference',
+        'usedReference': 'reference',
+        'usedCode': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definition', 'basedOn', 'partOf', 'status', 'notDone', 'notDoneReason',
+        'category', 'code', 'subject', 'context', 'performedDateTime', 'performedPeriod',
+        'performer', 'location', 'reasonCode', 'reasonReference', 'bodySite', 'outcome', 'report',
+        'complication', 'complicationDetail', 'followUp', 'note', 'focalDevice', 'usedReference',
+        'usedCode', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Procedure'
         # type: str
@@ -322,6 +362,16 @@ class Procedure_Performer(fhirbase):
 
     __name__ = 'Procedure_Performer'
 
+    _types = {
+        'role': 'reference',
+        'actor': 'reference',
+        'onBehalfOf': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('role', 'actor', 'onBehalfOf', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.role = None
         # reference to CodeableConcept
@@ -373,6 +423,15 @@ class Procedure_FocalDevice(fhirbase):
 
     __name__ = 'Procedure_FocalDevice'
 
+    _types = {
+        'action': 'reference',
+        'manipulated': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('action', 'manipulated', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.action = None
         # reference to CodeableConcept
@@ -83,6 +83,48 @@ class ProcedureRequest(fhirbase):
 
     __name__ = 'ProcedureRequest'
 
+    _types = {
+        'resourceType': 'str',
+        'definition': 'reference',
+        'basedOn': 'reference',
+        'replaces': 'reference',
+        'requisition': 'reference',
+        'status': 'str',
+        'intent': 'str',
+        'priority': 'str',
+        'doNotPerform': 'bool',
+        'category': 'reference',
+        'code': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'occurrenceDateTime': 'str',
+        'occurrencePeriod': 'reference',
+        'occurrenceTiming': 'reference',
+        'asNeededBoolean': 'bool',
+        'asNeededCodeableConcept': 'reference',
+        'authoredOn': 'str',
+        'requester': 'reference',
+        'performerType': 'reference',
+        'performer': 'reference',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'supportingInfo': 'reference',
+        'specimen': 'reference',
+        'bodySite': 'reference',
+        'note': 'reference',
+        'relevantHistory': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definition', 'basedOn', 'replaces', 'requisition', 'status', 'intent',
+        'priority', 'doNotPerform', 'category', 'code', 'subject', 'context', 'occurrenceDateTime',
+        'occurrencePeriod', 'occurrenceTiming', 'asNeededBoolean', 'asNeededCodeableConcept',
+        'authoredOn', 'requester', 'performerType', 'performer', 'reasonCode', 'reasonReference',
+        'supportingInfo', 'specimen', 'bodySite', 'note', 'relevantHistory', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ProcedureRequest'
         # type: str
@@ -320,6 +362,15 @@ class ProcedureRequest_Requester(fhirbase):
 
     __name__ = 'ProcedureRequest_Requester'
 
+    _types = {
+        'agent': 'reference',
+        'onBehalfOf': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('agent', 'onBehalfOf', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.agent = None
         # reference to Reference: identifier
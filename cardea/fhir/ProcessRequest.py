@@ -35,6 +35,36 @@ class ProcessRequest(fhirbase):
 
     __name__ = 'ProcessRequest'
 
+    _enums = {
+        'action': ['cancel', 'poll', 'reprocess', 'status'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'action': 'str',
+        'target': 'reference',
+        'created': 'str',
+        'provider': 'reference',
+        'organization': 'reference',
+        'request': 'reference',
+        'response': 'reference',
+        'nullify': 'bool',
+        'reference': 'str',
+        'item': 'reference',
+        'include': 'list',
+        'exclude': 'list',
+        'period': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'action', 'target', 'created', 'provider', 'organization',
+        'request', 'response', 'nullify', 'reference', 'item', 'include', 'exclude', 'period',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ProcessRequest'
         # type: str
@@ -92,15 +122,6 @@ class ProcessRequest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.action is not None:
-            for value in self.action:
-                if value is not None and value.lower() not in [
-                        'cancel', 'poll', 'reprocess', 'status']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'cancel, poll, reprocess, status'))
-
     def get_relationships(self):
 
         return [
@@ -158,6 +179,14 @@ class ProcessRequest_Item(fhirbase):
 
     __name__ = 'ProcessRequest_Item'
 
+    _types = {
+        'sequenceLinkId': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = ('sequenceLinkId', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.sequenceLinkId = None
         # type: int
@@ -31,6 +31,30 @@ class ProcessResponse(fhirbase):
 
     __name__ = 'ProcessResponse'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'created': 'str',
+        'organization': 'reference',
+        'request': 'reference',
+        'outcome': 'reference',
+        'disposition': 'str',
+        'requestProvider': 'reference',
+        'requestOrganization': 'reference',
+        'form': 'reference',
+        'processNote': 'reference',
+        'error': 'reference',
+        'communicationRequest': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'created', 'organization', 'request', 'outcome', 'disposition',
+        'requestProvider', 'requestOrganization', 'form', 'processNote', 'error',
+        'communicationRequest', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ProcessResponse'
         # type: str
@@ -150,6 +174,15 @@ class ProcessResponse_ProcessNote(fhirbase):
 
     __name__ = 'ProcessResponse_ProcessNote'
 
+    _types = {
+        'type': 'reference',
+        'text': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'text', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
@@ -41,6 +41,27 @@ class Provenance(fhirbase):
 
     __name__ = 'Provenance'
 
+    _types = {
+        'resourceType': 'str',
+        'target': 'reference',
+        'period': 'reference',
+        'recorded': 'str',
+        'policy': 'list',
+        'location': 'reference',
+        'reason': 'reference',
+        'activity': 'reference',
+        'agent': 'reference',
+        'entity': 'reference',
+        'signature': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'target', 'period', 'recorded', 'policy', 'location', 'reason', 'activity',
+        'agent', 'entity', 'signature', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Provenance'
         # type: str
@@ -163,6 +184,22 @@ class Provenance_Agent(fhirbase):
 
     __name__ = 'Provenance_Agent'
 
+    _types = {
+        'role': 'reference',
+        'whoUri': 'str',
+        'whoReference': 'reference',
+        'onBehalfOfUri': 'str',
+        'onBehalfOfReference': 'reference',
+        'relatedAgentType': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'role', 'whoUri', 'whoReference', 'onBehalfOfUri', 'onBehalfOfReference',
+        'relatedAgentType', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.role = None
         # type: list
@@ -244,6 +281,22 @@ class Provenance_Entity(fhirbase):
 
     __name__ = 'Provenance_Entity'
 
+    _enums = {
+        'role': ['derivation', 'revision', 'quotation', 'source', 'removal'],
+    }
+
+    _types = {
+        'role': 'str',
+        'whatUri': 'str',
+        'whatReference': 'reference',
+        'whatIdentifier': 'reference',
+        'agent': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('role', 'whatUri', 'whatReference', 'whatIdentifier', 'agent', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.role = None
         # type: str
@@ -270,15 +323,6 @@ class Provenance_Entity(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.role is not None:
-            for value in self.role:
-                if value is not None and value.lower() not in [
-                        'derivation', 'revision', 'quotation', 'source', 'removal']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'derivation, revision, quotation, source, removal'))
-
     def get_relationships(self):
 
         return [
@@ -24,6 +24,22 @@ class Quantity(fhirbase):
 
     __name__ = 'Quantity'
 
+    _enums = {
+        'comparator': ['<', '<=', '>=', '>'],
+    }
+
+    _types = {
+        'value': 'int',
+        'comparator': 'str',
+        'unit': 'str',
+        'system': 'str',
+        'code': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('value', 'comparator', 'unit', 'system', 'code', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.value = None
         # type: int
@@ -47,12 +63,3 @@ class Quantity(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.comparator is not None:
-            for value in self.comparator:
-                if value is not None and value.lower() not in [
-                        '<', '<=', '>=', '>']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, '<, <=, >=, >'))
@@ -77,6 +77,43 @@ class Questionnaire(fhirbase):
 
     __name__ = 'Questionnaire'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'effectivePeriod': 'reference',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'contact': 'reference',
+        'copyright': 'str',
+        'code': 'reference',
+        'subjectType': 'list',
+        'item': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'description', 'purpose', 'approvalDate', 'lastReviewDate', 'effectivePeriod',
+        'useContext', 'jurisdiction', 'contact', 'copyright', 'code', 'subjectType', 'item',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Questionnaire'
         # type: str
@@ -156,15 +193,6 @@ class Questionnaire(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -281,6 +309,52 @@ class Questionnaire_Item(fhirbase):
 
     __name__ = 'Questionnaire_Item'
 
+    _enums = {
+        'type': [
+            'group', 'display', 'boolean', 'decimal', 'integer', 'date', 'datetime', 'time',
+            'string', 'text', 'url', 'choice', 'open-choice', 'attachment', 'reference', 'quantity'
+        ],
+    }
+
+    _types = {
+        'linkId': 'str',
+        'definition': 'str',
+        'code': 'reference',
+        'prefix': 'str',
+        'text': 'str',
+        'type': 'str',
+        'enableWhen': 'reference',
+        'required': 'bool',
+        'repeats': 'bool',
+        'readOnly': 'bool',
+        'maxLength': 'int',
+        'options': 'reference',
+        'option': 'reference',
+        'initialBoolean': 'bool',
+        'initialDecimal': 'int',
+        'initialInteger': 'int',
+        'initialDate': 'str',
+        'initialDateTime': 'str',
+        'initialTime': 'str',
+        'initialString': 'str',
+        'initialUri': 'str',
+        'initialAttachment': 'reference',
+        'initialCoding': 'reference',
+        'initialQuantity': 'reference',
+        'initialReference': 'reference',
+        'item': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'linkId', 'definition', 'code', 'prefix', 'text', 'type', 'enableWhen', 'required',
+        'repeats', 'readOnly', 'maxLength', 'options', 'option', 'initialBoolean',
+        'initialDecimal', 'initialInteger', 'initialDate', 'initialDateTime', 'initialTime',
+        'initialString', 'initialUri', 'initialAttachment', 'initialCoding', 'initialQuantity',
+        'initialReference', 'item', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.linkId = None
         # type: str
@@ -374,19 +448,6 @@ class Questionnaire_Item(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'group', 'display', 'boolean', 'decimal', 'integer', 'date',
-                    'datetime', 'time', 'string', 'text', 'url', 'choice', 'open-choice',
-                        'attachment', 'reference', 'quantity']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'group, display, boolean, decimal, integer, date, dateTime, time,'
-                        'string, text, url, choice, open-choice, attachment, reference,'
-                        'quantity'))
-
     def get_relationships(self):
 
         return [
@@ -478,6 +539,31 @@ class Questionnaire_EnableWhen(fhirbase):
 
     __name__ = 'Questionnaire_EnableWhen'
 
+    _types = {
+        'question': 'str',
+        'hasAnswer': 'bool',
+        'answerBoolean': 'bool',
+        'answerDecimal': 'int',
+        'answerInteger': 'int',
+        'answerDate': 'str',
+        'answerDateTime': 'str',
+        'answerTime': 'str',
+        'answerString': 'str',
+        'answerUri': 'str',
+        'answerAttachment': 'reference',
+        'answerCoding': 'reference',
+        'answerQuantity': 'reference',
+        'answerReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'question', 'hasAnswer', 'answerBoolean', 'answerDecimal', 'answerInteger', 'answerDate',
+        'answerDateTime', 'answerTime', 'answerString', 'answerUri', 'answerAttachment',
+        'answerCoding', 'answerQuantity', 'answerReference', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.question = None
         # type: str
@@ -574,6 +660,18 @@ class Questionnaire_Option(fhirbase):
 
     __name__ = 'Questionnaire_Option'
 
+    _types = {
+        'valueInteger': 'int',
+        'valueDate': 'str',
+        'valueTime': 'str',
+        'valueString': 'str',
+        'valueCoding': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('valueInteger', 'valueDate', 'valueTime', 'valueString', 'valueCoding', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.valueInteger = None
         # type: int
@@ -39,6 +39,31 @@ class QuestionnaireResponse(fhirbase):
 
     __name__ = 'QuestionnaireResponse'
 
+    _enums = {
+        'status': ['in-progress', 'completed', 'amended', 'entered-in-error', 'stopped'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'basedOn': 'reference',
+        'parent': 'reference',
+        'questionnaire': 'reference',
+        'status': 'str',
+        'subject': 'reference',
+        'context': 'reference',
+        'authored': 'str',
+        'author': 'reference',
+        'source': 'reference',
+        'item': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'basedOn', 'parent', 'questionnaire', 'status', 'subject', 'context',
+        'authored', 'author', 'source', 'item', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'QuestionnaireResponse'
         # type: str
@@ -86,15 +111,6 @@ class QuestionnaireResponse(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'in-progress', 'completed', 'amended', 'entered-in-error', 'stopped']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'in-progress, completed, amended, entered-in-error, stopped'))
-
     def get_relationships(self):
 
         return [
@@ -166,6 +182,19 @@ class QuestionnaireResponse_Item(fhirbase):
 
     __name__ = 'QuestionnaireResponse_Item'
 
+    _types = {
+        'linkId': 'str',
+        'definition': 'str',
+        'text': 'str',
+        'subject': 'reference',
+        'answer': 'reference',
+        'item': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('linkId', 'definition', 'text', 'subject', 'answer', 'item', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.linkId = None
         # type: str
@@ -250,6 +279,30 @@ class QuestionnaireResponse_Answer(fhirbase):
 
     __name__ = 'QuestionnaireResponse_Answer'
 
+    _types = {
+        'valueBoolean': 'bool',
+        'valueDecimal': 'int',
+        'valueInteger': 'int',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+        'valueAttachment': 'reference',
+        'valueCoding': 'reference',
+        'valueQuantity': 'reference',
+        'valueReference': 'reference',
+        'item': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'valueBoolean', 'valueDecimal', 'valueInteger', 'valueDate', 'valueDateTime', 'valueTime',
+        'valueString', 'valueUri', 'valueAttachment', 'valueCoding', 'valueQuantity',
+        'valueReference', 'item', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.valueBoolean = None
         # type: bool
@@ -12,6 +12,15 @@ class Range(fhirbase):
 
     __name__ = 'Range'
 
+    _types = {
+        'low': 'reference',
+        'high': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('low', 'high', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.low = None
         # reference to Quantity
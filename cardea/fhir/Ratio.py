@@ -13,6 +13,15 @@ class Ratio(fhirbase):
 
     __name__ = 'Ratio'
 
+    _types = {
+        'numerator': 'reference',
+        'denominator': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('numerator', 'denominator', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.numerator = None
         # reference to Quantity
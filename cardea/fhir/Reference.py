@@ -28,6 +28,15 @@ class Reference(fhirbase):
 
     __name__ = 'Reference'
 
+    _types = {
+        'reference': 'str',
+        'display': 'str',
+        'identifier': 'reference',
+    }
+
+    _fields = ('reference', 'display', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.reference = None
         # type: str
@@ -72,6 +72,42 @@ class ReferralRequest(fhirbase):
 
     __name__ = 'ReferralRequest'
 
+    _types = {
+        'resourceType': 'str',
+        'definition': 'reference',
+        'basedOn': 'reference',
+        'replaces': 'reference',
+        'groupIdentifier': 'reference',
+        'status': 'str',
+        'intent': 'str',
+        'type': 'reference',
+        'priority': 'str',
+        'serviceRequested': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'occurrenceDateTime': 'str',
+        'occurrencePeriod': 'reference',
+        'authoredOn': 'str',
+        'requester': 'reference',
+        'specialty': 'reference',
+        'recipient': 'reference',
+        'reasonCode': 'reference',
+        'reasonReference': 'reference',
+        'description': 'str',
+        'supportingInfo': 'reference',
+        'note': 'reference',
+        'relevantHistory': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definition', 'basedOn', 'replaces', 'groupIdentifier', 'status', 'intent',
+        'type', 'priority', 'serviceRequested', 'subject', 'context', 'occurrenceDateTime',
+        'occurrencePeriod', 'authoredOn', 'requester', 'specialty', 'recipient', 'reasonCode',
+        'reasonReference', 'description', 'supportingInfo', 'note', 'relevantHistory', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ReferralRequest'
         # type: str
@@ -273,6 +309,15 @@ class ReferralRequest_Requester(fhirbase):
 
     __name__ = 'ReferralRequest_Requester'
 
+    _types = {
+        'agent': 'reference',
+        'onBehalfOf': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('agent', 'onBehalfOf', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.agent = None
         # reference to Reference: identifier
@@ -22,6 +22,26 @@ class RelatedArtifact(fhirbase):
 
     __name__ = 'RelatedArtifact'
 
+    _enums = {
+        'type': [
+            'documentation', 'justification', 'citation', 'predecessor', 'successor',
+            'derived-from', 'depends-on', 'composed-of'
+        ],
+    }
+
+    _types = {
+        'type': 'str',
+        'display': 'str',
+        'citation': 'str',
+        'url': 'str',
+        'document': 'reference',
+        'resource': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'display', 'citation', 'url', 'document', 'resource', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -50,17 +70,6 @@ class RelatedArtifact(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'documentation', 'justification', 'citation', 'predecessor',
-                        'successor', 'derived-from', 'depends-on', 'composed-of']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'documentation, justification, citation, predecessor, successor,'
-                        'derived-from, depends-on, composed-of'))
-
     def get_relationships(self):
 
         return [
@@ -28,6 +28,31 @@ class RelatedPerson(fhirbase):
 
     __name__ = 'RelatedPerson'
 
+    _enums = {
+        'gender': ['male', 'female', 'other', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'active': 'bool',
+        'patient': 'reference',
+        'relationship': 'reference',
+        'name': 'reference',
+        'telecom': 'reference',
+        'gender': 'str',
+        'birthDate': 'str',
+        'address': 'reference',
+        'photo': 'reference',
+        'period': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'active', 'patient', 'relationship', 'name', 'telecom', 'gender',
+        'birthDate', 'address', 'photo', 'period', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'RelatedPerson'
         # type: str
@@ -76,15 +101,6 @@ class RelatedPerson(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.gender is not None:
-            for value in self.gender:
-                if value is not None and value.lower() not in [
-                        'male', 'female', 'other', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'male, female, other, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -49,6 +49,33 @@ class RequestGroup(fhirbase):
 
     __name__ = 'RequestGroup'
 
+    _types = {
+        'resourceType': 'str',
+        'definition': 'reference',
+        'basedOn': 'reference',
+        'replaces': 'reference',
+        'groupIdentifier': 'reference',
+        'status': 'str',
+        'intent': 'str',
+        'priority': 'str',
+        'subject': 'reference',
+        'context': 'reference',
+        'authoredOn': 'str',
+        'author': 'reference',
+        'reasonCodeableConcept': 'reference',
+        'reasonReference': 'reference',
+        'note': 'reference',
+        'action': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definition', 'basedOn', 'replaces', 'groupIdentifier', 'status', 'intent',
+        'priority', 'subject', 'context', 'authoredOn', 'author', 'reasonCodeableConcept',
+        'reasonReference', 'note', 'action', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'RequestGroup'
         # type: str
@@ -232,6 +259,41 @@ class RequestGroup_Action(fhirbase):
 
     __name__ = 'RequestGroup_Action'
 
+    _types = {
+        'label': 'str',
+        'title': 'str',
+        'description': 'str',
+        'textEquivalent': 'str',
+        'code': 'reference',
+        'documentation': 'reference',
+        'condition': 'reference',
+        'relatedAction': 'reference',
+        'timingDateTime': 'str',
+        'timingPeriod': 'reference',
+        'timingDuration': 'reference',
+        'timingRange': 'reference',
+        'timingTiming': 'reference',
+        'participant': 'reference',
+        'type': 'reference',
+        'groupingBehavior': 'str',
+        'selectionBehavior': 'str',
+        'requiredBehavior': 'str',
+        'precheckBehavior': 'str',
+        'cardinalityBehavior': 'str',
+        'resource': 'reference',
+        'action': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'label', 'title', 'description', 'textEquivalent', 'code', 'documentation', 'condition',
+        'relatedAction', 'timingDateTime', 'timingPeriod', 'timingDuration', 'timingRange',
+        'timingTiming', 'participant', 'type', 'groupingBehavior', 'selectionBehavior',
+        'requiredBehavior', 'precheckBehavior', 'cardinalityBehavior', 'resource', 'action',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.label = None
         # type: str
@@ -393,6 +455,17 @@ class RequestGroup_Condition(fhirbase):
 
     __name__ = 'RequestGroup_Condition'
 
+    _types = {
+        'kind': 'str',
+        'description': 'str',
+        'language': 'str',
+        'expression': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('kind', 'description', 'language', 'expression', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.kind = None
         # type: str
@@ -430,6 +503,17 @@ class RequestGroup_RelatedAction(fhirbase):
 
     __name__ = 'RequestGroup_RelatedAction'
 
+    _types = {
+        'actionId': 'str',
+        'relationship': 'str',
+        'offsetDuration': 'reference',
+        'offsetRange': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('actionId', 'relationship', 'offsetDuration', 'offsetRange', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.actionId = None
         # type: str
@@ -55,6 +55,43 @@ class ResearchStudy(fhirbase):
 
     __name__ = 'ResearchStudy'
 
+    _enums = {
+        'status': [
+            'draft', 'in-progress', 'suspended', 'stopped', 'completed', 'entered-in-error'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'title': 'str',
+        'protocol': 'reference',
+        'partOf': 'reference',
+        'status': 'str',
+        'category': 'reference',
+        'focus': 'reference',
+        'contact': 'reference',
+        'relatedArtifact': 'reference',
+        'keyword': 'reference',
+        'jurisdiction': 'reference',
+        'description': 'str',
+        'enrollment': 'reference',
+        'period': 'reference',
+        'sponsor': 'reference',
+        'principalInvestigator': 'reference',
+        'site': 'reference',
+        'reasonStopped': 'reference',
+        'note': 'reference',
+        'arm': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'title', 'protocol', 'partOf', 'status', 'category', 'focus', 'contact',
+        'relatedArtifact', 'keyword', 'jurisdiction', 'description', 'enrollment', 'period',
+        'sponsor', 'principalInvestigator', 'site', 'reasonStopped', 'note', 'arm', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ResearchStudy'
         # type: str
@@ -139,17 +176,6 @@ class ResearchStudy(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'draft', 'in-progress', 'suspended', 'stopped', 'completed',
-                        'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, in-progress, suspended, stopped, completed, '
-                        'entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -260,6 +286,16 @@ class ResearchStudy_Arm(fhirbase):
 
     __name__ = 'ResearchStudy_Arm'
 
+    _types = {
+        'name': 'str',
+        'code': 'reference',
+        'description': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'code', 'description', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
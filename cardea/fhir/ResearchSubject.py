@@ -31,6 +31,28 @@ class ResearchSubject(fhirbase):
 
     __name__ = 'ResearchSubject'
 
+    _enums = {
+        'status': ['candidate', 'enrolled', 'active', 'suspended', 'withdrawn', 'completed'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'period': 'reference',
+        'study': 'reference',
+        'individual': 'reference',
+        'assignedArm': 'str',
+        'actualArm': 'str',
+        'consent': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'period', 'study', 'individual', 'assignedArm', 'actualArm',
+        'consent', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ResearchSubject'
         # type: str
@@ -66,16 +88,6 @@ class ResearchSubject(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'candidate', 'enrolled', 'active', 'suspended', 'withdrawn',
-                        'completed']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'candidate, enrolled, active, suspended, withdrawn, completed'))
-
     def get_relationships(self):
 
         return [
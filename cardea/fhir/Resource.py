@@ -19,6 +19,16 @@ class Resource(fhirbase):
 
     __name__ = 'Resource'
 
+    _types = {
+        'meta': 'reference',
+        'implicitRules': 'str',
+        'language': 'str',
+        'id': 'str',
+    }
+
+    _fields = ('meta', 'implicitRules', 'language', 'id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.meta = None
         # reference to Meta
@@ -4,6 +4,14 @@ from .fhirbase import fhirbase
 class ResourceList(fhirbase):
     __name__ = 'ResourceList'
 
+    _types = {
+        'ref': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('ref', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.ref = None
 
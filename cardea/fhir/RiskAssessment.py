@@ -39,6 +39,36 @@ class RiskAssessment(fhirbase):
 
     __name__ = 'RiskAssessment'
 
+    _types = {
+        'resourceType': 'str',
+        'basedOn': 'reference',
+        'parent': 'reference',
+        'status': 'str',
+        'method': 'reference',
+        'code': 'reference',
+        'subject': 'reference',
+        'context': 'reference',
+        'occurrenceDateTime': 'str',
+        'occurrencePeriod': 'reference',
+        'condition': 'reference',
+        'performer': 'reference',
+        'reasonCodeableConcept': 'reference',
+        'reasonReference': 'reference',
+        'basis': 'reference',
+        'prediction': 'reference',
+        'mitigation': 'str',
+        'comment': 'str',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'basedOn', 'parent', 'status', 'method', 'code', 'subject', 'context',
+        'occurrenceDateTime', 'occurrencePeriod', 'condition', 'performer',
+        'reasonCodeableConcept', 'reasonReference', 'basis', 'prediction', 'mitigation', 'comment',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'RiskAssessment'
         # type: str
@@ -207,6 +237,24 @@ class RiskAssessment_Prediction(fhirbase):
 
     __name__ = 'RiskAssessment_Prediction'
 
+    _types = {
+        'outcome': 'reference',
+        'probabilityDecimal': 'int',
+        'probabilityRange': 'reference',
+        'qualitativeRisk': 'reference',
+        'relativeRisk': 'int',
+        'whenPeriod': 'reference',
+        'whenRange': 'reference',
+        'rationale': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'outcome', 'probabilityDecimal', 'probabilityRange', 'qualitativeRisk', 'relativeRisk',
+        'whenPeriod', 'whenRange', 'rationale', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.outcome = None
         # reference to CodeableConcept
@@ -30,6 +30,22 @@ class SampledData(fhirbase):
 
     __name__ = 'SampledData'
 
+    _types = {
+        'origin': 'reference',
+        'period': 'int',
+        'factor': 'int',
+        'lowerLimit': 'int',
+        'upperLimit': 'int',
+        'dimensions': 'int',
+        'data': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'origin', 'period', 'factor', 'lowerLimit', 'upperLimit', 'dimensions', 'data', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.origin = None
         # reference to Quantity
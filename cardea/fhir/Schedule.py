@@ -33,6 +33,24 @@ class Schedule(fhirbase):
 
     __name__ = 'Schedule'
 
+    _types = {
+        'resourceType': 'str',
+        'active': 'bool',
+        'serviceCategory': 'reference',
+        'serviceType': 'reference',
+        'specialty': 'reference',
+        'actor': 'reference',
+        'planningHorizon': 'reference',
+        'comment': 'str',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'active', 'serviceCategory', 'serviceType', 'specialty', 'actor',
+        'planningHorizon', 'comment', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Schedule'
         # type: str
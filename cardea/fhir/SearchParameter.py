@@ -82,6 +82,53 @@ class SearchParameter(fhirbase):
 
     __name__ = 'SearchParameter'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+        'type': ['number', 'date', 'string', 'token', 'reference', 'composite', 'quantity', 'uri'],
+        'xpathUsage': ['normal', 'phonetic', 'nearby', 'distance', 'other'],
+        'comparator': ['eq', 'ne', 'gt', 'lt', 'ge', 'le', 'sa', 'eb', 'ap'],
+        'modifier': [
+            'missing', 'exact', 'contains', 'not', 'text', 'in', 'not-in', 'below', 'above', 'type'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'purpose': 'str',
+        'code': 'str',
+        'base': 'list',
+        'type': 'str',
+        'derivedFrom': 'str',
+        'description': 'str',
+        'expression': 'str',
+        'xpath': 'str',
+        'xpathUsage': 'str',
+        'target': 'list',
+        'comparator': 'list',
+        'modifier': 'list',
+        'chain': 'list',
+        'component': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'status', 'experimental', 'date', 'publisher',
+        'contact', 'useContext', 'jurisdiction', 'purpose', 'code', 'base', 'type', 'derivedFrom',
+        'description', 'expression', 'xpath', 'xpathUsage', 'target', 'comparator', 'modifier',
+        'chain', 'component', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'SearchParameter'
         # type: str
@@ -177,46 +224,6 @@ class SearchParameter(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'number', 'date', 'string', 'token', 'reference', 'composite',
-                        'quantity', 'uri']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'number, date, string, token, reference, composite, quantity, uri'))
-
-        if self.xpathUsage is not None:
-            for value in self.xpathUsage:
-                if value is not None and value.lower() not in [
-                        'normal', 'phonetic', 'nearby', 'distance', 'other']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'normal, phonetic, nearby, distance, other'))
-
-        if self.comparator is not None:
-            for value in self.comparator:
-                if value is not None and value.lower() not in [
-                        'eq', 'ne', 'gt', 'lt', 'ge', 'le', 'sa', 'eb', 'ap']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'eq, ne, gt, lt, ge, le, sa, eb, ap'))
-
-        if self.modifier is not None:
-            for value in self.modifier:
-                if value is not None and value.lower() not in [
-                    'missing', 'exact', 'contains', 'not', 'text', 'in', 'not-in',
-                        'below', 'above', 'type']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'missing, exact, contains, not, text, in, not-in, below, above, '
-                        'type'))
-
     def get_relationships(self):
 
         return [
@@ -256,6 +263,15 @@ class SearchParameter_Component(fhirbase):
 
     __name__ = 'SearchParameter_Component'
 
+    _types = {
+        'definition': 'reference',
+        'expression': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('definition', 'expression', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.definition = None
         # reference to Reference: identifier
@@ -46,6 +46,36 @@ class Sequence(fhirbase):
 
     __name__ = 'Sequence'
 
+    _enums = {
+        'type': ['aa', 'dna', 'rna'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'type': 'str',
+        'coordinateSystem': 'int',
+        'patient': 'reference',
+        'specimen': 'reference',
+        'device': 'reference',
+        'performer': 'reference',
+        'quantity': 'reference',
+        'referenceSeq': 'reference',
+        'variant': 'reference',
+        'observedSeq': 'str',
+        'quality': 'reference',
+        'readCoverage': 'int',
+        'repository': 'reference',
+        'pointer': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'type', 'coordinateSystem', 'patient', 'specimen', 'device', 'performer',
+        'quantity', 'referenceSeq', 'variant', 'observedSeq', 'quality', 'readCoverage',
+        'repository', 'pointer', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Sequence'
         # type: str
@@ -106,15 +136,6 @@ class Sequence(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'aa', 'dna', 'rna']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'aa, dna, rna'))
-
     def get_relationships(self):
 
         return [
@@ -209,6 +230,24 @@ class Sequence_ReferenceSeq(fhirbase):
 
     __name__ = 'Sequence_ReferenceSeq'
 
+    _types = {
+        'chromosome': 'reference',
+        'genomeBuild': 'str',
+        'referenceSeqId': 'reference',
+        'referenceSeqPointer': 'reference',
+        'referenceSeqString': 'str',
+        'strand': 'int',
+        'windowStart': 'int',
+        'windowEnd': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'chromosome', 'genomeBuild', 'referenceSeqId', 'referenceSeqPointer', 'referenceSeqString',
+        'strand', 'windowStart', 'windowEnd', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.chromosome = None
         # reference to CodeableConcept
@@ -297,6 +336,21 @@ class Sequence_Variant(fhirbase):
 
     __name__ = 'Sequence_Variant'
 
+    _types = {
+        'start': 'int',
+        'end': 'int',
+        'observedAllele': 'str',
+        'referenceAllele': 'str',
+        'cigar': 'str',
+        'variantPointer': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'start', 'end', 'observedAllele', 'referenceAllele', 'cigar', 'variantPointer', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.start = None
         # type: int
@@ -379,6 +433,34 @@ class Sequence_Quality(fhirbase):
 
     __name__ = 'Sequence_Quality'
 
+    _enums = {
+        'type': ['indel', 'snp', 'unknown'],
+    }
+
+    _types = {
+        'type': 'str',
+        'standardSequence': 'reference',
+        'start': 'int',
+        'end': 'int',
+        'score': 'reference',
+        'method': 'reference',
+        'truthTP': 'int',
+        'queryTP': 'int',
+        'truthFN': 'int',
+        'queryFP': 'int',
+        'gtFP': 'int',
+        'precision': 'int',
+        'recall': 'int',
+        'fScore': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'type', 'standardSequence', 'start', 'end', 'score', 'method', 'truthTP', 'queryTP',
+        'truthFN', 'queryFP', 'gtFP', 'precision', 'recall', 'fScore', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -430,15 +512,6 @@ class Sequence_Quality(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'indel', 'snp', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'indel, snp, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -481,6 +554,23 @@ class Sequence_Repository(fhirbase):
 
     __name__ = 'Sequence_Repository'
 
+    _enums = {
+        'type': ['directlink', 'openapi', 'login', 'oauth', 'other'],
+    }
+
+    _types = {
+        'type': 'str',
+        'url': 'str',
+        'name': 'str',
+        'datasetId': 'str',
+        'variantsetId': 'str',
+        'readsetId': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'url', 'name', 'datasetId', 'variantsetId', 'readsetId', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -507,12 +597,3 @@ class Sequence_Repository(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'directlink', 'openapi', 'login', 'oauth', 'other']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'directlink, openapi, login, oauth, other'))
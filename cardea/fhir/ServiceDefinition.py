@@ -89,6 +89,48 @@ class ServiceDefinition(fhirbase):
 
     __name__ = 'ServiceDefinition'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'description': 'str',
+        'purpose': 'str',
+        'usage': 'str',
+        'approvalDate': 'str',
+        'lastReviewDate': 'str',
+        'effectivePeriod': 'reference',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'topic': 'reference',
+        'contributor': 'reference',
+        'contact': 'reference',
+        'copyright': 'str',
+        'relatedArtifact': 'reference',
+        'trigger': 'reference',
+        'dataRequirement': 'reference',
+        'operationDefinition': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'description', 'purpose', 'usage', 'approvalDate', 'lastReviewDate',
+        'effectivePeriod', 'useContext', 'jurisdiction', 'topic', 'contributor', 'contact',
+        'copyright', 'relatedArtifact', 'trigger', 'dataRequirement', 'operationDefinition',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ServiceDefinition'
         # type: str
@@ -183,15 +225,6 @@ class ServiceDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -32,6 +32,24 @@ class Signature(fhirbase):
 
     __name__ = 'Signature'
 
+    _types = {
+        'type': 'reference',
+        'when': 'str',
+        'whoUri': 'str',
+        'whoReference': 'reference',
+        'onBehalfOfUri': 'str',
+        'onBehalfOfReference': 'reference',
+        'contentType': 'str',
+        'blob': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'type', 'when', 'whoUri', 'whoReference', 'onBehalfOfUri', 'onBehalfOfReference',
+        'contentType', 'blob', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: list
@@ -33,6 +33,31 @@ class Slot(fhirbase):
 
     __name__ = 'Slot'
 
+    _enums = {
+        'status': ['busy', 'free', 'busy-unavailable', 'busy-tentative', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'serviceCategory': 'reference',
+        'serviceType': 'reference',
+        'specialty': 'reference',
+        'appointmentType': 'reference',
+        'schedule': 'reference',
+        'status': 'str',
+        'start': 'str',
+        'end': 'str',
+        'overbooked': 'bool',
+        'comment': 'str',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'serviceCategory', 'serviceType', 'specialty', 'appointmentType',
+        'schedule', 'status', 'start', 'end', 'overbooked', 'comment', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Slot'
         # type: str
@@ -80,16 +105,6 @@ class Slot(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'busy', 'free', 'busy-unavailable', 'busy-tentative',
-                        'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'busy, free, busy-unavailable, busy-tentative, entered-in-error'))
-
     def get_relationships(self):
 
         return [
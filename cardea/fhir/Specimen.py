@@ -35,6 +35,32 @@ class Specimen(fhirbase):
 
     __name__ = 'Specimen'
 
+    _enums = {
+        'status': ['available', 'unavailable', 'unsatisfactory', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'accessionIdentifier': 'reference',
+        'status': 'str',
+        'type': 'reference',
+        'subject': 'reference',
+        'receivedTime': 'str',
+        'parent': 'reference',
+        'request': 'reference',
+        'collection': 'reference',
+        'processing': 'reference',
+        'container': 'reference',
+        'note': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'accessionIdentifier', 'status', 'type', 'subject', 'receivedTime',
+        'parent', 'request', 'collection', 'processing', 'container', 'note', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Specimen'
         # type: str
@@ -88,15 +114,6 @@ class Specimen(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'available', 'unavailable', 'unsatisfactory', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'available, unavailable, unsatisfactory, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -174,6 +191,22 @@ class Specimen_Collection(fhirbase):
 
     __name__ = 'Specimen_Collection'
 
+    _types = {
+        'collector': 'reference',
+        'collectedDateTime': 'str',
+        'collectedPeriod': 'reference',
+        'quantity': 'reference',
+        'method': 'reference',
+        'bodySite': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'collector', 'collectedDateTime', 'collectedPeriod', 'quantity', 'method', 'bodySite',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.collector = None
         # reference to Reference: identifier
@@ -248,6 +281,18 @@ class Specimen_Processing(fhirbase):
 
     __name__ = 'Specimen_Processing'
 
+    _types = {
+        'description': 'str',
+        'procedure': 'reference',
+        'additive': 'reference',
+        'timeDateTime': 'str',
+        'timePeriod': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('description', 'procedure', 'additive', 'timeDateTime', 'timePeriod', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.description = None
         # type: str
@@ -315,6 +360,22 @@ class Specimen_Container(fhirbase):
 
     __name__ = 'Specimen_Container'
 
+    _types = {
+        'description': 'str',
+        'type': 'reference',
+        'capacity': 'reference',
+        'specimenQuantity': 'reference',
+        'additiveCodeableConcept': 'reference',
+        'additiveReference': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'description', 'type', 'capacity', 'specimenQuantity', 'additiveCodeableConcept',
+        'additiveReference', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.description = None
         # type: str
@@ -96,6 +96,54 @@ class StructureDefinition(fhirbase):
 
     __name__ = 'StructureDefinition'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+        'kind': ['primitive-type', 'complex-type', 'resource', 'logical'],
+        'contextType': ['resource', 'datatype', 'extension'],
+        'derivation': ['specialization', 'constraint'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'purpose': 'str',
+        'copyright': 'str',
+        'keyword': 'reference',
+        'fhirVersion': 'str',
+        'mapping': 'reference',
+        'kind': 'str',
+        'abstract': 'bool',
+        'contextType': 'str',
+        'context': 'list',
+        'contextInvariant': 'list',
+        'type': 'str',
+        'baseDefinition': 'str',
+        'derivation': 'str',
+        'snapshot': 'reference',
+        'differential': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'contact', 'description', 'useContext', 'jurisdiction', 'purpose',
+        'copyright', 'keyword', 'fhirVersion', 'mapping', 'kind', 'abstract', 'contextType',
+        'context', 'contextInvariant', 'type', 'baseDefinition', 'derivation', 'snapshot',
+        'differential', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'StructureDefinition'
         # type: str
@@ -200,36 +248,6 @@ class StructureDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
-        if self.kind is not None:
-            for value in self.kind:
-                if value is not None and value.lower() not in [
-                        'primitive-type', 'complex-type', 'resource', 'logical']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'primitive-type, complex-type, resource, logical'))
-
-        if self.contextType is not None:
-            for value in self.contextType:
-                if value is not None and value.lower() not in [
-                        'resource', 'datatype', 'extension']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'resource, datatype, extension'))
-
-        if self.derivation is not None:
-            for value in self.derivation:
-                if value is not None and value.lower() not in [
-                        'specialization', 'constraint']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'specialization, constraint'))
-
     def get_relationships(self):
 
         return [
@@ -293,6 +311,17 @@ class StructureDefinition_Mapping(fhirbase):
 
     __name__ = 'StructureDefinition_Mapping'
 
+    _types = {
+        'identity': 'str',
+        'uri': 'str',
+        'name': 'str',
+        'comment': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('identity', 'uri', 'name', 'comment', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.identity = None
         # type: str
@@ -325,6 +354,14 @@ class StructureDefinition_Snapshot(fhirbase):
 
     __name__ = 'StructureDefinition_Snapshot'
 
+    _types = {
+        'element': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('element', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.element = None
         # type: list
@@ -358,6 +395,14 @@ class StructureDefinition_Differential(fhirbase):
 
     __name__ = 'StructureDefinition_Differential'
 
+    _types = {
+        'element': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('element', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.element = None
         # type: list
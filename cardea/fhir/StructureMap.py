@@ -67,6 +67,39 @@ class StructureMap(fhirbase):
 
     __name__ = 'StructureMap'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'purpose': 'str',
+        'copyright': 'str',
+        'structure': 'reference',
+        '_import': 'list',
+        'group': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'contact', 'description', 'useContext', 'jurisdiction', 'purpose',
+        'copyright', 'structure', '_import', 'group', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'StructureMap'
         # type: str
@@ -137,15 +170,6 @@ class StructureMap(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -196,6 +220,21 @@ class StructureMap_Structure(fhirbase):
 
     __name__ = 'StructureMap_Structure'
 
+    _enums = {
+        'mode': ['source', 'queried', 'target', 'produced'],
+    }
+
+    _types = {
+        'url': 'str',
+        'mode': 'str',
+        'alias': 'str',
+        'documentation': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('url', 'mode', 'alias', 'documentation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.url = None
         # type: str
@@ -217,15 +256,6 @@ class StructureMap_Structure(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'source', 'queried', 'target', 'produced']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'source, queried, target, produced'))
-
 
 class StructureMap_Group(fhirbase):
     """
@@ -247,6 +277,23 @@ class StructureMap_Group(fhirbase):
 
     __name__ = 'StructureMap_Group'
 
+    _enums = {
+        'typeMode': ['none', 'types', 'type-and-types'],
+    }
+
+    _types = {
+        'name': 'str',
+        'extends': 'str',
+        'typeMode': 'str',
+        'documentation': 'str',
+        'input': 'reference',
+        'rule': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'extends', 'typeMode', 'documentation', 'input', 'rule', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -276,15 +323,6 @@ class StructureMap_Group(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.typeMode is not None:
-            for value in self.typeMode:
-                if value is not None and value.lower() not in [
-                        'none', 'types', 'type-and-types']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'none, types, type-and-types'))
-
     def get_relationships(self):
 
         return [
@@ -314,6 +352,21 @@ class StructureMap_Input(fhirbase):
 
     __name__ = 'StructureMap_Input'
 
+    _enums = {
+        'mode': ['source', 'target'],
+    }
+
+    _types = {
+        'name': 'str',
+        'type': 'str',
+        'mode': 'str',
+        'documentation': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'type', 'mode', 'documentation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -335,15 +388,6 @@ class StructureMap_Input(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.mode is not None:
-            for value in self.mode:
-                if value is not None and value.lower() not in [
-                        'source', 'target']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'source, target'))
-
 
 class StructureMap_Rule(fhirbase):
     """
@@ -361,6 +405,19 @@ class StructureMap_Rule(fhirbase):
 
     __name__ = 'StructureMap_Rule'
 
+    _types = {
+        'name': 'str',
+        'source': 'reference',
+        'target': 'reference',
+        'rule': 'reference',
+        'dependent': 'reference',
+        'documentation': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'source', 'target', 'rule', 'dependent', 'documentation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -547,6 +604,99 @@ class StructureMap_Source(fhirbase):
 
     __name__ = 'StructureMap_Source'
 
+    _enums = {
+        'listMode': ['first', 'not_first', 'last', 'not_last', 'only_one'],
+    }
+
+    _types = {
+        'context': 'str',
+        'min': 'int',
+        'max': 'str',
+        'type': 'str',
+        'defaultValueBoolean': 'bool',
+        'defaultValueInteger': 'int',
+        'defaultValueDecimal': 'int',
+        'defaultValueBase64Binary': 'str',
+        'defaultValueInstant': 'str',
+        'defaultValueString': 'str',
+        'defaultValueUri': 'str',
+        'defaultValueDate': 'str',
+        'defaultValueDateTime': 'str',
+        'defaultValueTime': 'str',
+        'defaultValueCode': 'str',
+        'defaultValueOid': 'str',
+        'defaultValueUuid': 'str',
+        'defaultValueId': 'str',
+        'defaultValueUnsignedInt': 'int',
+        'defaultValuePositiveInt': 'int',
+        'defaultValueMarkdown': 'str',
+        'defaultValueElement': 'reference',
+        'defaultValueExtension': 'reference',
+        'defaultValueBackboneElement': 'reference',
+        'defaultValueNarrative': 'reference',
+        'defaultValueAnnotation': 'reference',
+        'defaultValueAttachment': 'reference',
+        'defaultValueIdentifier': 'reference',
+        'defaultValueCodeableConcept': 'reference',
+        'defaultValueCoding': 'reference',
+        'defaultValueQuantity': 'reference',
+        'defaultValueDuration': 'reference',
+        'defaultValueSimpleQuantity': 'reference',
+        'defaultValueDistance': 'reference',
+        'defaultValueCount': 'reference',
+        'defaultValueMoney': 'reference',
+        'defaultValueAge': 'reference',
+        'defaultValueRange': 'reference',
+        'defaultValuePeriod': 'reference',
+        'defaultValueRatio': 'reference',
+        'defaultValueReference': 'reference',
+        'defaultValueSampledData': 'reference',
+        'defaultValueSignature': 'reference',
+        'defaultValueHumanName': 'reference',
+        'defaultValueAddress': 'reference',
+        'defaultValueContactPoint': 'reference',
+        'defaultValueTiming': 'reference',
+        'defaultValueMeta': 'reference',
+        'defaultValueElementDefinition': 'reference',
+        'defaultValueContactDetail': 'reference',
+        'defaultValueContributor': 'reference',
+        'defaultValueDosage': 'reference',
+        'defaultValueRelatedArtifact': 'reference',
+        'defaultValueUsageContext': 'reference',
+        'defaultValueDataRequirement': 'reference',
+        'defaultValueParameterDefinition': 'reference',
+        'defaultValueTriggerDefinition': 'reference',
+        'element': 'str',
+        'listMode': 'str',
+        'variable': 'str',
+        'condition': 'str',
+        'check': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'context', 'min', 'max', 'type', 'defaultValueBoolean', 'defaultValueInteger',
+        'defaultValueDecimal', 'defaultValueBase64Binary', 'defaultValueInstant',
+        'defaultValueString', 'defaultValueUri', 'defaultValueDate', 'defaultValueDateTime',
+        'defaultValueTime', 'defaultValueCode', 'defaultValueOid', 'defaultValueUuid',
+        'defaultValueId', 'defaultValueUnsignedInt', 'defaultValuePositiveInt',
+        'defaultValueMarkdown', 'defaultValueElement', 'defaultValueExtension',
+        'defaultValueBackboneElement', 'defaultValueNarrative', 'defaultValueAnnotation',
+        'defaultValueAttachment', 'defaultValueIdentifier', 'defaultValueCodeableConcept',
+        'defaultValueCoding', 'defaultValueQuantity', 'defaultValueDuration',
+        'defaultValueSimpleQuantity', 'defaultValueDistance', 'defaultValueCount',
+        'defaultValueMoney', 'defaultValueAge', 'defaultValueRange', 'defaultValuePeriod',
+        'defaultValueRatio', 'defaultValueReference', 'defaultValueSampledData',
+        'defaultValueSignature', 'defaultValueHumanName', 'defaultValueAddress',
+        'defaultValueContactPoint', 'defaultValueTiming', 'defaultValueMeta',
+        'defaultValueElementDefinition', 'defaultValueContactDetail', 'defaultValueContributor',
+        'defaultValueDosage', 'defaultValueRelatedArtifact', 'defaultValueUsageContext',
+        'defaultValueDataRequirement', 'defaultValueParameterDefinition',
+        'defaultValueTriggerDefinition', 'element', 'listMode', 'variable', 'condition', 'check',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.context = None
         # type: str
@@ -742,15 +892,6 @@ class StructureMap_Source(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.listMode is not None:
-            for value in self.listMode:
-                if value is not None and value.lower() not in [
-                        'first', 'not_first', 'last', 'not_last', 'only_one']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'first, not_first, last, not_last, only_one'))
-
     def get_relationships(self):
 
         return [
@@ -955,6 +1096,33 @@ class StructureMap_Target(fhirbase):
 
     __name__ = 'StructureMap_Target'
 
+    _enums = {
+        'contextType': ['type', 'variable'],
+        'listMode': ['first', 'share', 'last', 'collate'],
+        'transform': [
+            'create', 'copy', 'truncate', 'escape', 'cast', 'append', 'translate', 'reference',
+            'dateop', 'uuid', 'pointer', 'evaluate', 'cc', 'c', 'qty', 'id', 'cp'
+        ],
+    }
+
+    _types = {
+        'context': 'str',
+        'contextType': 'str',
+        'element': 'str',
+        'variable': 'str',
+        'listMode': 'list',
+        'listRuleId': 'str',
+        'transform': 'str',
+        'parameter': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'context', 'contextType', 'element', 'variable', 'listMode', 'listRuleId', 'transform',
+        'parameter', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.context = None
         # type: str
@@ -993,56 +1161,6 @@ class StructureMap_Target(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.contextType is not None:
-            for value in self.contextType:
-                if value is not None and value.lower() not in [
-                        'type', 'variable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'type, variable'))
-
-        if self.listMode is not None:
-            for value in self.listMode:
-                if value is not None and value.lower() not in [
-                        'first', 'share', 'last', 'collate']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'first, share, last, collate'))
-
-        if self.transform is not None:
-            for value in self.transform:
-                if value is not None and value.lower() not in [
-                    'create', 'copy', 'truncate', 'escape', 'cast', 'append', 'translate',
-                    'reference', 'dateop', 'uuid', 'pointer', 'evaluate', 'cc', 'c',
-                        'qty', 'id', 'cp']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'create, copy, truncate, escape, cast, append, translate, '
-                        'reference, dateOp, uuid, pointer, evaluate, cc, c, qty, id, cp'))
-
-        if self.contextType is not None:
-            for value in self.contextType:
-                if value is not None and value.lower() not in [
-                        'type', 'variable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'type, variable'))
-
-        if self.listMode is not None:
-            for value in self.listMode:
-                if value is not None and value.lower() not in [
-                        'first', 'share', 'last', 'collate']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'first, share, last, collate'))
-
-        if self.transform is not None:
-            for value in self.transform:
-                if value is not None and value.lower() not in [
-                    'create', 'copy', 'truncate', 'escape', 'cast', 'append', 'translate',
-                    'reference', 'dateop', 'uuid', 'pointer', 'evaluate', 'cc', 'c',
-                        'qty', 'id', 'cp']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'create, copy, truncate, escape, cast, append, translate, '
-                        'reference, dateOp, uuid, pointer, evaluate, cc, c, qty, id, cp'))
-
     def get_relationships(self):
 
         return [
@@ -1068,6 +1186,20 @@ class StructureMap_Parameter(fhirbase):
 
     __name__ = 'StructureMap_Parameter'
 
+    _types = {
+        'valueId': 'str',
+        'valueString': 'str',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'valueId', 'valueString', 'valueBoolean', 'valueInteger', 'valueDecimal', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.valueId = None
         # type: str
@@ -1103,6 +1235,15 @@ class StructureMap_Dependent(fhirbase):
 
     __name__ = 'StructureMap_Dependent'
 
+    _types = {
+        'name': 'str',
+        'variable': 'list',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'variable', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -31,6 +31,29 @@ class Subscription(fhirbase):
 
     __name__ = 'Subscription'
 
+    _enums = {
+        'status': ['requested', 'active', 'error', 'off'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'contact': 'reference',
+        'end': 'str',
+        'reason': 'str',
+        'criteria': 'str',
+        'error': 'str',
+        'channel': 'reference',
+        'tag': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'contact', 'end', 'reason', 'criteria', 'error', 'channel',
+        'tag', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Subscription'
         # type: str
@@ -70,15 +93,6 @@ class Subscription(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'requested', 'active', 'error', 'off']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'requested, active, error, off'))
-
     def get_relationships(self):
 
         return [
@@ -122,6 +136,21 @@ class Subscription_Channel(fhirbase):
 
     __name__ = 'Subscription_Channel'
 
+    _enums = {
+        'type': ['rest-hook', 'websocket', 'email', 'sms', 'message'],
+    }
+
+    _types = {
+        'type': 'str',
+        'endpoint': 'str',
+        'payload': 'str',
+        'header': 'list',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'endpoint', 'payload', 'header', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -142,12 +171,3 @@ class Subscription_Channel(fhirbase):
         if dict_values:
             self.set_attributes(dict_values)
             self.assert_type()
-
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'rest-hook', 'websocket', 'email', 'sms', 'message']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'rest-hook, websocket, email, sms, message'))
@@ -21,6 +21,27 @@ class Substance(fhirbase):
 
     __name__ = 'Substance'
 
+    _enums = {
+        'status': ['active', 'inactive', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'category': 'reference',
+        'code': 'reference',
+        'description': 'str',
+        'instance': 'reference',
+        'ingredient': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'category', 'code', 'description', 'instance', 'ingredient',
+        'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Substance'
         # type: str
@@ -56,15 +77,6 @@ class Substance(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'active', 'inactive', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'active, inactive, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -109,6 +121,15 @@ class Substance_Instance(fhirbase):
 
     __name__ = 'Substance_Instance'
 
+    _types = {
+        'expiry': 'str',
+        'quantity': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = ('expiry', 'quantity', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.expiry = None
         # type: str
@@ -152,6 +173,16 @@ class Substance_Ingredient(fhirbase):
 
     __name__ = 'Substance_Ingredient'
 
+    _types = {
+        'quantity': 'reference',
+        'substanceCodeableConcept': 'reference',
+        'substanceReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('quantity', 'substanceCodeableConcept', 'substanceReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.quantity = None
         # reference to Ratio
@@ -32,6 +32,34 @@ class SupplyDelivery(fhirbase):
 
     __name__ = 'SupplyDelivery'
 
+    _enums = {
+        'status': ['in-progress', 'completed', 'abandoned', 'entered-in-error'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'basedOn': 'reference',
+        'partOf': 'reference',
+        'status': 'str',
+        'patient': 'reference',
+        'type': 'reference',
+        'suppliedItem': 'reference',
+        'occurrenceDateTime': 'str',
+        'occurrencePeriod': 'reference',
+        'occurrenceTiming': 'reference',
+        'supplier': 'reference',
+        'destination': 'reference',
+        'receiver': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'basedOn', 'partOf', 'status', 'patient', 'type', 'suppliedItem',
+        'occurrenceDateTime', 'occurrencePeriod', 'occurrenceTiming', 'supplier', 'destination',
+        'receiver', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'SupplyDelivery'
         # type: str
@@ -85,15 +113,6 @@ class SupplyDelivery(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'in-progress', 'completed', 'abandoned', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'in-progress, completed, abandoned, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -173,6 +192,16 @@ class SupplyDelivery_SuppliedItem(fhirbase):
 
     __name__ = 'SupplyDelivery_SuppliedItem'
 
+    _types = {
+        'quantity': 'reference',
+        'itemCodeableConcept': 'reference',
+        'itemReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('quantity', 'itemCodeableConcept', 'itemReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.quantity = None
         # reference to Quantity
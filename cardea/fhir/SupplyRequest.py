@@ -30,6 +30,38 @@ class SupplyRequest(fhirbase):
 
     __name__ = 'SupplyRequest'
 
+    _enums = {
+        'status': [
+            'draft', 'active', 'suspended', 'cancelled', 'completed', 'entered-in-error', 'unknown'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'category': 'reference',
+        'priority': 'str',
+        'orderedItem': 'reference',
+        'occurrenceDateTime': 'str',
+        'occurrencePeriod': 'reference',
+        'occurrenceTiming': 'reference',
+        'authoredOn': 'str',
+        'requester': 'reference',
+        'supplier': 'reference',
+        'reasonCodeableConcept': 'reference',
+        'reasonReference': 'reference',
+        'deliverFrom': 'reference',
+        'deliverTo': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'category', 'priority', 'orderedItem', 'occurrenceDateTime',
+        'occurrencePeriod', 'occurrenceTiming', 'authoredOn', 'requester', 'supplier',
+        'reasonCodeableConcept', 'reasonReference', 'deliverFrom', 'deliverTo', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'SupplyRequest'
         # type: str
@@ -87,17 +119,6 @@ class SupplyRequest(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'draft', 'active', 'suspended', 'cancelled', 'completed',
-                        'entered-in-error', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, suspended, cancelled, completed, entered-in-error,'
-                        'unknown'))
-
     def get_relationships(self):
 
         return [
@@ -175,6 +196,16 @@ class SupplyRequest_OrderedItem(fhirbase):
 
     __name__ = 'SupplyRequest_OrderedItem'
 
+    _types = {
+        'quantity': 'reference',
+        'itemCodeableConcept': 'reference',
+        'itemReference': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('quantity', 'itemCodeableConcept', 'itemReference', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.quantity = None
         # reference to Quantity
@@ -224,6 +255,15 @@ class SupplyRequest_Requester(fhirbase):
 
     __name__ = 'SupplyRequest_Requester'
 
+    _types = {
+        'agent': 'reference',
+        'onBehalfOf': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('agent', 'onBehalfOf', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.agent = None
         # reference to Reference: identifier
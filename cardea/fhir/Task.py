@@ -70,6 +70,54 @@ class Task(fhirbase):
 
     __name__ = 'Task'
 
+    _enums = {
+        'status': [
+            'draft', 'requested', 'received', 'accepted', 'rejected', 'ready', 'cancelled',
+            'in-progress', 'on-hold', 'failed', 'completed', 'entered-in-error'
+        ],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'definitionUri': 'str',
+        'definitionReference': 'reference',
+        'basedOn': 'reference',
+        'groupIdentifier': 'reference',
+        'partOf': 'reference',
+        'status': 'str',
+        'statusReason': 'reference',
+        'businessStatus': 'reference',
+        'intent': 'str',
+        'priority': 'str',
+        'code': 'reference',
+        'description': 'str',
+        'focus': 'reference',
+        '_for': 'reference',
+        'context': 'reference',
+        'executionPeriod': 'reference',
+        'authoredOn': 'str',
+        'lastModified': 'str',
+        'requester': 'reference',
+        'performerType': 'reference',
+        'owner': 'reference',
+        'reason': 'reference',
+        'note': 'reference',
+        'relevantHistory': 'reference',
+        'restriction': 'reference',
+        'input': 'reference',
+        'output': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'definitionUri', 'definitionReference', 'basedOn', 'groupIdentifier',
+        'partOf', 'status', 'statusReason', 'businessStatus', 'intent', 'priority', 'code',
+        'description', 'focus', '_for', 'context', 'executionPeriod', 'authoredOn', 'lastModified',
+        'requester', 'performerType', 'owner', 'reason', 'note', 'relevantHistory', 'restriction',
+        'input', 'output', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'Task'
         # type: str
@@ -174,18 +222,6 @@ class Task(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                    'draft', 'requested', 'received', 'accepted', 'rejected', 'ready',
-                    'cancelled', 'in-progress', 'on-hold', 'failed', 'completed',
-                        'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, requested, received, accepted, rejected, ready, cancelled,'
-                        'in-progress, on-hold, failed, completed, entered-in-error'))
-
     def get_relationships(self):
 
         return [
@@ -308,6 +344,15 @@ class Task_Requester(fhirbase):
 
     __name__ = 'Task_Requester'
 
+    _types = {
+        'agent': 'reference',
+        'onBehalfOf': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('agent', 'onBehalfOf', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.agent = None
         # reference to Reference: identifier
@@ -350,6 +395,16 @@ class Task_Restriction(fhirbase):
 
     __name__ = 'Task_Restriction'
 
+    _types = {
+        'repetitions': 'int',
+        'period': 'reference',
+        'recipient': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('repetitions', 'period', 'recipient', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.repetitions = None
         # type: int
@@ -453,6 +508,80 @@ class Task_Input(fhirbase):
 
     __name__ = 'Task_Input'
 
+    _types = {
+        'type': 'reference',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueBase64Binary': 'str',
+        'valueInstant': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueCode': 'str',
+        'valueOid': 'str',
+        'valueUuid': 'str',
+        'valueId': 'str',
+        'valueUnsignedInt': 'int',
+        'valuePositiveInt': 'int',
+        'valueMarkdown': 'str',
+        'valueElement': 'reference',
+        'valueExtension': 'reference',
+        'valueBackboneElement': 'reference',
+        'valueNarrative': 'reference',
+        'valueAnnotation': 'reference',
+        'valueAttachment': 'reference',
+        'valueIdentifier': 'reference',
+        'valueCodeableConcept': 'reference',
+        'valueCoding': 'reference',
+        'valueQuantity': 'reference',
+        'valueDuration': 'reference',
+        'valueSimpleQuantity': 'reference',
+        'valueDistance': 'reference',
+        'valueCount': 'reference',
+        'valueMoney': 'reference',
+        'valueAge': 'reference',
+        'valueRange': 'reference',
+        'valuePeriod': 'reference',
+        'valueRatio': 'reference',
+        'valueReference': 'reference',
+        'valueSampledData': 'reference',
+        'valueSignature': 'reference',
+        'valueHumanName': 'reference',
+        'valueAddress': 'reference',
+        'valueContactPoint': 'reference',
+        'valueTiming': 'reference',
+        'valueMeta': 'reference',
+        'valueElementDefinition': 'reference',
+        'valueContactDetail': 'reference',
+        'valueContributor': 'reference',
+        'valueDosage': 'reference',
+        'valueRelatedArtifact': 'reference',
+        'valueUsageContext': 'reference',
+        'valueDataRequirement': 'reference',
+        'valueParameterDefinition': 'reference',
+        'valueTriggerDefinition': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'type', 'valueBoolean', 'valueInteger', 'valueDecimal', 'valueBase64Binary',
+        'valueInstant', 'valueString', 'valueUri', 'valueDate', 'valueDateTime', 'valueTime',
+        'valueCode', 'valueOid', 'valueUuid', 'valueId', 'valueUnsignedInt', 'valuePositiveInt',
+        'valueMarkdown', 'valueElement', 'valueExtension', 'valueBackboneElement',
+        'valueNarrative', 'valueAnnotation', 'valueAttachment', 'valueIdentifier',
+        'valueCodeableConcept', 'valueCoding', 'valueQuantity', 'valueDuration',
+        'valueSimpleQuantity', 'valueDistance', 'valueCount', 'valueMoney', 'valueAge',
+        'valueRange', 'valuePeriod', 'valueRatio', 'valueReference', 'valueSampledData',
+        'valueSignature', 'valueHumanName', 'valueAddress', 'valueContactPoint', 'valueTiming',
+        'valueMeta', 'valueElementDefinition', 'valueContactDetail', 'valueContributor',
+        'valueDosage', 'valueRelatedArtifact', 'valueUsageContext', 'valueDataRequirement',
+        'valueParameterDefinition', 'valueTriggerDefinition', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
@@ -883,6 +1012,80 @@ class Task_Output(fhirbase):
 
     __name__ = 'Task_Output'
 
+    _types = {
+        'type': 'reference',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueBase64Binary': 'str',
+        'valueInstant': 'str',
+        'valueString': 'str',
+        'valueUri': 'str',
+        'valueDate': 'str',
+        'valueDateTime': 'str',
+        'valueTime': 'str',
+        'valueCode': 'str',
+        'valueOid': 'str',
+        'valueUuid': 'str',
+        'valueId': 'str',
+        'valueUnsignedInt': 'int',
+        'valuePositiveInt': 'int',
+        'valueMarkdown': 'str',
+        'valueElement': 'reference',
+        'valueExtension': 'reference',
+        'valueBackboneElement': 'reference',
+        'valueNarrative': 'reference',
+        'valueAnnotation': 'reference',
+        'valueAttachment': 'reference',
+        'valueIdentifier': 'reference',
+        'valueCodeableConcept': 'reference',
+        'valueCoding': 'reference',
+        'valueQuantity': 'reference',
+        'valueDuration': 'reference',
+        'valueSimpleQuantity': 'reference',
+        'valueDistance': 'reference',
+        'valueCount': 'reference',
+        'valueMoney': 'reference',
+        'valueAge': 'reference',
+        'valueRange': 'reference',
+        'valuePeriod': 'reference',
+        'valueRatio': 'reference',
+        'valueReference': 'reference',
+        'valueSampledData': 'reference',
+        'valueSignature': 'reference',
+        'valueHumanName': 'reference',
+        'valueAddress': 'reference',
+        'valueContactPoint': 'reference',
+        'valueTiming': 'reference',
+        'valueMeta': 'reference',
+        'valueElementDefinition': 'reference',
+        'valueContactDetail': 'reference',
+        'valueContributor': 'reference',
+        'valueDosage': 'reference',
+        'valueRelatedArtifact': 'reference',
+        'valueUsageContext': 'reference',
+        'valueDataRequirement': 'reference',
+        'valueParameterDefinition': 'reference',
+        'valueTriggerDefinition': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'type', 'valueBoolean', 'valueInteger', 'valueDecimal', 'valueBase64Binary',
+        'valueInstant', 'valueString', 'valueUri', 'valueDate', 'valueDateTime', 'valueTime',
+        'valueCode', 'valueOid', 'valueUuid', 'valueId', 'valueUnsignedInt', 'valuePositiveInt',
+        'valueMarkdown', 'valueElement', 'valueExtension', 'valueBackboneElement',
+        'valueNarrative', 'valueAnnotation', 'valueAttachment', 'valueIdentifier',
+        'valueCodeableConcept', 'valueCoding', 'valueQuantity', 'valueDuration',
+        'valueSimpleQuantity', 'valueDistance', 'valueCount', 'valueMoney', 'valueAge',
+        'valueRange', 'valuePeriod', 'valueRatio', 'valueReference', 'valueSampledData',
+        'valueSignature', 'valueHumanName', 'valueAddress', 'valueContactPoint', 'valueTiming',
+        'valueMeta', 'valueElementDefinition', 'valueContactDetail', 'valueContributor',
+        'valueDosage', 'valueRelatedArtifact', 'valueUsageContext', 'valueDataRequirement',
+        'valueParameterDefinition', 'valueTriggerDefinition', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to CodeableConcept
@@ -34,6 +34,33 @@ class TestReport(fhirbase):
 
     __name__ = 'TestReport'
 
+    _enums = {
+        'status': ['completed', 'in-progress', 'waiting', 'stopped', 'entered-in-error'],
+        'result': ['pass', 'fail', 'pending'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'name': 'str',
+        'status': 'str',
+        'testScript': 'reference',
+        'result': 'str',
+        'score': 'int',
+        'tester': 'str',
+        'issued': 'str',
+        'participant': 'reference',
+        'setup': 'reference',
+        'test': 'reference',
+        'teardown': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'name', 'status', 'testScript', 'result', 'score', 'tester', 'issued',
+        'participant', 'setup', 'test', 'teardown', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'TestReport'
         # type: str
@@ -84,22 +111,6 @@ class TestReport(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'completed', 'in-progress', 'waiting', 'stopped', 'entered-in-error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'completed, in-progress, waiting, stopped, entered-in-error'))
-
-        if self.result is not None:
-            for value in self.result:
-                if value is not None and value.lower() not in [
-                        'pass', 'fail', 'pending']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'pass, fail, pending'))
-
     def get_relationships(self):
 
         return [
@@ -148,6 +159,20 @@ class TestReport_Participant(fhirbase):
 
     __name__ = 'TestReport_Participant'
 
+    _enums = {
+        'type': ['test-engine', 'client', 'server'],
+    }
+
+    _types = {
+        'type': 'str',
+        'uri': 'str',
+        'display': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('type', 'uri', 'display', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -166,15 +191,6 @@ class TestReport_Participant(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                        'test-engine', 'client', 'server']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'test-engine, client, server'))
-
 
 class TestReport_Setup(fhirbase):
     """
@@ -187,6 +203,14 @@ class TestReport_Setup(fhirbase):
 
     __name__ = 'TestReport_Setup'
 
+    _types = {
+        'action': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('action', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.action = None
         # type: list
@@ -221,6 +245,15 @@ class TestReport_Action(fhirbase):
 
     __name__ = 'TestReport_Action'
 
+    _types = {
+        'operation': 'reference',
+        '_assert': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('operation', '_assert', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.operation = None
         # reference to TestReport_Operation
@@ -262,6 +295,20 @@ class TestReport_Operation(fhirbase):
 
     __name__ = 'TestReport_Operation'
 
+    _enums = {
+        'result': ['pass', 'skip', 'fail', 'warning', 'error'],
+    }
+
+    _types = {
+        'result': 'str',
+        'message': 'str',
+        'detail': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('result', 'message', 'detail', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.result = None
         # type: str
@@ -280,15 +327,6 @@ class TestReport_Operation(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.result is not None:
-            for value in self.result:
-                if value is not None and value.lower() not in [
-                        'pass', 'skip', 'fail', 'warning', 'error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'pass, skip, fail, warning, error'))
-
 
 class TestReport_Assert(fhirbase):
     """
@@ -303,6 +341,20 @@ class TestReport_Assert(fhirbase):
 
     __name__ = 'TestReport_Assert'
 
+    _enums = {
+        'result': ['pass', 'skip', 'fail', 'warning', 'error'],
+    }
+
+    _types = {
+        'result': 'str',
+        'message': 'str',
+        'detail': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('result', 'message', 'detail', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.result = None
         # type: str
@@ -321,15 +373,6 @@ class TestReport_Assert(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.result is not None:
-            for value in self.result:
-                if value is not None and value.lower() not in [
-                        'pass', 'skip', 'fail', 'warning', 'error']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'pass, skip, fail, warning, error'))
-
 
 class TestReport_Test(fhirbase):
     """
@@ -346,6 +389,16 @@ class TestReport_Test(fhirbase):
 
     __name__ = 'TestReport_Test'
 
+    _types = {
+        'name': 'str',
+        'description': 'str',
+        'action': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'description', 'action', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -386,6 +439,15 @@ class TestReport_Action1(fhirbase):
 
     __name__ = 'TestReport_Action1'
 
+    _types = {
+        'operation': 'reference',
+        '_assert': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('operation', '_assert', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.operation = None
         # reference to TestReport_Operation
@@ -425,6 +487,14 @@ class TestReport_Teardown(fhirbase):
 
     __name__ = 'TestReport_Teardown'
 
+    _types = {
+        'action': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('action', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.action = None
         # type: list
@@ -457,6 +527,14 @@ class TestReport_Action2(fhirbase):
 
     __name__ = 'TestReport_Action2'
 
+    _types = {
+        'operation': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('operation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.operation = None
         # reference to TestReport_Operation
@@ -79,6 +79,48 @@ class TestScript(fhirbase):
 
     __name__ = 'TestScript'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'purpose': 'str',
+        'copyright': 'str',
+        'origin': 'reference',
+        'destination': 'reference',
+        'metadata': 'reference',
+        'fixture': 'reference',
+        'profile': 'reference',
+        'variable': 'reference',
+        'rule': 'reference',
+        'ruleset': 'reference',
+        'setup': 'reference',
+        'test': 'reference',
+        'teardown': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'contact', 'description', 'useContext', 'jurisdiction', 'purpose',
+        'copyright', 'origin', 'destination', 'metadata', 'fixture', 'profile', 'variable', 'rule',
+        'ruleset', 'setup', 'test', 'teardown', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'TestScript'
         # type: str
@@ -178,15 +220,6 @@ class TestScript(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -280,6 +313,15 @@ class TestScript_Origin(fhirbase):
 
     __name__ = 'TestScript_Origin'
 
+    _types = {
+        'index': 'int',
+        'profile': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('index', 'profile', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.index = None
         # type: int
@@ -316,6 +358,15 @@ class TestScript_Destination(fhirbase):
 
     __name__ = 'TestScript_Destination'
 
+    _types = {
+        'index': 'int',
+        'profile': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('index', 'profile', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.index = None
         # type: int
@@ -352,6 +403,15 @@ class TestScript_Metadata(fhirbase):
 
     __name__ = 'TestScript_Metadata'
 
+    _types = {
+        'link': 'reference',
+        'capability': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('link', 'capability', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.link = None
         # type: list
@@ -395,6 +455,15 @@ class TestScript_Link(fhirbase):
 
     __name__ = 'TestScript_Link'
 
+    _types = {
+        'url': 'str',
+        'description': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('url', 'description', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.url = None
         # type: str
@@ -433,6 +502,23 @@ class TestScript_Capability(fhirbase):
 
     __name__ = 'TestScript_Capability'
 
+    _types = {
+        'required': 'bool',
+        'validated': 'bool',
+        'description': 'str',
+        'origin': 'list',
+        'destination': 'int',
+        'link': 'list',
+        'capabilities': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'required', 'validated', 'description', 'origin', 'destination', 'link', 'capabilities',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.required = None
         # type: bool
@@ -491,6 +577,16 @@ class TestScript_Fixture(fhirbase):
 
     __name__ = 'TestScript_Fixture'
 
+    _types = {
+        'autocreate': 'bool',
+        'autodelete': 'bool',
+        'resource': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('autocreate', 'autodelete', 'resource', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.autocreate = None
         # type: bool
@@ -544,6 +640,24 @@ class TestScript_Variable(fhirbase):
 
     __name__ = 'TestScript_Variable'
 
+    _types = {
+        'name': 'str',
+        'defaultValue': 'str',
+        'description': 'str',
+        'expression': 'str',
+        'headerField': 'str',
+        'hint': 'str',
+        'path': 'str',
+        'sourceId': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'name', 'defaultValue', 'description', 'expression', 'headerField', 'hint', 'path',
+        'sourceId', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -590,6 +704,15 @@ class TestScript_Rule(fhirbase):
 
     __name__ = 'TestScript_Rule'
 
+    _types = {
+        'resource': 'reference',
+        'param': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('resource', 'param', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resource = None
         # reference to Reference: identifier
@@ -633,6 +756,15 @@ class TestScript_Param(fhirbase):
 
     __name__ = 'TestScript_Param'
 
+    _types = {
+        'name': 'str',
+        'value': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -660,6 +792,15 @@ class TestScript_Ruleset(fhirbase):
 
     __name__ = 'TestScript_Ruleset'
 
+    _types = {
+        'resource': 'reference',
+        'rule': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('resource', 'rule', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resource = None
         # reference to Reference: identifier
@@ -703,6 +844,15 @@ class TestScript_Rule1(fhirbase):
 
     __name__ = 'TestScript_Rule1'
 
+    _types = {
+        'ruleId': 'str',
+        'param': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('ruleId', 'param', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.ruleId = None
         # type: str
@@ -741,6 +891,15 @@ class TestScript_Param1(fhirbase):
 
     __name__ = 'TestScript_Param1'
 
+    _types = {
+        'name': 'str',
+        'value': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -766,6 +925,14 @@ class TestScript_Setup(fhirbase):
 
     __name__ = 'TestScript_Setup'
 
+    _types = {
+        'action': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('action', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.action = None
         # type: list
@@ -800,6 +967,15 @@ class TestScript_Action(fhirbase):
 
     __name__ = 'TestScript_Action'
 
+    _types = {
+        'operation': 'reference',
+        '_assert': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('operation', '_assert', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.operation = None
         # reference to TestScript_Operation
@@ -868,6 +1044,38 @@ class TestScript_Operation(fhirbase):
 
     __name__ = 'TestScript_Operation'
 
+    _enums = {
+        'accept': ['xml', 'json', 'ttl', 'none'],
+        'contentType': ['xml', 'json', 'ttl', 'none'],
+    }
+
+    _types = {
+        'type': 'reference',
+        'resource': 'str',
+        'label': 'str',
+        'description': 'str',
+        'accept': 'str',
+        'contentType': 'str',
+        'destination': 'int',
+        'encodeRequestUrl': 'bool',
+        'origin': 'int',
+        'params': 'str',
+        'requestHeader': 'reference',
+        'requestId': 'str',
+        'responseId': 'str',
+        'sourceId': 'str',
+        'targetId': 'str',
+        'url': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'type', 'resource', 'label', 'description', 'accept', 'contentType', 'destination',
+        'encodeRequestUrl', 'origin', 'params', 'requestHeader', 'requestId', 'responseId',
+        'sourceId', 'targetId', 'url', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # reference to Coding
@@ -927,50 +1135,6 @@ class TestScript_Operation(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.accept is not None:
-            for value in self.accept:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.contentType is not None:
-            for value in self.contentType:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.accept is not None:
-            for value in self.accept:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.contentType is not None:
-            for value in self.contentType:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.accept is not None:
-            for value in self.accept:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.contentType is not None:
-            for value in self.contentType:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
     def get_relationships(self):
 
         return [
@@ -998,6 +1162,15 @@ class TestScript_RequestHeader(fhirbase):
 
     __name__ = 'TestScript_RequestHeader'
 
+    _types = {
+        'field': 'str',
+        'value': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('field', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.field = None
         # type: str
@@ -1069,6 +1242,57 @@ class TestScript_Assert(fhirbase):
 
     __name__ = 'TestScript_Assert'
 
+    _enums = {
+        'direction': ['response', 'request'],
+        'contentType': ['xml', 'json', 'ttl', 'none'],
+        'operator': [
+            'equals', 'notequals', 'in', 'notin', 'greaterthan', 'lessthan', 'empty', 'notempty',
+            'contains', 'notcontains', 'eval'
+        ],
+        'requestMethod': ['delete', 'get', 'options', 'patch', 'post', 'put'],
+        'response': [
+            'okay', 'created', 'nocontent', 'notmodified', 'bad', 'forbidden', 'notfound',
+            'methodnotallowed', 'conflict', 'gone', 'preconditionfailed', 'unprocessable'
+        ],
+    }
+
+    _types = {
+        'label': 'str',
+        'description': 'str',
+        'direction': 'str',
+        'compareToSourceId': 'str',
+        'compareToSourceExpression': 'str',
+        'compareToSourcePath': 'str',
+        'contentType': 'str',
+        'expression': 'str',
+        'headerField': 'str',
+        'minimumId': 'str',
+        'navigationLinks': 'bool',
+        'operator': 'str',
+        'path': 'str',
+        'requestMethod': 'str',
+        'requestURL': 'str',
+        'resource': 'str',
+        'response': 'str',
+        'responseCode': 'str',
+        'rule': 'reference',
+        'ruleset': 'reference',
+        'sourceId': 'str',
+        'validateProfileId': 'str',
+        'value': 'str',
+        'warningOnly': 'bool',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'label', 'description', 'direction', 'compareToSourceId', 'compareToSourceExpression',
+        'compareToSourcePath', 'contentType', 'expression', 'headerField', 'minimumId',
+        'navigationLinks', 'operator', 'path', 'requestMethod', 'requestURL', 'resource',
+        'response', 'responseCode', 'rule', 'ruleset', 'sourceId', 'validateProfileId', 'value',
+        'warningOnly', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.label = None
         # type: str
@@ -1157,88 +1381,6 @@ class TestScript_Assert(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.direction is not None:
-            for value in self.direction:
-                if value is not None and value.lower() not in [
-                        'response', 'request']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'response, request'))
-
-        if self.contentType is not None:
-            for value in self.contentType:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.operator is not None:
-            for value in self.operator:
-                if value is not None and value.lower() not in [
-                    'equals', 'notequals', 'in', 'notin', 'greaterthan', 'lessthan',
-                        'empty', 'notempty', 'contains', 'notcontains', 'eval']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'equals, notEquals, in, notIn, greaterThan, lessThan, empty,'
-                        ' notEmpty, contains, notContains, eval'))
-
-        if self.requestMethod is not None:
-            for value in self.requestMethod:
-                if value is not None and value.lower() not in [
-                        'delete', 'get', 'options', 'patch', 'post', 'put']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'delete, get, options, patch, post, put'))
-
-        if self.response is not None:
-            for value in self.response:
-                if value is not None and value.lower() not in [
-                    'okay', 'created', 'nocontent', 'notmodified', 'bad', 'forbidden',
-                    'notfound', 'methodnotallowed', 'conflict', 'gone',
-                        'preconditionfailed', 'unprocessable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'okay, created, noContent, notModified, bad, forbidden, notFound,'
-                        'methodNotAllowed, conflict, gone, preconditionFailed, unprocessable'))
-
-        if self.direction is not None:
-            for value in self.direction:
-                if value is not None and value.lower() not in [
-                        'response', 'request']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'response, request'))
-
-        if self.contentType is not None:
-            for value in self.contentType:
-                if value is not None and value.lower() not in [
-                        'xml', 'json', 'ttl', 'none']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'xml, json, ttl, none'))
-
-        if self.operator is not None:
-            for value in self.operator:
-                if value is not None and value.lower() not in [
-                    'equals', 'notequals', 'in', 'notin', 'greaterthan', 'lessthan',
-                        'empty', 'notempty', 'contains', 'notcontains', 'eval']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'equals, notEquals, in, notIn, greaterThan, lessThan, empty,'
-                        ' notEmpty, contains, notContains, eval'))
-
-        if self.requestMethod is not None:
-            for value in self.requestMethod:
-                if value is not None and value.lower() not in [
-                        'delete', 'get', 'options', 'patch', 'post', 'put']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'delete, get, options, patch, post, put'))
-
-        if self.response is not None:
-            for value in self.response:
-                if value is not None and value.lower() not in [
-                    'okay', 'created', 'nocontent', 'notmodified', 'bad', 'forbidden',
-                    'notfound', 'methodnotallowed', 'conflict', 'gone',
-                        'preconditionfailed', 'unprocessable']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'okay, created, noContent, notModified, bad, forbidden, notFound,'
-                        'methodNotAllowed, conflict, gone, preconditionFailed, unprocessable'))
-
     def get_relationships(self):
 
         return [
@@ -1267,6 +1409,15 @@ class TestScript_Rule2(fhirbase):
 
     __name__ = 'TestScript_Rule2'
 
+    _types = {
+        'ruleId': 'str',
+        'param': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('ruleId', 'param', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.ruleId = None
         # type: str
@@ -1305,6 +1456,15 @@ class TestScript_Param2(fhirbase):
 
     __name__ = 'TestScript_Param2'
 
+    _types = {
+        'name': 'str',
+        'value': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -1331,6 +1491,15 @@ class TestScript_Ruleset1(fhirbase):
 
     __name__ = 'TestScript_Ruleset1'
 
+    _types = {
+        'rulesetId': 'str',
+        'rule': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('rulesetId', 'rule', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.rulesetId = None
         # type: str
@@ -1369,6 +1538,15 @@ class TestScript_Rule3(fhirbase):
 
     __name__ = 'TestScript_Rule3'
 
+    _types = {
+        'ruleId': 'str',
+        'param': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('ruleId', 'param', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.ruleId = None
         # type: str
@@ -1407,6 +1585,15 @@ class TestScript_Param3(fhirbase):
 
     __name__ = 'TestScript_Param3'
 
+    _types = {
+        'name': 'str',
+        'value': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -1436,6 +1623,16 @@ class TestScript_Test(fhirbase):
 
     __name__ = 'TestScript_Test'
 
+    _types = {
+        'name': 'str',
+        'description': 'str',
+        'action': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('name', 'description', 'action', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -1476,6 +1673,15 @@ class TestScript_Action1(fhirbase):
 
     __name__ = 'TestScript_Action1'
 
+    _types = {
+        'operation': 'reference',
+        '_assert': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('operation', '_assert', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.operation = None
         # reference to TestScript_Operation
@@ -1515,6 +1721,14 @@ class TestScript_Teardown(fhirbase):
 
     __name__ = 'TestScript_Teardown'
 
+    _types = {
+        'action': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('action', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.action = None
         # type: list
@@ -1547,6 +1761,14 @@ class TestScript_Action2(fhirbase):
 
     __name__ = 'TestScript_Action2'
 
+    _types = {
+        'operation': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('operation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.operation = None
         # reference to TestScript_Operation
@@ -24,6 +24,16 @@ class Timing(fhirbase):
 
     __name__ = 'Timing'
 
+    _types = {
+        'event': 'list',
+        'repeat': 'reference',
+        'code': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('event', 'repeat', 'code', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.event = None
         # type: list
@@ -106,6 +116,43 @@ class Timing_Repeat(fhirbase):
 
     __name__ = 'Timing_Repeat'
 
+    _enums = {
+        'durationUnit': ['s', 'min', 'h', 'd', 'wk', 'mo', 'a'],
+        'periodUnit': ['s', 'min', 'h', 'd', 'wk', 'mo', 'a'],
+        'when': [
+            'morn', 'aft', 'eve', 'night', 'phs', 'hs', 'wake', 'c', 'cm', 'cd', 'cv', 'ac', 'acm',
+            'acd', 'acv', 'pc', 'pcm', 'pcd', 'pcv'
+        ],
+    }
+
+    _types = {
+        'boundsDuration': 'reference',
+        'boundsRange': 'reference',
+        'boundsPeriod': 'reference',
+        'count': 'int',
+        'countMax': 'int',
+        'duration': 'int',
+        'durationMax': 'int',
+        'durationUnit': 'str',
+        'frequency': 'int',
+        'frequencyMax': 'int',
+        'period': 'int',
+        'periodMax': 'int',
+        'periodUnit': 'str',
+        'dayOfWeek': 'list',
+        'timeOfDay': 'list',
+        'when': 'list',
+        'offset': 'int',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'boundsDuration', 'boundsRange', 'boundsPeriod', 'count', 'countMax', 'duration',
+        'durationMax', 'durationUnit', 'frequency', 'frequencyMax', 'period', 'periodMax',
+        'periodUnit', 'dayOfWeek', 'timeOfDay', 'when', 'offset', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.boundsDuration = None
         # reference to Duration
@@ -169,31 +216,6 @@ class Timing_Repeat(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.durationUnit is not None:
-            for value in self.durationUnit:
-                if value is not None and value.lower() not in [
-                        's', 'min', 'h', 'd', 'wk', 'mo', 'a']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 's, min, h, d, wk, mo, a'))
-
-        if self.periodUnit is not None:
-            for value in self.periodUnit:
-                if value is not None and value.lower() not in [
-                        's', 'min', 'h', 'd', 'wk', 'mo', 'a']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 's, min, h, d, wk, mo, a'))
-
-        if self.when is not None:
-            for value in self.when:
-                if value is not None and value.lower() not in [
-                    'morn', 'aft', 'eve', 'night', 'phs', 'hs', 'wake', 'c', 'cm', 'cd',
-                        'cv', 'ac', 'acm', 'acd', 'acv', 'pc', 'pcm', 'pcd', 'pcv']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'MORN, AFT, EVE, NIGHT, PHS, HS, WAKE, C, CM, CD, CV, AC, ACM, ACD,'
-                        'ACV, PC, PCM, PCD, PCV'))
-
     def get_relationships(self):
 
         return [
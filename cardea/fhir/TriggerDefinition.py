@@ -22,6 +22,30 @@ class TriggerDefinition(fhirbase):
 
     __name__ = 'TriggerDefinition'
 
+    _enums = {
+        'type': [
+            'named-event', 'periodic', 'data-added', 'data-modified', 'data-removed',
+            'data-accessed', 'data-access-ended'
+        ],
+    }
+
+    _types = {
+        'type': 'str',
+        'eventName': 'str',
+        'eventTimingTiming': 'reference',
+        'eventTimingReference': 'reference',
+        'eventTimingDate': 'str',
+        'eventTimingDateTime': 'str',
+        'eventData': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'type', 'eventName', 'eventTimingTiming', 'eventTimingReference', 'eventTimingDate',
+        'eventTimingDateTime', 'eventData', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.type = None
         # type: str
@@ -53,17 +77,6 @@ class TriggerDefinition(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.type is not None:
-            for value in self.type:
-                if value is not None and value.lower() not in [
-                    'named-event', 'periodic', 'data-added', 'data-modified',
-                        'data-removed', 'data-accessed', 'data-access-ended']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'named-event, periodic, data-added, data-modified, data-removed,'
-                        'data-accessed, data-access-ended'))
-
     def get_relationships(self):
 
         return [
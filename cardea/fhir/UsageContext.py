@@ -24,6 +24,17 @@ class UsageContext(fhirbase):
 
     __name__ = 'UsageContext'
 
+    _types = {
+        'code': 'reference',
+        'valueCodeableConcept': 'reference',
+        'valueQuantity': 'reference',
+        'valueRange': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'valueCodeableConcept', 'valueQuantity', 'valueRange', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # reference to Coding
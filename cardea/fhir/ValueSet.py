@@ -71,6 +71,40 @@ class ValueSet(fhirbase):
 
     __name__ = 'ValueSet'
 
+    _enums = {
+        'status': ['draft', 'active', 'retired', 'unknown'],
+    }
+
+    _types = {
+        'resourceType': 'str',
+        'url': 'str',
+        'version': 'str',
+        'name': 'str',
+        'title': 'str',
+        'status': 'str',
+        'experimental': 'bool',
+        'date': 'str',
+        'publisher': 'str',
+        'contact': 'reference',
+        'description': 'str',
+        'useContext': 'reference',
+        'jurisdiction': 'reference',
+        'immutable': 'bool',
+        'purpose': 'str',
+        'copyright': 'str',
+        'extensible': 'bool',
+        'compose': 'reference',
+        'expansion': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'url', 'version', 'name', 'title', 'status', 'experimental', 'date',
+        'publisher', 'contact', 'description', 'useContext', 'jurisdiction', 'immutable',
+        'purpose', 'copyright', 'extensible', 'compose', 'expansion', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'ValueSet'
         # type: str
@@ -142,15 +176,6 @@ class ValueSet(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.status is not None:
-            for value in self.status:
-                if value is not None and value.lower() not in [
-                        'draft', 'active', 'retired', 'unknown']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'draft, active, retired, unknown'))
-
     def get_relationships(self):
 
         return [
@@ -211,6 +236,17 @@ class ValueSet_Compose(fhirbase):
 
     __name__ = 'ValueSet_Compose'
 
+    _types = {
+        'lockedDate': 'str',
+        'inactive': 'bool',
+        'include': 'reference',
+        'exclude': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('lockedDate', 'inactive', 'include', 'exclude', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.lockedDate = None
         # type: str
@@ -267,6 +303,18 @@ class ValueSet_Include(fhirbase):
 
     __name__ = 'ValueSet_Include'
 
+    _types = {
+        'system': 'str',
+        'version': 'str',
+        'concept': 'reference',
+        'filter': 'reference',
+        'valueSet': 'list',
+        'object_id': 'reference',
+    }
+
+    _fields = ('system', 'version', 'concept', 'filter', 'valueSet', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.system = None
         # type: str
@@ -324,6 +372,16 @@ class ValueSet_Concept(fhirbase):
 
     __name__ = 'ValueSet_Concept'
 
+    _types = {
+        'code': 'str',
+        'display': 'str',
+        'designation': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = ('code', 'display', 'designation', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.code = None
         # type: str
@@ -364,6 +422,16 @@ class ValueSet_Designation(fhirbase):
 
     __name__ = 'ValueSet_Designation'
 
+    _types = {
+        'language': 'str',
+        'use': 'reference',
+        'value': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('language', 'use', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.language = None
         # type: str
@@ -407,6 +475,23 @@ class ValueSet_Filter(fhirbase):
 
     __name__ = 'ValueSet_Filter'
 
+    _enums = {
+        'op': [
+            '=', 'is-a', 'descendent-of', 'is-not-a', 'regex', 'in', 'not-in', 'generalizes',
+            'exists'
+        ],
+    }
+
+    _types = {
+        'property': 'str',
+        'op': 'str',
+        'value': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = ('property', 'op', 'value', 'object_id')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.property = None
         # type: str
@@ -426,17 +511,6 @@ class ValueSet_Filter(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.op is not None:
-            for value in self.op:
-                if value is not None and value.lower() not in [
-                    '=', 'is-a', 'descendent-of', 'is-not-a', 'regex', 'in', 'not-in',
-                        'generalizes', 'exists']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, '=, is-a, descendent-of, is-not-a, regex, in, not-in, generalizes,'
-                        'exists'))
-
 
 class ValueSet_Expansion(fhirbase):
     """
@@ -465,6 +539,18 @@ class ValueSet_Expansion(fhirbase):
 
     __name__ = 'ValueSet_Expansion'
 
+    _types = {
+        'timestamp': 'str',
+        'total': 'int',
+        'offset': 'int',
+        'parameter': 'reference',
+        'contains': 'reference',
+        'identifier': 'str',
+    }
+
+    _fields = ('timestamp', 'total', 'offset', 'parameter', 'contains', 'identifier')
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.timestamp = None
         # type: str
@@ -521,6 +607,23 @@ class ValueSet_Parameter(fhirbase):
 
     __name__ = 'ValueSet_Parameter'
 
+    _types = {
+        'name': 'str',
+        'valueString': 'str',
+        'valueBoolean': 'bool',
+        'valueInteger': 'int',
+        'valueDecimal': 'int',
+        'valueUri': 'str',
+        'valueCode': 'str',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'name', 'valueString', 'valueBoolean', 'valueInteger', 'valueDecimal', 'valueUri',
+        'valueCode', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.name = None
         # type: str
@@ -581,6 +684,24 @@ class ValueSet_Contains(fhirbase):
 
     __name__ = 'ValueSet_Contains'
 
+    _types = {
+        'system': 'str',
+        'abstract': 'bool',
+        'inactive': 'bool',
+        'version': 'str',
+        'code': 'str',
+        'display': 'str',
+        'designation': 'reference',
+        'contains': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'system', 'abstract', 'inactive', 'version', 'code', 'display', 'designation', 'contains',
+        'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.system = None
         # type: str
@@ -29,6 +29,25 @@ class VisionPrescription(fhirbase):
 
     __name__ = 'VisionPrescription'
 
+    _types = {
+        'resourceType': 'str',
+        'status': 'str',
+        'patient': 'reference',
+        'encounter': 'reference',
+        'dateWritten': 'str',
+        'prescriber': 'reference',
+        'reasonCodeableConcept': 'reference',
+        'reasonReference': 'reference',
+        'dispense': 'reference',
+        'identifier': 'reference',
+    }
+
+    _fields = (
+        'resourceType', 'status', 'patient', 'encounter', 'dateWritten', 'prescriber',
+        'reasonCodeableConcept', 'reasonReference', 'dispense', 'identifier'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.resourceType = 'VisionPrescription'
         # type: str
@@ -137,6 +156,36 @@ class VisionPrescription_Dispense(fhirbase):
 
     __name__ = 'VisionPrescription_Dispense'
 
+    _enums = {
+        'eye': ['right', 'left'],
+        'base': ['up', 'down', 'in', 'out'],
+    }
+
+    _types = {
+        'product': 'reference',
+        'eye': 'str',
+        'sphere': 'int',
+        'cylinder': 'int',
+        'axis': 'int',
+        'prism': 'int',
+        'base': 'str',
+        'add': 'int',
+        'power': 'int',
+        'backCurve': 'int',
+        'diameter': 'int',
+        'duration': 'reference',
+        'color': 'str',
+        'brand': 'str',
+        'note': 'reference',
+        'object_id': 'reference',
+    }
+
+    _fields = (
+        'product', 'eye', 'sphere', 'cylinder', 'axis', 'prism', 'base', 'add', 'power',
+        'backCurve', 'diameter', 'duration', 'color', 'brand', 'note', 'object_id'
+    )
+    __slots__ = _fields
+
     def __init__(self, dict_values=None):
         self.product = None
         # reference to CodeableConcept
@@ -193,22 +242,6 @@ class VisionPrescription_Dispense(fhirbase):
             self.set_attributes(dict_values)
             self.assert_type()
 
-    def assert_type(self):
-
-        if self.eye is not None:
-            for value in self.eye:
-                if value is not None and value.lower() not in [
-                        'right', 'left']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'right, left'))
-
-        if self.base is not None:
-            for value in self.base:
-                if value is not None and value.lower() not in [
-                        'up', 'down', 'in', 'out']:
-                    raise ValueError('"{}" does not match possible values: {}'.format(
-                        value, 'up, down, in, out'))
-
     def get_relationships(self):
 
         return [
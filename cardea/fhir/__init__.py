@@ -1,260 +1,398 @@
-from cardea.fhir.Account import Account, Account_Coverage, Account_Guarantor
-from cardea.fhir.ActivityDefinition import (
-    ActivityDefinition, ActivityDefinition_DynamicValue, ActivityDefinition_Participant)
-from cardea.fhir.Address import Address
-from cardea.fhir.AdverseEvent import AdverseEvent, AdverseEvent_SuspectEntity
-from cardea.fhir.Age import Age
-from cardea.fhir.AllergyIntolerance import AllergyIntolerance, AllergyIntolerance_Reaction
-from cardea.fhir.Annotation import Annotation
-from cardea.fhir.Appointment import Appointment, Appointment_Participant
-from cardea.fhir.AppointmentResponse import AppointmentResponse
-from cardea.fhir.Attachment import Attachment
-from cardea.fhir.AuditEvent import (
-    AuditEvent, AuditEvent_Agent, AuditEvent_Detail, AuditEvent_Entity, AuditEvent_Network,
-    AuditEvent_Source)
-from cardea.fhir.BackboneElement import BackboneElement
-from cardea.fhir.Basic import Basic
-from cardea.fhir.Binary import Binary
-from cardea.fhir.BodySite import BodySite
-from cardea.fhir.Bundle import (
-    Bundle, Bundle_Entry, Bundle_Link, Bundle_Request, Bundle_Response, Bundle_Search)
-from cardea.fhir.CapabilityStatement import (
-    CapabilityStatement, CapabilityStatement_Certificate, CapabilityStatement_Document,
-    CapabilityStatement_Endpoint, CapabilityStatement_Event, CapabilityStatement_Implementation,
-    CapabilityStatement_Interaction, CapabilityStatement_Interaction1,
-    CapabilityStatement_Messaging, CapabilityStatement_Operation, CapabilityStatement_Resource,
-    CapabilityStatement_Rest, CapabilityStatement_SearchParam, CapabilityStatement_Security,
-    CapabilityStatement_Software, CapabilityStatement_SupportedMessage)
-from cardea.fhir.CarePlan import CarePlan, CarePlan_Activity, CarePlan_Detail
-from cardea.fhir.CareTeam import CareTeam, CareTeam_Participant
-from cardea.fhir.ChargeItem import ChargeItem, ChargeItem_Participant
-from cardea.fhir.Claim import (
-    Claim, Claim_Accident, Claim_CareTeam, Claim_Detail, Claim_Diagnosis, Claim_Information,
-    Claim_Insurance, Claim_Item, Claim_Payee, Claim_Procedure, Claim_Related, Claim_SubDetail)
-from cardea.fhir.ClaimResponse import (
-    ClaimResponse, ClaimResponse_AddItem, ClaimResponse_Adjudication, ClaimResponse_Detail,
-    ClaimResponse_Detail1, ClaimResponse_Error, ClaimResponse_Insurance, ClaimResponse_Item,
-    ClaimResponse_Payment, ClaimResponse_ProcessNote, ClaimResponse_SubDetail)
-from cardea.fhir.ClinicalImpression import (
-    ClinicalImpression, ClinicalImpression_Finding, ClinicalImpression_Investigation)
-from cardea.fhir.CodeableConcept import CodeableConcept
-from cardea.fhir.CodeSystem import (
-    CodeSystem, CodeSystem_Concept, CodeSystem_Designation, CodeSystem_Filter, CodeSystem_Property,
-    CodeSystem_Property1)
-from cardea.fhir.Coding import Coding
-from cardea.fhir.Communication import Communication, Communication_Payload
-from cardea.fhir.CommunicationRequest import (
-    CommunicationRequest, CommunicationRequest_Payload, CommunicationRequest_Requester)
-from cardea.fhir.CompartmentDefinition import CompartmentDefinition, CompartmentDefinition_Resource
-from cardea.fhir.Composition import (
-    Composition, Composition_Attester, Composition_Event, Composition_RelatesTo,
-    Composition_Section)
-from cardea.fhir.ConceptMap import (
-    ConceptMap, ConceptMap_DependsOn, ConceptMap_Element, ConceptMap_Group, ConceptMap_Target,
-    ConceptMap_Unmapped)
-from cardea.fhir.Condition import Condition, Condition_Evidence, Condition_Stage
-from cardea.fhir.Consent import (
-    Consent, Consent_Actor, Consent_Actor1, Consent_Data, Consent_Data1, Consent_Except,
-    Consent_Policy)
-from cardea.fhir.ContactDetail import ContactDetail
-from cardea.fhir.ContactPoint import ContactPoint
-from cardea.fhir.Contract import (
-    Contract, Contract_Agent, Contract_Agent1, Contract_Friendly, Contract_Legal, Contract_Rule,
-    Contract_Signer, Contract_Term, Contract_ValuedItem, Contract_ValuedItem1)
-from cardea.fhir.Contributor import Contributor
-from cardea.fhir.Count import Count
-from cardea.fhir.Coverage import Coverage, Coverage_Grouping
-from cardea.fhir.DataElement import DataElement, DataElement_Mapping
-from cardea.fhir.DataRequirement import (
-    DataRequirement, DataRequirement_CodeFilter, DataRequirement_DateFilter)
-from cardea.fhir.DetectedIssue import DetectedIssue, DetectedIssue_Mitigation
-from cardea.fhir.Device import Device, Device_Udi
-from cardea.fhir.DeviceComponent import DeviceComponent, DeviceComponent_ProductionSpecification
-from cardea.fhir.DeviceMetric import DeviceMetric, DeviceMetric_Calibration
-from cardea.fhir.DeviceRequest import DeviceRequest, DeviceRequest_Requester
-from cardea.fhir.DeviceUseStatement import DeviceUseStatement
-from cardea.fhir.DiagnosticReport import (
-    DiagnosticReport, DiagnosticReport_Image, DiagnosticReport_Performer)
-from cardea.fhir.Distance import Distance
-from cardea.fhir.DocumentManifest import (
-    DocumentManifest, DocumentManifest_Content, DocumentManifest_Related)
-from cardea.fhir.DocumentReference import (
-    DocumentReference, DocumentReference_Content, DocumentReference_Context,
-    DocumentReference_Related, DocumentReference_RelatesTo)
-from cardea.fhir.DomainResource import DomainResource
-from cardea.fhir.Dosage import Dosage
-from cardea.fhir.Duration import Duration
-from cardea.fhir.Element import Element
-from cardea.fhir.ElementDefinition import (
-    ElementDefinition, ElementDefinition_Base, ElementDefinition_Binding,
-    ElementDefinition_Constraint, ElementDefinition_Discriminator, ElementDefinition_Example,
-    ElementDefinition_Mapping, ElementDefinition_Slicing, ElementDefinition_Type)
-from cardea.fhir.EligibilityRequest import EligibilityRequest
-from cardea.fhir.EligibilityResponse import (
-    EligibilityResponse, EligibilityResponse_BenefitBalance, EligibilityResponse_Error,
-    EligibilityResponse_Financial, EligibilityResponse_Insurance)
-from cardea.fhir.Encounter import (
-    Encounter, Encounter_ClassHistory, Encounter_Diagnosis, Encounter_Hospitalization,
-    Encounter_Location, Encounter_Participant, Encounter_StatusHistory)
-from cardea.fhir.Endpoint import Endpoint
-from cardea.fhir.EnrollmentRequest import EnrollmentRequest
-from cardea.fhir.EnrollmentResponse import EnrollmentResponse
-from cardea.fhir.EpisodeOfCare import (
-    EpisodeOfCare, EpisodeOfCare_Diagnosis, EpisodeOfCare_StatusHistory)
-from cardea.fhir.ExpansionProfile import (
-    ExpansionProfile, ExpansionProfile_Designation, ExpansionProfile_Designation1,
-    ExpansionProfile_Designation2, ExpansionProfile_Exclude, ExpansionProfile_ExcludedSystem,
-    ExpansionProfile_FixedVersion, ExpansionProfile_Include)
-from cardea.fhir.ExplanationOfBenefit import (
-    ExplanationOfBenefit, ExplanationOfBenefit_Accident, ExplanationOfBenefit_AddItem,
-    ExplanationOfBenefit_Adjudication, ExplanationOfBenefit_BenefitBalance,
-    ExplanationOfBenefit_CareTeam, ExplanationOfBenefit_Detail, ExplanationOfBenefit_Detail1,
-    ExplanationOfBenefit_Diagnosis, ExplanationOfBenefit_Financial,
-    ExplanationOfBenefit_Information, ExplanationOfBenefit_Insurance, ExplanationOfBenefit_Item,
-    ExplanationOfBenefit_Payee, ExplanationOfBenefit_Payment, ExplanationOfBenefit_Procedure,
-    ExplanationOfBenefit_ProcessNote, ExplanationOfBenefit_Related, ExplanationOfBenefit_SubDetail)
-from cardea.fhir.Extension import Extension
-from cardea.fhir.FamilyMemberHistory import FamilyMemberHistory, FamilyMemberHistory_Condition
+"""Lazy registry of the fhir resource classes.
+
+Resource modules are only imported when one of their classes is first accessed,
+either through ``get_resource`` or as an attribute of this package, so that
+``import cardea`` does not pay for loading the whole FHIR schema.
+"""
+
+import importlib
+import sys
+
 from cardea.fhir.fhirbase import fhirbase
-from cardea.fhir.Flag import Flag
-from cardea.fhir.Goal import Goal, Goal_Target
-from cardea.fhir.GraphDefinition import (
-    GraphDefinition, GraphDefinition_Compartment, GraphDefinition_Link, GraphDefinition_Target)
-from cardea.fhir.Group import Group, Group_Characteristic, Group_Member
-from cardea.fhir.GuidanceResponse import GuidanceResponse
-from cardea.fhir.HealthcareService import (
-    HealthcareService, HealthcareService_AvailableTime, HealthcareService_NotAvailable)
-from cardea.fhir.HumanName import HumanName
-from cardea.fhir.Identifier import Identifier
-from cardea.fhir.ImagingManifest import (
-    ImagingManifest, ImagingManifest_Instance, ImagingManifest_Series, ImagingManifest_Study)
-from cardea.fhir.ImagingStudy import ImagingStudy, ImagingStudy_Instance, ImagingStudy_Series
-from cardea.fhir.Immunization import (
-    Immunization, Immunization_Explanation, Immunization_Practitioner, Immunization_Reaction,
-    Immunization_VaccinationProtocol)
-from cardea.fhir.ImmunizationRecommendation import (
-    ImmunizationRecommendation, ImmunizationRecommendation_DateCriterion,
-    ImmunizationRecommendation_Protocol, ImmunizationRecommendation_Recommendation)
-from cardea.fhir.ImplementationGuide import (
-    ImplementationGuide, ImplementationGuide_Dependency, ImplementationGuide_Global,
-    ImplementationGuide_Package, ImplementationGuide_Page, ImplementationGuide_Resource)
-from cardea.fhir.Library import Library
-from cardea.fhir.Linkage import Linkage, Linkage_Item
-from cardea.fhir.List import List, List_Entry
-from cardea.fhir.Location import Location, Location_Position
-from cardea.fhir.Measure import (
-    Measure, Measure_Group, Measure_Population, Measure_Stratifier, Measure_SupplementalData)
-from cardea.fhir.MeasureReport import (
-    MeasureReport, MeasureReport_Group, MeasureReport_Population, MeasureReport_Population1,
-    MeasureReport_Stratifier, MeasureReport_Stratum)
-from cardea.fhir.Media import Media
-from cardea.fhir.Medication import (
-    Medication, Medication_Batch, Medication_Content, Medication_Ingredient, Medication_Package)
-from cardea.fhir.MedicationAdministration import (
-    MedicationAdministration, MedicationAdministration_Dosage, MedicationAdministration_Performer)
-from cardea.fhir.MedicationDispense import (
-    MedicationDispense, MedicationDispense_Performer, MedicationDispense_Substitution)
-from cardea.fhir.MedicationRequest import (
-    MedicationRequest, MedicationRequest_DispenseRequest, MedicationRequest_Requester,
-    MedicationRequest_Substitution)
-from cardea.fhir.MedicationStatement import MedicationStatement
-from cardea.fhir.MessageDefinition import (
-    MessageDefinition, MessageDefinition_AllowedResponse, MessageDefinition_Focus)
-from cardea.fhir.MessageHeader import (
-    MessageHeader, MessageHeader_Destination, MessageHeader_Response, MessageHeader_Source)
-from cardea.fhir.Meta import Meta
-from cardea.fhir.Money import Money
-from cardea.fhir.NamingSystem import NamingSystem, NamingSystem_UniqueId
-from cardea.fhir.Narrative import Narrative
-from cardea.fhir.NutritionOrder import (
-    NutritionOrder, NutritionOrder_Administration, NutritionOrder_EnteralFormula,
-    NutritionOrder_Nutrient, NutritionOrder_OralDiet, NutritionOrder_Supplement,
-    NutritionOrder_Texture)
-from cardea.fhir.Observation import (
-    Observation, Observation_Component, Observation_ReferenceRange, Observation_Related)
-from cardea.fhir.OperationDefinition import (
-    OperationDefinition, OperationDefinition_Binding, OperationDefinition_Overload,
-    OperationDefinition_Parameter)
-from cardea.fhir.OperationOutcome import OperationOutcome, OperationOutcome_Issue
-from cardea.fhir.Organization import Organization, Organization_Contact
-from cardea.fhir.ParameterDefinition import ParameterDefinition
-from cardea.fhir.Parameters import Parameters, Parameters_Parameter
-from cardea.fhir.Patient import (
-    Patient, Patient_Animal, Patient_Communication, Patient_Contact, Patient_Link)
-from cardea.fhir.PaymentNotice import PaymentNotice
-from cardea.fhir.PaymentReconciliation import (
-    PaymentReconciliation, PaymentReconciliation_Detail, PaymentReconciliation_ProcessNote)
-from cardea.fhir.Period import Period
-from cardea.fhir.Person import Person, Person_Link
-from cardea.fhir.PlanDefinition import (
-    PlanDefinition, PlanDefinition_Action, PlanDefinition_Condition, PlanDefinition_DynamicValue,
-    PlanDefinition_Goal, PlanDefinition_Participant, PlanDefinition_RelatedAction,
-    PlanDefinition_Target)
-from cardea.fhir.Practitioner import Practitioner, Practitioner_Qualification
-from cardea.fhir.PractitionerRole import (
-    PractitionerRole, PractitionerRole_AvailableTime, PractitionerRole_NotAvailable)
-from cardea.fhir.Procedure import Procedure, Procedure_FocalDevice, Procedure_Performer
-from cardea.fhir.ProcedureRequest import ProcedureRequest, ProcedureRequest_Requester
-from cardea.fhir.ProcessRequest import ProcessRequest, ProcessRequest_Item
-from cardea.fhir.ProcessResponse import ProcessResponse, ProcessResponse_ProcessNote
-from cardea.fhir.Provenance import Provenance, Provenance_Agent, Provenance_Entity
-from cardea.fhir.Quantity import Quantity
-from cardea.fhir.Questionnaire import (
-    Questionnaire, Questionnaire_EnableWhen, Questionnaire_Item, Questionnaire_Option)
-from cardea.fhir.QuestionnaireResponse import (
-    QuestionnaireResponse, QuestionnaireResponse_Answer, QuestionnaireResponse_Item)
-from cardea.fhir.Range import Range
-from cardea.fhir.Ratio import Ratio
-from cardea.fhir.Reference import Reference
-from cardea.fhir.ReferralRequest import ReferralRequest, ReferralRequest_Requester
-from cardea.fhir.RelatedArtifact import RelatedArtifact
-from cardea.fhir.RelatedPerson import RelatedPerson
-from cardea.fhir.RequestGroup import (
-    RequestGroup, RequestGroup_Action, RequestGroup_Condition, RequestGroup_RelatedAction)
-from cardea.fhir.ResearchStudy import ResearchStudy, ResearchStudy_Arm
-from cardea.fhir.ResearchSubject import ResearchSubject
-from cardea.fhir.Resource import Resource
-from cardea.fhir.ResourceList import ResourceList
-from cardea.fhir.RiskAssessment import RiskAssessment, RiskAssessment_Prediction
-from cardea.fhir.SampledData import SampledData
-from cardea.fhir.Schedule import Schedule
-from cardea.fhir.SearchParameter import SearchParameter, SearchParameter_Component
-from cardea.fhir.Sequence import (
-    Sequence, Sequence_Quality, Sequence_ReferenceSeq, Sequence_Repository, Sequence_Variant)
-from cardea.fhir.ServiceDefinition import ServiceDefinition
-from cardea.fhir.Signature import Signature
-from cardea.fhir.Slot import Slot
-from cardea.fhir.Specimen import (
-    Specimen, Specimen_Collection, Specimen_Container, Specimen_Processing)
-from cardea.fhir.StructureDefinition import (
-    StructureDefinition, StructureDefinition_Differential, StructureDefinition_Mapping,
-    StructureDefinition_Snapshot)
-from cardea.fhir.StructureMap import (
-    StructureMap, StructureMap_Dependent, StructureMap_Group, StructureMap_Input,
-    StructureMap_Parameter, StructureMap_Rule, StructureMap_Source, StructureMap_Structure,
-    StructureMap_Target)
-from cardea.fhir.Subscription import Subscription, Subscription_Channel
-from cardea.fhir.Substance import Substance, Substance_Ingredient, Substance_Instance
-from cardea.fhir.SupplyDelivery import SupplyDelivery, SupplyDelivery_SuppliedItem
-from cardea.fhir.SupplyRequest import (
-    SupplyRequest, SupplyRequest_OrderedItem, SupplyRequest_Requester)
-from cardea.fhir.Task import Task, Task_Input, Task_Output, Task_Requester, Task_Restriction
-from cardea.fhir.TestReport import (
-    TestReport, TestReport_Action, TestReport_Action1, TestReport_Action2, TestReport_Assert,
-    TestReport_Operation, TestReport_Participant, TestReport_Setup, TestReport_Teardown,
-    TestReport_Test)
-from cardea.fhir.TestScript import (
-    TestScript, TestScript_Action, TestScript_Action1, TestScript_Action2, TestScript_Assert,
-    TestScript_Capability, TestScript_Destination, TestScript_Fixture, TestScript_Link,
-    TestScript_Metadata, TestScript_Operation, TestScript_Origin, TestScript_Param,
-    TestScript_Param1, TestScript_Param2, TestScript_Param3, TestScript_RequestHeader,
-    TestScript_Rule, TestScript_Rule1, TestScript_Rule2, TestScript_Rule3, TestScript_Ruleset,
-    TestScript_Ruleset1, TestScript_Setup, TestScript_Teardown, TestScript_Test,
-    TestScript_Variable)
-from cardea.fhir.Timing import Timing, Timing_Repeat
-from cardea.fhir.TriggerDefinition import TriggerDefinition
-from cardea.fhir.UsageContext import UsageContext
-from cardea.fhir.ValueSet import (
-    ValueSet, ValueSet_Compose, ValueSet_Concept, ValueSet_Contains, ValueSet_Designation,
-    ValueSet_Expansion, ValueSet_Filter, ValueSet_Include, ValueSet_Parameter)
-from cardea.fhir.VisionPrescription import VisionPrescription, VisionPrescription_Dispense
+
+MODULES = {
+    'Account': ('Account', 'Account_Coverage', 'Account_Guarantor'),
+    'ActivityDefinition': (
+        'ActivityDefinition', 'ActivityDefinition_DynamicValue', 'ActivityDefinition_Participant'
+    ),
+    'Address': ('Address',),
+    'AdverseEvent': ('AdverseEvent', 'AdverseEvent_SuspectEntity'),
+    'Age': ('Age',),
+    'AllergyIntolerance': ('AllergyIntolerance', 'AllergyIntolerance_Reaction'),
+    'Annotation': ('Annotation',),
+    'Appointment': ('Appointment', 'Appointment_Participant'),
+    'AppointmentResponse': ('AppointmentResponse',),
+    'Attachment': ('Attachment',),
+    'AuditEvent': (
+        'AuditEvent', 'AuditEvent_Agent', 'AuditEvent_Detail', 'AuditEvent_Entity',
+        'AuditEvent_Network', 'AuditEvent_Source'
+    ),
+    'BackboneElement': ('BackboneElement',),
+    'Basic': ('Basic',),
+    'Binary': ('Binary',),
+    'BodySite': ('BodySite',),
+    'Bundle': (
+        'Bundle', 'Bundle_Entry', 'Bundle_Link', 'Bundle_Request', 'Bundle_Response',
+        'Bundle_Search'
+    ),
+    'CapabilityStatement': (
+        'CapabilityStatement', 'CapabilityStatement_Certificate', 'CapabilityStatement_Document',
+        'CapabilityStatement_Endpoint', 'CapabilityStatement_Event',
+        'CapabilityStatement_Implementation', 'CapabilityStatement_Interaction',
+        'CapabilityStatement_Interaction1', 'CapabilityStatement_Messaging',
+        'CapabilityStatement_Operation', 'CapabilityStatement_Resource',
+        'CapabilityStatement_Rest', 'CapabilityStatement_SearchParam',
+        'CapabilityStatement_Security', 'CapabilityStatement_Software',
+        'CapabilityStatement_SupportedMessage'
+    ),
+    'CarePlan': ('CarePlan', 'CarePlan_Activity', 'CarePlan_Detail'),
+    'CareTeam': ('CareTeam', 'CareTeam_Participant'),
+    'ChargeItem': ('ChargeItem', 'ChargeItem_Participant'),
+    'Claim': (
+        'Claim', 'Claim_Accident', 'Claim_CareTeam', 'Claim_Detail', 'Claim_Diagnosis',
+        'Claim_Information', 'Claim_Insurance', 'Claim_Item', 'Claim_Payee', 'Claim_Procedure',
+        'Claim_Related', 'Claim_SubDetail'
+    ),
+    'ClaimResponse': (
+        'ClaimResponse', 'ClaimResponse_AddItem', 'ClaimResponse_Adjudication',
+        'ClaimResponse_Detail', 'ClaimResponse_Detail1', 'ClaimResponse_Error',
+        'ClaimResponse_Insurance', 'ClaimResponse_Item', 'ClaimResponse_Payment',
+        'ClaimResponse_ProcessNote', 'ClaimResponse_SubDetail'
+    ),
+    'ClinicalImpression': (
+        'ClinicalImpression', 'ClinicalImpression_Finding', 'ClinicalImpression_Investigation'
+    ),
+    'CodeableConcept': ('CodeableConcept',),
+    'CodeSystem': (
+        'CodeSystem', 'CodeSystem_Concept', 'CodeSystem_Designation', 'CodeSystem_Filter',
+        'CodeSystem_Property', 'CodeSystem_Property1'
+    ),
+    'Coding': ('Coding',),
+    'Communication': ('Communication', 'Communication_Payload'),
+    'CommunicationRequest': (
+        'CommunicationRequest', 'CommunicationRequest_Payload', 'CommunicationRequest_Requester'
+    ),
+    'CompartmentDefinition': ('CompartmentDefinition', 'CompartmentDefinition_Resource'),
+    'Composition': (
+        'Composition', 'Composition_Attester', 'Composition_Event', 'Composition_RelatesTo',
+        'Composition_Section'
+    ),
+    'ConceptMap': (
+        'ConceptMap', 'ConceptMap_DependsOn', 'ConceptMap_Element', 'ConceptMap_Group',
+        'ConceptMap_Target', 'ConceptMap_Unmapped'
+    ),
+    'Condition': ('Condition', 'Condition_Evidence', 'Condition_Stage'),
+    'Consent': (
+        'Consent', 'Consent_Actor', 'Consent_Actor1', 'Consent_Data', 'Consent_Data1',
+        'Consent_Except', 'Consent_Policy'
+    ),
+    'ContactDetail': ('ContactDetail',),
+    'ContactPoint': ('ContactPoint',),
+    'Contract': (
+        'Contract', 'Contract_Agent', 'Contract_Agent1', 'Contract_Friendly', 'Contract_Legal',
+        'Contract_Rule', 'Contract_Signer', 'Contract_Term', 'Contract_ValuedItem',
+        'Contract_ValuedItem1'
+    ),
+    'Contributor': ('Contributor',),
+    'Count': ('Count',),
+    'Coverage': ('Coverage', 'Coverage_Grouping'),
+    'DataElement': ('DataElement', 'DataElement_Mapping'),
+    'DataRequirement': (
+        'DataRequirement', 'DataRequirement_CodeFilter', 'DataRequirement_DateFilter'
+    ),
+    'DetectedIssue': ('DetectedIssue', 'DetectedIssue_Mitigation'),
+    'Device': ('Device', 'Device_Udi'),
+    'DeviceComponent': ('DeviceComponent', 'DeviceComponent_ProductionSpecification'),
+    'DeviceMetric': ('DeviceMetric', 'DeviceMetric_Calibration'),
+    'DeviceRequest': ('DeviceRequest', 'DeviceRequest_Requester'),
+    'DeviceUseStatement': ('DeviceUseStatement',),
+    'DiagnosticReport': (
+        'DiagnosticReport', 'DiagnosticReport_Image', 'DiagnosticReport_Performer'
+    ),
+    'Distance': ('Distance',),
+    'DocumentManifest': (
+        'DocumentManifest', 'DocumentManifest_Content', 'DocumentManifest_Related'
+    ),
+    'DocumentReference': (
+        'DocumentReference', 'DocumentReference_Content', 'DocumentReference_Context',
+        'DocumentReference_Related', 'DocumentReference_RelatesTo'
+    ),
+    'DomainResource': ('DomainResource',),
+    'Dosage': ('Dosage',),
+    'Duration': ('Duration',),
+    'Element': ('Element',),
+    'ElementDefinition': (
+        'ElementDefinition', 'ElementDefinition_Base', 'ElementDefinition_Binding',
+        'ElementDefinition_Constraint', 'ElementDefinition_Discriminator',
+        'ElementDefinition_Example', 'ElementDefinition_Mapping', 'ElementDefinition_Slicing',
+        'ElementDefinition_Type'
+    ),
+    'EligibilityRequest': ('EligibilityRequest',),
+    'EligibilityResponse': (
+        'EligibilityResponse', 'EligibilityResponse_BenefitBalance', 'EligibilityResponse_Error',
+        'EligibilityResponse_Financial', 'EligibilityResponse_Insurance'
+    ),
+    'Encounter': (
+        'Encounter', 'Encounter_ClassHistory', 'Encounter_Diagnosis', 'Encounter_Hospitalization',
+        'Encounter_Location', 'Encounter_Participant', 'Encounter_StatusHistory'
+    ),
+    'Endpoint': ('Endpoint',),
+    'EnrollmentRequest': ('EnrollmentRequest',),
+    'EnrollmentResponse': ('EnrollmentResponse',),
+    'EpisodeOfCare': ('EpisodeOfCare', 'EpisodeOfCare_Diagnosis', 'EpisodeOfCare_StatusHistory'),
+    'ExpansionProfile': (
+        'ExpansionProfile', 'ExpansionProfile_Designation', 'ExpansionProfile_Designation1',
+        'ExpansionProfile_Designation2', 'ExpansionProfile_Exclude',
+        'ExpansionProfile_ExcludedSystem', 'ExpansionProfile_FixedVersion',
+        'ExpansionProfile_Include'
+    ),
+    'ExplanationOfBenefit': (
+        'ExplanationOfBenefit', 'ExplanationOfBenefit_Accident', 'ExplanationOfBenefit_AddItem',
+        'ExplanationOfBenefit_Adjudication', 'ExplanationOfBenefit_BenefitBalance',
+        'ExplanationOfBenefit_CareTeam', 'ExplanationOfBenefit_Detail',
+        'ExplanationOfBenefit_Detail1', 'ExplanationOfBenefit_Diagnosis',
+        'ExplanationOfBenefit_Financial', 'ExplanationOfBenefit_Information',
+        'ExplanationOfBenefit_Insurance', 'ExplanationOfBenefit_Item',
+        'ExplanationOfBenefit_Payee', 'ExplanationOfBenefit_Payment',
+        'ExplanationOfBenefit_Procedure', 'ExplanationOfBenefit_ProcessNote',
+        'ExplanationOfBenefit_Related', 'ExplanationOfBenefit_SubDetail'
+    ),
+    'Extension': ('Extension',),
+    'FamilyMemberHistory': ('FamilyMemberHistory', 'FamilyMemberHistory_Condition'),
+    'Flag': ('Flag',),
+    'Goal': ('Goal', 'Goal_Target'),
+    'GraphDefinition': (
+        'GraphDefinition', 'GraphDefinition_Compartment', 'GraphDefinition_Link',
+        'GraphDefinition_Target'
+    ),
+    'Group': ('Group', 'Group_Characteristic', 'Group_Member'),
+    'GuidanceResponse': ('GuidanceResponse',),
+    'HealthcareService': (
+        'HealthcareService', 'HealthcareService_AvailableTime', 'HealthcareService_NotAvailable'
+    ),
+    'HumanName': ('HumanName',),
+    'Identifier': ('Identifier',),
+    'ImagingManifest': (
+        'ImagingManifest', 'ImagingManifest_Instance', 'ImagingManifest_Series',
+        'ImagingManifest_Study'
+    ),
+    'ImagingStudy': ('ImagingStudy', 'ImagingStudy_Instance', 'ImagingStudy_Series'),
+    'Immunization': (
+        'Immunization', 'Immunization_Explanation', 'Immunization_Practitioner',
+        'Immunization_Reaction', 'Immunization_VaccinationProtocol'
+    ),
+    'ImmunizationRecommendation': (
+        'ImmunizationRecommendation', 'ImmunizationRecommendation_DateCriterion',
+        'ImmunizationRecommendation_Protocol', 'ImmunizationRecommendation_Recommendation'
+    ),
+    'ImplementationGuide': (
+        'ImplementationGuide', 'ImplementationGuide_Dependency', 'ImplementationGuide_Global',
+        'ImplementationGuide_Package', 'ImplementationGuide_Page', 'ImplementationGuide_Resource'
+    ),
+    'Library': ('Library',),
+    'Linkage': ('Linkage', 'Linkage_Item'),
+    'List': ('List', 'List_Entry'),
+    'Location': ('Location', 'Location_Position'),
+    'Measure': (
+        'Measure', 'Measure_Group', 'Measure_Population', 'Measure_Stratifier',
+        'Measure_SupplementalData'
+    ),
+    'MeasureReport': (
+        'MeasureReport', 'MeasureReport_Group', 'MeasureReport_Population',
+        'MeasureReport_Population1', 'MeasureReport_Stratifier', 'MeasureReport_Stratum'
+    ),
+    'Media': ('Media',),
+    'Medication': (
+        'Medication', 'Medication_Batch', 'Medication_Content', 'Medication_Ingredient',
+        'Medication_Package'
+    ),
+    'MedicationAdministration': (
+        'MedicationAdministration', 'MedicationAdministration_Dosage',
+        'MedicationAdministration_Performer'
+    ),
+    'MedicationDispense': (
+        'MedicationDispense', 'MedicationDispense_Performer', 'MedicationDispense_Substitution'
+    ),
+    'MedicationRequest': (
+        'MedicationRequest', 'MedicationRequest_DispenseRequest', 'MedicationRequest_Requester',
+        'MedicationRequest_Substitution'
+    ),
+    'MedicationStatement': ('MedicationStatement',),
+    'MessageDefinition': (
+        'MessageDefinition', 'MessageDefinition_AllowedResponse', 'MessageDefinition_Focus'
+    ),
+    'MessageHeader': (
+        'MessageHeader', 'MessageHeader_Destination', 'MessageHeader_Response',
+        'MessageHeader_Source'
+    ),
+    'Meta': ('Meta',),
+    'Money': ('Money',),
+    'NamingSystem': ('NamingSystem', 'NamingSystem_UniqueId'),
+    'Narrative': ('Narrative',),
+    'NutritionOrder': (
+        'NutritionOrder', 'NutritionOrder_Administration', 'NutritionOrder_EnteralFormula',
+        'NutritionOrder_Nutrient', 'NutritionOrder_OralDiet', 'NutritionOrder_Supplement',
+        'NutritionOrder_Texture'
+    ),
+    'Observation': (
+        'Observation', 'Observation_Component', 'Observation_ReferenceRange', 'Observation_Related'
+    ),
+    'OperationDefinition': (
+        'OperationDefinition', 'OperationDefinition_Binding', 'OperationDefinition_Overload',
+        'OperationDefinition_Parameter'
+    ),
+    'OperationOutcome': ('OperationOutcome', 'OperationOutcome_Issue'),
+    'Organization': ('Organization', 'Organization_Contact'),
+    'ParameterDefinition': ('ParameterDefinition',),
+    'Parameters': ('Parameters', 'Parameters_Parameter'),
+    'Patient': (
+        'Patient', 'Patient_Animal', 'Patient_Communication', 'Patient_Contact', 'Patient_Link'
+    ),
+    'PaymentNotice': ('PaymentNotice',),
+    'PaymentReconciliation': (
+        'PaymentReconciliation', 'PaymentReconciliation_Detail',
+        'PaymentReconciliation_ProcessNote'
+    ),
+    'Period': ('Period',),
+    'Person': ('Person', 'Person_Link'),
+    'PlanDefinition': (
+        'PlanDefinition', 'PlanDefinition_Action', 'PlanDefinition_Condition',
+        'PlanDefinition_DynamicValue', 'PlanDefinition_Goal', 'PlanDefinition_Participant',
+        'PlanDefinition_RelatedAction', 'PlanDefinition_Target'
+    ),
+    'Practitioner': ('Practitioner', 'Practitioner_Qualification'),
+    'PractitionerRole': (
+        'PractitionerRole', 'PractitionerRole_AvailableTime', 'PractitionerRole_NotAvailable'
+    ),
+    'Procedure': ('Procedure', 'Procedure_FocalDevice', 'Procedure_Performer'),
+    'ProcedureRequest': ('ProcedureRequest', 'ProcedureRequest_Requester'),
+    'ProcessRequest': ('ProcessRequest', 'ProcessRequest_Item'),
+    'ProcessResponse': ('ProcessResponse', 'ProcessResponse_ProcessNote'),
+    'Provenance': ('Provenance', 'Provenance_Agent', 'Provenance_Entity'),
+    'Quantity': ('Quantity',),
+    'Questionnaire': (
+        'Questionnaire', 'Questionnaire_EnableWhen', 'Questionnaire_Item', 'Questionnaire_Option'
+    ),
+    'QuestionnaireResponse': (
+        'QuestionnaireResponse', 'QuestionnaireResponse_Answer', 'QuestionnaireResponse_Item'
+    ),
+    'Range': ('Range',),
+    'Ratio': ('Ratio',),
+    'Reference': ('Reference',),
+    'ReferralRequest': ('ReferralRequest', 'ReferralRequest_Requester'),
+    'RelatedArtifact': ('RelatedArtifact',),
+    'RelatedPerson': ('RelatedPerson',),
+    'RequestGroup': (
+        'RequestGroup', 'RequestGroup_Action', 'RequestGroup_Condition',
+        'RequestGroup_RelatedAction'
+    ),
+    'ResearchStudy': ('ResearchStudy', 'ResearchStudy_Arm'),
+    'ResearchSubject': ('ResearchSubject',),
+    'Resource': ('Resource',),
+    'ResourceList': ('ResourceList',),
+    'RiskAssessment': ('RiskAssessment', 'RiskAssessment_Prediction'),
+    'SampledData': ('SampledData',),
+    'Schedule': ('Schedule',),
+    'SearchParameter': ('SearchParameter', 'SearchParameter_Component'),
+    'Sequence': (
+        'Sequence', 'Sequence_Quality', 'Sequence_ReferenceSeq', 'Sequence_Repository',
+        'Sequence_Variant'
+    ),
+    'ServiceDefinition': ('ServiceDefinition',),
+    'Signature': ('Signature',),
+    'Slot': ('Slot',),
+    'Specimen': ('Specimen', 'Specimen_Collection', 'Specimen_Container', 'Specimen_Processing'),
+    'StructureDefinition': (
+        'StructureDefinition', 'StructureDefinition_Differential', 'StructureDefinition_Mapping',
+        'StructureDefinition_Snapshot'
+    ),
+    'StructureMap': (
+        'StructureMap', 'StructureMap_Dependent', 'StructureMap_Group', 'StructureMap_Input',
+        'StructureMap_Parameter', 'StructureMap_Rule', 'StructureMap_Source',
+        'StructureMap_Structure', 'StructureMap_Target'
+    ),
+    'Subscription': ('Subscription', 'Subscription_Channel'),
+    'Substance': ('Substance', 'Substance_Ingredient', 'Substance_Instance'),
+    'SupplyDelivery': ('SupplyDelivery', 'SupplyDelivery_SuppliedItem'),
+    'SupplyRequest': ('SupplyRequest', 'SupplyRequest_OrderedItem', 'SupplyRequest_Requester'),
+    'Task': ('Task', 'Task_Input', 'Task_Output', 'Task_Requester', 'Task_Restriction'),
+    'TestReport': (
+        'TestReport', 'TestReport_Action', 'TestReport_Action1', 'TestReport_Action2',
+        'TestReport_Assert', 'TestReport_Operation', 'TestReport_Participant', 'TestReport_Setup',
+        'TestReport_Teardown', 'TestReport_Test'
+    ),
+    'TestScript': (
+        'TestScript', 'TestScript_Action', 'TestScript_Action1', 'TestScript_Action2',
+        'TestScript_Assert', 'TestScript_Capability', 'TestScript_Destination',
+        'TestScript_Fixture', 'TestScript_Link', 'TestScript_Metadata', 'TestScript_Operation',
+        'TestScript_Origin', 'TestScript_Param', 'TestScript_Param1', 'TestScript_Param2',
+        'TestScript_Param3', 'TestScript_RequestHeader', 'TestScript_Rule', 'TestScript_Rule1',
+        'TestScript_Rule2', 'TestScript_Rule3', 'TestScript_Ruleset', 'TestScript_Ruleset1',
+        'TestScript_Setup', 'TestScript_Teardown', 'TestScript_Test', 'TestScript_Variable'
+    ),
+    'Timing': ('Timing', 'Timing_Repeat'),
+    'TriggerDefinition': ('TriggerDefinition',),
+    'UsageContext': ('UsageContext',),
+    'ValueSet': (
+        'ValueSet', 'ValueSet_Compose', 'ValueSet_Concept', 'ValueSet_Contains',
+        'ValueSet_Designation', 'ValueSet_Expansion', 'ValueSet_Filter', 'ValueSet_Include',
+        'ValueSet_Parameter'
+    ),
+    'VisionPrescription': ('VisionPrescription', 'VisionPrescription_Dispense'),
+}
+
+RESOURCES = {name: module for module, names in MODULES.items() for name in names}
+
+__all__ = ['fhirbase', 'get_resource'] + sorted(RESOURCES)
+
+
+def _load_module(module_name):
+    """Imports a resource module and publishes its classes in this package.
+
+    Importing a submodule binds the module object to the package attribute of the
+    same name, so the classes are bound afterwards to keep ``cardea.fhir.Patient``
+    pointing to the class rather than to the module.
+    """
+
+    module = importlib.import_module('{}.{}'.format(__name__, module_name))
+    package = sys.modules[__name__]
+    for name in MODULES[module_name]:
+        setattr(package, name, getattr(module, name))
+
+    return module
+
+
+def get_resource(name):
+    """Returns the fhir class registered under the given name.
+
+    Args:
+        name: A string with the name of the fhir class.
+
+    Returns:
+        The corresponding fhir class.
+
+    Raises:
+        LookupError: An error occurs if name is not part of the FHIR schema.
+    """
+
+    if name not in RESOURCES:
+        raise LookupError('{} is not part of FHIR schema'.format(name))
+
+    return getattr(_load_module(RESOURCES[name]), name)
+
+
+def __getattr__(name):
+    if name in RESOURCES:
+        return get_resource(name)
+
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(RESOURCES))
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ (PEP 562) is not supported, import everything up front
+    for _module_name in MODULES:
+        _load_module(_module_name)
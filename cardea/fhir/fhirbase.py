@@ -1,41 +1,147 @@
 import logging
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger('cardea.fhir')
 
 
+def find_enum_violations(values, possible_values):
+    """Returns the rows whose value does not match the possible enumerations.
+
+    The comparison is case insensitive and missing values are ignored. Values are
+    lowered once per distinct value through a categorical instead of once per row.
+
+    Args:
+        values: A pandas series or a list with the values of an attribute.
+        possible_values: A list of the possible lowercase values of the attribute.
+
+    Returns:
+        An index with the rows that do not match the possible values.
+    """
+
+    values = pd.Series(values)
+    categories = values.astype('category')
+    if categories.cat.categories.empty:
+        # empty or all missing columns, which have no value to lower
+        return values.index[:0]
+
+    matches = categories.cat.categories.astype(str).str.lower().isin(possible_values)
+
+    # missing values have the code -1, which points to the appended True
+    invalid = ~np.append(matches, True)[categories.cat.codes.values]
+
+    return values.index[invalid]
+
+
+def assert_enums(columns, enums, name):
+    """Checks that columns follow the possible enumerations of a fhir class.
+
+    Args:
+        columns: A dataframe or a dictionary of the values of each attribute.
+        enums: A dictionary of attributes and their possible values.
+        name: The name of the fhir class being checked.
+
+    Raises:
+        ValueError: An error occurs if an attribute does not match its possible
+            enumerations, listing every offending value and row.
+    """
+
+    errors = []
+    for attr, possible_values in enums.items():
+        values = columns.get(attr)
+        if values is None:
+            continue
+
+        invalid = find_enum_violations(values, possible_values)
+        if len(invalid):
+            invalid_values = pd.Series(values).loc[invalid]
+            rows = ', '.join(str(row) for row in invalid[:20])
+            if len(invalid) > 20:
+                rows += ', ... ({} rows)'.format(len(invalid))
+
+            errors.append('{}: {} at rows [{}] do not match possible values: {}'.format(
+                attr, ', '.join('"{}"'.format(v) for v in invalid_values.unique()),
+                rows, ', '.join(possible_values)))
+
+    if errors:
+        raise ValueError('{} values do not match possible values.\n{}'.format(
+            name, '\n'.join(errors)))
+
+
 class fhirbase(object):
+    """Base of the fhir classes.
+
+    Each fhir class declares its attributes in the class level _fields tuple, which
+    also defines its __slots__, their types in _types and their possible enumerations
+    in _enums. Types are one of str, bool, int, list or reference, the latter being
+    used by the attributes that hold keys joining fhir classes.
+    """
+
+    _enums = {}
+    _types = {}
+    _fields = ()
+    __slots__ = ('_dataframe',)
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """Returns an object of the fhir class in columnar mode.
+
+        The object wraps df instead of copying it: its attributes hold the columns
+        of df and get_dataframe returns df itself, so the object should be treated
+        as a read-only view of the dataframe.
+
+        Args:
+            df: A dataframe with fhir class data.
+
+        Returns:
+            An object of the associate fhir class backed by df.
+        """
+
+        object = cls()
+        object.set_attributes(df)
+        object._dataframe = df
+        return object
 
     def set_attributes(self, dict_values):
         """Sets values to class attributes.
 
         Args:
-            dict_values: A dictionary representation of inserted data.
+            dict_values: A dictionary or dataframe representation of inserted data.
 
         Returns:
             An object of the associate fhir class filled with data.
         """
 
         for key in dict_values.keys():
-            if key not in self.__dict__.keys():
+            if key not in self._fields:
                 logger.warning(
-                    "Attribute %s in %s could not be loaded.", (key, self.__name__))
+                    "Attribute %s in %s could not be loaded.", key, self.__name__)
             else:
-                self.__dict__[key] = dict_values[key]
+                setattr(self, key, dict_values[key])
 
     def get_dataframe(self):
         """Returns dataframe from class attribute values.
 
         Returns:
-            A dataframe representation of the class.
+            A dataframe representation of the class. In columnar mode, this is the
+            wrapped dataframe, or its loaded columns if some could not be loaded.
         """
 
         dataframe = {}
-        for attr, value in self.__dict__.items():
+        for attr in self._fields:
+            value = getattr(self, attr)
             if value is not None and attr != 'resourceType':
                 dataframe[attr] = value
 
+        wrapped = getattr(self, '_dataframe', None)
+        if wrapped is not None:
+            columns = [column for column in wrapped.columns if column in dataframe]
+            if len(columns) == len(wrapped.columns):
+                return wrapped
+
+            return wrapped[columns]
+
         return pd.DataFrame(dataframe)
 
     def get_id(self):
@@ -65,6 +171,9 @@ class fhirbase(object):
                 does not match its possible enumerations.
         """
 
+        assert_enums({attr: getattr(self, attr) for attr in self._enums},
+                     self._enums, self.__name__)
+
     def get_relationships(self):
         """Returns class relationships.
 
@@ -0,0 +1,154 @@
+"""Cached index of the FHIR schema.
+
+The index is built once per process and per resource, on first access, from the
+fhir classes themselves: the identifier columns they declare, their relationships
+and their enumeration constraints.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+from cardea import fhir
+
+IDENTIFIERS = ('identifier', 'id', 'object_id')
+
+# str attributes holding a date, a dateTime or an instant
+DATETIME_FIELDS = ('date', 'start', 'end', 'created', 'issued', 'recorded', 'authoredOn')
+DATETIME_SUFFIXES = ('Date', 'DateTime', 'Instant')
+
+Relationship = namedtuple(
+    'Relationship', ['parent_entity', 'parent_variable', 'child_entity', 'child_variable'])
+
+
+class ResourceSchema(namedtuple('ResourceSchema', ['name', 'resource', 'fields', 'types',
+                                                   'identifiers', 'relationships', 'enums'])):
+    """Frozen description of a fhir class.
+
+    Attributes:
+        name: The name of the fhir class.
+        resource: The fhir class.
+        fields: A tuple with the attribute names of the fhir class.
+        types: A read-only mapping of attribute names to their types.
+        identifiers: A tuple with the identifier attributes of the fhir class, by priority.
+        relationships: A tuple of the class's associated relationships.
+        enums: A read-only mapping of attribute names to their possible values.
+    """
+
+    __slots__ = ()
+
+    def get_dtypes(self):
+        """Returns the dtypes to read the text attributes of the fhir class with.
+
+        Attributes with possible enumerations are read as categories and the other
+        text attributes as strings. Datetime attributes are left to get_parse_dates.
+
+        Returns:
+            A dictionary of the text attributes and their dtype.
+        """
+
+        return {field: 'category' if field in self.enums else str
+                for field, type in self.types.items()
+                if type == 'str' and not is_datetime_field(field)}
+
+    def get_parse_dates(self, columns):
+        """Returns the datetime attributes among the given columns.
+
+        Args:
+            columns: An iterable of the loaded column names.
+
+        Returns:
+            A list with the names of the datetime columns.
+        """
+
+        return [column for column in columns
+                if self.types.get(column) == 'str' and is_datetime_field(column)]
+
+    def get_id(self, columns):
+        """Returns the identifier column used among the given columns.
+
+        Args:
+            columns: An iterable of the loaded column names.
+
+        Returns:
+            The name of the identifier column, or None if no identifier is loaded.
+        """
+
+        columns = set(columns)
+        for identifier in self.identifiers:
+            if identifier in columns:
+                return identifier
+
+        return None
+
+    def get_relationships(self, columns, names=None):
+        """Returns the relationships of the columns that are loaded.
+
+        Args:
+            columns: An iterable of the loaded column names.
+            names: An optional iterable of the loaded resources, used to filter the parents.
+
+        Returns:
+            A list of the eligible relationships.
+        """
+
+        columns = set(columns)
+        names = None if names is None else set(names)
+        return [relation for relation in self.relationships
+                if relation.child_variable in columns and
+                (names is None or relation.parent_entity in names)]
+
+
+def is_datetime_field(field):
+    """Returns whether a str attribute holds a date, a dateTime or an instant.
+
+    Args:
+        field: The name of the attribute.
+
+    Returns:
+        A boolean.
+    """
+
+    return field in DATETIME_FIELDS or field.endswith(DATETIME_SUFFIXES)
+
+
+def list_resources():
+    """Returns the names of the classes that are part of the FHIR schema.
+
+    Returns:
+        A sorted list with the names of the fhir classes.
+    """
+
+    return sorted(fhir.RESOURCES)
+
+
+@lru_cache(maxsize=None)
+def get_schema(name):
+    """Returns the schema of a fhir class.
+
+    Args:
+        name: A string with the name of the fhir class.
+
+    Returns:
+        A ResourceSchema of the corresponding fhir class.
+
+    Raises:
+        LookupError: An error occurs if name is not part of the FHIR schema.
+    """
+
+    resource = fhir.get_resource(name)
+    fields = resource._fields
+
+    relationships = tuple(Relationship(**relation)
+                          for relation in resource().get_relationships())
+    enums = MappingProxyType({attr: tuple(values)
+                              for attr, values in resource._enums.items()})
+
+    return ResourceSchema(
+        name=name,
+        resource=resource,
+        fields=fields,
+        types=MappingProxyType(dict(resource._types)),
+        identifiers=tuple(i for i in IDENTIFIERS if i in fields),
+        relationships=relationships,
+        enums=enums)
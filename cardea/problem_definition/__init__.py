@@ -2,6 +2,7 @@
 from cardea.problem_definition.definition import ProblemDefinition
 from cardea.problem_definition.length_of_stay import LengthOfStay
 from cardea.problem_definition.mortality_prediction import MortalityPrediction
+from cardea.problem_definition.multi_label_diagnosis import MultiLabelDiagnosisPrediction
 from cardea.problem_definition.predicting_diagnosis import DiagnosisPrediction
 from cardea.problem_definition.prolonged_length_of_stay import ProlongedLengthOfStay
 from cardea.problem_definition.readmission import Readmission
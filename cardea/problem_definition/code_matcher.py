@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+FAMILY_WILDCARD = '*'
+
+
+class CodeMatcher():
+    """A class that matches diagnosis codes, such as ICD codes, against a set of patterns.
+
+    Patterns ending with a wildcard match a family of codes: 'V09.*' matches V09 and every
+    code under it, while 'V0*' matches every code that starts with V0. Other patterns
+    match exact codes. Codes are compared stripped and upper-cased.
+
+    Exact codes are matched with isin, and the families through a trie of their prefixes,
+    which is walked once per distinct code instead of once per row.
+
+    Attributes:
+        codes: A frozenset of the exact codes.
+        trie: A nested dictionary of the prefixes of the code families, where the None key
+            marks the end of a prefix.
+    """
+
+    __name__ = 'CodeMatcher'
+
+    def __init__(self, patterns):
+        codes = set()
+        self.trie = {}
+        for pattern in patterns:
+            pattern = self.normalize(pattern)
+            if not pattern.endswith(FAMILY_WILDCARD):
+                codes.add(pattern)
+                continue
+
+            prefix = pattern[:-len(FAMILY_WILDCARD)]
+            if prefix.endswith('.'):
+                codes.add(prefix[:-1])  # the parent code of a dotted family
+
+            node = self.trie
+            for character in prefix:
+                node = node.setdefault(character, {})
+
+            node[None] = True
+
+        self.codes = frozenset(codes)
+
+    @staticmethod
+    def normalize(code):
+        return str(code).strip().upper()
+
+    def match_family(self, code):
+        """Returns whether a normalized code belongs to one of the code families.
+
+        Args:
+            code: A normalized code.
+
+        Returns:
+            A boolean.
+        """
+
+        node = self.trie
+        for character in code:
+            if None in node:
+                return True
+
+            node = node.get(character)
+            if node is None:
+                return False
+
+        return None in node
+
+    def match(self, values):
+        """Returns which values match one of the patterns.
+
+        Args:
+            values: A pandas series of codes.
+
+        Returns:
+            A boolean pandas series, False for missing values.
+        """
+
+        labels, uniques = pd.factorize(values)
+        codes = pd.Series(uniques).map(self.normalize)
+
+        matches = codes.isin(self.codes).values
+        if self.trie:
+            matches = matches | np.array([self.match_family(code) for code in codes], dtype=bool)
+
+        # missing values are labeled -1, which takes the appended False
+        matches = np.append(matches, False)
+        return pd.Series(matches[labels], index=values.index, name=values.name)
@@ -62,41 +62,44 @@ class ProblemDefinition:
             ValueError: An error occurs if the cutoff variable does not exist.
         """
 
-    def unify_cutoff_times_hours_admission_time(self, df, cutoff_time_label):
-        """Unify records cutoff times based on shared time.
+    @staticmethod
+    def _unify_days(df, date_label, cutoff_time_label, aggregation):
+        """Unify the cutoff times of the records with a positive duration per day.
 
-        Args:
-            df: cutoff_entity dataframe.
+        Records with a positive duration share the aggregated cutoff time of their day,
+        while the other records are left without a cutoff time. The other records of
+        the days with a positive duration are unchecked.
         """
-        df = df.sort_values(by=[cutoff_time_label])
-        df = df.reset_index()
 
-        for i in df.index:
+        df = df[df['duration'].notnull() & df[date_label].notnull()]
+
+        greater = df['duration'] > 0
+        shared_ct = df[cutoff_time_label].where(greater).groupby(
+            df[date_label]).transform(aggregation)
+
+        checked = df['checked'].where(shared_ct.isnull(), greater)
 
-            if i == 0:
+        return df.assign(ct=shared_ct.where(greater), checked=checked).drop_duplicates()
 
-                if df.get_value(i, 'checked') is not True:
-                    df.set_value(i, 'ct', df.get_value(i, cutoff_time_label))
-                    df.set_value(i, 'checked', True)
+    def unify_cutoff_times_hours_admission_time(self, df, cutoff_time_label):
+        """Unify records cutoff times based on shared time.
 
-            elif df.get_value(i, 'checked') is not True:
+        Records are sorted by their cutoff time, and a record that is still ongoing when
+        the next one starts takes the cutoff time of the next one.
 
-                ct_val1 = df.get_value(i - 1, 'ct')
-                end_val1 = df.get_value(i - 1, 'end')
-                start_val2 = df.get_value(i, cutoff_time_label)
-                df.get_value(i, 'end')
+        Args:
+            df: cutoff_entity dataframe.
+        """
 
-                if ct_val1 < start_val2 < end_val1:
-                    df.set_value(i - 1, 'ct', start_val2)
-                    df.set_value(i, 'ct', start_val2)
-                    df.set_value(i, 'checked', True)
+        df = df.sort_values(by=[cutoff_time_label], kind='mergesort')
+        df = df.reset_index()
 
-                else:
-                    df.set_value(i, 'ct', df.get_value(i, cutoff_time_label))
-                    df.set_value(i, 'checked', True)
+        ct = df[cutoff_time_label]
+        next_ct = ct.shift(-1)
+        overlap = (ct < next_ct) & (next_ct < df['end'])
 
-                if i + 1 == len(df):
-                    break
+        df['ct'] = next_ct.where(overlap, ct)
+        df['checked'] = True
         return df
 
     def unify_cutoff_times_days_admission_time(self, df, cutoff_time_label):
@@ -106,33 +109,9 @@ class ProblemDefinition:
             df: cutoff_entity dataframe.
         """
 
-        frames = []
-        for d in set(df['date']):
-            sub_day = df[df['date'] == d]
-
-            sub_duration_greater = sub_day[sub_day['duration'] > 0]
-            sub_duration_less = sub_day[sub_day['duration'] <= 0]
-            frames.append(sub_duration_less)
-            sub_duration_greater = sub_duration_greater.sort_values(by=[cutoff_time_label])
-            if len(sub_duration_greater) != 0:
-                final_date = sub_duration_greater.iloc[-1][cutoff_time_label]
-
-                for i in sub_duration_greater.index:
-                    sub_duration_greater.set_value(i, 'ct', final_date)
-                    sub_duration_greater.set_value(i, 'checked', True)
-
-                frames.append(sub_duration_greater)
-
-                for i in sub_duration_less.index:
-                    sub_duration_less.set_value(i, 'ct', pd.NaT)
-                    sub_duration_less.set_value(i, 'checked', False)
-
-                    frames.append(sub_duration_less)
-
-        result = pd.concat(frames)
-        result = result.drop_duplicates()
+        result = self._unify_days(df, 'date', cutoff_time_label, 'max')
         result[cutoff_time_label] = pd.to_datetime(result.start)
-        result = result.sort_values(by=[cutoff_time_label])
+        result = result.sort_values(by=[cutoff_time_label], kind='mergesort')
         result = result.reset_index()
         return result
 
@@ -150,9 +129,7 @@ class ProblemDefinition:
         df = es[cutoff_entity].df
         df[cutoff_time_label] = pd.to_datetime(df[cutoff_time_label])
         df['end'] = pd.to_datetime(df['end'])
-        duration = (df['end'] - df[cutoff_time_label]).dt.days
-        duration = duration.tolist()
-        df['duration'] = duration
+        df['duration'] = (df['end'] - df[cutoff_time_label]).dt.days
         df['date'] = df[cutoff_time_label].dt.date
         df['ct'] = ''
         df['checked'] = False
@@ -169,29 +146,7 @@ class ProblemDefinition:
             df: cutoff_entity dataframe.
         """
 
-        frames = []
-        for d in set(df['end_date']):
-            sub_day = df[df['end_date'] == d]
-
-            sub_duration_greater = sub_day[sub_day['duration'] > 0]
-            sub_duration_less = sub_day[sub_day['duration'] <= 0]
-            frames.append(sub_duration_less)
-            sub_duration_greater = sub_duration_greater.sort_values(by=[cutoff_time_label])
-            if len(sub_duration_greater) != 0:
-                first_date = sub_duration_greater.iloc[0][cutoff_time_label]
-
-                for i in sub_duration_greater.index:
-                    sub_duration_greater.set_value(i, 'ct', first_date)
-                    sub_duration_greater.set_value(i, 'checked', True)
-                frames.append(sub_duration_greater)
-
-                for i in sub_duration_less.index:
-                    sub_duration_less.set_value(i, 'ct', pd.NaT)
-                    sub_duration_less.set_value(i, 'checked', False)
-                frames.append(sub_duration_less)
-
-        result = pd.concat(frames)
-        result = result.drop_duplicates()
+        result = self._unify_days(df, 'end_date', cutoff_time_label, 'min')
         result[cutoff_time_label] = pd.to_datetime(result.end)
         result = result.reset_index()
         return result
@@ -199,25 +154,16 @@ class ProblemDefinition:
     def unify_cutoff_times_hours_discharge_time(self, df, cutoff_time_label):
         """Unify records cutoff times based on shared time.
 
+        Records that end in the same hour share the earliest cutoff time of that hour.
+
         Args:
             df: cutoff_entity dataframe.
         """
 
-        frames = []
-        for d in set(df['end_date']):
-            sub_day = df[df['end_date'] == d]
-            for h in set(sub_day['hour']):
-                sub_hour = sub_day[sub_day['hour'] == h]
-                sub_hour = sub_hour.sort_values(by=[cutoff_time_label])
-                if len(sub_hour) != 0:
-                    first_date = sub_hour.iloc[0][cutoff_time_label]
-                    for i in sub_hour.index:
-                        sub_hour.set_value(i, 'ct', first_date)
-                        sub_hour.set_value(i, 'checked', True)
-
-                    frames.append(sub_hour)
-
-        result = pd.concat(frames)
+        df = df[df['end_date'].notnull() & df['hour'].notnull()]
+        ct = df.groupby(['end_date', 'hour'])[cutoff_time_label].transform('min')
+
+        result = df.assign(ct=ct, checked=True)
         result = result.drop_duplicates()
         return result
 
@@ -234,10 +180,8 @@ class ProblemDefinition:
 
         df = es[cutoff_entity].df
         df['end_date'] = df[cutoff_time_label].dt.date
-        df['hour'] = df.end.apply(lambda x: x.hour)
-        duration = (df[cutoff_time_label] - df['start']).dt.days
-        duration = duration.tolist()
-        df['duration'] = duration
+        df['hour'] = df['end'].dt.hour
+        df['duration'] = (df[cutoff_time_label] - df['start']).dt.days
         df['ct'] = ''
         df['checked'] = False
         result1 = self.unify_cutoff_times_days_discharge_time(df, cutoff_time_label)
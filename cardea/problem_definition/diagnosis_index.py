@@ -0,0 +1,175 @@
+import weakref
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# the entities the diagnosis codes are joined from
+SOURCE_ENTITIES = ('Coding', 'CodeableConcept', 'Condition')
+
+# diagnosis index of each entityset, keyed by id and invalidated when the dataframe of
+# one of its sources changes
+_DIAGNOSIS_INDEXES = {}
+
+
+class DiagnosisIndex():
+    """A class that maps encounters to the codes of their diagnoses.
+
+    The codes of the Coding entity are joined to the encounters through the
+    CodeableConcept of each Condition and the encounter the Condition refers to in its
+    subject. The pairs of encounter and code are stored exploded, one row per distinct
+    pair, with the codes as a categorical so each distinct code is stored once.
+
+    Attributes:
+        pairs: A dataframe with the encounter and code columns.
+    """
+
+    __name__ = 'DiagnosisIndex'
+
+    def __init__(self, encounters, codes):
+        pairs = pd.DataFrame({'encounter': encounters, 'code': codes})
+        pairs = pairs.dropna().drop_duplicates().reset_index(drop=True)
+        pairs['code'] = pairs['code'].astype('category')
+        self.pairs = pairs
+
+    @classmethod
+    def from_entityset(cls, es):
+        """Returns the diagnosis index of the encounters of an entityset.
+
+        Args:
+            es: fhir entityset.
+
+        Returns:
+            A DiagnosisIndex.
+        """
+
+        coding = es['Coding'].df
+        concepts = es['CodeableConcept'].df
+        conditions = es['Condition'].df
+
+        coding_codes = pd.Series(coding['code'].values, index=coding['object_id'].values)
+        concept_codes = pd.Series(concepts['coding'].map(coding_codes).values,
+                                  index=concepts['object_id'].values)
+        condition_codes = conditions['code'].map(concept_codes)
+
+        return cls(conditions['subject'].values, condition_codes.values)
+
+    def get_codes(self, encounter):
+        """Returns the diagnosis codes of an encounter.
+
+        Args:
+            encounter: The identifier of the encounter.
+
+        Returns:
+            A list of the distinct codes of the encounter.
+        """
+
+        return list(self.pairs['code'][self.pairs['encounter'] == encounter])
+
+    def get_first_codes(self, encounters):
+        """Returns the first diagnosis code of each encounter.
+
+        Args:
+            encounters: A pandas series of encounter identifiers.
+
+        Returns:
+            A pandas series of codes aligned with encounters, NaN for encounters without
+            diagnosis.
+        """
+
+        first_codes = self.pairs.drop_duplicates('encounter')
+        first_codes = pd.Series(first_codes['code'].astype(object).values,
+                                index=first_codes['encounter'].values)
+
+        return encounters.map(first_codes)
+
+    def match(self, encounters, code_matcher):
+        """Returns which encounters have a diagnosis code matched by code_matcher.
+
+        Each distinct code is matched once, and the matches are spread to the encounters
+        through the categorical codes of the pairs.
+
+        Args:
+            encounters: A pandas series of encounter identifiers.
+            code_matcher: A CodeMatcher of the diagnoses.
+
+        Returns:
+            A boolean pandas series aligned with encounters.
+        """
+
+        codes = self.pairs['code']
+        matches = code_matcher.match(pd.Series(codes.cat.categories)).values
+        matched_encounters = self.pairs['encounter'][matches[codes.cat.codes.values]]
+
+        return encounters.isin(matched_encounters)
+
+    def match_matrix(self, encounters, code_matchers):
+        """Returns which encounters have a diagnosis code matched by each code matcher.
+
+        The distinct codes are matched once per code matcher, and the matches are
+        spread to the encounters by a product of sparse matrices.
+
+        Args:
+            encounters: A pandas series of distinct encounter identifiers.
+            code_matchers: A list of CodeMatcher.
+
+        Returns:
+            A boolean scipy.sparse.csr_matrix with a row per encounter and a column per
+            code matcher.
+        """
+
+        codes = self.pairs['code']
+        categories = pd.Series(codes.cat.categories)
+
+        category_rows = []
+        matcher_columns = []
+        for column, code_matcher in enumerate(code_matchers):
+            matched = np.flatnonzero(code_matcher.match(categories).values)
+            category_rows.append(matched)
+            matcher_columns.append(np.full(len(matched), column))
+
+        category_rows = np.concatenate(category_rows or [[]]).astype(int)
+        matcher_columns = np.concatenate(matcher_columns or [[]]).astype(int)
+        category_matches = sparse.csr_matrix(
+            (np.ones(len(category_rows)), (category_rows, matcher_columns)),
+            shape=(len(categories), len(code_matchers)))
+
+        # pairs of encounters that are not requested are labeled -1
+        rows = pd.Index(encounters).get_indexer(self.pairs['encounter'])
+        requested = rows >= 0
+        encounter_codes = sparse.csr_matrix(
+            (np.ones(requested.sum()), (rows[requested], codes.cat.codes.values[requested])),
+            shape=(len(encounters), len(categories)))
+
+        return (encounter_codes * category_matches) > 0
+
+
+def get_diagnosis_index(es):
+    """Returns the diagnosis index of an entityset.
+
+    The index is built once per entityset and kept until the entityset is garbage
+    collected or the dataframe of one of its SOURCE_ENTITIES changes, either by
+    replacing the entity or by updating its data, so every diagnosis based problem
+    definition shares it.
+
+    Args:
+        es: fhir entityset.
+
+    Returns:
+        A DiagnosisIndex.
+    """
+
+    key = id(es)
+    sources = tuple(es[name].df for name in SOURCE_ENTITIES)
+
+    entry = _DIAGNOSIS_INDEXES.get(key)
+    if entry is not None:
+        ref, source_refs, index = entry
+        if ref() is es and all(r() is s for r, s in zip(source_refs, sources)):
+            return index
+
+    index = DiagnosisIndex.from_entityset(es)
+    ref = weakref.ref(es, lambda _: _DIAGNOSIS_INDEXES.pop(key, None))
+    _DIAGNOSIS_INDEXES[key] = (ref, tuple(weakref.ref(s) for s in sources), index)
+
+    return index
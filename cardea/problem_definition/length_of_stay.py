@@ -95,17 +95,8 @@ class LengthOfStay (ProblemDefinition):
         end = 'end'
         label_name = self.target_label_column_name
 
-        if (DL().check_column_existence(es,
-                                        generate_from,
-                                        start) and DL().check_column_existence(es,
-                                                                               generate_from,
-                                                                               end)):
-            if (not DL().check_for_missing_values(es,
-                                                  generate_from,
-                                                  start) and not
-                (DL().check_for_missing_values(es,
-                                               generate_from,
-                                               end))):
+        if not DL().get_missing_columns(es, {generate_from: [start, end]}):
+            if not DL().check_for_missing_values(es, generate_from, [start, end]):
 
                 es[generate_from].df[start] = pd.to_datetime(
                     es[generate_from].df[start])
@@ -1,7 +1,7 @@
-import pandas as pd
-
 from cardea.data_loader import DataLoader
 from cardea.problem_definition import ProblemDefinition
+from cardea.problem_definition.code_matcher import CodeMatcher
+from cardea.problem_definition.diagnosis_index import get_diagnosis_index
 
 
 class MortalityPrediction (ProblemDefinition):
@@ -23,6 +23,9 @@ class MortalityPrediction (ProblemDefinition):
         cutoff_time_label: The cutoff time label of the prediction problem.
         cutoff_entity: Name of the entity containing the cutoff time label.
         prediction_type: The type of the machine learning prediction.
+        causes_of_death: The codes of the causes of death, where codes ending with '*'
+            match a family of codes.
+        code_matcher: A CodeMatcher of the causes of death.
     """
     __name__ = 'mortality'
 
@@ -36,6 +39,12 @@ class MortalityPrediction (ProblemDefinition):
     causes_of_death = ['X60', 'X84', 'Y87.0', 'X85', 'Y09',
                        'Y87.1', 'V02', 'V04', 'V09.0', 'V09.2', 'V12', 'V14']
 
+    def __init__(self, causes_of_death=None):
+        if causes_of_death is not None:
+            self.causes_of_death = list(causes_of_death)
+
+        self.code_matcher = CodeMatcher(self.causes_of_death)
+
     def generate_cutoff_times(self, es):
         """Generates cutoff times for the predection problem.
 
@@ -73,11 +82,8 @@ class MortalityPrediction (ProblemDefinition):
             cutoff_times['instance_id'] = instance_id
             cutoff_times.columns = ['cutoff_time', 'instance_id']
 
-            cutoff_times['label'] = list(es[self.target_entity].df[self.target_label_column_name])
-
-            for (idx, row) in cutoff_times.iterrows():
-                new_val = row.loc['label'] in self.causes_of_death
-                cutoff_times.set_value(idx, 'label', new_val)
+            cutoff_times['label'] = get_diagnosis_index(es).match(
+                cutoff_times['instance_id'], self.code_matcher).values
 
             return(es, self.target_entity, cutoff_times)
         else:
@@ -107,23 +113,8 @@ class MortalityPrediction (ProblemDefinition):
                                                          self.target_label_column_name):
                 entity_set_df = es[self.target_entity].df
 
-                merging_coding = pd.merge(es['Coding'].df, es['CodeableConcept'].df,
-                                          left_on='object_id', right_on='coding', how='left')
-                merging_condtion = pd.merge(merging_coding, es['Condition'].df,
-                                            left_on='object_id_y', right_on='code', how='left')
-                merging_diagnosis = pd.merge(
-                    merging_condtion,
-                    es['Encounter_Diagnosis'].df,
-                    left_on='identifier',
-                    right_on='condition', how='left')
-
-                merging_encouter = pd.merge(merging_diagnosis, es[self.target_entity].df,
-                                            left_on='subject', right_on='identifier', how='left')
-                merging_encouter['target'] = merging_encouter['code_x']
-
-                set(es[self.target_entity].df.identifier)
-
-                entity_set_df[self.target_label_column_name] = list(merging_encouter['target'])
+                entity_set_df[self.target_label_column_name] = get_diagnosis_index(
+                    es).get_first_codes(entity_set_df['identifier']).values
 
                 es = es.entity_from_dataframe(entity_id=self.target_entity,
                                               dataframe=entity_set_df,
@@ -0,0 +1,69 @@
+import numpy as np
+
+from cardea.problem_definition.code_matcher import CodeMatcher
+from cardea.problem_definition.diagnosis_index import get_diagnosis_index
+from cardea.problem_definition.predicting_diagnosis import DiagnosisPrediction
+
+
+class MultiLabelDiagnosisPrediction (DiagnosisPrediction):
+    """Defines the problem of diagnosis Prediction for many diagnoses at once.
+
+    Finding which of the specified diagnoses a patient will be diagnosed with.
+
+    Note:
+        The cutoff times are shared by every diagnosis, so a single feature matrix
+        serves all of them. The labels are kept in a sparse matrix with a row per
+        instance, in the order of the cutoff times, and a column per diagnosis.
+
+    Attributes:
+        target_label_column_name: The target label of the prediction problem.
+        target_entity: Name of the entity containing the target label.
+        cutoff_time_label: The cutoff time label of the prediction problem.
+        cutoff_entity: Name of the entity containing the cutoff time label.
+        prediction_type: The type of the machine learning prediction.
+        diagnoses: The list of diagnosis codes, where codes ending with '*' match a
+            family of codes.
+        code_matchers: A CodeMatcher per diagnosis.
+        labels: A boolean scipy.sparse.csr_matrix of the labels, set by
+            generate_cutoff_times.
+    """
+    __name__ = 'multi_label_diagnosis'
+
+    def __init__(self, diagnoses):
+        self.diagnoses = list(diagnoses)
+        self.code_matchers = [CodeMatcher([diagnosis]) for diagnosis in self.diagnoses]
+        self.labels = None
+
+    def label_cutoff_times(self, es, cutoff_times):
+        """Labels the instances of the cutoff times with every diagnosis.
+
+        Args:
+            es: fhir entityset.
+            cutoff_times: A dataframe of cutoff_times and instance_ids.
+
+        Returns:
+            The cutoff_times, while the labels are stored in the labels attribute.
+        """
+
+        self.labels = get_diagnosis_index(es).match_matrix(
+            cutoff_times['instance_id'], self.code_matchers)
+        return cutoff_times
+
+    def get_labels(self, diagnosis):
+        """Returns the labels of a single diagnosis.
+
+        Args:
+            diagnosis: One of the diagnoses of the problem.
+
+        Returns:
+            A boolean numpy array aligned with the cutoff times.
+
+        Raises:
+            ValueError: An error occurs if the cutoff times were not generated yet.
+        """
+
+        if self.labels is None:
+            raise ValueError('The cutoff times of {} were not generated'.format(self.__name__))
+
+        column = self.diagnoses.index(diagnosis)
+        return np.asarray(self.labels[:, column].todense()).ravel()
@@ -1,7 +1,7 @@
-import pandas as pd
-
 from cardea.data_loader import DataLoader
 from cardea.problem_definition import ProblemDefinition
+from cardea.problem_definition.code_matcher import CodeMatcher
+from cardea.problem_definition.diagnosis_index import get_diagnosis_index
 
 
 class DiagnosisPrediction (ProblemDefinition):
@@ -35,6 +35,7 @@ class DiagnosisPrediction (ProblemDefinition):
 
     def __init__(self, d):
         self.diagnosis = d
+        self.code_matcher = CodeMatcher([d])
 
     def generate_cutoff_times(self, es):
         """Generates cutoff times for the predection problem.
@@ -72,14 +73,28 @@ class DiagnosisPrediction (ProblemDefinition):
 
             cutoff_times['instance_id'] = instance_id
             cutoff_times.columns = ['cutoff_time', 'instance_id']
-            cutoff_times['label'] = list(es[self.target_entity].df[self.target_label_column_name])
-            cutoff_times['label'] = cutoff_times['label'] == self.diagnosis
+            cutoff_times = self.label_cutoff_times(es, cutoff_times)
 
             return(es, self.target_entity, cutoff_times)
         else:
             raise ValueError('Cutoff time label {} in table {} does not exist'
                              .format(self.cutoff_time_label, self.target_entity))
 
+    def label_cutoff_times(self, es, cutoff_times):
+        """Labels the instances of the cutoff times with their diagnosis.
+
+        Args:
+            es: fhir entityset.
+            cutoff_times: A dataframe of cutoff_times and instance_ids.
+
+        Returns:
+            The cutoff_times with the target labels.
+        """
+
+        cutoff_times['label'] = get_diagnosis_index(es).match(
+            cutoff_times['instance_id'], self.code_matcher).values
+        return cutoff_times
+
     def generate_target_label(self, es):
         """Generates target labels in the case of having missing label in the entityset.
 
@@ -103,23 +118,8 @@ class DiagnosisPrediction (ProblemDefinition):
                                                          self.target_label_column_name):
                 entity_set_df = es[self.target_entity].df
 
-                merging_coding = pd.merge(es['Coding'].df, es['CodeableConcept'].df,
-                                          left_on='object_id', right_on='coding', how='left')
-                merging_condtion = pd.merge(merging_coding, es['Condition'].df,
-                                            left_on='object_id_y', right_on='code', how='left')
-                merging_diagnosis = pd.merge(
-                    merging_condtion,
-                    es['Encounter_Diagnosis'].df,
-                    left_on='identifier',
-                    right_on='condition', how='left')
-
-                merging_encouter = pd.merge(merging_diagnosis, es[self.target_entity].df,
-                                            left_on='subject', right_on='identifier', how='left')
-                merging_encouter['target'] = merging_encouter['code_x']
-
-                set(es[self.target_entity].df.identifier)
-
-                entity_set_df[self.target_label_column_name] = list(merging_encouter['target'])
+                entity_set_df[self.target_label_column_name] = get_diagnosis_index(
+                    es).get_first_codes(entity_set_df['identifier']).values
 
                 es = es.entity_from_dataframe(entity_id=self.target_entity,
                                               dataframe=entity_set_df,
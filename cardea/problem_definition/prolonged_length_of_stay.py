@@ -105,19 +105,9 @@ class ProlongedLengthOfStay (ProblemDefinition):
         start = self.cutoff_time_label
         end = 'end'
         label_name = self.target_label_column_name
-        if (DataLoader().check_column_existence(
-            es,
-            generate_from,
-            start) and DataLoader().check_column_existence(es,
-                                                           generate_from,
-                                                           end)):
-
-            if (not DataLoader().check_for_missing_values(
-                    es,
-                    generate_from,
-                    start) and not DataLoader().check_for_missing_values(es,
-                                                                         generate_from,
-                                                                         end)):
+        if not DataLoader().get_missing_columns(es, {generate_from: [start, end]}):
+
+            if not DataLoader().check_for_missing_values(es, generate_from, [start, end]):
 
                 es[generate_from].df[start] = pd.to_datetime(
                     es[generate_from]
@@ -11,7 +11,9 @@ class Readmission (ProblemDefinition):
 
     Note:
         The patient visit is considered a readmission if he/she visits
-        the hospital again within 30 days.
+        the hospital again within 30 days. Additional windows label the
+        visits in label_<days> columns of the cutoff times only, so they
+        are not added to the entityset and do not leak into the features.
 
         The readmission diagnosis does not have to be the same as the initial visit diagnosis,
         (The patient could be diagnosed of something that is a complication
@@ -23,6 +25,10 @@ class Readmission (ProblemDefinition):
         cutoff_time_label: The cutoff time label of the prediction problem.
         cutoff_entity: Name of the entity containing the cutoff time label.
         prediction_type: The type of the machine learning prediction.
+        readmission_threshold: The number of days within which a visit is a readmission.
+        windows: A tuple of additional readmission thresholds, in days.
+        window_labels: A dataframe of the labels of the additional windows, indexed by
+            the identifier of the visits, set by generate_target_label.
     """
     __name__ = 'readmission'
 
@@ -33,9 +39,49 @@ class Readmission (ProblemDefinition):
     cutoff_entity = 'Period'
     prediction_type = 'classification'
     conn = 'period'
+    window_labels = None
 
-    def __init__(self, t=30):
+    def __init__(self, t=30, windows=()):
         self.readmission_threshold = t
+        self.windows = tuple(windows)
+
+    def get_label_columns(self):
+        """Returns the label columns and their readmission thresholds.
+
+        Returns:
+            A dictionary of the label column names and their threshold in days.
+        """
+
+        label_columns = {self.target_label_column_name: self.readmission_threshold}
+        for window in self.windows:
+            label_columns['{}_{}'.format(self.target_label_column_name, window)] = window
+
+        return label_columns
+
+    def label_readmissions(self, visits, time_label):
+        """Labels the visits that follow a previous visit of the same patient.
+
+        The visits of each patient are sorted by time, and a visit is labeled as a
+        readmission when it happens within the threshold of the previous one. Visits
+        without a patient are not labeled.
+
+        Args:
+            visits: A dataframe of encounters with their subject and time_label.
+            time_label: The column that holds the time of the visits.
+
+        Returns:
+            A dataframe with the identifier of the visits and a column per threshold.
+        """
+
+        visits = visits[visits['subject'].notnull()]
+        visits = visits.sort_values(by=['subject', time_label], kind='mergesort')
+        gaps = visits.groupby('subject')[time_label].diff().dt.days
+
+        labels = pd.DataFrame({'identifier': visits['identifier'].values})
+        for column, threshold in self.get_label_columns().items():
+            labels[column] = (gaps <= threshold).values
+
+        return labels
 
     def generate_cutoff_times(self, es):
         """Generates cutoff times for the predection problem.
@@ -74,6 +120,12 @@ class Readmission (ProblemDefinition):
             cutoff_times['instance_id'] = instance_id
             cutoff_times.columns = ['cutoff_time', 'instance_id']
             cutoff_times['label'] = list(es[self.target_entity].df[self.target_label_column_name])
+
+            window_labels = self.window_labels.reindex(instance_id)
+            for window in self.windows:
+                cutoff_times['label_{}'.format(window)] = window_labels[
+                    '{}_{}'.format(self.target_label_column_name, window)].values
+
             return(es, self.target_entity, cutoff_times)
         else:
             raise ValueError('Cutoff time label {} in table {} does not exist'
@@ -93,12 +145,8 @@ class Readmission (ProblemDefinition):
         """
         generate_from = 'Period'
         end = 'end'
-        if (DataLoader().check_column_existence(
-            es,
-            generate_from,
-            end)) and (DataLoader().check_column_existence(es,
-                                                           self.target_entity,
-                                                           'period')):
+        if not DataLoader().get_missing_columns(es, {generate_from: [end],
+                                                     self.target_entity: ['period']}):
 
             if not DataLoader().check_for_missing_values(
                     es,
@@ -109,36 +157,16 @@ class Readmission (ProblemDefinition):
                 merged_df = pd.merge(entity_set_df, generated_df, how='left',
                                      left_on='period', right_on='object_id')
 
-                generated_target_label = []
-                encounter_identifier = []
-
-                for patient in set(merged_df['subject']):
-                    patient_visits = merged_df[merged_df['subject'] == patient]
-                    inital_date = patient_visits[end].iloc[0]
-
-                    encounter_identifier.append(patient_visits['identifier'].iloc[0])
-                    generated_target_label.append(False)  # first visit
-
-                    if len(patient_visits) != 1:
-                        for visit_date, encounter_id in zip(patient_visits[end][1:],
-                                                            patient_visits['identifier'][1:]):
-
-                            visit_range = visit_date - inital_date
-                            inital_date = visit_date
-
-                            if visit_range.days <= self.readmission_threshold:
-                                generated_target_label.append(True)
-                                encounter_identifier.append(encounter_id)
+                generated_labels = self.label_readmissions(merged_df, end)
 
-                            else:
-                                generated_target_label.append(False)
-                                encounter_identifier.append(encounter_id)
+                # only the target label is added to the entity, the labels of the other
+                # windows are kept for the cutoff times
+                window_columns = [column for column in generated_labels.columns
+                                  if column not in ('identifier', self.target_label_column_name)]
+                self.window_labels = generated_labels.set_index('identifier')[window_columns]
 
-                generated_labels = pd.DataFrame(
-                    {self.target_label_column_name: generated_target_label,
-                     'identifier': encounter_identifier})
                 updated_target_entity = pd.merge(entity_set_df,
-                                                 generated_labels,
+                                                 generated_labels.drop(columns=window_columns),
                                                  on='identifier')
 
                 es = es.entity_from_dataframe(entity_id=self.target_entity,
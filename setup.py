@@ -20,6 +20,10 @@ install_requires = [
     'hyperopt==0.1.2'
 ]
 
+parquet_requires = [
+    'pyarrow>=0.15.1',
+]
+
 setup_requires = [
     'pytest-runner>=2.11.1',
 ]
@@ -74,8 +78,9 @@ setup(
     ],
     description="Cardea",
     extras_require={
-        'dev': development_requires + tests_require,
-        'test': tests_require
+        'dev': development_requires + tests_require + parquet_requires,
+        'parquet': parquet_requires,
+        'test': tests_require + parquet_requires
     },
     include_package_data=True,
     install_requires=install_requires,
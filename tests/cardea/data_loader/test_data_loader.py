@@ -5,6 +5,8 @@ import pandas as pd
 import pytest
 
 from cardea.data_loader import DataLoader, Diamond
+from cardea.data_loader.data_loader import (
+    MergeStep, find_missing_values, get_columns, get_identifier_index, memory_cost)
 
 
 @pytest.fixture()
@@ -108,6 +110,18 @@ def test_data_loader_create_object(loader, patient_df):
     assert len(object_df) == len(patient_df)
 
 
+def test_data_loader_create_object_no_copy(loader, patient_df):
+    object = loader.create_object(patient_df, 'Patient')
+    assert object.get_dataframe() is patient_df
+
+
+def test_resolve_reference_keeps_dataframes(objects):
+    identifier_df = objects[-1].get_dataframe()
+    diamond = Diamond(objects)
+    diamond.resolve_reference()
+    assert identifier_df['object_id'].dtype == 'int64'
+
+
 def test_fhir_class_exist(loader, patient_df):
     with pytest.raises(LookupError):
         loader.create_object(patient_df, 'Inpatient')
@@ -119,6 +133,12 @@ def test_assert_object_identifier(loader, patient_df):
         loader.create_object(df, 'Patient')
 
 
+def test_assert_object_enum(loader, patient_df):
+    patient_df['gender'] = ['female', 'F', 'male', 'female']
+    with pytest.raises(ValueError):
+        loader.create_object(patient_df, 'Patient')
+
+
 def test_get_object_ids(loader, patient):
     id = loader.get_object_ids([patient])
     assert len(id) == 1 and id['Patient'] == "identifier"
@@ -135,6 +155,13 @@ def test_get_relationships_multiple(loader, patient, encounter, reference):
     assert len(relationships) == 1
 
 
+def test_get_relationships_empty(loader, encounter):
+    relationships = loader.get_relationships([encounter], ['Encounter'])
+    assert len(relationships) == 0
+    assert list(relationships.columns) == ['parent_entity', 'parent_variable',
+                                           'child_entity', 'child_variable']
+
+
 def test_get_dataframes(loader, patient):
     dfs = loader.get_dataframes([patient])
     assert len(dfs) == 1
@@ -152,12 +179,45 @@ def test_merge_cost(diamond):
     assert sum(cost) == sum([26, 22, 22, 16, 21, 14, 16, 16, 20])
 
 
+def test_get_relation(diamond):
+    forward = diamond.get_relation('Period', 'Encounter')
+    backward = diamond.get_relation('Encounter', 'Period')
+    assert len(forward) == 1 and forward.index.equals(backward.index)
+
+
 def test_resolve_reference(diamond):
     diamond.resolve_reference()
     relationships = diamond.get_fhir_relationships()
     assert len(relationships) == 5
 
 
+def test_resolve_reference_targets(diamond):
+    diamond.resolve_reference()
+    relationships = diamond.get_fhir_relationships()
+    subject = relationships[relationships['child_entity'] == 'Condition']
+    condition = relationships[relationships['child_entity'] == 'Encounter_Diagnosis']
+    assert subject['parent_entity'].tolist() == ['Patient']
+    assert condition['parent_entity'].tolist() == ['Condition']
+
+
+def test_resolve_reference_multiple_targets(loader, objects):
+    encounter_df = pd.DataFrame({"identifier": [10, 11, 12],
+                                 "subject": [10, 2, 3]})
+    objects[1] = loader.create_object(encounter_df, 'Encounter')
+    diamond = Diamond(objects)
+    diamond.resolve_reference()
+    relationships = diamond.get_fhir_relationships()
+    subject = relationships[(relationships['child_entity'] == 'Encounter') &
+                            (relationships['child_variable'] == 'subject')]
+    assert subject['parent_entity'].tolist() == ['Patient']
+
+
+def test_get_identifier_index(diamond):
+    index = get_identifier_index(diamond.get_fhir_dataframes())
+    assert len(index) == 10 and 'Reference' not in index['resource'].cat.categories
+    assert index.loc[index['identifier'] == '1000', 'resource'].tolist() == ['Condition']
+
+
 def test_resolve_reference_lookuperror(objects):
     objects = objects[:-1]
     diamond = Diamond(objects)
@@ -193,3 +253,126 @@ def test_resolve_diamond(diamond):
     relationships = diamond.get_fhir_relationships()
     fhir = diamond.get_fhir_dataframes()
     assert len(relationships) == 4 and len(fhir) == 7
+
+
+@pytest.fixture()
+def deferred(objects):
+    diamond = Diamond(objects, deferred=True)
+    diamond.resolve_diamond()
+    return diamond
+
+
+def test_resolve_diamond_deferred(objects, diamond, deferred):
+    diamond.resolve_diamond()
+    assert len(deferred.merge_plan) == 1
+    assert deferred.get_fhir_relationships().equals(diamond.get_fhir_relationships())
+    assert all(deferred.get_fhir_dataframes()[object.__name__] is object.get_dataframe()
+               for object in objects)
+
+
+def test_get_merge_plan(deferred):
+    plan = deferred.get_merge_plan()
+    assert len(plan) == 1 and plan['memory'].iloc[0] > 0
+    assert deferred.get_merge_plan({plan['source_entity'].iloc[0]: []})['memory'].iloc[0] == 0
+
+
+def test_get_merge_plan_estimates(deferred):
+    plan = deferred.get_merge_plan()
+    step = deferred.merge_plan[0]
+    assert plan['rows'].iloc[0] == deferred.estimate_merge(step)[0]
+    assert plan['memory'].iloc[0] == pytest.approx(memory_cost(deferred, step), abs=1)
+
+
+def test_materialize(diamond, deferred):
+    diamond.resolve_diamond()
+    fhir = deferred.materialize()
+    assert not deferred.merge_plan
+    assert all(fhir[name].equals(df) for name, df in diamond.get_fhir_dataframes().items())
+
+
+def test_materialize_columns(deferred):
+    step = deferred.merge_plan[0]
+    previous = len(deferred.get_fhir_dataframes()[step.target_entity].columns)
+    fhir = deferred.materialize({step.source_entity: []})
+    assert len(fhir[step.target_entity].columns) == previous
+
+
+def test_diamond_cost_model_error(objects):
+    with pytest.raises(ValueError):
+        Diamond(objects, cost_model='rows')
+
+
+def test_merge_cost_memory(objects):
+    diamond = Diamond(objects, cost_model='memory')
+    cost = diamond.merge_cost()
+    assert len(cost) == len(diamond.get_fhir_relationships())
+    assert min(cost) >= 0 and max(cost) > 0
+
+
+def test_merge_cost_callable(objects):
+    diamond = Diamond(objects, cost_model=lambda diamond, step: 1)
+    assert set(diamond.merge_cost()) == {1}
+
+
+def test_resolve_diamond_size_weights(diamond):
+    weights = pd.Series(diamond.merge_cost(), index=diamond.get_fhir_relationships().index)
+    diamond.resolve_diamond()
+    relationships = diamond.get_fhir_relationships()
+    assert relationships['weight'].tolist() == weights[relationships.index].tolist()
+    assert relationships['weight'].tolist() == [22, 16, 21, 16]
+
+
+def test_memory_cost(diamond_witout_ref, edge):
+    step = MergeStep(*diamond_witout_ref.get_relation(*edge).iloc[0][:4])
+    source_df = diamond_witout_ref.get_fhir_dataframes()[step.source_entity]
+    target_df = diamond_witout_ref.get_fhir_dataframes()[step.target_entity]
+
+    copied = source_df.drop(columns=step.source_column).memory_usage(index=False).sum()
+    added = len(target_df) * copied / len(source_df)
+    assert memory_cost(diamond_witout_ref, step) == pytest.approx(added, abs=1)
+
+
+def test_estimate_merge(diamond_witout_ref, edge):
+    step = MergeStep(*diamond_witout_ref.get_relation(*edge).iloc[0][:4])
+    rows, memory = diamond_witout_ref.estimate_merge(step)
+    assert rows == 3 and memory > 0
+
+
+def test_get_merge_report(objects):
+    diamond = Diamond(objects, cost_model='memory')
+    diamond.resolve_diamond()
+    report = diamond.get_merge_report()
+    assert len(report) == 1
+    assert (report['estimated_rows'] == report['rows']).all()
+
+
+def test_find_missing_values():
+    values = pd.Series(['female', None, 'nan', 'unknown', 'NULL'])
+    assert find_missing_values(values).tolist() == [False, True, True, True, False]
+
+
+def test_find_missing_values_numeric():
+    assert find_missing_values(pd.Series([1.0, float('nan')])).tolist() == [False, True]
+
+
+class Variable():
+    def __init__(self, name):
+        self.name = name
+
+
+class Entity():
+    def __init__(self, names):
+        self.variables = [Variable(name) for name in names]
+
+
+def test_get_columns_cached():
+    entity = Entity(['identifier', 'gender'])
+    assert get_columns(entity) == {'identifier', 'gender'}
+    assert get_columns(entity) is get_columns(entity)
+
+
+def test_get_columns_invalidated():
+    entity = Entity(['identifier'])
+    get_columns(entity)
+    entity.variables.append(Variable('gender'))
+    assert get_columns(entity) == {'identifier', 'gender'}
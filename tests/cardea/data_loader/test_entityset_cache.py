@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+from cardea.data_loader import EntitySetCache, entityset_cache
+from cardea.data_loader.entityset_cache import get_code_fingerprint
+
+
+@pytest.fixture()
+def cache(tmpdir):
+    return EntitySetCache(str(tmpdir.join('cache')))
+
+
+@pytest.fixture()
+def csv_file(tmpdir):
+    file_path = str(tmpdir.join('Patient.csv'))
+    with open(file_path, 'w') as csv:
+        csv.write('identifier,gender\n1,female\n')
+
+    return file_path
+
+
+def test_get_key_unchanged(cache, csv_file):
+    assert cache.get_key([csv_file]) == cache.get_key([csv_file])
+
+
+def test_get_key_changed(cache, csv_file):
+    key = cache.get_key([csv_file])
+    with open(csv_file, 'a') as csv:
+        csv.write('2,male\n')
+
+    assert cache.get_key([csv_file]) != key
+
+
+def test_get_key_code_changed(cache, csv_file, monkeypatch):
+    key = cache.get_key([csv_file])
+    monkeypatch.setattr(entityset_cache, 'get_code_fingerprint', lambda: 'edited loader')
+    assert cache.get_key([csv_file]) != key
+
+
+def test_get_code_fingerprint():
+    fingerprint = get_code_fingerprint()
+    assert len(fingerprint) == 64 and get_code_fingerprint() == fingerprint
+
+
+def test_set_get(cache):
+    cache.set('key', {'Patient': [1, 2]})
+    assert cache.get('key') == {'Patient': [1, 2]} and cache.get('other') is None
+
+
+def test_get_corrupted(cache):
+    with open(os.path.join(cache.cache_dir, 'key.pkl'), 'wb') as cache_file:
+        cache_file.write(b'')
+
+    assert cache.get('key') is None and not os.listdir(cache.cache_dir)
+
+
+def test_evict_least_recently_used(cache):
+    cache.set('first', list(range(100)))
+    cache.set('second', list(range(100)))
+    os.utime(os.path.join(cache.cache_dir, 'first.pkl'), (0, 0))
+
+    cache.max_size = os.path.getsize(os.path.join(cache.cache_dir, 'second.pkl'))
+    cache.set('third', list(range(100)))
+
+    assert cache.get('first') is None and cache.get('second') is None
+    assert cache.get('third') == list(range(100))
+
+
+def test_clear(cache):
+    cache.set('key', [1])
+    cache.clear()
+    assert cache.get('key') is None
@@ -1,11 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import json
+import os
+import pickle
+
 import featuretools as ft
 import pandas as pd
 import pytest
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
 
-from cardea.data_loader import EntitySetLoader
+from cardea.data_loader import EntitySetLoader, KeyEncoder
 
 
 @pytest.fixture()
@@ -71,3 +76,188 @@ def test_load_df_entityset(es_loader, encounter_df, period_df):
     fhir = {"Encounter": encounter_df, "Period": period_df}
     es = es_loader.load_df_entityset(fhir)
     assert len(es.relationships) == 1 and len(es.entities) == 2
+
+
+@pytest.fixture()
+def csv_folder(tmpdir, encounter_df, period_df):
+    encounter_df.assign(status=['planned', 'arrived', 'finished']).to_csv(
+        str(tmpdir.join('Encounter.csv')), index=False)
+    period_df.to_csv(str(tmpdir.join('Period.csv')), index=False)
+    return str(tmpdir)
+
+
+def test_read_csv_files(es_loader, csv_folder):
+    fhir = es_loader.read_csv_files(csv_folder, n_jobs=2)
+    assert sorted(fhir) == ['Encounter', 'Period'] and len(fhir['Period']) == 3
+
+
+def test_read_csv_files_dtypes(es_loader, csv_folder):
+    fhir = es_loader.read_csv_files(csv_folder)
+    assert fhir['Encounter']['status'].dtype == 'category'
+    assert fhir['Encounter']['identifier'].dtype == 'int64'
+    assert is_datetime64_any_dtype(fhir['Period']['start'])
+
+
+def test_set_dtypes(es_loader):
+    df = pd.DataFrame({"object_id": ['10', '11'],
+                       "use": ['usual', 'official'],
+                       "value": ['1', '2'],
+                       "period": ['120', '121']})
+    df = es_loader.set_dtypes(df, 'Identifier')
+    assert df['object_id'].dtype == 'int64' and df['period'].dtype == 'int64'
+    assert df['use'].dtype == 'category' and df['value'].tolist() == ['1', '2']
+
+
+def test_set_dtypes_no_conversion(es_loader, encounter_df):
+    assert es_loader.set_dtypes(encounter_df, 'Encounter') is encounter_df
+
+
+@pytest.fixture()
+def parquet_folder(tmpdir, es_loader, encounter_df, period_df):
+    pytest.importorskip('pyarrow')
+    folder_path = str(tmpdir.join('parquet'))
+    es_loader.write_parquet_files({"Encounter": encounter_df, "Period": period_df}, folder_path)
+    return folder_path
+
+
+def test_write_parquet_files(parquet_folder):
+    with open(os.path.join(parquet_folder, 'manifest.json')) as manifest_file:
+        manifest = json.load(manifest_file)
+
+    assert manifest['entities']['Period']['index'] == 'object_id'
+    assert len(manifest['relationships']) == 1
+
+
+def test_read_parquet_files_columns(es_loader, parquet_folder):
+    fhir, relationships, identifiers = es_loader.read_parquet_files(
+        parquet_folder, columns={'Period': []})
+    assert list(fhir['Period'].columns) == ['object_id', 'start']
+    assert list(fhir['Encounter'].columns) == ['identifier', 'period']
+
+
+def test_load_parquet_entityset(es_loader, parquet_folder):
+    es = es_loader.load_parquet_entityset(parquet_folder)
+    assert len(es.relationships) == 1 and len(es.entities) == 2
+
+
+@pytest.fixture()
+def loaded_entityset(es_loader, encounter_df, period_df):
+    return es_loader.load_df_entityset({"Encounter": encounter_df, "Period": period_df})
+
+
+def test_append_df_entityset(es_loader, loaded_entityset):
+    fhir_delta = {"Encounter": pd.DataFrame({"identifier": [13], "period": [123]}),
+                  "Period": pd.DataFrame({"object_id": [123],
+                                          "start": ['4/1/2000 20:00'],
+                                          "end": ['4/2/2000 21:10']})}
+    es = es_loader.append_df_entityset(loaded_entityset, fhir_delta)
+    assert len(es['Encounter'].df) == 4 and len(es['Period'].df) == 4
+    assert len(es.relationships) == 1
+
+
+def test_append_df_entityset_loaded_rows(es_loader, loaded_entityset):
+    fhir_delta = {"Encounter": pd.DataFrame({"identifier": [12], "period": [122]})}
+    with pytest.raises(ValueError):
+        es_loader.append_df_entityset(loaded_entityset, fhir_delta)
+
+
+def test_append_df_entityset_repeated_rows(es_loader, loaded_entityset):
+    fhir_delta = {"Encounter": pd.DataFrame({"identifier": [13, 13], "period": [120, 121]})}
+    with pytest.raises(ValueError, match='13'):
+        es_loader.append_df_entityset(loaded_entityset, fhir_delta)
+
+    assert len(loaded_entityset['Encounter'].df) == 3
+
+
+def test_append_df_entityset_unknown_entity(es_loader, loaded_entityset):
+    fhir_delta = {"Patient": pd.DataFrame({"identifier": [0]})}
+    with pytest.raises(ValueError):
+        es_loader.append_df_entityset(loaded_entityset, fhir_delta)
+
+
+@pytest.fixture()
+def json_folder(tmpdir):
+    resources = [{"resourceType": "Patient", "id": "p1", "gender": "female",
+                  "name": [{"family": "Doe", "given": ["Jane"]}]},
+                 {"resourceType": "Patient", "id": "p2", "gender": "male"},
+                 {"resourceType": "Encounter", "id": "e1", "status": "finished",
+                  "subject": {"reference": "Patient/p1"},
+                  "period": {"start": "2000-01-01T20:00:00", "end": "2000-01-02T21:10:00"}},
+                 {"resourceType": "Encounter", "id": "e2", "status": "finished",
+                  "subject": {"reference": "Patient/p2"}}]
+
+    with open(str(tmpdir.join('resources.ndjson')), 'w') as ndjson_file:
+        ndjson_file.write('\n'.join(json.dumps(resource) for resource in resources))
+
+    return str(tmpdir)
+
+
+def test_load_json_entityset_missing_elements(es_loader, json_folder):
+    es = es_loader.load_json_entityset(json_folder)
+
+    patients = es['Patient'].df.set_index('identifier')
+    assert patients['name'].isnull().tolist() == [False, True]
+    assert es['Patient'].df['name'].dtype == es['HumanName'].df['object_id'].dtype
+    assert es['HumanName'].df.set_index('object_id').loc[
+        patients.loc['Patient/p1', 'name'], 'family'] == 'Doe'
+    assert es['Encounter'].df['period'].isnull().sum() == 1
+
+
+@pytest.fixture()
+def diamond_fhir():
+    return {'Patient': pd.DataFrame({"identifier": [0, 1, 2, 3],
+                                     "gender": ['female', 'female', 'male', 'female']}),
+            'Encounter': pd.DataFrame({"identifier": [10, 11, 12],
+                                       "subject": [1, 2, 3],
+                                       "diagnosis": [91, 92, 91]}),
+            'Encounter_Diagnosis': pd.DataFrame({"object_id": [91, 92],
+                                                 "condition": [1000, 3000]}),
+            'Condition': pd.DataFrame({"identifier": [1000, 2000, 3000],
+                                       "subject": [2, 2, 1]}),
+            'Reference': pd.DataFrame({"identifier": [0, 1, 2, 3, 10, 11, 12, 1000, 2000,
+                                                      3000]}),
+            'Identifier': pd.DataFrame({"object_id": [0, 1, 2, 3, 10, 11, 12, 1000, 2000,
+                                                      3000]})}
+
+
+def test_load_df_entityset_deferred(es_loader, diamond_fhir):
+    es = es_loader.load_df_entityset(diamond_fhir, columns={'Encounter_Diagnosis': ['condition']})
+
+    step, columns = es_loader.merge_plan[0]
+    assert len(es_loader.merge_plan) == 1 and columns == ['condition']
+    assert step.target_entity == 'Encounter'
+    assert 'condition' not in es['Encounter'].df.columns
+
+    materialized = es_loader.materialize_entityset(es)
+    assert not es_loader.merge_plan and es_loader.merges == ((step, ['condition']), )
+    assert materialized['Encounter'].df.set_index('identifier')['condition'].tolist() == [
+        1000, 3000, 1000]
+    assert es_loader.materialize_entityset(materialized) is materialized
+
+
+@pytest.mark.parametrize('encode_keys', [False, True])
+def test_append_df_entityset_pickled(es_loader, diamond_fhir, encode_keys):
+    es = es_loader.load_df_entityset(diamond_fhir, encode_keys=encode_keys)
+    es = pickle.loads(pickle.dumps(es))
+
+    fhir_delta = {"Encounter": pd.DataFrame({"identifier": [13, 14],
+                                             "subject": [1, 2],
+                                             "diagnosis": [92, None]})}
+    es = EntitySetLoader().append_df_entityset(es, fhir_delta)
+
+    encounters = es['Encounter'].df
+    conditions = KeyEncoder.normalize(encounters['condition'])
+    if encode_keys:
+        conditions = es.key_encoder.decode(encounters['condition'])
+
+    assert conditions.tolist()[-2:] == ['3000', None]
+    assert is_numeric_dtype(encounters['diagnosis'])
+
+
+def test_append_df_entityset_unknown_merges(es_loader, loaded_entityset):
+    entity_set = ft.EntitySet(id="fhir", entities={
+        'Encounter': (loaded_entityset['Encounter'].df, 'identifier')})
+
+    fhir_delta = {"Encounter": pd.DataFrame({"identifier": [13], "period": [123]})}
+    with pytest.raises(ValueError, match='merges'):
+        es_loader.append_df_entityset(entity_set, fhir_delta)
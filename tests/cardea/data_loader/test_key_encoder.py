@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pandas as pd
+import pytest
+
+from cardea.data_loader import DataLoader, Diamond, KeyEncoder
+
+
+@pytest.fixture()
+def fhir():
+    return {'Patient': pd.DataFrame({"identifier": [0, 1, 2],
+                                     "gender": ['female', 'female', 'male']}),
+            'Encounter': pd.DataFrame({"identifier": ['10', '11', '12'],
+                                       "subject": [1.0, None, 2.0]}),
+            'Condition': pd.DataFrame({"identifier": [1000, 2000],
+                                       "subject": ['2', '2']}),
+            'Reference': pd.DataFrame({"identifier": [0, 1, 2, 10, 11, 12, 1000, 2000]}),
+            'Identifier': pd.DataFrame({"object_id": [0, 1, 2, 10, 11, 12, 1000, 2000]})}
+
+
+@pytest.fixture()
+def encoder(fhir):
+    return KeyEncoder().fit(fhir)
+
+
+def test_get_key_columns():
+    assert KeyEncoder.get_key_columns('Encounter', ['identifier', 'status', 'subject']) == [
+        'identifier', 'subject']
+    assert KeyEncoder.get_key_columns('Inpatient', ['identifier']) == []
+
+
+def test_transform_shared_keys(encoder, fhir):
+    encoded = encoder.transform(fhir)
+    assert encoded['Patient']['identifier'].dtype == 'int64'
+    assert encoded['Condition']['subject'].tolist() == [encoded['Patient']['identifier'][2]] * 2
+    assert encoded['Encounter']['subject'][0] == encoded['Patient']['identifier'][1]
+
+
+def test_transform_missing_keys(encoder, fhir):
+    encoded = encoder.transform(fhir)
+    assert encoded['Encounter']['subject'].isnull().tolist() == [False, True, False]
+
+
+def test_encode_non_integral_keys(fhir):
+    values = pd.Series([1.0, 1.5, None])
+    encoder = KeyEncoder().fit({'Patient': fhir['Patient'],
+                                'Encounter': pd.DataFrame({"subject": values})})
+    codes = encoder.encode(values)
+    assert codes[0] == encoder.encode(fhir['Patient']['identifier'])[1]
+    assert codes[1] not in encoder.encode(fhir['Patient']['identifier']).tolist()
+    assert codes[1] >= 0 and pd.isnull(codes[2])
+    assert KeyEncoder.normalize(values).tolist() == ['1', '1.5', None]
+
+
+def test_transform_keeps_other_columns(encoder, fhir):
+    encoded = encoder.transform(fhir)
+    assert encoded['Patient']['gender'].tolist() == ['female', 'female', 'male']
+    assert fhir['Patient']['identifier'].tolist() == [0, 1, 2]
+
+
+def test_decode(encoder, fhir):
+    codes = encoder.encode(fhir['Encounter']['subject'])
+    assert encoder.decode(codes).tolist() == ['1', None, '2']
+
+
+def test_resolve_diamond_encoded(fhir, encoder):
+    loader = DataLoader()
+    objects = [loader.create_object(df, name) for name, df in encoder.transform(fhir).items()]
+    diamond = Diamond(objects)
+    diamond.resolve_reference()
+    relationships = diamond.get_fhir_relationships()
+    assert set(relationships['parent_entity']) == {'Patient'}
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from cardea.data_loader import ResourceReader
+
+
+@pytest.fixture()
+def patients():
+    return [{"resourceType": "Patient",
+             "id": "p1",
+             "gender": "female",
+             "identifier": [{"system": "mrn", "value": "123"}],
+             "name": [{"family": "Doe", "given": ["Jane"]}]},
+            {"resourceType": "Patient",
+             "id": "p2",
+             "gender": "male",
+             "identifier": [{"system": "mrn", "value": "456"}]}]
+
+
+@pytest.fixture()
+def encounter():
+    return {"resourceType": "Encounter",
+            "id": "e1",
+            "status": "finished",
+            "class": {"code": "IMP"},
+            "subject": {"reference": "Patient/p1"},
+            "period": {"start": "2000-01-01T20:00:00", "end": "2000-01-02T21:10:00"}}
+
+
+@pytest.fixture()
+def folder(tmpdir, patients, encounter):
+    with open(str(tmpdir.join('Patient.ndjson')), 'w') as ndjson_file:
+        ndjson_file.write('\n'.join(json.dumps(patient) for patient in patients))
+
+    bundle = {"resourceType": "Bundle",
+              "type": "collection",
+              "entry": [{"fullUrl": "urn:uuid:e1", "resource": encounter}]}
+    with open(str(tmpdir.join('bundle.json')), 'w') as json_file:
+        json.dump(bundle, json_file)
+
+    return str(tmpdir)
+
+
+@pytest.fixture()
+def reader():
+    return ResourceReader(chunksize=2)
+
+
+def test_get_reference_id():
+    assert ResourceReader.get_reference_id('Patient/p1') == 'p1'
+    assert ResourceReader.get_reference_id('http://fhir/Patient/p1/_history/2') == 'p1'
+    assert ResourceReader.get_reference_id('urn:uuid:p1') == 'p1'
+
+
+def test_get_reference_key():
+    assert ResourceReader.get_reference_key('Patient/p1') == 'Patient/p1'
+    assert ResourceReader.get_reference_key('http://fhir/Patient/p1/_history/2') == 'Patient/p1'
+    assert ResourceReader.get_reference_key('urn:uuid:p1') == 'urn:uuid:p1'
+
+
+def test_flatten_nested_elements(reader, encounter):
+    reader.flatten(encounter)
+    tables = reader.get_tables()
+
+    encounter_df = tables['Encounter']
+    period_key = encounter_df['period'][0]
+    assert tables['Period'].set_index('object_id').loc[period_key, 'end'] == \
+        "2000-01-02T21:10:00"
+    assert tables['Coding']['object_id'][0] == encounter_df['_class'][0]
+
+
+def test_flatten_references(reader, encounter):
+    reader.flatten(encounter)
+    reader.flatten(dict(encounter, id='e2'))
+    tables = reader.get_tables()
+
+    assert list(tables['Encounter']['subject']) == ['Patient/p1', 'Patient/p1']
+    assert list(tables['Reference']['identifier']) == ['Patient/p1']
+
+
+def test_flatten_identifier(reader, patients):
+    reader.flatten(patients[0])
+    tables = reader.get_tables()
+
+    assert tables['Patient']['identifier'][0] == 'Patient/p1'
+    assert tables['Identifier'].set_index('object_id').loc['Patient/p1', 'value'] == '123'
+
+
+def test_flatten_keys_do_not_collide(reader, patients):
+    # logical ids that look like generated keys or that other resource types share
+    reader.flatten(dict(patients[0], id='1'))
+    reader.flatten(dict(patients[1], id='0'))
+    reader.flatten({"resourceType": "Encounter", "id": "1",
+                    "subject": {"reference": "Patient/1"},
+                    "identifier": [{"system": "visit", "value": "789"}]})
+    tables = reader.get_tables()
+
+    assert tables['Identifier']['object_id'].is_unique
+    assert tables['HumanName']['object_id'].tolist() == ['_0']
+    assert tables['Encounter']['subject'].tolist() == ['Patient/1']
+    assert tables['Reference']['identifier'].tolist() == ['Patient/1']
+
+
+def test_iter_resources_full_url(reader, tmpdir, encounter):
+    patient = {"resourceType": "Patient", "gender": "female"}
+    encounter = dict(encounter, subject={"reference": "urn:uuid:1234"})
+    bundle = {"resourceType": "Bundle",
+              "type": "collection",
+              "entry": [{"fullUrl": "urn:uuid:1234", "resource": patient},
+                        {"resource": encounter}]}
+    file_path = str(tmpdir.join('bundle.json'))
+    with open(file_path, 'w') as json_file:
+        json.dump(bundle, json_file)
+
+    for resource in reader.iter_resources(file_path):
+        reader.flatten(resource)
+
+    tables = reader.get_tables()
+    assert tables['Patient']['identifier'].tolist() == ['Patient/1234']
+    assert tables['Encounter']['subject'].tolist() == ['Patient/1234']
+
+
+def test_iter_chunks(reader, folder):
+    chunks = list(reader.iter_chunks(folder))
+    patients = sum(len(chunk.get('Patient', [])) for chunk in chunks)
+    encounters = sum(len(chunk.get('Encounter', [])) for chunk in chunks)
+    assert len(chunks) == 2 and patients == 2 and encounters == 1
+
+
+def test_flatten_repeated_elements(reader, patients):
+    patients[0]['name'].append({"family": "Roe"})
+    patients[0]['identifier'].append({"system": "ssn", "value": "789"})
+    reader.flatten(patients[0])
+    tables = reader.get_tables()
+
+    assert tables['HumanName']['family'].tolist() == ['Doe']
+    assert reader.dropped[('Patient', 'name')] == 1
+    assert reader.dropped[('Patient', 'identifier')] == 1
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+
+import pandas as pd
+import pytest
+
+from cardea.data_loader import ShardSplitter
+
+
+@pytest.fixture()
+def keys():
+    patients = [str(i) for i in range(20)]
+    return {'Patient': pd.DataFrame({"identifier": patients}),
+            'Encounter': pd.DataFrame({"identifier": ['e' + i for i in patients],
+                                       "subject": patients,
+                                       "period": ['p' + i for i in patients]}),
+            'Period': pd.DataFrame({"object_id": ['p' + i for i in patients]}),
+            'Reference': pd.DataFrame({"identifier": patients + ['doctor']}),
+            'Appointment_Participant': pd.DataFrame({"object_id": ['a' + i for i in patients],
+                                                     "actor": patients}),
+            'Appointment': pd.DataFrame({"identifier": ['ap' + i for i in patients],
+                                         "participant": ['a' + i for i in patients]}),
+            'Organization': pd.DataFrame({"identifier": ['o1', 'o2']})}
+
+
+@pytest.fixture()
+def shards(keys):
+    return ShardSplitter(n_shards=3).get_shards(keys)
+
+
+def test_get_shards_patients(shards):
+    assert shards['Patient'].shape == (20, 3)
+    assert (shards['Patient'].sum(axis=1) == 1).all()
+    assert shards['Patient'].any(axis=0).all()
+
+
+def test_get_shards_follow_patient(shards):
+    for name in ['Encounter', 'Period', 'Appointment_Participant', 'Appointment']:
+        assert (shards[name] == shards['Patient']).all()
+
+    assert (shards['Reference'][:20] == shards['Patient']).all()
+
+
+def test_get_shards_unconnected(shards):
+    assert shards['Reference'][20].tolist() == [True, False, False]
+    assert shards['Organization'].all()
+
+
+def test_get_shards_unreached(keys):
+    keys['Encounter'].loc[0, 'subject'] = None
+    shards = ShardSplitter(n_shards=3).get_shards(keys)
+    assert shards['Encounter'][0].tolist() == [True, False, False]
+    assert shards['Period'][0].tolist() == [True, False, False]
+
+
+def test_get_shards_subject_encounters(keys):
+    # the subject of a condition is the encounter it was diagnosed in
+    keys['Condition'] = pd.DataFrame({"identifier": 'c' + keys['Patient']['identifier'],
+                                      "subject": keys['Encounter']['identifier']})
+    shards = ShardSplitter(n_shards=3).get_shards(keys)
+    assert (shards['Condition'] == shards['Encounter']).all()
+
+
+def test_resolve_references(keys):
+    keys['Condition'] = pd.DataFrame({"identifier": ['c1'], "subject": ['e1']})
+    targets = {(relation.child_entity, relation.child_variable): relation.parent_entity
+               for relation in ShardSplitter.resolve_references(keys)}
+    assert targets[('Encounter', 'subject')] == 'Patient'
+    assert targets[('Appointment_Participant', 'actor')] == 'Patient'
+    assert targets[('Condition', 'subject')] == 'Encounter'
+
+
+def test_read_keys_normalized(tmpdir):
+    folder_path = str(tmpdir)
+    pd.DataFrame({"identifier": [1, 2]}).to_csv(
+        os.path.join(folder_path, 'Patient.csv'), index=False)
+    pd.DataFrame({"identifier": ['e1', 'e2', 'e3'], "subject": [1, None, 2]}).to_csv(
+        os.path.join(folder_path, 'Encounter.csv'), index=False)
+
+    splitter = ShardSplitter(n_shards=3)
+    keys = splitter.read_keys({name: os.path.join(folder_path, name + '.csv')
+                               for name in ['Patient', 'Encounter']})
+    assert keys['Encounter']['subject'].tolist() == ['1', None, '2']
+
+    shards = splitter.get_shards(keys)
+    assert (shards['Encounter'][[0, 2]] == shards['Patient']).all()
+
+
+def test_split_csv_files(tmpdir, keys):
+    folder_path = str(tmpdir.mkdir('fhir'))
+    patient = keys['Patient'].assign(gender='female')
+    patient.to_csv(os.path.join(folder_path, 'Patient.csv'), index=False)
+    keys['Encounter'].to_csv(os.path.join(folder_path, 'Encounter.csv'), index=False)
+
+    shard_paths = ShardSplitter(n_shards=3, chunksize=7).split_csv_files(
+        folder_path, str(tmpdir.join('shards')))
+
+    assert len(shard_paths) == 3
+    shards = [pd.read_csv(os.path.join(shard_path, 'Patient.csv'), dtype=str)
+              for shard_path in shard_paths]
+    assert sorted(pd.concat(shards)['identifier'].astype(int)) == list(range(20))
+    assert all(list(shard.columns) == ['identifier', 'gender'] for shard in shards)
+
+    for shard_path, shard in zip(shard_paths, shards):
+        encounters = pd.read_csv(os.path.join(shard_path, 'Encounter.csv'), dtype=str)
+        assert sorted(encounters['subject']) == sorted(shard['identifier'])
+
+
+def test_split_csv_files_unreached(tmpdir, keys):
+    folder_path = str(tmpdir.mkdir('fhir'))
+    keys['Encounter'].loc[0, 'subject'] = None
+    keys['Patient'].to_csv(os.path.join(folder_path, 'Patient.csv'), index=False)
+    keys['Encounter'].to_csv(os.path.join(folder_path, 'Encounter.csv'), index=False)
+
+    shard_paths = ShardSplitter(n_shards=3).split_csv_files(folder_path,
+                                                            str(tmpdir.join('shards')))
+
+    encounters = [pd.read_csv(os.path.join(shard_path, 'Encounter.csv'), dtype=str)
+                  for shard_path in shard_paths]
+    assert sum(len(shard) for shard in encounters) == 20
+    assert 'e0' in encounters[0]['identifier'].tolist()
+
+
+def test_split_csv_files_empty_shards(tmpdir):
+    folder_path = str(tmpdir.mkdir('fhir'))
+    for name, identifiers in [('Patient', ['1']), ('Organization', ['o1'])]:
+        pd.DataFrame({"identifier": identifiers}).to_csv(
+            os.path.join(folder_path, name + '.csv'), index=False)
+
+    shard_paths = ShardSplitter(n_shards=3).split_csv_files(folder_path,
+                                                            str(tmpdir.join('shards')))
+
+    assert len(shard_paths) == 1
+    assert len(pd.read_csv(os.path.join(shard_paths[0], 'Patient.csv'))) == 1
+    assert len(os.listdir(str(tmpdir.join('shards')))) == 1
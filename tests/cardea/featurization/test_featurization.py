@@ -63,3 +63,36 @@ def test_generate_feature_matrix(featurization, entityset, cutoff):
     fm_encoded, features_encoded = featurization.generate_feature_matrix(
         entityset, "Encounter", cutoff)
     assert len(fm_encoded) == 3 and len(fm_encoded.columns) == 32
+
+
+def test_partition_cutoff():
+    cutoff = pd.DataFrame({"instance_id": [10, 11, 10, 12, 13],
+                           "cutoff_time": pd.date_range('1/1/2000', periods=5)})
+
+    partitions = Featurization.partition_cutoff(cutoff, 2)
+    assert [partition['instance_id'].tolist() for partition in partitions] == [
+        [10, 10, 12], [11, 13]]
+    assert partitions[0]['_cutoff_position'].tolist() == [0, 2, 3]
+    assert Featurization.partition_cutoff(cutoff.head(1), 4)[0]['instance_id'].tolist() == [10]
+
+
+def test_partition_cutoff_problem_columns():
+    # the column order of the cutoff times of every problem definition
+    cutoff = pd.DataFrame({"cutoff_time": pd.to_datetime(['1/1/2000'] * 6 + ['2/1/2000'] * 2),
+                           "instance_id": range(8),
+                           "label": [True, False] * 4})
+
+    partitions = Featurization.partition_cutoff(cutoff, 4)
+    assert [partition['instance_id'].tolist() for partition in partitions] == [
+        [0, 4], [1, 5], [2, 6], [3, 7]]
+
+
+def test_generate_feature_matrix_parallel(featurization, entityset, cutoff):
+    fm_encoded, _ = featurization.generate_feature_matrix(entityset, "Encounter", cutoff)
+    fm_parallel, features_parallel = Featurization(n_jobs=2).generate_feature_matrix(
+        entityset, "Encounter", cutoff)
+
+    assert list(fm_parallel.index) == [10, 11, 12]
+    assert '_cutoff_position' not in fm_parallel.columns
+    pd.testing.assert_frame_equal(fm_parallel[fm_encoded.columns], fm_encoded,
+                                  check_dtype=False)
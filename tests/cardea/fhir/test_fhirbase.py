@@ -5,6 +5,7 @@ import pandas as pd
 import pytest
 
 from cardea.fhir import Patient
+from cardea.fhir.fhirbase import assert_enums, find_enum_violations
 
 
 @pytest.fixture()
@@ -34,6 +35,31 @@ def test_object_number_of_tuples(patient_object_df, patient_df):
     assert len(patient_object_df) == len(patient_df)
 
 
+def test_from_dataframe_wraps_dataframe(patient_df):
+    object = Patient.from_dataframe(patient_df)
+    assert object.get_dataframe() is patient_df
+
+
+def test_from_dataframe_attributes(patient_df):
+    object = Patient.from_dataframe(patient_df)
+    assert list(object.gender) == list(patient_df['gender']) and object.get_id() == 'identifier'
+
+
+def test_from_dataframe_unknown_column(patient_df):
+    patient_df['unknown'] = [0, 1, 2, 3]
+    object_df = Patient.from_dataframe(patient_df).get_dataframe()
+    assert 'unknown' not in object_df.columns and len(object_df) == len(patient_df)
+
+
+def test_object_fields(patient_object):
+    assert not hasattr(patient_object, '__dict__') and 'gender' in Patient._fields
+
+
+def test_set_attributes_unknown_attribute(patient_object):
+    patient_object.set_attributes({'unknown': [0, 1, 2, 3]})
+    assert not hasattr(patient_object, 'unknown')
+
+
 def test_get_id(patient_object):
     assert patient_object.get_id() == 'identifier'
 
@@ -61,3 +87,29 @@ def test_assert_type_enum():
     object_values = df.to_dict('list')
     with pytest.raises(ValueError):
         Patient(object_values)
+
+
+def test_assert_type_enum_case_insensitive():
+    df = pd.DataFrame({"identifier": [0, 1], "gender": ['Female', 'MALE']})
+    Patient(df.to_dict('list')).assert_type()
+
+
+def test_find_enum_violations():
+    values = pd.Series(['female', 'F', None, 'Male', 'x'], index=[10, 11, 12, 13, 14])
+    invalid = find_enum_violations(values, ['male', 'female'])
+    assert list(invalid) == [11, 14]
+
+
+def test_find_enum_violations_no_values():
+    assert list(find_enum_violations(pd.Series([None, None], index=[10, 11]), ['male'])) == []
+    assert list(find_enum_violations(pd.Series([], dtype=object), ['male'])) == []
+    assert_enums(pd.DataFrame({"gender": [None, None]}), {'gender': ['male']}, 'Patient')
+
+
+def test_assert_enums_reports_all_violations():
+    df = pd.DataFrame({"gender": ['female', 'F', 'M'], "status": ['x', 'active', 'active']})
+    with pytest.raises(ValueError) as error:
+        assert_enums(df, {'gender': ['male', 'female'], 'status': ['active']}, 'Patient')
+
+    message = str(error.value)
+    assert '"F", "M" at rows [1, 2]' in message and '"x" at rows [0]' in message
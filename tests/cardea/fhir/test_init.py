@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from cardea import fhir
+
+
+def test_get_resource():
+    resource = fhir.get_resource('Patient_Contact')
+    assert resource.__name__ == 'Patient_Contact'
+
+
+def test_get_resource_lookup_error():
+    with pytest.raises(LookupError):
+        fhir.get_resource('Inpatient')
+
+
+def test_resource_attribute_is_class():
+    fhir.get_resource('Encounter_Diagnosis')
+    assert isinstance(fhir.Encounter, type) and fhir.Encounter.__name__ == 'Encounter'
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        fhir.Inpatient
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from cardea.fhir import Patient
+from cardea.fhir.schema import get_schema, is_datetime_field, list_resources
+
+
+@pytest.fixture()
+def patient_schema():
+    return get_schema('Patient')
+
+
+def test_get_schema_resource(patient_schema):
+    assert patient_schema.resource is Patient and patient_schema.name == 'Patient'
+
+
+def test_get_schema_cached(patient_schema):
+    assert get_schema('Patient') is patient_schema
+
+
+def test_get_schema_lookup_error():
+    with pytest.raises(LookupError):
+        get_schema('Inpatient')
+
+
+def test_get_schema_identifiers():
+    assert get_schema('Patient').identifiers == ('identifier',)
+    assert get_schema('Period').identifiers == ('object_id',)
+
+
+def test_get_schema_relationships(patient_schema):
+    assert len(patient_schema.relationships) == 12
+
+
+def test_get_schema_enums(patient_schema):
+    assert patient_schema.enums['gender'] == ('male', 'female', 'other', 'unknown')
+
+
+def test_get_id(patient_schema):
+    assert patient_schema.get_id(['gender', 'identifier']) == 'identifier'
+    assert patient_schema.get_id(['gender']) is None
+
+
+def test_get_relationships(patient_schema):
+    relationships = patient_schema.get_relationships(['identifier', 'address'], ['Address'])
+    assert len(relationships) == 1 and relationships[0].child_variable == 'address'
+
+
+def test_list_resources():
+    resources = list_resources()
+    assert 'Patient' in resources and 'Patient_Contact' in resources
+
+
+def test_get_schema_types(patient_schema):
+    assert patient_schema.types['gender'] == 'str'
+    assert patient_schema.types['active'] == 'bool'
+    assert patient_schema.types['address'] == 'reference'
+
+
+def test_get_dtypes(patient_schema):
+    dtypes = patient_schema.get_dtypes()
+    assert dtypes['gender'] == 'category' and dtypes['resourceType'] is str
+    assert 'address' not in dtypes and 'birthDate' not in dtypes
+
+
+def test_get_parse_dates():
+    assert get_schema('Period').get_parse_dates(['object_id', 'end', 'start']) == ['end', 'start']
+
+
+def test_is_datetime_field():
+    assert is_datetime_field('birthDate') and is_datetime_field('issued')
+    assert not is_datetime_field('gender')
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pandas as pd
+import pytest
+from numpy import nan
+
+from cardea.problem_definition.code_matcher import CodeMatcher
+
+
+@pytest.fixture()
+def code_matcher():
+    return CodeMatcher(['X60', 'V09.*', 'y8*'])
+
+
+def test_match_exact(code_matcher):
+    codes = pd.Series(['X60', 'X60.1', 'X6', ' x60 '])
+    assert code_matcher.match(codes).tolist() == [True, False, False, True]
+
+
+def test_match_family(code_matcher):
+    codes = pd.Series(['V09', 'V09.0', 'V09.21', 'V091', 'V0', 'Y87.0', 'Y8', 'Y9'])
+    assert code_matcher.match(codes).tolist() == [
+        True, True, True, False, False, True, True, False]
+
+
+def test_match_missing_values(code_matcher):
+    codes = pd.Series(['X60', nan, None, 'C12'], index=[3, 2, 1, 0])
+    matches = code_matcher.match(codes)
+
+    assert matches.tolist() == [True, False, False, False]
+    assert matches.index.tolist() == [3, 2, 1, 0]
+
+
+def test_match_family_trie(code_matcher):
+    assert code_matcher.codes == frozenset(['X60', 'V09'])
+    assert code_matcher.match_family('V09.4')
+    assert not code_matcher.match_family('V09')
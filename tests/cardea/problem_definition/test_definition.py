@@ -80,3 +80,32 @@ def test_check_target_label_values_false(entityset, problem_definition):
 def test_check_target_label_values_error(entityset, problem_definition):
     assert problem_definition.check_for_missing_values_in_target_label(
         entityset, 'Encounter', 'class') is False
+
+
+def test_check_for_missing_values_columns(entityset, es_loader):
+    assert es_loader.check_for_missing_values(entityset, 'Patient', ['gender', 'active'])
+    assert not es_loader.check_for_missing_values(entityset, 'Patient', ['gender', 'class'])
+
+
+def test_count_missing_values(entityset, es_loader):
+    counts = es_loader.count_missing_values(entityset, 'Patient', ['active', 'gender', 'class'])
+    assert counts.to_dict() == {'active': 1, 'gender': 0}
+
+
+def test_get_missing_columns(entityset, es_loader):
+    missing = es_loader.get_missing_columns(
+        entityset, {'Patient': ['gender', 'class'], 'Period': ['start'], 'Claim': ['use']})
+    assert sorted(missing) == ['Claim.use', 'Patient.class']
+
+
+def test_require_columns(entityset, es_loader):
+    es_loader.require_columns(entityset, {'Patient': ['gender'], 'Period': ['start', 'end']})
+    with pytest.raises(ValueError):
+        es_loader.require_columns(entityset, {'Patient': ['gender', 'class']})
+
+
+def test_check_column_existence_replaced_entity(entityset, es_loader):
+    assert not es_loader.check_column_existence(entityset, 'Encounter', 'length')
+    df = entityset['Encounter'].df.assign(length=[1, 2, 3])
+    entityset.entity_from_dataframe(entity_id='Encounter', dataframe=df, index='identifier')
+    assert es_loader.check_column_existence(entityset, 'Encounter', 'length')
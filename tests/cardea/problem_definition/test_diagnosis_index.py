@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import featuretools as ft
+import pandas as pd
+import pytest
+
+from cardea.problem_definition.code_matcher import CodeMatcher
+from cardea.problem_definition.diagnosis_index import DiagnosisIndex, get_diagnosis_index
+
+
+@pytest.fixture()
+def entityset():
+    coding_df = pd.DataFrame({"object_id": [100, 111, 112, 113],
+                              "code": ["X60", "C12", "V09.2", "C12"]})
+
+    cc_df = pd.DataFrame({"object_id": [1, 2, 3, 4],
+                          "coding": [100, 111, 112, 113]})
+
+    condition_df = pd.DataFrame({"identifier": [20, 21, 22, 23],
+                                 "code": [1, 2, 3, 4],
+                                 "subject": [10, 10, 12, 10]})
+
+    es = ft.EntitySet(id="test")
+    es.entity_from_dataframe(entity_id='Coding', dataframe=coding_df, index='object_id')
+    es.entity_from_dataframe(entity_id='CodeableConcept', dataframe=cc_df, index='object_id')
+    es.entity_from_dataframe(entity_id='Condition', dataframe=condition_df, index='identifier')
+    return es
+
+
+@pytest.fixture()
+def diagnosis_index(entityset):
+    return DiagnosisIndex.from_entityset(entityset)
+
+
+def test_from_entityset(diagnosis_index):
+    assert diagnosis_index.get_codes(10) == ['X60', 'C12']
+    assert diagnosis_index.get_codes(11) == []
+    assert diagnosis_index.pairs['code'].dtype.name == 'category'
+
+
+def test_get_first_codes(diagnosis_index):
+    codes = diagnosis_index.get_first_codes(pd.Series([12, 11, 10]))
+    assert codes.tolist()[0::2] == ['V09.2', 'X60']
+    assert codes.isnull().tolist() == [False, True, False]
+
+
+def test_match(diagnosis_index):
+    encounters = pd.Series([10, 11, 12])
+    assert diagnosis_index.match(encounters, CodeMatcher(['C12'])).tolist() == [
+        True, False, False]
+    assert diagnosis_index.match(encounters, CodeMatcher(['V09.*', 'X60'])).tolist() == [
+        True, False, True]
+
+
+def test_get_diagnosis_index(entityset):
+    diagnosis_index = get_diagnosis_index(entityset)
+    assert get_diagnosis_index(entityset) is diagnosis_index
+
+    condition_df = entityset['Condition'].df.assign(subject=[11, 11, 11, 11])
+    entityset.entity_from_dataframe(entity_id='Condition', dataframe=condition_df,
+                                    index='identifier')
+
+    updated_index = get_diagnosis_index(entityset)
+    assert updated_index is not diagnosis_index
+    assert updated_index.get_codes(11) == ['X60', 'C12', 'V09.2']
+
+
+def test_match_matrix(diagnosis_index):
+    code_matchers = [CodeMatcher(['C12']), CodeMatcher(['V09.*', 'X60']), CodeMatcher(['A00'])]
+
+    matrix = diagnosis_index.match_matrix(pd.Series([12, 11, 10]), code_matchers)
+    assert matrix.shape == (3, 3)
+    assert matrix.toarray().tolist() == [[False, True, False],
+                                         [False, False, False],
+                                         [True, True, False]]
+
+
+def test_get_diagnosis_index_update_data(entityset):
+    diagnosis_index = get_diagnosis_index(entityset)
+
+    condition_df = entityset['Condition'].df
+    new_condition = pd.DataFrame({"identifier": [24], "code": [2], "subject": [102]})
+    entityset['Condition'].update_data(pd.concat([condition_df, new_condition],
+                                                 ignore_index=True, sort=False))
+
+    updated_index = get_diagnosis_index(entityset)
+    assert updated_index is not diagnosis_index
+    assert updated_index.get_codes(102) == ['C12']
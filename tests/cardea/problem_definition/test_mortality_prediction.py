@@ -266,3 +266,9 @@ def test_generate_label_with_missing_values(
                                        index='identifier')
     with pytest.raises(ValueError):
         mortality_prediction.generate_cutoff_times(es)
+
+
+def test_generate_cutoff_times_code_families(entityset_success):
+    _, _, generated_df = MortalityPrediction(['C1*', 'V0*']).generate_cutoff_times(
+        entityset_success)
+    assert list(generated_df['label']) == [False, True, True]
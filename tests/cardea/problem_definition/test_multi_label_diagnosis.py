@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import featuretools as ft
+import pandas as pd
+import pytest
+
+from cardea.data_loader import EntitySetLoader
+from cardea.problem_definition import MultiLabelDiagnosisPrediction
+
+
+@pytest.fixture()
+def multi_label_diagnosis():
+    return MultiLabelDiagnosisPrediction(['Z10', 'C1*', 'A10', 'B20'])
+
+
+@pytest.fixture()
+def es_loader():
+    return EntitySetLoader()
+
+
+@pytest.fixture()
+def objects(es_loader):
+
+    encounter_df = pd.DataFrame({"identifier": [10, 11, 12],
+                                 "subject": [0, 1, 2],
+                                 "period": [120, 121, 122],
+                                 "diagnosis": [1, 2, 3]})
+
+    encounter_diagnosis_df = pd.DataFrame({"object_id": [1, 2, 3],
+                                           "condition": [10, 11, 12]})
+
+    condition_df = pd.DataFrame({"identifier": [10, 11, 12, 13],
+                                 "code": [1, 2, 3, 4],
+                                 "subject": [10, 11, 12, 10]})
+
+    cc_df = pd.DataFrame({"object_id": [1, 2, 3, 4],
+                          "coding": [100, 111, 112, 113]})
+
+    coding_df = pd.DataFrame({"object_id": [100, 111, 112, 113],
+                              "code": ["Z10", "C12", "A10", "C10"]})
+
+    period_df = pd.DataFrame({"object_id": [120, 121, 122],
+                              "start": ['9/22/2018 00:00', '9/21/2018 00:00', '10/4/2018 00:00'],
+                              "end": ['9/22/2018 00:10', '9/21/2018 00:10', '10/4/2018 00:10']})
+
+    patient_df = pd.DataFrame({"identifier": [0, 1, 2],
+                               "gender": ['female', 'female', 'male']})
+
+    return [es_loader.create_object(encounter_df, 'Encounter'),
+            es_loader.create_object(period_df, 'Period'),
+            es_loader.create_object(patient_df, 'Patient'),
+            es_loader.create_object(encounter_diagnosis_df, 'Encounter_Diagnosis'),
+            es_loader.create_object(condition_df, 'Condition'),
+            es_loader.create_object(cc_df, 'CodeableConcept'),
+            es_loader.create_object(coding_df, 'Coding')]
+
+
+@pytest.fixture()
+def entityset(objects, es_loader):
+    es = ft.EntitySet(id="test")
+
+    identifiers = es_loader.get_object_ids(objects)
+
+    fhir_dict = es_loader.get_dataframes(objects)
+    es_loader.create_entity(fhir_dict, identifiers, entity_set=es)
+
+    relationships = es_loader.get_relationships(objects, list(fhir_dict.keys()))
+    es_loader.create_relationships(relationships, entity_set=es)
+
+    return es
+
+
+def test_generate_cutoff_times(entityset, multi_label_diagnosis):
+    _, target_entity, cutoff_times = multi_label_diagnosis.generate_cutoff_times(entityset)
+
+    assert target_entity == 'Encounter'
+    assert list(cutoff_times.columns) == ['cutoff_time', 'instance_id']
+    assert list(cutoff_times['instance_id']) == [10, 11, 12]
+
+    labels = multi_label_diagnosis.labels
+    assert labels.shape == (3, 4)
+    assert labels.nnz == 4
+    assert labels.toarray().tolist() == [[True, True, False, False],
+                                         [False, True, False, False],
+                                         [False, False, True, False]]
+
+
+def test_get_labels(entityset, multi_label_diagnosis):
+    with pytest.raises(ValueError):
+        multi_label_diagnosis.get_labels('Z10')
+
+    multi_label_diagnosis.generate_cutoff_times(entityset)
+    assert multi_label_diagnosis.get_labels('C1*').tolist() == [True, True, False]
+    assert multi_label_diagnosis.get_labels('B20').tolist() == [False, False, False]
@@ -233,3 +233,46 @@ def test_generate_cutoff_times_missing_generation_label(entityset_success, readm
 def test_generate_label_with_missing_values(entityset_fail_missing_generation_value, readmission):
     with pytest.raises(ValueError):
         readmission.generate_cutoff_times(entityset_fail_missing_generation_value)
+
+
+def test_generate_labels_success_windows(entityset_success, cutoff_times):
+    es, _, generated_df = Readmission(windows=(7, 20)).generate_cutoff_times(
+        entityset_success)
+
+    assert list(generated_df['label']) == [False, False, False, True, False, True]
+    assert list(generated_df['label_7']) == [False, False, False, True, False, False]
+    assert list(generated_df['label_20']) == [False, False, False, True, False, True]
+    assert 'readmitted_7' not in es['Encounter'].df.columns
+
+
+def test_label_readmissions_unsorted_visits(readmission):
+    visits = pd.DataFrame({"identifier": [10, 11, 12, 13, 14],
+                           "subject": [0, 0, 1, 0, nan],
+                           "end": pd.to_datetime(['10/30/2018', '9/22/2018', '9/21/2018',
+                                                  '9/28/2018', '9/29/2018'])})
+
+    labels = readmission.label_readmissions(visits, 'end')
+
+    assert list(labels['identifier']) == [11, 13, 10, 12]
+    assert list(labels['readmitted']) == [False, True, False, False]
+
+
+@pytest.mark.parametrize('encode_keys', [False, True])
+def test_generate_labels_missing_subjects(es_loader, encode_keys):
+    fhir = {'Encounter': pd.DataFrame({"identifier": [10, 11, 12, 13],
+                                       "subject": [0, 1, None, None],
+                                       "period": [120, 121, 122, 123]}),
+            'Period': pd.DataFrame({"object_id": [120, 121, 122, 123],
+                                    "start": ['9/20/2018', '9/20/2018', '9/27/2018',
+                                              '9/28/2018'],
+                                    "end": ['9/22/2018', '9/21/2018', '9/28/2018',
+                                            '9/29/2018']}),
+            'Patient': pd.DataFrame({"identifier": [0, 1],
+                                     "gender": ['female', 'male']})}
+
+    es = es_loader.load_df_entityset(fhir, encode_keys=encode_keys)
+    assert es_loader.check_for_missing_values(es, 'Encounter', 'subject')
+
+    # encounters without a subject are not readmissions of each other
+    _, _, generated_df = Readmission().generate_cutoff_times(es)
+    assert list(generated_df['label']) == [False, False]
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Parity tests of the cutoff time unification against its original, row-wise version."""
+
+import featuretools as ft
+import numpy as np
+import pandas as pd
+import pytest
+
+from cardea.problem_definition import ProblemDefinition
+
+pytestmark = pytest.mark.skipif(not hasattr(pd.DataFrame, 'get_value'),
+                                reason='the original version requires DataFrame.get_value')
+
+
+def legacy_hours_admission_time(df, cutoff_time_label):
+    df = df.sort_values(by=[cutoff_time_label])
+    df = df.reset_index()
+
+    for i in df.index:
+
+        if i == 0:
+
+            if df.get_value(i, 'checked') is not True:
+                df.set_value(i, 'ct', df.get_value(i, cutoff_time_label))
+                df.set_value(i, 'checked', True)
+
+        elif df.get_value(i, 'checked') is not True:
+
+            ct_val1 = df.get_value(i - 1, 'ct')
+            end_val1 = df.get_value(i - 1, 'end')
+            start_val2 = df.get_value(i, cutoff_time_label)
+            df.get_value(i, 'end')
+
+            if ct_val1 < start_val2 < end_val1:
+                df.set_value(i - 1, 'ct', start_val2)
+                df.set_value(i, 'ct', start_val2)
+                df.set_value(i, 'checked', True)
+
+            else:
+                df.set_value(i, 'ct', df.get_value(i, cutoff_time_label))
+                df.set_value(i, 'checked', True)
+
+            if i + 1 == len(df):
+                break
+    return df
+
+
+def legacy_days_admission_time(df, cutoff_time_label):
+    frames = []
+    for d in set(df['date']):
+        sub_day = df[df['date'] == d]
+
+        sub_duration_greater = sub_day[sub_day['duration'] > 0]
+        sub_duration_less = sub_day[sub_day['duration'] <= 0]
+        frames.append(sub_duration_less)
+        sub_duration_greater = sub_duration_greater.sort_values(by=[cutoff_time_label])
+        if len(sub_duration_greater) != 0:
+            final_date = sub_duration_greater.iloc[-1][cutoff_time_label]
+
+            for i in sub_duration_greater.index:
+                sub_duration_greater.set_value(i, 'ct', final_date)
+                sub_duration_greater.set_value(i, 'checked', True)
+
+            frames.append(sub_duration_greater)
+
+            for i in sub_duration_less.index:
+                sub_duration_less.set_value(i, 'ct', pd.NaT)
+                sub_duration_less.set_value(i, 'checked', False)
+
+                frames.append(sub_duration_less)
+
+    result = pd.concat(frames)
+    result = result.drop_duplicates()
+    result[cutoff_time_label] = pd.to_datetime(result.start)
+    result = result.sort_values(by=[cutoff_time_label])
+    result = result.reset_index()
+    return result
+
+
+def legacy_admission_time(es, cutoff_entity, cutoff_time_label):
+    df = es[cutoff_entity].df
+    df[cutoff_time_label] = pd.to_datetime(df[cutoff_time_label])
+    df['end'] = pd.to_datetime(df['end'])
+    duration = (df['end'] - df[cutoff_time_label]).dt.days
+    duration = duration.tolist()
+    df['duration'] = duration
+    df['date'] = df[cutoff_time_label].dt.date
+    df['ct'] = ''
+    df['checked'] = False
+    result1 = legacy_days_admission_time(df, cutoff_time_label)
+    result = legacy_hours_admission_time(result1, cutoff_time_label)
+    if 'level_0' in result.columns:
+        result = result.drop(columns=['level_0'])
+    return result
+
+
+def legacy_days_discharge_time(df, cutoff_time_label):
+    frames = []
+    for d in set(df['end_date']):
+        sub_day = df[df['end_date'] == d]
+
+        sub_duration_greater = sub_day[sub_day['duration'] > 0]
+        sub_duration_less = sub_day[sub_day['duration'] <= 0]
+        frames.append(sub_duration_less)
+        sub_duration_greater = sub_duration_greater.sort_values(by=[cutoff_time_label])
+        if len(sub_duration_greater) != 0:
+            first_date = sub_duration_greater.iloc[0][cutoff_time_label]
+
+            for i in sub_duration_greater.index:
+                sub_duration_greater.set_value(i, 'ct', first_date)
+                sub_duration_greater.set_value(i, 'checked', True)
+            frames.append(sub_duration_greater)
+
+            for i in sub_duration_less.index:
+                sub_duration_less.set_value(i, 'ct', pd.NaT)
+                sub_duration_less.set_value(i, 'checked', False)
+            frames.append(sub_duration_less)
+
+    result = pd.concat(frames)
+    result = result.drop_duplicates()
+    result[cutoff_time_label] = pd.to_datetime(result.end)
+    result = result.reset_index()
+    return result
+
+
+def legacy_hours_discharge_time(df, cutoff_time_label):
+    frames = []
+    for d in set(df['end_date']):
+        sub_day = df[df['end_date'] == d]
+        for h in set(sub_day['hour']):
+            sub_hour = sub_day[sub_day['hour'] == h]
+            sub_hour = sub_hour.sort_values(by=[cutoff_time_label])
+            if len(sub_hour) != 0:
+                first_date = sub_hour.iloc[0][cutoff_time_label]
+                for i in sub_hour.index:
+                    sub_hour.set_value(i, 'ct', first_date)
+                    sub_hour.set_value(i, 'checked', True)
+
+                frames.append(sub_hour)
+
+    result = pd.concat(frames)
+    result = result.drop_duplicates()
+    return result
+
+
+def legacy_discharge_time(es, cutoff_entity, cutoff_time_label):
+    df = es[cutoff_entity].df
+    df['end_date'] = df[cutoff_time_label].dt.date
+    df['hour'] = df.end.apply(lambda x: x.hour)
+    duration = (df[cutoff_time_label] - df['start']).dt.days
+    duration = duration.tolist()
+    df['duration'] = duration
+    df['ct'] = ''
+    df['checked'] = False
+    result1 = legacy_days_discharge_time(df, cutoff_time_label)
+    result = legacy_hours_discharge_time(result1, cutoff_time_label)
+    if 'level_0' in result.columns:
+        result = result.drop(columns=['level_0'])
+    return result
+
+
+@pytest.fixture()
+def problem_definition():
+    return ProblemDefinition()
+
+
+@pytest.fixture()
+def period_df():
+    random = np.random.RandomState(0)
+    size = 300
+
+    minutes = random.choice(20 * 24 * 60, size, replace=False)
+    start = pd.Timestamp('2000-01-01') + pd.to_timedelta(np.sort(minutes), unit='m')
+    lengths = random.choice([-30, 30, 90, 20 * 60, 30 * 60, 3 * 24 * 60], size)
+    end = start + pd.to_timedelta(lengths + random.randint(0, 7, size), unit='m')
+
+    df = pd.DataFrame({'object_id': np.arange(size) + 100, 'start': start, 'end': end})
+    df.loc[[5, 50, 150], 'end'] = pd.NaT
+
+    # a day without records of a positive duration
+    df.loc[size] = [999, pd.Timestamp('2000-02-15 10:00'), pd.Timestamp('2000-02-15 09:00')]
+    return df.sample(frac=1, random_state=random)
+
+
+def get_entityset(df):
+    return ft.EntitySet(id='test').entity_from_dataframe(
+        entity_id='Period', dataframe=df.copy(), index='object_id')
+
+
+def assert_unified_equal(result, expected, sort_by=None):
+    if sort_by:
+        result = result.sort_values(sort_by).reset_index(drop=True)
+        expected = expected.sort_values(sort_by).reset_index(drop=True)
+
+    assert list(result.columns) == list(expected.columns)
+    pd.testing.assert_series_equal(pd.to_datetime(result.pop('ct')),
+                                   pd.to_datetime(expected.pop('ct')))
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_unify_cutoff_time_admission_time(problem_definition, period_df):
+    result = problem_definition.unify_cutoff_time_admission_time(
+        get_entityset(period_df), 'Period', 'start')
+    expected = legacy_admission_time(get_entityset(period_df), 'Period', 'start')
+
+    assert len(result) == len(period_df) - 3
+    assert_unified_equal(result, expected)
+
+
+def test_unify_cutoff_times_days_admission_time(problem_definition, period_df):
+    period_df['duration'] = (period_df['end'] - period_df['start']).dt.days
+    period_df['date'] = period_df['start'].dt.date
+    period_df['ct'] = ''
+    period_df['checked'] = False
+
+    result = problem_definition.unify_cutoff_times_days_admission_time(period_df, 'start')
+    expected = legacy_days_admission_time(period_df, 'start')
+
+    assert (expected['ct'] == '').any()
+    assert_unified_equal(result, expected)
+
+
+def test_unify_cutoff_time_discharge_time(problem_definition, period_df):
+    result = problem_definition.unify_cutoff_time_discharge_time(
+        get_entityset(period_df), 'Period', 'end')
+    expected = legacy_discharge_time(get_entityset(period_df), 'Period', 'end')
+
+    assert len(result) == len(period_df) - 3
+    assert_unified_equal(result, expected, sort_by='object_id')
+
+
+def test_unify_cutoff_times_days_discharge_time(problem_definition, period_df):
+    period_df['end_date'] = period_df['end'].dt.date
+    period_df['duration'] = (period_df['end'] - period_df['start']).dt.days
+    period_df['ct'] = ''
+    period_df['checked'] = False
+
+    result = problem_definition.unify_cutoff_times_days_discharge_time(period_df, 'end')
+    expected = legacy_days_discharge_time(period_df, 'end')
+
+    assert_unified_equal(result, expected, sort_by='object_id')
+
+
+def test_unify_cutoff_times_hours_admission_time_overlap(problem_definition):
+    df = pd.DataFrame({'start': pd.to_datetime(['2000-01-01 10:00', '2000-01-01 12:00',
+                                                '2000-01-02 09:00']),
+                       'end': pd.to_datetime(['2000-01-01 13:00', '2000-01-01 14:00',
+                                              '2000-01-02 10:00'])})
+
+    result = problem_definition.unify_cutoff_times_hours_admission_time(df, 'start')
+    assert list(result['ct']) == list(pd.to_datetime(
+        ['2000-01-01 12:00', '2000-01-01 12:00', '2000-01-02 09:00']))
+    assert result['checked'].all()